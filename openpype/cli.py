@@ -25,6 +25,8 @@ from .pype_commands import PypeCommands
               help=("Change OpenPype log level (debug - critical or 0-50)"))
 @click.option("--automatic-tests", is_flag=True, expose_value=False,
               help=("Run in automatic tests mode"))
+@click.option("--profile-startup", is_flag=True, expose_value=False,
+              help=("Print import and initialization times of modules"))
 def main(ctx):
     """Pype is main command serving as entry point to pipeline system.
 
@@ -134,7 +136,14 @@ def webpublisherwebserver(executable, upload_dir, host=None, port=None):
 @click.option(
     "--envgroup", help="Environment group (e.g. \"farm\")", default=None
 )
-def extractenvironments(output_json_path, project, asset, task, app, envgroup):
+@click.option(
+    "--cache-path",
+    help="Cache file reused until settings are saved",
+    default=None
+)
+def extractenvironments(
+    output_json_path, project, asset, task, app, envgroup, cache_path
+):
     """Extract environment variables for entered context to a json file.
 
     Entered output filepath will be created if does not exists.
@@ -145,7 +154,7 @@ def extractenvironments(output_json_path, project, asset, task, app, envgroup):
     Context options are "project", "asset", "task", "app"
     """
     PypeCommands.extractenvironments(
-        output_json_path, project, asset, task, app, envgroup
+        output_json_path, project, asset, task, app, envgroup, cache_path
     )
 
 
@@ -165,6 +174,23 @@ def publish(paths, targets, gui):
     PypeCommands.publish(list(paths), targets, gui)
 
 
+@main.command()
+@click.option("-p", "--port", help="Port of worker", type=int, default=None)
+@click.option("--max-jobs", type=int, default=None,
+              help="Amount of jobs after which is worker process restarted")
+@click.option("--once", is_flag=True, default=False,
+              help="Do not restart worker process when it exits")
+def publishworker(port, max_jobs, once):
+    """Start worker processing publish jobs on this machine.
+
+    Modules, settings and publish plugins are kept loaded between jobs.
+    Command 'publish' sends jobs to the worker when
+    'OPENPYPE_PUBLISH_WORKER_PORT' environment variable is set.
+    """
+
+    PypeCommands.launch_publish_worker(port, max_jobs, once)
+
+
 @main.command()
 @click.argument("path")
 @click.option("-h", "--host", help="Host")
@@ -418,9 +444,18 @@ def repack_version(directory):
     "--dirpath", help="Directory where package is stored", default=None)
 @click.option(
     "--dbonly", help="Store only Database data", default=False, is_flag=True)
-def pack_project(project, dirpath, dbonly):
+@click.option(
+    "--previous",
+    help="Previous package, only changed files are packed",
+    default=None
+)
+@click.option(
+    "--workers", help="Number of threads reading files", type=int,
+    default=None
+)
+def pack_project(project, dirpath, dbonly, previous, workers):
     """Create a package of project with all files and database dump."""
-    PypeCommands().pack_project(project, dirpath, dbonly)
+    PypeCommands().pack_project(project, dirpath, dbonly, previous, workers)
 
 
 @main.command()
@@ -430,9 +465,37 @@ def pack_project(project, dirpath, dbonly):
 )
 @click.option(
     "--dbonly", help="Store only Database data", default=False, is_flag=True)
-def unpack_project(zipfile, root, dbonly):
+@click.option(
+    "--workers", help="Number of threads extracting files", type=int,
+    default=None
+)
+def unpack_project(zipfile, root, dbonly, workers):
     """Create a package of project with all files and database dump."""
-    PypeCommands().unpack_project(zipfile, root, dbonly)
+    PypeCommands().unpack_project(zipfile, root, dbonly, workers)
+
+
+@main.command()
+@click.option("--project", required=True, help="Project name")
+@click.option(
+    "--expand",
+    help="Expand compact sequences back to item per file",
+    default=False,
+    is_flag=True
+)
+@click.option(
+    "--dry-run",
+    help="Only report changes without writing to database",
+    default=False,
+    is_flag=True
+)
+def migrate_repre_files(project, expand, dry_run):
+    """Store files of sequences in representations compactly.
+
+    Each sequence in representation 'files' is stored as one item with
+    frame ranges instead of item per file. Use '--expand' to convert
+    representations back.
+    """
+    PypeCommands().migrate_repre_files(project, expand, dry_run)
 
 
 @main.command()
@@ -45,12 +45,28 @@ from .entities import (
     get_workfile_info,
 )
 
+from .entity_cache import (
+    enable_entity_cache,
+    disable_entity_cache,
+    get_entity_cache,
+    get_entity_cache_stats,
+    invalidate_entity_cache,
+)
+
 from .entity_links import (
     get_linked_asset_ids,
     get_linked_assets,
     get_linked_representation_id,
 )
 
+from .representation_files import (
+    is_compact_file_info,
+    get_file_info_path,
+    iter_representation_files,
+    expand_representation_files,
+    compact_representation_files,
+)
+
 from .operations import (
     create_project,
 )
@@ -100,9 +116,21 @@ __all__ = (
 
     "get_workfile_info",
 
+    "enable_entity_cache",
+    "disable_entity_cache",
+    "get_entity_cache",
+    "get_entity_cache_stats",
+    "invalidate_entity_cache",
+
     "get_linked_asset_ids",
     "get_linked_assets",
     "get_linked_representation_id",
 
+    "is_compact_file_info",
+    "get_file_info_path",
+    "iter_representation_files",
+    "expand_representation_files",
+    "compact_representation_files",
+
     "create_project",
 )
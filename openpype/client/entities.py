@@ -11,8 +11,11 @@ import collections
 
 import six
 from bson.objectid import ObjectId
+from pymongo.errors import OperationFailure
 
 from .mongo import get_project_database, get_project_connection
+from .entity_cache import cached_entity_query
+from .representation_files import expand_representation_doc
 
 PatternType = type(re.compile(""))
 
@@ -93,6 +96,7 @@ def get_projects(active=True, inactive=False, fields=None):
             yield project_doc
 
 
+@cached_entity_query("project")
 def get_project(project_name, active=True, inactive=True, fields=None):
     """Return project entity document by project name.
 
@@ -150,6 +154,7 @@ def get_whole_project(project_name):
     return conn.find({})
 
 
+@cached_entity_query("asset")
 def get_asset_by_id(project_name, asset_id, fields=None):
     """Receive asset data by its id.
 
@@ -174,6 +179,7 @@ def get_asset_by_id(project_name, asset_id, fields=None):
     return conn.find_one(query_filter, _prepare_fields(fields))
 
 
+@cached_entity_query("asset")
 def get_asset_by_name(project_name, asset_name, fields=None):
     """Receive asset data by its name.
 
@@ -268,6 +274,7 @@ def _get_assets(
     return conn.find(query_filter, _prepare_fields(fields))
 
 
+@cached_entity_query("asset")
 def get_assets(
     project_name,
     asset_ids=None,
@@ -384,6 +391,7 @@ def get_asset_ids_with_subsets(project_name, asset_ids=None):
     return asset_ids_with_subsets
 
 
+@cached_entity_query("subset")
 def get_subset_by_id(project_name, subset_id, fields=None):
     """Single subset entity data by its id.
 
@@ -408,6 +416,7 @@ def get_subset_by_id(project_name, subset_id, fields=None):
     return conn.find_one(query_filters, _prepare_fields(fields))
 
 
+@cached_entity_query("subset")
 def get_subset_by_name(project_name, subset_name, asset_id, fields=None):
     """Single subset entity data by its name and its version id.
 
@@ -439,6 +448,7 @@ def get_subset_by_name(project_name, subset_name, asset_id, fields=None):
     return conn.find_one(query_filters, _prepare_fields(fields))
 
 
+@cached_entity_query("subset")
 def get_subsets(
     project_name,
     subset_ids=None,
@@ -548,6 +558,7 @@ def get_subset_families(project_name, subset_ids=None):
     return set()
 
 
+@cached_entity_query("version")
 def get_version_by_id(project_name, version_id, fields=None):
     """Single version entity data by its id.
 
@@ -575,6 +586,7 @@ def get_version_by_id(project_name, version_id, fields=None):
     return conn.find_one(query_filter, _prepare_fields(fields))
 
 
+@cached_entity_query("version")
 def get_version_by_name(project_name, version, subset_id, fields=None):
     """Single version entity data by its name and subset id.
 
@@ -690,6 +702,7 @@ def _get_versions(
     return conn.find(query_filter, _prepare_fields(fields))
 
 
+@cached_entity_query("version")
 def get_versions(
     project_name,
     version_ids=None,
@@ -729,6 +742,7 @@ def get_versions(
     )
 
 
+@cached_entity_query("version")
 def get_hero_version_by_subset_id(project_name, subset_id, fields=None):
     """Hero version by subset id.
 
@@ -761,6 +775,7 @@ def get_hero_version_by_subset_id(project_name, subset_id, fields=None):
     return None
 
 
+@cached_entity_query("version")
 def get_hero_version_by_id(project_name, version_id, fields=None):
     """Hero version by its id.
 
@@ -792,6 +807,7 @@ def get_hero_version_by_id(project_name, version_id, fields=None):
     return None
 
 
+@cached_entity_query("version")
 def get_hero_versions(
     project_name,
     subset_ids=None,
@@ -1006,6 +1022,7 @@ def get_last_version_by_subset_name(
     )
 
 
+@cached_entity_query("representation")
 def get_representation_by_id(project_name, representation_id, fields=None):
     """Representation entity data by its id.
 
@@ -1033,9 +1050,12 @@ def get_representation_by_id(project_name, representation_id, fields=None):
 
     conn = get_project_connection(project_name)
 
-    return conn.find_one(query_filter, _prepare_fields(fields))
+    return expand_representation_doc(
+        conn.find_one(query_filter, _prepare_fields(fields))
+    )
 
 
+@cached_entity_query("representation")
 def get_representation_by_name(
     project_name, representation_name, version_id, fields=None
 ):
@@ -1065,7 +1085,9 @@ def get_representation_by_name(
     }
 
     conn = get_project_connection(project_name)
-    return conn.find_one(query_filter, _prepare_fields(fields))
+    return expand_representation_doc(
+        conn.find_one(query_filter, _prepare_fields(fields))
+    )
 
 
 def _flatten_dict(data):
@@ -1120,6 +1142,51 @@ def _regex_filters(filters):
     return output
 
 
+class _RepresentationsCursor(object):
+    """Cursor expanding compact sequences of representations on iteration.
+
+    Other attributes are passed to wrapped mongo cursor.
+
+    Args:
+        cursor (Cursor): Mongo cursor of representation documents.
+    """
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return expand_representation_doc(next(self._cursor))
+
+    next = __next__
+
+    def __getitem__(self, index):
+        result = self._cursor[index]
+        if isinstance(result, dict):
+            return expand_representation_doc(result)
+        return self._wrap_result(result)
+
+    def __getattr__(self, attr_name):
+        attr = getattr(self._cursor, attr_name)
+        if not callable(attr):
+            return attr
+
+        @six.wraps(attr)
+        def wrapper(*args, **kwargs):
+            return self._wrap_result(attr(*args, **kwargs))
+        return wrapper
+
+    def _wrap_result(self, result):
+        # Chained methods (e.g. 'sort', 'limit') return the cursor
+        if result is self._cursor:
+            return self
+        if isinstance(result, self._cursor.__class__):
+            return self.__class__(result)
+        return result
+
+
 def _get_representations(
     project_name,
     representation_ids,
@@ -1206,9 +1273,12 @@ def _get_representations(
 
     conn = get_project_connection(project_name)
 
-    return conn.find(query_filter, _prepare_fields(fields))
+    return _RepresentationsCursor(
+        conn.find(query_filter, _prepare_fields(fields))
+    )
 
 
+@cached_entity_query("representation")
 def get_representations(
     project_name,
     representation_ids=None,
@@ -1302,37 +1372,35 @@ def get_archived_representations(
     )
 
 
-def get_representations_parents(project_name, representations):
-    """Prepare parents of representation entities.
+def _prepare_parent_fields(fields):
+    """Fields of parent entities with keys required for joining."""
 
-    Each item of returned dictionary contains version, subset, asset
-    and project in that order.
+    if fields is None:
+        return None
+    fields = set(fields)
+    fields |= {"_id", "parent", "type"}
+    return fields
 
-    Args:
-        project_name (str): Name of project where to look for queried entities.
-        representations (List[dict]): Representation entities with at least
-            '_id' and 'parent' keys.
 
-    Returns:
-        dict[ObjectId, tuple]: Parents by representation id.
+def _get_parents_by_version_id_queries(
+    project_name, version_ids, version_fields, subset_fields, asset_fields
+):
+    """Query parents of versions with query per entity type.
+
+    Fallback for '_get_parents_by_version_id_aggregation'.
     """
 
-    repre_docs_by_version_id = collections.defaultdict(list)
+    output = {}
     version_docs_by_version_id = {}
     version_docs_by_subset_id = collections.defaultdict(list)
     subset_docs_by_subset_id = {}
     subset_docs_by_asset_id = collections.defaultdict(list)
-    output = {}
-    for repre_doc in representations:
-        repre_id = repre_doc["_id"]
-        version_id = repre_doc["parent"]
-        output[repre_id] = (None, None, None, None)
-        repre_docs_by_version_id[version_id].append(repre_doc)
 
     version_docs = get_versions(
         project_name,
-        version_ids=repre_docs_by_version_id.keys(),
-        hero=True
+        version_ids=version_ids,
+        hero=True,
+        fields=version_fields
     )
     for version_doc in version_docs:
         version_id = version_doc["_id"]
@@ -1341,7 +1409,9 @@ def get_representations_parents(project_name, representations):
         version_docs_by_subset_id[subset_id].append(version_doc)
 
     subset_docs = get_subsets(
-        project_name, subset_ids=version_docs_by_subset_id.keys()
+        project_name,
+        subset_ids=version_docs_by_subset_id.keys(),
+        fields=subset_fields
     )
     for subset_doc in subset_docs:
         subset_id = subset_doc["_id"]
@@ -1350,16 +1420,16 @@ def get_representations_parents(project_name, representations):
         subset_docs_by_asset_id[asset_id].append(subset_doc)
 
     asset_docs = get_assets(
-        project_name, asset_ids=subset_docs_by_asset_id.keys()
+        project_name,
+        asset_ids=subset_docs_by_asset_id.keys(),
+        fields=asset_fields
     )
     asset_docs_by_id = {
         asset_doc["_id"]: asset_doc
         for asset_doc in asset_docs
     }
 
-    project_doc = get_project(project_name)
-
-    for version_id, repre_docs in repre_docs_by_version_id.items():
+    for version_id in version_ids:
         asset_doc = None
         subset_doc = None
         version_doc = version_docs_by_version_id.get(version_id)
@@ -1369,7 +1439,136 @@ def get_representations_parents(project_name, representations):
             if subset_doc:
                 asset_id = subset_doc["parent"]
                 asset_doc = asset_docs_by_id.get(asset_id)
+        output[version_id] = (version_doc, subset_doc, asset_doc)
+    return output
+
+
+def _get_parents_by_version_id_aggregation(
+    project_name, version_ids, version_fields, subset_fields, asset_fields
+):
+    """Query parents of versions in single aggregation roundtrip.
+
+    Versions are joined with subsets and assets using '$lookup' stages on
+    project collection.
+    """
+
+    projection = {}
+    for key, fields in (
+        ("version", version_fields),
+        ("subset", subset_fields),
+        ("asset", asset_fields),
+    ):
+        if fields is None:
+            projection[key] = True
+            continue
+        for field in fields:
+            projection["{}.{}".format(key, field)] = True
+
+    pipeline = [
+        {"$match": {
+            "type": {"$in": ["version", "hero_version"]},
+            "_id": {"$in": convert_ids(version_ids)}
+        }},
+        # Move version document to subkey so parents can be projected
+        #   to requested fields next to it
+        {"$project": {"version": "$$ROOT"}},
+        {"$lookup": {
+            "from": project_name,
+            "localField": "version.parent",
+            "foreignField": "_id",
+            "as": "subset"
+        }},
+        {"$unwind": {"path": "$subset", "preserveNullAndEmptyArrays": True}},
+        {"$lookup": {
+            "from": project_name,
+            "localField": "subset.parent",
+            "foreignField": "_id",
+            "as": "asset"
+        }},
+        {"$unwind": {"path": "$asset", "preserveNullAndEmptyArrays": True}},
+        {"$project": projection}
+    ]
+
+    output = {
+        version_id: (None, None, None)
+        for version_id in version_ids
+    }
+    conn = get_project_connection(project_name)
+    for item in conn.aggregate(pipeline):
+        version_doc = item["version"]
+        subset_doc = item.get("subset")
+        asset_doc = None
+        # Match the same entity types as queries in fallback would
+        if not subset_doc or subset_doc.get("type") != "subset":
+            subset_doc = None
+        else:
+            asset_doc = item.get("asset")
+            if not asset_doc or asset_doc.get("type") != "asset":
+                asset_doc = None
+        output[version_doc["_id"]] = (version_doc, subset_doc, asset_doc)
+    return output
+
+
+def get_representations_parents(
+    project_name,
+    representations,
+    version_fields=None,
+    subset_fields=None,
+    asset_fields=None
+):
+    """Prepare parents of representation entities.
+
+    Each item of returned dictionary contains version, subset, asset
+    and project in that order.
+
+    Parents are queried using single aggregation. Query per entity type is
+    used as fallback if aggregation fails (e.g. unsupported by mongo server).
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        representations (List[dict]): Representation entities with at least
+            '_id' and 'parent' keys.
+        version_fields (Optional[Iterable[str]]): Fields of version documents
+            that should be returned. All fields are returned if 'None'.
+        subset_fields (Optional[Iterable[str]]): Fields of subset documents
+            that should be returned. All fields are returned if 'None'.
+        asset_fields (Optional[Iterable[str]]): Fields of asset documents
+            that should be returned. All fields are returned if 'None'.
+
+    Returns:
+        dict[ObjectId, tuple]: Parents by representation id.
+    """
+
+    repre_docs_by_version_id = collections.defaultdict(list)
+    output = {}
+    for repre_doc in representations:
+        repre_id = repre_doc["_id"]
+        version_id = repre_doc["parent"]
+        output[repre_id] = (None, None, None, None)
+        repre_docs_by_version_id[version_id].append(repre_doc)
 
+    if not repre_docs_by_version_id:
+        return output
+
+    version_ids = list(repre_docs_by_version_id.keys())
+    args = (
+        project_name,
+        version_ids,
+        _prepare_parent_fields(version_fields),
+        _prepare_parent_fields(subset_fields),
+        _prepare_parent_fields(asset_fields),
+    )
+    try:
+        parents_by_version_id = _get_parents_by_version_id_aggregation(*args)
+    except OperationFailure:
+        parents_by_version_id = _get_parents_by_version_id_queries(*args)
+
+    project_doc = get_project(project_name)
+
+    for version_id, repre_docs in repre_docs_by_version_id.items():
+        version_doc, subset_doc, asset_doc = parents_by_version_id.get(
+            version_id, (None, None, None)
+        )
         for repre_doc in repre_docs:
             repre_id = repre_doc["_id"]
             output[repre_id] = (
@@ -0,0 +1,578 @@
+"""Opt-in read-through cache for project entity queries.
+
+Query functions in '~/client/entities.py' are decorated with
+'cached_entity_query' which does nothing unless the cache is enabled. The
+cache can be enabled with environment variable 'OPENPYPE_ENTITY_CACHE' set to
+'1' (before first query) or by calling 'enable_entity_cache'.
+
+Cached values are stored per project and entity type in bounded LRU buckets.
+Cache of a project is invalidated when its mongo collection changes. Changes
+are received using mongo change stream which is available only on replica
+sets, so as fallback are project caches expired after a poll interval.
+
+Warnings:
+    Functions which return mongo cursor return list when cache is enabled.
+"""
+
+import os
+import re
+import copy
+import time
+import logging
+import threading
+import collections
+
+import six
+
+PatternType = type(re.compile(""))
+
+DEFAULT_CACHE_SIZE = 256
+DEFAULT_POLL_INTERVAL = 30
+
+_MISSING = object()
+
+
+class _UnhashableQuery(Exception):
+    """Query arguments can't be converted to cache key."""
+    pass
+
+
+def _hashable(value):
+    """Convert query argument to hashable value usable in cache key.
+
+    Raises:
+        _UnhashableQuery: When value can't be converted.
+    """
+
+    if value is None or isinstance(
+        value, (six.string_types, bool, int, float)
+    ):
+        return value
+
+    if isinstance(value, PatternType):
+        return ("__regex__", value.pattern, value.flags)
+
+    if isinstance(value, dict):
+        return tuple(sorted(
+            (
+                (_hashable(key), _hashable(item))
+                for key, item in value.items()
+            ),
+            key=repr
+        ))
+
+    # Iterables of ids or names (list, set, tuple, dict keys)
+    if hasattr(value, "__iter__"):
+        return tuple(sorted(
+            (_hashable(item) for item in value),
+            key=repr
+        ))
+
+    try:
+        hash(value)
+    except TypeError:
+        raise _UnhashableQuery()
+    return value
+
+
+def _materialize(value):
+    """Convert one-shot iterables (e.g. generators) of query argument to list.
+
+    Values are iterated to create cache key so iterators would be exhausted
+    before query function receives them.
+    """
+
+    if (
+        isinstance(value, (six.string_types, dict, list, tuple, PatternType))
+        or not hasattr(value, "__iter__")
+    ):
+        return value
+    return list(value)
+
+
+def _fields_key(fields):
+    if not fields:
+        return None
+    output = set(fields)
+    output.add("_id")
+    return frozenset(output)
+
+
+def _field_is_covered(field, fields_key):
+    """Field or any of its parent fields is available in projection."""
+
+    if fields_key is None:
+        return True
+
+    if field in fields_key:
+        return True
+
+    parts = field.split(".")
+    for idx in range(1, len(parts)):
+        if ".".join(parts[:idx]) in fields_key:
+            return True
+    return False
+
+
+def _project_value(value, parts):
+    if not parts:
+        return value
+
+    if isinstance(value, dict):
+        key = parts[0]
+        if key not in value:
+            return _MISSING
+        sub_value = _project_value(value[key], parts[1:])
+        if sub_value is _MISSING:
+            return _MISSING
+        return {key: sub_value}
+
+    if isinstance(value, list):
+        output = []
+        for item in value:
+            if isinstance(item, dict):
+                sub_value = _project_value(item, parts)
+                output.append({} if sub_value is _MISSING else sub_value)
+        return output
+
+    return _MISSING
+
+
+def _merge_projected(output, value):
+    for key, item in value.items():
+        current = output.get(key, _MISSING)
+        if isinstance(current, dict) and isinstance(item, dict):
+            _merge_projected(current, item)
+
+        elif isinstance(current, list) and isinstance(item, list):
+            for current_item, new_item in zip(current, item):
+                _merge_projected(current_item, new_item)
+
+        else:
+            output[key] = item
+
+
+def project_document(doc, fields_key):
+    """Reduce document to passed fields as mongo inclusive projection would.
+
+    Args:
+        doc (dict[str, Any]): Full or already projected document.
+        fields_key (Union[frozenset[str], None]): Fields to keep. Document is
+            returned as is if 'None' is passed.
+
+    Returns:
+        dict[str, Any]: Projected document.
+    """
+
+    if doc is None or fields_key is None:
+        return doc
+
+    output = {}
+    for field in fields_key:
+        value = _project_value(doc, field.split("."))
+        if value is not _MISSING:
+            _merge_projected(output, value)
+    return output
+
+
+class EntityCacheStats(object):
+    """Hit and miss counters of entity cache per entity type."""
+
+    def __init__(self):
+        self.hits = collections.Counter()
+        self.misses = collections.Counter()
+        self.invalidations = collections.Counter()
+
+    def reset(self):
+        self.hits.clear()
+        self.misses.clear()
+        self.invalidations.clear()
+
+    def to_data(self):
+        entity_types = set(self.hits) | set(self.misses)
+        output = {}
+        for entity_type in entity_types:
+            hits = self.hits[entity_type]
+            misses = self.misses[entity_type]
+            total = hits + misses
+            output[entity_type] = {
+                "hits": hits,
+                "misses": misses,
+                "ratio": float(hits) / total if total else 0.0
+            }
+        return {
+            "entity_types": output,
+            "invalidations": dict(self.invalidations)
+        }
+
+
+class EntityCache(object):
+    """Bounded LRU cache of query results per project and entity type.
+
+    Each bucket (project name, entity type) holds up to 'max_size' queries.
+    Every query may be stored with multiple field projections. Lookup with
+    fields that are a subset of already cached projection (or full document)
+    is resolved from cache without another query.
+
+    Args:
+        max_size (Optional[int]): Maximum number of cached queries per
+            project and entity type.
+    """
+
+    log = logging.getLogger("EntityCache")
+
+    def __init__(self, max_size=None):
+        if max_size is None:
+            max_size = int(
+                os.environ.get("OPENPYPE_ENTITY_CACHE_SIZE")
+                or DEFAULT_CACHE_SIZE
+            )
+        self._max_size = max_size
+        self._lock = threading.RLock()
+        self._buckets = {}
+        self._project_timestamps = {}
+        self._stats = EntityCacheStats()
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    @property
+    def stats(self):
+        return self._stats
+
+    def get(self, project_name, entity_type, query_key, fields_key):
+        """Cached result for query or '_MISSING' sentinel."""
+
+        with self._lock:
+            bucket = self._buckets.get((project_name, entity_type))
+            entries = None
+            if bucket is not None:
+                entries = bucket.get(query_key)
+
+            if entries is None:
+                self._stats.misses[entity_type] += 1
+                return _MISSING
+
+            # Mark query as recently used
+            bucket[query_key] = bucket.pop(query_key)
+            result = entries.get(fields_key, _MISSING)
+            if result is _MISSING:
+                for cached_fields_key, cached_result in entries.items():
+                    if self._covers(cached_fields_key, fields_key):
+                        result = self._project_result(
+                            cached_result, fields_key
+                        )
+                        break
+
+            if result is _MISSING:
+                self._stats.misses[entity_type] += 1
+                return _MISSING
+
+            self._stats.hits[entity_type] += 1
+            # Callers may modify returned documents
+            return copy.deepcopy(result)
+
+    def set(self, project_name, entity_type, query_key, fields_key, result):
+        with self._lock:
+            bucket_key = (project_name, entity_type)
+            bucket = self._buckets.get(bucket_key)
+            if bucket is None:
+                bucket = collections.OrderedDict()
+                self._buckets[bucket_key] = bucket
+
+            self._project_timestamps.setdefault(project_name, time.time())
+            entries = bucket.get(query_key)
+            if entries is None:
+                entries = {}
+            else:
+                bucket.pop(query_key)
+            bucket[query_key] = entries
+            entries[fields_key] = copy.deepcopy(result)
+
+            while len(bucket) > self._max_size:
+                bucket.popitem(last=False)
+
+    def invalidate_project(self, project_name):
+        """Remove all cached values of a project."""
+
+        with self._lock:
+            for bucket_key in tuple(self._buckets.keys()):
+                if bucket_key[0] == project_name:
+                    self._buckets.pop(bucket_key)
+            if self._project_timestamps.pop(project_name, None) is not None:
+                self._stats.invalidations[project_name] += 1
+
+    def expire(self, lifetime):
+        """Invalidate projects which were cached longer than 'lifetime'."""
+
+        now = time.time()
+        with self._lock:
+            expired = [
+                project_name
+                for project_name, timestamp in (
+                    self._project_timestamps.items()
+                )
+                if now - timestamp > lifetime
+            ]
+            for project_name in expired:
+                self.invalidate_project(project_name)
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+            self._project_timestamps.clear()
+
+    @staticmethod
+    def _covers(cached_fields_key, fields_key):
+        if cached_fields_key is None:
+            return True
+        if fields_key is None:
+            return False
+        return all(
+            _field_is_covered(field, cached_fields_key)
+            for field in fields_key
+        )
+
+    @staticmethod
+    def _project_result(result, fields_key):
+        if isinstance(result, list):
+            return [
+                project_document(doc, fields_key)
+                for doc in result
+            ]
+        return project_document(result, fields_key)
+
+
+class EntityCacheInvalidator(threading.Thread):
+    """Thread invalidating entity cache on project collection changes.
+
+    Mongo change stream of project database is used when available. Mongo
+    server which is not part of replica set does not support change streams,
+    in that case are cached projects expired after 'poll_interval'.
+
+    Args:
+        cache (EntityCache): Cache which should be invalidated.
+        poll_interval (Optional[float]): Lifetime of project cache when
+            change streams are not available.
+    """
+
+    log = logging.getLogger("EntityCacheInvalidator")
+
+    def __init__(self, cache, poll_interval=None):
+        super(EntityCacheInvalidator, self).__init__()
+        self.daemon = True
+        if poll_interval is None:
+            poll_interval = float(
+                os.environ.get("OPENPYPE_ENTITY_CACHE_POLL_INTERVAL")
+                or DEFAULT_POLL_INTERVAL
+            )
+        self._cache = cache
+        self._poll_interval = poll_interval
+        self._stop_event = threading.Event()
+        self._use_change_stream = None
+
+    @property
+    def use_change_stream(self):
+        """Change stream is used for invalidation.
+
+        Returns:
+            Union[bool, None]: None if thread did not start yet.
+        """
+
+        return self._use_change_stream
+
+    def stop(self):
+        self._stop_event.set()
+
+    def run(self):
+        try:
+            self._watch_changes()
+            return
+        except Exception:
+            self.log.info((
+                "Mongo change streams are not available."
+                " Using polling fallback for entity cache invalidation."
+            ), exc_info=True)
+
+        self._use_change_stream = False
+        # Anything could change while stream was not watched
+        self._cache.clear()
+        while not self._stop_event.wait(self._poll_interval / 2.0):
+            self._cache.expire(self._poll_interval)
+
+    def _watch_changes(self):
+        from .mongo import get_project_database
+
+        database = get_project_database()
+        pipeline = [{"$project": {"ns": 1, "operationType": 1}}]
+        with database.watch(pipeline, max_await_time_ms=1000) as stream:
+            self._use_change_stream = True
+            while not self._stop_event.is_set():
+                change = stream.try_next()
+                if change is None:
+                    continue
+                namespace = change.get("ns") or {}
+                project_name = namespace.get("coll")
+                if project_name:
+                    self._cache.invalidate_project(project_name)
+                else:
+                    # Drop of database or invalidation of stream
+                    self._cache.clear()
+
+
+class _EntityCacheState:
+    cache = None
+    invalidator = None
+    env_checked = False
+    lock = threading.Lock()
+
+
+def enable_entity_cache(max_size=None, poll_interval=None, watch=True):
+    """Enable process-wide entity cache.
+
+    Args:
+        max_size (Optional[int]): Maximum number of cached queries per
+            project and entity type.
+        poll_interval (Optional[float]): Lifetime of project cache when
+            mongo change streams are not available.
+        watch (Optional[bool]): Start thread invalidating cache on changes
+            in database.
+
+    Returns:
+        EntityCache: Enabled cache object.
+    """
+
+    with _EntityCacheState.lock:
+        _EntityCacheState.env_checked = True
+        if _EntityCacheState.cache is None:
+            _EntityCacheState.cache = EntityCache(max_size)
+
+        if watch and _EntityCacheState.invalidator is None:
+            invalidator = EntityCacheInvalidator(
+                _EntityCacheState.cache, poll_interval
+            )
+            invalidator.start()
+            _EntityCacheState.invalidator = invalidator
+        return _EntityCacheState.cache
+
+
+def disable_entity_cache():
+    """Disable entity cache and stop its invalidation."""
+
+    with _EntityCacheState.lock:
+        _EntityCacheState.env_checked = True
+        if _EntityCacheState.invalidator is not None:
+            _EntityCacheState.invalidator.stop()
+        _EntityCacheState.invalidator = None
+        _EntityCacheState.cache = None
+
+
+def get_entity_cache():
+    """Currently enabled entity cache.
+
+    Returns:
+        Union[EntityCache, None]: Cache object or None if cache is disabled.
+    """
+
+    if not _EntityCacheState.env_checked:
+        _EntityCacheState.env_checked = True
+        value = os.environ.get("OPENPYPE_ENTITY_CACHE") or ""
+        if value.lower() in ("1", "true", "yes"):
+            enable_entity_cache()
+    return _EntityCacheState.cache
+
+
+def get_entity_cache_stats():
+    """Hit and miss counters of entity cache.
+
+    Returns:
+        Union[dict[str, Any], None]: Counters by entity type or None if cache
+            is disabled.
+    """
+
+    cache = get_entity_cache()
+    if cache is None:
+        return None
+    return cache.stats.to_data()
+
+
+def invalidate_entity_cache(project_name=None):
+    """Invalidate cached entities of a project or of all projects.
+
+    Args:
+        project_name (Optional[str]): Project which should be invalidated.
+            All projects are invalidated if 'None' is passed.
+    """
+
+    cache = _EntityCacheState.cache
+    if cache is None:
+        return
+
+    if project_name is None:
+        cache.clear()
+    else:
+        cache.invalidate_project(project_name)
+
+
+def cached_entity_query(entity_type):
+    """Decorator adding read-through cache to entity query function.
+
+    Decorated function must have 'project_name' as first argument and
+    'fields' argument. Cursor results are converted to list before they are
+    cached.
+
+    Args:
+        entity_type (str): Entity type used as cache bucket.
+    """
+
+    def decorator(func):
+        arg_names = func.__code__.co_varnames[:func.__code__.co_argcount]
+        fields_index = arg_names.index("fields")
+
+        @six.wraps(func)
+        def wrapper(project_name, *args, **kwargs):
+            cache = get_entity_cache()
+            if cache is None:
+                return func(project_name, *args, **kwargs)
+
+            args = list(args)
+            if "fields" in kwargs:
+                fields = kwargs.pop("fields")
+            elif len(args) >= fields_index:
+                fields = args.pop(fields_index - 1)
+            else:
+                fields = None
+
+            if fields is not None:
+                fields = list(fields)
+
+            args = [_materialize(arg) for arg in args]
+            kwargs = {
+                key: _materialize(value)
+                for key, value in kwargs.items()
+            }
+
+            try:
+                query_key = (
+                    func.__name__,
+                    tuple(_hashable(arg) for arg in args),
+                    _hashable(kwargs)
+                )
+            except _UnhashableQuery:
+                return func(project_name, *args, fields=fields, **kwargs)
+
+            fields_key = _fields_key(fields)
+            result = cache.get(
+                project_name, entity_type, query_key, fields_key
+            )
+            if result is not _MISSING:
+                return result
+
+            result = func(project_name, *args, fields=fields, **kwargs)
+            if result is not None and not isinstance(result, dict):
+                result = list(result)
+            cache.set(project_name, entity_type, query_key, fields_key, result)
+            return result
+        return wrapper
+    return decorator
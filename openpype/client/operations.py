@@ -10,6 +10,7 @@ from pymongo import DeleteOne, InsertOne, UpdateOne
 
 from .mongo import get_project_connection
 from .entities import get_project
+from .entity_cache import invalidate_entity_cache
 
 REMOVED_VALUE = object()
 
@@ -671,6 +672,7 @@ class OperationsSession(object):
             if bulk_writes:
                 collection = get_project_connection(project_name)
                 collection.bulk_write(bulk_writes)
+                invalidate_entity_cache(project_name)
 
     def create_entity(self, project_name, entity_type, data):
         """Fast access to 'CreateOperation'.
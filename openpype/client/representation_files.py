@@ -0,0 +1,453 @@
+"""Compact representation of frame sequences in representation 'files'.
+
+By default each published file has its own item in 'files' of representation
+document. Representation of long image sequence then contains thousands of
+items which have to be transferred on each query.
+
+Files of a sequence can be stored as single compact item instead:
+{
+    "_id": ObjectId(...),
+    "sequence": {
+        "head": "{root[work]}/project/.../renderMain_v001.",
+        "tail": ".exr",
+        "padding": 4,
+        "ranges": [[1001, 1049], [1051, 1100]]
+    },
+    "size": <sum of file sizes>,
+    "sizes": <packed uint64 array of file sizes>,
+    "mtimes": <packed float64 array of modification times>,
+    "contentHashes": {
+        "algorithm": "sha256",
+        "digests": <concatenated raw digests>
+    },
+    "sites": [...]
+}
+
+Arrays are ordered by frames and 'contentHashes' is stored only if all files
+have content hash. Site state is stored once for whole sequence so sync
+server transfers and tracks the sequence as one item.
+
+Compact items are expanded to standard file items when representations are
+queried using functions in 'openpype.client'. All expanded files have '_id'
+of the compact item.
+"""
+
+import re
+import struct
+import binascii
+import collections
+
+import six
+from bson.binary import Binary
+from pymongo import UpdateOne
+
+from .mongo import get_project_connection
+
+COMPACT_MIN_FRAMES = 2
+
+# Same as 'clique.PATTERNS["frames"]'
+_FRAME_REGEX = re.compile(r"\.(\d+)\.\D+\d?$")
+_PATH_SPLIT_REGEX = re.compile(r"[/\\]")
+
+
+def is_compact_file_info(file_info):
+    """File item is compact representation of a sequence.
+
+    Args:
+        file_info (dict[str, Any]): Item from representation 'files'.
+
+    Returns:
+        bool: Item contains sequence.
+    """
+
+    return "sequence" in file_info
+
+
+def get_file_info_path(file_info):
+    """Path of file item.
+
+    Compact items don't have path, pattern of sequence with frame
+    placeholder (e.g. 'render.%04d.exr') is returned instead.
+
+    Args:
+        file_info (dict[str, Any]): Item from representation 'files'.
+
+    Returns:
+        Union[str, None]: Path of file or pattern of sequence.
+    """
+
+    sequence = file_info.get("sequence")
+    if not sequence:
+        return file_info.get("path")
+    padding = sequence["padding"]
+    return "{}%{}d{}".format(
+        sequence["head"],
+        "0{}".format(padding) if padding else "",
+        sequence["tail"]
+    )
+
+
+def _get_source_hash(path, mtime, size):
+    # Same output as 'openpype.lib.source_hash'
+    file_name = _PATH_SPLIT_REGEX.split(path)[-1]
+    return "|".join([file_name, str(mtime), str(size)]).replace(".", ",")
+
+
+def _iter_frames(ranges):
+    for start, end in ranges:
+        for frame in range(start, end + 1):
+            yield frame
+
+
+def _frames_to_ranges(frames):
+    ranges = []
+    for frame in frames:
+        if ranges and frame == ranges[-1][1] + 1:
+            ranges[-1][1] = frame
+        else:
+            ranges.append([frame, frame])
+    return ranges
+
+
+def _unpack(value, fmt, count):
+    return struct.unpack("<{}{}".format(count, fmt), bytes(value))
+
+
+def _iter_compact_files(file_info):
+    sequence = file_info["sequence"]
+    head = sequence["head"]
+    tail = sequence["tail"]
+    padding = sequence["padding"]
+    ranges = sequence["ranges"]
+    count = sum(end - start + 1 for start, end in ranges)
+
+    sizes = _unpack(file_info["sizes"], "Q", count)
+    mtimes = _unpack(file_info["mtimes"], "d", count)
+    algorithm = digests = None
+    digest_size = 0
+    content_hashes = file_info.get("contentHashes")
+    if content_hashes:
+        algorithm = content_hashes["algorithm"]
+        digests = bytes(content_hashes["digests"])
+        digest_size = len(digests) // count
+
+    for idx, frame in enumerate(_iter_frames(ranges)):
+        path = "{}{}{}".format(head, str(frame).zfill(padding), tail)
+        item = {
+            "_id": file_info["_id"],
+            "path": path,
+            "size": sizes[idx],
+            "hash": _get_source_hash(path, mtimes[idx], sizes[idx]),
+            "sites": file_info["sites"]
+        }
+        if digests is not None:
+            digest = digests[idx * digest_size:(idx + 1) * digest_size]
+            item["contentHash"] = "{}:{}".format(
+                algorithm, binascii.hexlify(digest).decode("ascii")
+            )
+        yield item
+
+
+def iter_representation_files(file_infos):
+    """Iterate over file items with expanded compact sequences.
+
+    Frames of compact sequence are created on demand. Compact items which
+    can't be expanded (e.g. queried only with some fields) are yielded
+    as they are.
+
+    Args:
+        file_infos (Iterable[dict[str, Any]]): Representation 'files'.
+
+    Yields:
+        dict[str, Any]: File item.
+    """
+
+    for file_info in file_infos:
+        sequence = file_info.get("sequence")
+        if (
+            not sequence
+            or "ranges" not in sequence
+            or "sizes" not in file_info
+        ):
+            yield file_info
+            continue
+
+        for item in _iter_compact_files(file_info):
+            yield item
+
+
+def expand_representation_files(file_infos):
+    """Expand compact sequences in representation 'files'.
+
+    Args:
+        file_infos (Iterable[dict[str, Any]]): Representation 'files'.
+
+    Returns:
+        list[dict[str, Any]]: File items where each file has own item.
+    """
+
+    return list(iter_representation_files(file_infos))
+
+
+def expand_representation_doc(repre_doc):
+    """Expand compact sequences of representation document in place.
+
+    Args:
+        repre_doc (Union[dict[str, Any], None]): Representation document.
+
+    Returns:
+        Union[dict[str, Any], None]: Passed representation document.
+    """
+
+    if not repre_doc:
+        return repre_doc
+
+    files = repre_doc.get("files")
+    if files and any(
+        isinstance(file_info, dict) and "sequence" in file_info
+        for file_info in files
+    ):
+        repre_doc["files"] = expand_representation_files(files)
+    return repre_doc
+
+
+def _parse_file_info(file_info):
+    """Prepare data for compacting of file item.
+
+    Returns:
+        Union[tuple[tuple, int, tuple], None]: Sequence key, frame and file
+            data or None if file can't be part of compact sequence.
+    """
+
+    path = file_info.get("path")
+    source_hash = file_info.get("hash")
+    if not path or not source_hash or set(file_info) - {
+        "_id", "path", "size", "hash", "sites", "contentHash"
+    }:
+        return None
+
+    match = _FRAME_REGEX.search(path)
+    if match is None:
+        return None
+
+    hash_parts = source_hash.split("|")
+    if len(hash_parts) != 3:
+        return None
+
+    size = file_info.get("size")
+    if not isinstance(size, six.integer_types) or size < 0:
+        return None
+
+    try:
+        mtime = float(hash_parts[1].replace(",", "."))
+    except ValueError:
+        return None
+
+    # Source hash must be exactly reproducible from stored values
+    if _get_source_hash(path, mtime, size) != source_hash:
+        return None
+
+    algorithm = digest = None
+    content_hash = file_info.get("contentHash")
+    if content_hash:
+        algorithm, _, hexdigest = content_hash.partition(":")
+        try:
+            digest = binascii.unhexlify(hexdigest)
+        except (TypeError, ValueError):
+            return None
+        # Expanded hash must be the same (e.g. lowercase)
+        if binascii.hexlify(digest).decode("ascii") != hexdigest:
+            return None
+
+    start, end = match.span(1)
+    digits = match.group(1)
+    key = (path[:start], path[end:], len(digits))
+    return key, int(digits), (size, mtime, algorithm, digest)
+
+
+def _create_compact_file_info(key, frames_data, sites, file_id):
+    """Create compact item from parsed files of sequence.
+
+    Returns:
+        Union[dict[str, Any], None]: Compact item or None if files have
+            different algorithms of content hash.
+    """
+
+    head, tail, padding = key
+    frames = sorted(frames_data)
+    sizes = []
+    mtimes = []
+    algorithms = set()
+    digests = []
+    for frame in frames:
+        size, mtime, algorithm, digest = frames_data[frame]
+        sizes.append(size)
+        mtimes.append(mtime)
+        algorithms.add(algorithm)
+        digests.append(digest)
+
+    if (
+        len(algorithms) != 1
+        or len({len(digest or b"") for digest in digests}) != 1
+    ):
+        return None
+
+    compact_info = {
+        "_id": file_id,
+        "sequence": {
+            "head": head,
+            "tail": tail,
+            "padding": padding,
+            "ranges": _frames_to_ranges(frames),
+        },
+        "size": sum(sizes),
+        "sizes": Binary(struct.pack("<{}Q".format(len(sizes)), *sizes)),
+        "mtimes": Binary(struct.pack("<{}d".format(len(mtimes)), *mtimes)),
+        "sites": sites
+    }
+    algorithm = algorithms.pop()
+    if algorithm is not None:
+        compact_info["contentHashes"] = {
+            "algorithm": algorithm,
+            "digests": Binary(b"".join(digests))
+        }
+    return compact_info
+
+
+def compact_representation_files(file_infos, min_frames=COMPACT_MIN_FRAMES):
+    """Replace files of sequences with compact items.
+
+    Files are grouped to sequences by frame number between dots before
+    extension (e.g. 'render.1001.exr'). Sequence is compacted only if it has
+    at least 'min_frames' files with same sites and all data of the files
+    can be restored from compact item. Other files are kept as they are.
+
+    Args:
+        file_infos (Iterable[dict[str, Any]]): Representation 'files'.
+        min_frames (int): Minimum number of files in sequence.
+
+    Returns:
+        list[dict[str, Any]]: Representation files with compact sequences.
+    """
+
+    file_infos = list(file_infos)
+    groups = collections.OrderedDict()
+    for idx, file_info in enumerate(file_infos):
+        if not isinstance(file_info, dict) or "sequence" in file_info:
+            continue
+        parsed = _parse_file_info(file_info)
+        if parsed is None:
+            continue
+        key, frame, frame_data = parsed
+        groups.setdefault(key, []).append((idx, frame, frame_data))
+
+    compacted_by_idx = {}
+    for key, items in groups.items():
+        if len(items) < max(min_frames, 1):
+            continue
+
+        first_info = file_infos[items[0][0]]
+        sites = first_info.get("sites")
+        frames_data = {}
+        for idx, frame, frame_data in items:
+            if frame in frames_data or file_infos[idx].get("sites") != sites:
+                frames_data = None
+                break
+            frames_data[frame] = frame_data
+
+        compact_info = None
+        if frames_data is not None:
+            compact_info = _create_compact_file_info(
+                key, frames_data, sites, first_info.get("_id")
+            )
+        if compact_info is None:
+            continue
+
+        compacted_by_idx[items[0][0]] = compact_info
+        for idx, _, _ in items[1:]:
+            compacted_by_idx[idx] = None
+
+    output = []
+    for idx, file_info in enumerate(file_infos):
+        if idx not in compacted_by_idx:
+            output.append(file_info)
+            continue
+        compact_info = compacted_by_idx[idx]
+        if compact_info is not None:
+            output.append(compact_info)
+    return output
+
+
+def migrate_representation_files(
+    project_name,
+    compact=True,
+    min_frames=COMPACT_MIN_FRAMES,
+    representation_ids=None,
+    dry_run=False,
+    batch_size=100
+):
+    """Convert 'files' of representations in project.
+
+    Representations are compacted or expanded back to standard file items
+    which is needed before the project is used by a tool which does not
+    support compact sequences.
+
+    Args:
+        project_name (str): Name of project.
+        compact (bool): Compact sequences if True, expand them otherwise.
+        min_frames (int): Minimum number of files in compacted sequence.
+        representation_ids (Optional[Iterable[ObjectId]]): Convert only
+            these representations.
+        dry_run (bool): Only count changes without writing to database.
+        batch_size (int): Number of updates sent to database at once.
+
+    Returns:
+        dict[str, int]: Number of processed and changed representations
+            with number of file items before and after conversion.
+    """
+
+    conn = get_project_connection(project_name)
+    query_filter = {
+        "type": {"$in": ["representation", "archived_representation"]},
+        "files": {"$exists": True}
+    }
+    if not compact:
+        query_filter["files.sequence"] = {"$exists": True}
+    if representation_ids is not None:
+        query_filter["_id"] = {"$in": list(representation_ids)}
+
+    report = {
+        "representations": 0,
+        "changed": 0,
+        "files_before": 0,
+        "files_after": 0,
+    }
+    updates = []
+    for repre_doc in conn.find(query_filter, {"files": True}):
+        report["representations"] += 1
+        files = repre_doc["files"] or []
+        if compact:
+            new_files = compact_representation_files(files, min_frames)
+        else:
+            new_files = expand_representation_files(files)
+
+        if new_files == files:
+            continue
+
+        report["changed"] += 1
+        report["files_before"] += len(files)
+        report["files_after"] += len(new_files)
+        if dry_run:
+            continue
+
+        updates.append(UpdateOne(
+            {"_id": repre_doc["_id"]},
+            {"$set": {"files": new_files}}
+        ))
+        if len(updates) >= batch_size:
+            conn.bulk_write(updates)
+            updates = []
+
+    if updates:
+        conn.bulk_write(updates)
+    return report
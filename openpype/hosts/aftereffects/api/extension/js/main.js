@@ -68,7 +68,14 @@ function main(websocket_url){
 
     log.warn("connected"); 
 
-    RPC.addRoute('AfterEffects.open', function (data) {
+    // routes are stored to be callable from 'batch' route
+    var routes = {};
+    function addRoute(route, callback){
+        routes[route] = callback;
+        RPC.addRoute(route, callback);
+    }
+
+    addRoute('AfterEffects.open', function (data) {
         log.warn('Server called client route "open":', data);
         var escapedPath = EscapeStringForJSX(data.path);
         return runEvalScript("fileOpen('" + escapedPath +"')")
@@ -78,7 +85,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.get_metadata', function (data) {
+    addRoute('AfterEffects.get_metadata', function (data) {
         log.warn('Server called client route "get_metadata":', data);
         return runEvalScript("getMetadata()")
             .then(function(result){
@@ -87,7 +94,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.get_active_document_name', function (data) {
+    addRoute('AfterEffects.get_active_document_name', function (data) {
         log.warn('Server called client route ' + 
             '"get_active_document_name":', data);
         return runEvalScript("getActiveDocumentName()")
@@ -97,7 +104,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.get_active_document_full_name', function (data){
+    addRoute('AfterEffects.get_active_document_full_name', function (data){
         log.warn('Server called client route ' + 
             '"get_active_document_full_name":', data);
         return runEvalScript("getActiveDocumentFullName()")
@@ -107,7 +114,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.get_items', function (data) {
+    addRoute('AfterEffects.get_items', function (data) {
         log.warn('Server called client route "get_items":', data);
         return runEvalScript("getItems("  + data.comps + "," +
                                             data.folders + "," +
@@ -119,7 +126,7 @@ function main(websocket_url){
     });
 
     
-    RPC.addRoute('AfterEffects.get_selected_items', function (data) {
+    addRoute('AfterEffects.get_selected_items', function (data) {
         log.warn('Server called client route "get_selected_items":', data);
         return runEvalScript("getSelectedItems(" + data.comps + "," +
                                                    data.folders + "," +
@@ -130,7 +137,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.import_file', function (data) {
+    addRoute('AfterEffects.import_file', function (data) {
         log.warn('Server called client route "import_file":', data);
         var escapedPath = EscapeStringForJSX(data.path);
         return runEvalScript("importFile('" + escapedPath +"', " +
@@ -143,7 +150,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.replace_item', function (data) {
+    addRoute('AfterEffects.replace_item', function (data) {
         log.warn('Server called client route "replace_item":', data);
         var escapedPath = EscapeStringForJSX(data.path);
         return runEvalScript("replaceItem(" + data.item_id + ", " +
@@ -155,7 +162,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.rename_item', function (data) {
+    addRoute('AfterEffects.rename_item', function (data) {
         log.warn('Server called client route "rename_item":', data);
         return runEvalScript("renameItem(" + data.item_id + ", " +
                                          "'" + data.item_name + "')")
@@ -165,7 +172,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.delete_item', function (data) {
+    addRoute('AfterEffects.delete_item', function (data) {
         log.warn('Server called client route "delete_item":', data);
         return runEvalScript("deleteItem(" + data.item_id + ")")
             .then(function(result){
@@ -174,7 +181,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.imprint', function (data) {
+    addRoute('AfterEffects.imprint', function (data) {
         log.warn('Server called client route "imprint":', data);
         var escaped = data.payload.replace(/\n/g, "\\n");
         return runEvalScript("imprint('" + escaped +"')")
@@ -184,7 +191,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.set_label_color', function (data) {
+    addRoute('AfterEffects.set_label_color', function (data) {
         log.warn('Server called client route "set_label_color":', data);
         return runEvalScript("setLabelColor(" + data.item_id + "," +
                                                 data.color_idx + ")")
@@ -194,7 +201,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.get_work_area', function (data) {
+    addRoute('AfterEffects.get_work_area', function (data) {
         log.warn('Server called client route "get_work_area":', data);
         return runEvalScript("getWorkArea(" + data.item_id + ")")
             .then(function(result){
@@ -203,7 +210,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.set_work_area', function (data) {
+    addRoute('AfterEffects.set_work_area', function (data) {
         log.warn('Server called client route "set_work_area":', data);
         return runEvalScript("setWorkArea(" + data.item_id + ',' +
                                               data.start + ',' +
@@ -215,7 +222,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.saveAs', function (data) {
+    addRoute('AfterEffects.saveAs', function (data) {
         log.warn('Server called client route "saveAs":', data);
         var escapedPath = EscapeStringForJSX(data.image_path);
         return runEvalScript("saveAs('" + escapedPath + "', " +
@@ -226,7 +233,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.save', function (data) {
+    addRoute('AfterEffects.save', function (data) {
         log.warn('Server called client route "save":', data);
         return runEvalScript("save()")
             .then(function(result){
@@ -235,7 +242,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.get_render_info', function (data) {
+    addRoute('AfterEffects.get_render_info', function (data) {
         log.warn('Server called client route "get_render_info":', data);
         return runEvalScript("getRenderInfo(" + data.comp_id +")")
             .then(function(result){
@@ -244,7 +251,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.get_audio_url', function (data) {
+    addRoute('AfterEffects.get_audio_url', function (data) {
         log.warn('Server called client route "get_audio_url":', data);
         return runEvalScript("getAudioUrlForComp(" + data.item_id + ")")
             .then(function(result){
@@ -253,7 +260,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.import_background', function (data) {
+    addRoute('AfterEffects.import_background', function (data) {
         log.warn('Server called client route "import_background":', data);
         return runEvalScript("importBackground(" + data.comp_id + ", " + 
                                                "'" + data.comp_name + "', " +
@@ -264,7 +271,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.reload_background', function (data) {
+    addRoute('AfterEffects.reload_background', function (data) {
         log.warn('Server called client route "reload_background":', data);
         return runEvalScript("reloadBackground(" + data.comp_id + ", " + 
                                                "'" + data.comp_name + "', " +
@@ -275,7 +282,7 @@ function main(websocket_url){
             });
     });
 
-   RPC.addRoute('AfterEffects.add_item_as_layer', function (data) {
+   addRoute('AfterEffects.add_item_as_layer', function (data) {
        log.warn('Server called client route "add_item_as_layer":', data);
        return runEvalScript("addItemAsLayerToComp(" + data.comp_id + ", " +
                                                   data.item_id + "," +
@@ -286,7 +293,7 @@ function main(websocket_url){
            });
    });
 
-   RPC.addRoute('AfterEffects.render', function (data) {
+   addRoute('AfterEffects.render', function (data) {
     log.warn('Server called client route "render":', data);
     var escapedPath = EscapeStringForJSX(data.folder_url);
     return runEvalScript("render('" + escapedPath +"', " + data.comp_id + ")")
@@ -296,12 +303,12 @@ function main(websocket_url){
         });
     });
 
-    RPC.addRoute('AfterEffects.get_extension_version', function (data) {
+    addRoute('AfterEffects.get_extension_version', function (data) {
       log.warn('Server called client route "get_extension_version":', data);
       return get_extension_version();
     });
 
-    RPC.addRoute('AfterEffects.get_app_version', function (data) {
+    addRoute('AfterEffects.get_app_version', function (data) {
         log.warn('Server called client route "get_app_version":', data);
         return runEvalScript("getAppVersion()")
             .then(function(result){
@@ -310,10 +317,65 @@ function main(websocket_url){
             });
     });
 
-     RPC.addRoute('AfterEffects.close', function (data) {
+     addRoute('AfterEffects.close', function (data) {
         log.warn('Server called client route "close":', data);
         return runEvalScript("close()");
     });
+
+    addRoute('AfterEffects.batch', function (data) {
+        // runs calls one by one in order, error of a call doesn't stop
+        // following calls, returns list of {result} or {error}
+        log.warn('Server called client route "batch":', data);
+        var calls = JSON.parse(data.calls);
+        var results = [];
+        var chain = Promise.resolve();
+        calls.forEach(function (call) {
+            chain = chain.then(function () {
+                var route = routes[call.method];
+                if (!route){
+                    throw new Error("Route not found " + call.method);
+                }
+                return route(call.params);
+            }).then(function (result) {
+                results.push({"result": result === undefined ? null : result});
+            }, function (error) {
+                results.push({"error": String(error)});
+            });
+        });
+        return chain.then(function () {
+            return JSON.stringify(results);
+        });
+    });
+
+    // server caches metadata of active project until it changes, cache is
+    // used only if application dispatches these events
+    function documentChanged(document){
+        RPC.call('AfterEffects.document_changed', {"document": document})
+            .then(function (data) {}, function (error) {
+                log.warn(error);
+            });
+    }
+
+    csInterface.addEventListener("documentAfterActivate", function(event){
+        documentChanged(String(event.data));
+    });
+
+    csInterface.addEventListener("documentAfterDeactivate", function(event){
+        documentChanged("");
+    });
+
+    // metadata might be changed without server, cached metadata are dropped
+    // (undo is not dispatched, metadata are read again before each write)
+    function metadataChanged(){
+        RPC.call('AfterEffects.metadata_changed')
+            .then(function (data) {}, function (error) {
+                log.warn(error);
+            });
+    }
+
+    csInterface.addEventListener("documentAfterSave", function(event){
+        metadataChanged();
+    });
 }
 
 /** main entry point **/
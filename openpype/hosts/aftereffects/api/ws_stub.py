@@ -3,12 +3,10 @@
     Used anywhere solution is calling client methods.
 """
 import json
-import logging
 
 import attr
 
-from wsrpc_aiohttp import WebSocketAsync
-from openpype.tools.adobe_webserver.app import WebServerTool
+from openpype.tools.adobe_webserver.stub import BaseServerStub
 
 
 @attr.s
@@ -33,7 +31,7 @@ class AEItem(object):
     height = attr.ib(default=None)
 
 
-class AfterEffectsServerStub():
+class AfterEffectsServerStub(BaseServerStub):
     """
         Stub for calling function on client (Photoshop js) side.
         Expects that client is already connected (started when avalon menu
@@ -43,25 +41,7 @@ class AfterEffectsServerStub():
     PUBLISH_ICON = '\u2117 '
     LOADED_ICON = '\u25bc'
 
-    def __init__(self):
-        self.websocketserver = WebServerTool.get_instance()
-        self.client = self.get_client()
-        self.log = logging.getLogger(self.__class__.__name__)
-
-    @staticmethod
-    def get_client():
-        """
-            Return first connected client to WebSocket
-            TODO implement selection by Route
-        :return: <WebSocketAsync> client
-        """
-        clients = WebSocketAsync.get_clients()
-        client = None
-        if len(clients) > 0:
-            key = list(clients.keys())[0]
-            client = clients.get(key)
-
-        return client
+    route_name = "AfterEffects"
 
     def open(self, path):
         """
@@ -70,12 +50,12 @@ class AfterEffectsServerStub():
             path(string): file path locally
         Returns: None
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.open', path=path))
+        self.get_metadata_cache().invalidate()
+        res = self._call('open', path=path)
 
         return self._handle_return(res)
 
-    def get_metadata(self):
+    def get_metadata(self, use_cache=True):
         """
             Get complete stored JSON with metadata from AE.Metadata.Label
             field.
@@ -83,14 +63,24 @@ class AfterEffectsServerStub():
             It contains containers loaded by any Loader OR instances created
             by Creator.
 
+        Args:
+            use_cache (bool): Metadata can be used from cache, disabled when
+                metadata are modified and written back.
+
         Returns:
             (list)
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.get_metadata'))
-        metadata = self._handle_return(res)
+        metadata = self._get_cached_metadata(use_cache)
+        if metadata is not None:
+            return metadata
+
+        cache = self.get_metadata_cache()
+        token = cache.token
+        res = self._call('get_metadata')
+        metadata = self._handle_return(res) or []
+        cache.set(metadata, token)
 
-        return metadata or []
+        return metadata
 
     def read(self, item, layers_meta=None):
         """
@@ -126,9 +116,11 @@ class AfterEffectsServerStub():
                            (for performance - provide only if imprint is in
                            loop - value should be same)
         Returns: None
+
+        Inside 'batch' are metadata written only once when batch is sent.
         """
         if not items_meta:
-            items_meta = self.get_metadata()
+            items_meta = self.get_metadata(use_cache=False)
 
         result_meta = []
         # fix existing
@@ -148,36 +140,20 @@ class AfterEffectsServerStub():
         if is_new:
             result_meta.append(data)
 
-        # Ensure only valid ids are stored.
-        if not all_items:
-            # loaders create FootageItem now
-            all_items = self.get_items(comps=True,
-                                       folders=True,
-                                       footages=True)
-        item_ids = [int(item.id) for item in all_items]
-        cleaned_data = []
-        for meta in result_meta:
-            # do not added instance with nonexistend item id
-            if meta.get("members"):
-                if int(meta["members"][0]) not in item_ids:
-                    continue
-
-            cleaned_data.append(meta)
+        if self._batch is not None:
+            self._set_batch_metadata(result_meta)
+            return
 
-        payload = json.dumps(cleaned_data, indent=4)
-
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.imprint',
-                                         payload=payload))
-        return self._handle_return(res)
+        return self._write_metadata(
+            self._clean_metadata(result_meta, all_items)
+        )
 
     def get_active_document_full_name(self):
         """
             Returns absolute path of active document via ws call
         Returns(string): file name
         """
-        res = self.websocketserver.call(self.client.call(
-            'AfterEffects.get_active_document_full_name'))
+        res = self._call('get_active_document_full_name')
 
         return self._handle_return(res)
 
@@ -186,8 +162,7 @@ class AfterEffectsServerStub():
             Returns just a name of active document via ws call
         Returns(string): file name
         """
-        res = self.websocketserver.call(self.client.call(
-            'AfterEffects.get_active_document_name'))
+        res = self._call('get_active_document_name')
 
         return self._handle_return(res)
 
@@ -208,12 +183,12 @@ class AfterEffectsServerStub():
         Returns:
             (list) of namedtuples
         """
-        res = self.websocketserver.call(
-            self.client.call('AfterEffects.get_items',
-                             comps=comps,
-                             folders=folders,
-                             footages=footages)
-              )
+        res = self._call(
+            'get_items',
+            comps=comps,
+            folders=folders,
+            footages=footages
+        )
         return self._to_records(self._handle_return(res))
 
     def get_selected_items(self, comps, folders=False, footages=False):
@@ -228,12 +203,12 @@ class AfterEffectsServerStub():
             (list) of namedtuples
 
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.get_selected_items',
-                                         comps=comps,
-                                         folders=folders,
-                                         footages=footages)
-                                        )
+        res = self._call(
+            'get_selected_items',
+            comps=comps,
+            folders=folders,
+            footages=footages
+        )
         return self._to_records(self._handle_return(res))
 
     def get_item(self, item_id):
@@ -259,12 +234,12 @@ class AfterEffectsServerStub():
                 config
 
         """
-        res = self.websocketserver.call(
-            self.client.call('AfterEffects.import_file',
-                             path=path,
-                             item_name=item_name,
-                             import_options=import_options)
-            )
+        res = self._call(
+            'import_file',
+            path=path,
+            item_name=item_name,
+            import_options=import_options
+        )
         records = self._to_records(self._handle_return(res))
         if records:
             return records.pop()
@@ -278,10 +253,12 @@ class AfterEffectsServerStub():
                 item_name (string): label on item in Project list
 
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.replace_item',
-                                         item_id=item_id,
-                                         path=path, item_name=item_name))
+        res = self._call(
+            'replace_item',
+            item_id=item_id,
+            path=path,
+            item_name=item_name
+        )
 
         return self._handle_return(res)
 
@@ -293,10 +270,11 @@ class AfterEffectsServerStub():
                 item_name (string): label on item in Project list
 
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.rename_item',
-                                         item_id=item_id,
-                                         item_name=item_name))
+        res = self._queue_call(
+            'rename_item',
+            item_id=item_id,
+            item_name=item_name
+        )
 
         return self._handle_return(res)
 
@@ -306,9 +284,7 @@ class AfterEffectsServerStub():
                 item_id (int):
 
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.delete_item',
-                                         item_id=item_id))
+        res = self._queue_call('delete_item', item_id=item_id)
 
         return self._handle_return(res)
 
@@ -324,17 +300,16 @@ class AfterEffectsServerStub():
         """
         cleaned_data = []
 
-        for instance in self.get_metadata():
+        for instance in self.get_metadata(use_cache=False):
             inst_id = instance.get("instance_id") or instance.get("uuid")
             if inst_id != instance_id:
                 cleaned_data.append(instance)
 
-        payload = json.dumps(cleaned_data, indent=4)
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.imprint',
-                                         payload=payload))
+        if self._batch is not None:
+            self._set_batch_metadata(cleaned_data)
+            return
 
-        return self._handle_return(res)
+        return self._write_metadata(cleaned_data)
 
     def is_saved(self):
         # TODO
@@ -348,10 +323,11 @@ class AfterEffectsServerStub():
             item_id (int):
             color_idx (int): 0-16 Label colors from AE Project view
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.set_label_color',
-                                         item_id=item_id,
-                                         color_idx=color_idx))
+        res = self._queue_call(
+            'set_label_color',
+            item_id=item_id,
+            color_idx=color_idx
+        )
 
         return self._handle_return(res)
 
@@ -364,10 +340,7 @@ class AfterEffectsServerStub():
                 (AEItem)
 
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.get_work_area',
-                                         item_id=item_id
-                                         ))
+        res = self._call('get_work_area', item_id=item_id)
 
         records = self._to_records(self._handle_return(res))
         if records:
@@ -385,12 +358,13 @@ class AfterEffectsServerStub():
             duration (float): in seconds
             frame_rate (float): frames in seconds
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.set_work_area',
-                                         item_id=item.id,
-                                         start=start,
-                                         duration=duration,
-                                         frame_rate=frame_rate))
+        res = self._queue_call(
+            'set_work_area',
+            item_id=item.id,
+            start=start,
+            duration=duration,
+            frame_rate=frame_rate
+        )
         return self._handle_return(res)
 
     def save(self):
@@ -398,8 +372,7 @@ class AfterEffectsServerStub():
             Saves active document
         Returns: None
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.save'))
+        res = self._call('save')
 
         return self._handle_return(res)
 
@@ -411,10 +384,7 @@ class AfterEffectsServerStub():
             as_copy: <boolean>
         Returns: None
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.saveAs',
-                                         image_path=project_path,
-                                         as_copy=as_copy))
+        res = self._call('saveAs', image_path=project_path, as_copy=as_copy)
 
         return self._handle_return(res)
 
@@ -424,9 +394,7 @@ class AfterEffectsServerStub():
             Returns:
                (list) of (AEItem): with 'file_name' field
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.get_render_info',
-                                         comp_id=comp_id))
+        res = self._call('get_render_info', comp_id=comp_id)
 
         records = self._to_records(self._handle_return(res))
         return records
@@ -439,9 +407,7 @@ class AfterEffectsServerStub():
             Returns:
                 (str): absolute path url
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.get_audio_url',
-                                         item_id=item_id))
+        res = self._call('get_audio_url', item_id=item_id)
 
         return self._handle_return(res)
 
@@ -467,11 +433,12 @@ class AfterEffectsServerStub():
             Returns:
                 (AEItem): object with id of created folder, all imported images
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.import_background',
-                                         comp_id=comp_id,
-                                         comp_name=comp_name,
-                                         files=files))
+        res = self._call(
+            'import_background',
+            comp_id=comp_id,
+            comp_name=comp_name,
+            files=files
+        )
 
         records = self._to_records(self._handle_return(res))
         if records:
@@ -493,11 +460,12 @@ class AfterEffectsServerStub():
             Returns:
                 (AEItem): object with id of created folder, all imported images
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.reload_background',
-                                         comp_id=comp_id,
-                                         comp_name=comp_name,
-                                         files=files))
+        res = self._call(
+            'reload_background',
+            comp_id=comp_id,
+            comp_name=comp_name,
+            files=files
+        )
 
         records = self._to_records(self._handle_return(res))
         if records:
@@ -513,10 +481,7 @@ class AfterEffectsServerStub():
                 item_id (int): FootageItem.id
                 comp already found previously
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.add_item_as_layer',
-                                         comp_id=comp_id,
-                                         item_id=item_id))
+        res = self._call('add_item_as_layer', comp_id=comp_id, item_id=item_id)
 
         records = self._to_records(self._handle_return(res))
         if records:
@@ -529,28 +494,23 @@ class AfterEffectsServerStub():
             folder_url(string): local folder path for collecting
         Returns: None
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.render',
-                                         folder_url=folder_url,
-                                         comp_id=comp_id))
+        res = self._call('render', folder_url=folder_url, comp_id=comp_id)
         return self._handle_return(res)
 
     def get_extension_version(self):
         """Returns version number of installed extension."""
-        res = self.websocketserver.call(self.client.call(
-            'AfterEffects.get_extension_version'))
+        res = self._call('get_extension_version')
 
         return self._handle_return(res)
 
     def get_app_version(self):
         """Returns version number of installed application (17.5...)."""
-        res = self.websocketserver.call(self.client.call(
-            'AfterEffects.get_app_version'))
+        res = self._call('get_app_version')
 
         return self._handle_return(res)
 
     def close(self):
-        res = self.websocketserver.call(self.client.call('AfterEffects.close'))
+        res = self._call('close')
 
         return self._handle_return(res)
 
@@ -578,6 +538,24 @@ class AfterEffectsServerStub():
             return parsed  # parsed
         return res
 
+    def _clean_metadata(self, metadata, all_items=None):
+        # Ensure only valid ids are stored.
+        if not all_items:
+            # loaders create FootageItem now
+            all_items = self.get_items(comps=True,
+                                       folders=True,
+                                       footages=True)
+        item_ids = [int(item.id) for item in all_items]
+        cleaned_data = []
+        for meta in metadata:
+            # do not added instance with nonexistend item id
+            if meta.get("members"):
+                if int(meta["members"][0]) not in item_ids:
+                    continue
+
+            cleaned_data.append(meta)
+        return cleaned_data
+
     def _to_records(self, payload):
         """
             Converts string json representation into list of AEItem
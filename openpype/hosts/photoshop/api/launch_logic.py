@@ -316,6 +316,26 @@ class PhotoshopRoute(WebSocketRoute):
     async def ping(self):
         log.debug("someone called Photoshop route ping")
 
+    async def document_changed(self, document=None):
+        """Client notifies about change of active document.
+
+        Cached metadata of previous document are dropped.
+
+        Args:
+            document (str): Identifier of active document, empty if no
+                document is opened.
+        """
+        log.debug("Active document changed to {}".format(document))
+        PhotoshopServerStub.set_active_document(document)
+
+    async def metadata_changed(self):
+        """Client notifies that metadata of active document have changed.
+
+        Called after document was saved, reverted or its history changed.
+        """
+        log.debug("Metadata of active document changed")
+        PhotoshopServerStub.invalidate_metadata()
+
     # This method calls function on the client side
     # client functions
     async def set_context(self, project, asset, task):
@@ -4,9 +4,8 @@
 """
 import json
 import attr
-from wsrpc_aiohttp import WebSocketAsync
 
-from openpype.tools.adobe_webserver.app import WebServerTool
+from openpype.tools.adobe_webserver.stub import BaseServerStub
 
 
 @attr.s
@@ -40,7 +39,7 @@ class PSItem(object):
                          .replace(PhotoshopServerStub.LOADED_ICON, ''))
 
 
-class PhotoshopServerStub:
+class PhotoshopServerStub(BaseServerStub):
     """
         Stub for calling function on client (Photoshop js) side.
         Expects that client is already connected (started when avalon menu
@@ -50,24 +49,7 @@ class PhotoshopServerStub:
     PUBLISH_ICON = '\u2117 '
     LOADED_ICON = '\u25bc'
 
-    def __init__(self):
-        self.websocketserver = WebServerTool.get_instance()
-        self.client = self.get_client()
-
-    @staticmethod
-    def get_client():
-        """
-            Return first connected client to WebSocket
-            TODO implement selection by Route
-        :return: <WebSocketAsync> client
-        """
-        clients = WebSocketAsync.get_clients()
-        client = None
-        if len(clients) > 0:
-            key = list(clients.keys())[0]
-            client = clients.get(key)
-
-        return client
+    route_name = "Photoshop"
 
     def open(self, path):
         """Open file located at 'path' (local).
@@ -76,9 +58,8 @@ class PhotoshopServerStub:
             path(string): file path locally
         Returns: None
         """
-        self.websocketserver.call(
-            self.client.call('Photoshop.open', path=path)
-        )
+        self.get_metadata_cache().invalidate()
+        self._call('open', path=path)
 
     def read(self, layer, layers_meta=None):
         """Parses layer metadata from Headline field of active document.
@@ -146,9 +127,11 @@ class PhotoshopServerStub:
                            (for performance - provide only if imprint is in
                            loop - value should be same)
         Returns: None
+
+        Inside 'batch' are metadata written only once when batch is sent.
         """
         if not items_meta:
-            items_meta = self.get_layers_metadata()
+            items_meta = self.get_layers_metadata(use_cache=False)
 
         # json.dumps writes integer values in a dictionary to string, so
         # anticipating it here.
@@ -169,23 +152,11 @@ class PhotoshopServerStub:
         if is_new:
             result_meta.append(data)
 
-        # Ensure only valid ids are stored.
-        if not all_layers:
-            all_layers = self.get_layers()
-        layer_ids = [layer.id for layer in all_layers]
-        cleaned_data = []
+        if self._batch is not None:
+            self._set_batch_metadata(result_meta)
+            return
 
-        for item in result_meta:
-            if item.get("members"):
-                if int(item["members"][0]) not in layer_ids:
-                    continue
-
-            cleaned_data.append(item)
-
-        payload = json.dumps(cleaned_data, indent=4)
-        self.websocketserver.call(
-            self.client.call('Photoshop.imprint', payload=payload)
-        )
+        self._write_metadata(self._clean_metadata(result_meta, all_layers))
 
     def get_layers(self):
         """Returns JSON document with all(?) layers in active document.
@@ -196,9 +167,7 @@ class PhotoshopServerStub:
                                      'type': 'GUIDE'|'FG'|'BG'|'OBJ'
                                      'visible': 'true'|'false'
         """
-        res = self.websocketserver.call(
-            self.client.call('Photoshop.get_layers')
-        )
+        res = self._call('get_layers')
 
         return self._to_records(res)
 
@@ -266,9 +235,7 @@ class PhotoshopServerStub:
             <PSItem>
         """
         enhanced_name = self.PUBLISH_ICON + name
-        ret = self.websocketserver.call(
-            self.client.call('Photoshop.create_group', name=enhanced_name)
-        )
+        ret = self._call('create_group', name=enhanced_name)
         # create group on PS is asynchronous, returns only id
         return PSItem(id=ret, name=name, group=True)
 
@@ -279,11 +246,7 @@ class PhotoshopServerStub:
             (Layer)
         """
         enhanced_name = self.PUBLISH_ICON + name
-        res = self.websocketserver.call(
-            self.client.call(
-                'Photoshop.group_selected_layers', name=enhanced_name
-            )
-        )
+        res = self._call('group_selected_layers', name=enhanced_name)
         res = self._to_records(res)
         if res:
             rec = res.pop()
@@ -296,9 +259,7 @@ class PhotoshopServerStub:
 
         Returns: <list of Layer('id':XX, 'name':"YYY")>
         """
-        res = self.websocketserver.call(
-            self.client.call('Photoshop.get_selected_layers')
-        )
+        res = self._call('get_selected_layers')
         return self._to_records(res)
 
     def select_layers(self, layers):
@@ -308,12 +269,7 @@ class PhotoshopServerStub:
             layers: <list of Layer('id':XX, 'name':"YYY")>
         """
         layers_id = [str(lay.id) for lay in layers]
-        self.websocketserver.call(
-            self.client.call(
-                'Photoshop.select_layers',
-                layers=json.dumps(layers_id)
-            )
-        )
+        self._queue_call('select_layers', layers=json.dumps(layers_id))
 
     def get_active_document_full_name(self):
         """Returns full name with path of active document via ws call
@@ -321,9 +277,7 @@ class PhotoshopServerStub:
         Returns(string):
             full path with name
         """
-        res = self.websocketserver.call(
-            self.client.call('Photoshop.get_active_document_full_name')
-        )
+        res = self._call('get_active_document_full_name')
 
         return res
 
@@ -333,9 +287,7 @@ class PhotoshopServerStub:
         Returns(string):
             file name
         """
-        return self.websocketserver.call(
-            self.client.call('Photoshop.get_active_document_name')
-        )
+        return self._call('get_active_document_name')
 
     def is_saved(self):
         """Returns true if no changes in active document
@@ -343,15 +295,11 @@ class PhotoshopServerStub:
         Returns:
             <boolean>
         """
-        return self.websocketserver.call(
-            self.client.call('Photoshop.is_saved')
-        )
+        return self._call('is_saved')
 
     def save(self):
         """Saves active document"""
-        self.websocketserver.call(
-            self.client.call('Photoshop.save')
-        )
+        self._call('save')
 
     def saveAs(self, image_path, ext, as_copy):
         """Saves active document to psd (copy) or png or jpg
@@ -362,14 +310,7 @@ class PhotoshopServerStub:
             as_copy: <boolean>
         Returns: None
         """
-        self.websocketserver.call(
-            self.client.call(
-                'Photoshop.saveAs',
-                image_path=image_path,
-                ext=ext,
-                as_copy=as_copy
-            )
-        )
+        self._call('saveAs', image_path=image_path, ext=ext, as_copy=as_copy)
 
     def set_visible(self, layer_id, visibility):
         """Set layer with 'layer_id' to 'visibility'
@@ -379,12 +320,10 @@ class PhotoshopServerStub:
             visibility: <true - set visible, false - hide>
         Returns: None
         """
-        self.websocketserver.call(
-            self.client.call(
-                'Photoshop.set_visible',
-                layer_id=layer_id,
-                visibility=visibility
-            )
+        self._queue_call(
+            'set_visible',
+            layer_id=layer_id,
+            visibility=visibility
         )
 
     def hide_all_others_layers(self, layers):
@@ -408,14 +347,19 @@ class PhotoshopServerStub:
         """
         if not layers:
             layers = self.get_layers()
-        for layer in layers:
-            if layer.visible and layer.id not in extract_ids:
-                self.set_visible(layer.id, False)
+        with self.batch():
+            for layer in layers:
+                if layer.visible and layer.id not in extract_ids:
+                    self.set_visible(layer.id, False)
 
-    def get_layers_metadata(self):
+    def get_layers_metadata(self, use_cache=True):
         """Reads layers metadata from Headline from active document in PS.
         (Headline accessible by File > File Info)
 
+        Args:
+            use_cache (bool): Metadata can be used from cache, disabled when
+                metadata are modified and written back.
+
         Returns:
             (list)
             example:
@@ -424,7 +368,13 @@ class PhotoshopServerStub:
                       "asset":"Town"}}
                 8 is layer(group) id - used for deletion, update etc.
         """
-        res = self.websocketserver.call(self.client.call('Photoshop.read'))
+        layers_data = self._get_cached_metadata(use_cache)
+        if layers_data is not None:
+            return layers_data
+
+        cache = self.get_metadata_cache()
+        token = cache.token
+        res = self._call('read')
         layers_data = []
         try:
             if res:
@@ -438,6 +388,7 @@ class PhotoshopServerStub:
                 if layer_meta.get("schema") != "openpype:container-2.0":
                     layer_meta["members"] = [str(layer_id)]
             layers_data = list(layers_data.values())
+        cache.set(layers_data, token)
         return layers_data
 
     def import_smart_object(self, path, layer_name, as_reference=False):
@@ -450,13 +401,11 @@ class PhotoshopServerStub:
             as_reference (bool): pull in content or reference
         """
         enhanced_name = self.LOADED_ICON + layer_name
-        res = self.websocketserver.call(
-            self.client.call(
-                'Photoshop.import_smart_object',
-                path=path,
-                name=enhanced_name,
-                as_reference=as_reference
-            )
+        res = self._call(
+            'import_smart_object',
+            path=path,
+            name=enhanced_name,
+            as_reference=as_reference
         )
         rec = self._to_records(res).pop()
         if rec:
@@ -473,13 +422,11 @@ class PhotoshopServerStub:
                 same smart object was loaded
         """
         enhanced_name = self.LOADED_ICON + layer_name
-        self.websocketserver.call(
-            self.client.call(
-                'Photoshop.replace_smart_object',
-                layer_id=layer.id,
-                path=path,
-                name=enhanced_name
-            )
+        self._call(
+            'replace_smart_object',
+            layer_id=layer.id,
+            path=path,
+            name=enhanced_name
         )
 
     def delete_layer(self, layer_id):
@@ -488,9 +435,7 @@ class PhotoshopServerStub:
         Args:
             layer_id (int): id of layer to delete
         """
-        self.websocketserver.call(
-            self.client.call('Photoshop.delete_layer', layer_id=layer_id)
-        )
+        self._queue_call('delete_layer', layer_id=layer_id)
 
     def rename_layer(self, layer_id, name):
         """Renames specific layer by it's id.
@@ -499,41 +444,47 @@ class PhotoshopServerStub:
             layer_id (int): id of layer to delete
             name (str): new name
         """
-        self.websocketserver.call(
-            self.client.call(
-                'Photoshop.rename_layer',
-                layer_id=layer_id,
-                name=name
-            )
-        )
+        self._queue_call('rename_layer', layer_id=layer_id, name=name)
 
     def remove_instance(self, instance_id):
         cleaned_data = []
 
-        for item in self.get_layers_metadata():
+        for item in self.get_layers_metadata(use_cache=False):
             inst_id = item.get("instance_id") or item.get("uuid")
             if inst_id != instance_id:
                 cleaned_data.append(item)
 
-        payload = json.dumps(cleaned_data, indent=4)
+        if self._batch is not None:
+            self._set_batch_metadata(cleaned_data)
+            return
 
-        self.websocketserver.call(
-            self.client.call('Photoshop.imprint', payload=payload)
-        )
+        self._write_metadata(cleaned_data)
 
     def get_extension_version(self):
         """Returns version number of installed extension."""
-        return self.websocketserver.call(
-            self.client.call('Photoshop.get_extension_version')
-        )
+        return self._call('get_extension_version')
 
     def close(self):
         """Shutting down PS and process too.
 
             For webpublishing only.
         """
-        # TODO change client.call to method with checks for client
-        self.websocketserver.call(self.client.call('Photoshop.close'))
+        self._call('close')
+
+    def _clean_metadata(self, metadata, all_items=None):
+        # Ensure only valid ids are stored.
+        if not all_items:
+            all_items = self.get_layers()
+        layer_ids = [layer.id for layer in all_items]
+        cleaned_data = []
+
+        for item in metadata:
+            if item.get("members"):
+                if int(item["members"][0]) not in layer_ids:
+                    continue
+
+            cleaned_data.append(item)
+        return cleaned_data
 
     def _to_records(self, res):
         """Converts string json representation into list of PSItem for
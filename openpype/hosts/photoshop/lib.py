@@ -24,9 +24,11 @@ class PSAutoCreator(AutoCreator):
 
     def update_instances(self, update_list):
         self.log.debug("update_list:: {}".format(update_list))
-        for created_inst, _changes in update_list:
-            api.stub().imprint(created_inst.get("instance_id"),
-                               created_inst.data_to_store())
+        stub = api.stub()
+        with stub.batch():
+            for created_inst, _changes in update_list:
+                stub.imprint(created_inst.get("instance_id"),
+                             created_inst.data_to_store())
 
     def create(self, options=None):
         existing_instance = None
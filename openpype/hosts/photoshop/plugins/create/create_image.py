@@ -133,12 +133,14 @@ class ImageCreator(Creator):
 
     def update_instances(self, update_list):
         self.log.debug("update_list:: {}".format(update_list))
-        for created_inst, _changes in update_list:
-            if created_inst.get("layer"):
-                # not storing PSItem layer to metadata
-                created_inst.pop("layer")
-            api.stub().imprint(created_inst.get("instance_id"),
-                               created_inst.data_to_store())
+        stub = api.stub()
+        with stub.batch():
+            for created_inst, _changes in update_list:
+                if created_inst.get("layer"):
+                    # not storing PSItem layer to metadata
+                    created_inst.pop("layer")
+                stub.imprint(created_inst.get("instance_id"),
+                             created_inst.data_to_store())
 
     def remove_instances(self, instances):
         for instance in instances:
@@ -1,8 +1,23 @@
 import os
+import io
+import sys
+import math
 import shutil
+import hashlib
 import collections
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
 from PIL import Image, ImageDraw
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Minimum number of frames composited by one process of process pool
+COMPOSITING_FRAMES_PER_WORKER = 10
+
 
 def backwards_id_conversion(data_by_layer_id):
     """Convert layer ids to strings from integers."""
@@ -543,7 +558,7 @@ def cleanup_rendered_layers(filepaths_by_layer_id):
 def composite_rendered_layers(
     layers_data, filepaths_by_layer_id,
     range_start, range_end,
-    dst_filepaths_by_frame, cleanup=True
+    dst_filepaths_by_frame, cleanup=True, workers=None
 ):
     """Composite multiple rendered layers by their position.
 
@@ -564,6 +579,8 @@ def composite_rendered_layers(
             image after compositing will be stored. Path must not clash with
             source filepaths.
         cleanup(bool): Remove all source filepaths when done with compositing.
+        workers(int): Maximum number of processes used for compositing.
+            Number of CPUs is used by default.
     """
     # Prepare layers by their position
     #   - position tells in which order will compositing happen
@@ -579,6 +596,8 @@ def composite_rendered_layers(
     transparent_filepaths = set()
     # Store first final filepath
     first_dst_filepath = None
+    # Source and destination filepaths of frames which must be composited
+    compositing_jobs = []
     for frame_idx in range(range_start, range_end + 1):
         dst_filepath = dst_filepaths_by_frame[frame_idx]
         src_filepaths = []
@@ -605,7 +624,9 @@ def composite_rendered_layers(
                 copy_render_file(src_filepath, dst_filepath)
 
         else:
-            composite_images(src_filepaths, dst_filepath)
+            compositing_jobs.append((src_filepaths, dst_filepath))
+
+    composite_frames(compositing_jobs, workers)
 
     # Store first transparent filepath to be able copy it
     transparent_filepath = None
@@ -632,6 +653,10 @@ def composite_images(input_image_paths, output_filepath):
     if not input_image_paths:
         raise ValueError("Nothing to composite.")
 
+    if numpy is not None:
+        LayersCompositor().composite(input_image_paths, output_filepath)
+        return
+
     img_obj = None
     for image_filepath in input_image_paths:
         _img_obj = Image.open(image_filepath)
@@ -642,6 +667,379 @@ def composite_images(input_image_paths, output_filepath):
     img_obj.save(output_filepath)
 
 
+class _LayerImage(object):
+    """Decoded layer image used by 'LayersCompositor'.
+
+    Args:
+        array (numpy.ndarray): RGBA uint8 array with shape
+            (height, width, 4).
+        bbox (Optional[tuple[int, int, int, int]]): Bounding box (left,
+            upper, right, lower) of pixels with non-zero alpha, None if
+            image is fully transparent. Calculated if not passed.
+    """
+
+    def __init__(self, array, bbox=False):
+        if bbox is False:
+            bbox = _get_alpha_bbox(array)
+        self.array = array
+        self.bbox = bbox
+        self._premultiplied = None
+
+    @property
+    def region(self):
+        left, upper, right, lower = self.bbox
+        return slice(upper, lower), slice(left, right)
+
+    def get_premultiplied(self):
+        """Premultiplied color and inverted alpha of visible region.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: Planar float32 color with
+                shape (3, height, width) and '1 - alpha' of visible region.
+        """
+        if self._premultiplied is None:
+            region = self.array[self.region]
+            scale = numpy.float32(1.0 / 255.0)
+            alpha = numpy.multiply(region[..., 3], scale, dtype=numpy.float32)
+            rgb = numpy.empty((3, ) + alpha.shape, dtype=numpy.float32)
+            for channel in range(3):
+                numpy.multiply(region[..., channel], alpha, out=rgb[channel])
+            rgb *= scale
+            numpy.subtract(1.0, alpha, out=alpha)
+            self._premultiplied = (rgb, alpha)
+        return self._premultiplied
+
+
+def _get_alpha_bbox(array):
+    """Bounding box of pixels with non-zero alpha in RGBA array."""
+    alpha = array[..., 3]
+    rows = numpy.flatnonzero(alpha.any(axis=1))
+    if not rows.size:
+        return None
+    columns = numpy.flatnonzero(alpha.any(axis=0))
+    return (
+        int(columns[0]), int(rows[0]),
+        int(columns[-1]) + 1, int(rows[-1]) + 1
+    )
+
+
+def _merge_bboxes(bbox, other_bbox):
+    if bbox is None:
+        return other_bbox
+    if other_bbox is None:
+        return bbox
+    return (
+        min(bbox[0], other_bbox[0]),
+        min(bbox[1], other_bbox[1]),
+        max(bbox[2], other_bbox[2]),
+        max(bbox[3], other_bbox[3]),
+    )
+
+
+class LayersCompositor(object):
+    """Composite RGBA images with premultiplied alpha using numpy.
+
+    Compositor is meant to be used for sequence of frames where layers
+    hold drawings for multiple frames:
+    - decoded layers are kept by hash of file content until next frame
+        so held drawings are decoded and premultiplied only once
+    - frame with same content of all layers as one of previous frames is
+        copied instead of compositing
+    - result of bottom layers which are same as in previous frame is kept
+        and used as start of compositing of next frames
+    - only region with visible pixels of each layer is composited
+    - buffers are reused while resolution does not change
+    """
+
+    def __init__(self):
+        if numpy is None:
+            raise RuntimeError("Compositing requires 'numpy' module.")
+        # Decoded layers of previous frame by hash of file content
+        self._layers_by_hash = {}
+        # Output filepath by content hashes of composited layers
+        self._output_by_key = {}
+        self._previous_key = ()
+        # Composited bottom layers (key, bbox, rgb, alpha)
+        self._snapshot = None
+        self._buffers = None
+
+    def composite(self, input_image_paths, output_filepath):
+        """Composite images in order from passed list to output.
+
+        Raises:
+            ValueError: When entered list is empty or images have
+                different resolution.
+        """
+        if not input_image_paths:
+            raise ValueError("Nothing to composite.")
+
+        contents = []
+        hashes = []
+        for image_filepath in input_image_paths:
+            with open(image_filepath, "rb") as stream:
+                content = stream.read()
+            contents.append(content)
+            hashes.append(hashlib.sha1(content).hexdigest())
+
+        key = tuple(hashes)
+        src_filepath = self._output_by_key.get(key)
+        if src_filepath is not None and os.path.exists(src_filepath):
+            if os.path.exists(output_filepath):
+                os.remove(output_filepath)
+            copy_render_file(src_filepath, output_filepath)
+            return
+
+        layers_by_hash = {}
+        layers = []
+        for content_hash, content in zip(hashes, contents):
+            layer = layers_by_hash.get(content_hash)
+            if layer is None:
+                layer = self._layers_by_hash.get(content_hash)
+            if layer is None:
+                layer = self._decode(content)
+            layers_by_hash[content_hash] = layer
+            layers.append(layer)
+        self._layers_by_hash = layers_by_hash
+
+        result = self._composite_layers(layers, key)
+        Image.fromarray(result, "RGBA").save(output_filepath)
+        self._output_by_key[key] = output_filepath
+
+    def composite_arrays(self, layers):
+        """Composite decoded layers.
+
+        Args:
+            layers (list[numpy.ndarray]): RGBA uint8 arrays with shape
+                (height, width, 4) from bottom to top.
+
+        Returns:
+            numpy.ndarray: Composited RGBA uint8 array. Array may be reused
+                by next call.
+        """
+        if not layers:
+            raise ValueError("Nothing to composite.")
+        return self._composite_layers([_LayerImage(layer) for layer in layers])
+
+    def _prepare_snapshot(self, key):
+        """Find out which bottom layers can be skipped using snapshot.
+
+        Returns:
+            tuple[int, Union[tuple, None], Union[int, None]]: Index of first
+                layer to composite, usable snapshot and index of layer
+                before which new snapshot should be stored.
+        """
+        previous_key = self._previous_key
+        self._previous_key = key
+        same_count = 0
+        for content_hash, previous_hash in zip(key, previous_key):
+            if content_hash != previous_hash:
+                break
+            same_count += 1
+
+        start_idx = 0
+        snapshot = self._snapshot
+        if snapshot is not None:
+            snapshot_key = snapshot[0]
+            if key[:len(snapshot_key)] == snapshot_key:
+                start_idx = len(snapshot_key)
+            else:
+                snapshot = None
+
+        store_idx = None
+        if start_idx < same_count < len(key):
+            store_idx = same_count
+        return start_idx, snapshot, store_idx
+
+    def _composite_layers(self, layers, key=None):
+        height, width = layers[0].array.shape[:2]
+        for layer in layers:
+            if layer.array.shape != (height, width, 4):
+                raise ValueError("Images do not match")
+
+        start_idx = 0
+        snapshot = store_idx = None
+        if key is not None:
+            start_idx, snapshot, store_idx = self._prepare_snapshot(key)
+
+        bbox = None
+        if snapshot is not None:
+            bbox = snapshot[1]
+        visible_layers = []
+        for layer in layers[start_idx:]:
+            if layer.bbox is not None:
+                visible_layers.append(layer)
+                bbox = _merge_bboxes(bbox, layer.bbox)
+
+        if bbox is None:
+            return numpy.zeros_like(layers[0].array)
+
+        # Single visible layer doesn't need any compositing
+        if (
+            len(visible_layers) == 1
+            and store_idx is None
+            and (snapshot is None or snapshot[1] is None)
+        ):
+            return visible_layers[0].array
+
+        # Buffers are planar, broadcasting of alpha over interleaved
+        #   channels is much slower
+        rgb, alpha, scale, output = self._get_buffers(height, width)
+        union = (slice(bbox[1], bbox[3]), slice(bbox[0], bbox[2]))
+        rgb[(slice(None), ) + union] = 0.0
+        alpha[union] = 0.0
+
+        acc_bbox = None
+        if snapshot is not None and snapshot[1] is not None:
+            _, acc_bbox, snapshot_rgb, snapshot_alpha = snapshot
+            region = (
+                slice(acc_bbox[1], acc_bbox[3]),
+                slice(acc_bbox[0], acc_bbox[2])
+            )
+            rgb[(slice(None), ) + region] = snapshot_rgb
+            alpha[region] = snapshot_alpha
+
+        for idx in range(start_idx, len(layers)):
+            if idx == store_idx:
+                self._store_snapshot(key[:idx], acc_bbox, rgb, alpha)
+
+            layer = layers[idx]
+            if layer.bbox is None:
+                continue
+            acc_bbox = _merge_bboxes(acc_bbox, layer.bbox)
+            layer_rgb, inv_alpha = layer.get_premultiplied()
+            region = layer.region
+            # 'over' operator: dst = src + dst * (1 - src_alpha)
+            dst_rgb = rgb[(slice(None), ) + region]
+            dst_rgb *= inv_alpha
+            dst_rgb += layer_rgb
+            # Alpha: 1 - (1 - dst_alpha) * (1 - src_alpha)
+            dst_alpha = alpha[region]
+            numpy.subtract(1.0, dst_alpha, out=dst_alpha)
+            dst_alpha *= inv_alpha
+            numpy.subtract(1.0, dst_alpha, out=dst_alpha)
+
+        # Convert back to straight alpha, premultiplied color is never
+        #   higher than alpha so values don't overflow 255
+        union_rgb = rgb[(slice(None), ) + union]
+        union_alpha = alpha[union]
+        union_scale = scale[union]
+        union_scale.fill(0.0)
+        numpy.divide(255.0, union_alpha, out=union_scale,
+                     where=union_alpha > 0.0)
+        union_rgb *= union_scale
+        union_rgb += 0.5
+        union_alpha *= 255.0
+        union_alpha += 0.5
+
+        output.fill(0)
+        union_output = output[union]
+        for channel in range(3):
+            union_output[..., channel] = union_rgb[channel]
+        union_output[..., 3] = union_alpha
+        return output
+
+    def _store_snapshot(self, key, bbox, rgb, alpha):
+        if bbox is None:
+            self._snapshot = (key, None, None, None)
+            return
+        region = (slice(bbox[1], bbox[3]), slice(bbox[0], bbox[2]))
+        self._snapshot = (
+            key,
+            bbox,
+            rgb[(slice(None), ) + region].copy(),
+            alpha[region].copy()
+        )
+
+    def _get_buffers(self, height, width):
+        buffers = self._buffers
+        if buffers is None or buffers[-1].shape[:2] != (height, width):
+            buffers = (
+                numpy.empty((3, height, width), dtype=numpy.float32),
+                numpy.empty((height, width), dtype=numpy.float32),
+                numpy.empty((height, width), dtype=numpy.float32),
+                numpy.empty((height, width, 4), dtype=numpy.uint8),
+            )
+            self._buffers = buffers
+        return buffers
+
+    @staticmethod
+    def _decode(content):
+        img_obj = Image.open(io.BytesIO(content))
+        if img_obj.mode != "RGBA":
+            img_obj = img_obj.convert("RGBA")
+        return _LayerImage(
+            numpy.asarray(img_obj), img_obj.getchannel("A").getbbox()
+        )
+
+
+def _composite_frames(compositing_jobs):
+    """Composite frames in current process.
+
+    Used also as function of process pool so must be importable.
+    """
+    if numpy is None:
+        for src_filepaths, dst_filepath in compositing_jobs:
+            composite_images(src_filepaths, dst_filepath)
+        return
+
+    compositor = LayersCompositor()
+    for src_filepaths, dst_filepath in compositing_jobs:
+        compositor.composite(src_filepaths, dst_filepath)
+
+
+def _get_compositing_workers(jobs_count, workers=None):
+    # Process pool of frozen build would start new processes of build
+    if getattr(sys, "frozen", False):
+        return 1
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, jobs_count // COMPOSITING_FRAMES_PER_WORKER))
+
+
+def composite_frames(compositing_jobs, workers=None):
+    """Composite multiple frames, spread over process pool when possible.
+
+    Frames are split to continuous chunks so held drawings in a chunk are
+    composited only once. Frames are composited in current process if
+    there are only few of them, process pool can't be used or fails to
+    start.
+
+    Args:
+        compositing_jobs (list[tuple[list[str], str]]): Source filepaths
+            ordered from bottom to top and output filepath of each frame.
+        workers (Optional[int]): Maximum number of processes. Number of
+            CPUs is used by default.
+    """
+    workers = _get_compositing_workers(len(compositing_jobs), workers)
+    if workers < 2:
+        _composite_frames(compositing_jobs)
+        return
+
+    chunk_size = int(math.ceil(len(compositing_jobs) / float(workers)))
+    chunks = [
+        compositing_jobs[idx:idx + chunk_size]
+        for idx in range(0, len(compositing_jobs), chunk_size)
+    ]
+    failed_chunks = []
+    try:
+        with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            futures = [
+                executor.submit(_composite_frames, chunk)
+                for chunk in chunks
+            ]
+            for chunk, future in zip(chunks, futures):
+                try:
+                    future.result()
+                except BrokenProcessPool:
+                    failed_chunks.append(chunk)
+    except OSError:
+        failed_chunks = chunks
+
+    for chunk in failed_chunks:
+        _composite_frames(chunk)
+
+
 def rename_filepaths_by_frame_start(
     filepaths_by_frame, range_start, range_end, new_frame_start
 ):
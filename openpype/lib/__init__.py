@@ -91,6 +91,8 @@ from .dateutils import (
 
 from .python_module_tools import (
     import_filepath,
+    import_filepath_cached,
+    get_file_fingerprint,
     modules_from_path,
     recursive_bases_from_class,
     classes_from_module,
@@ -99,10 +101,14 @@ from .python_module_tools import (
 
 from .profiles_filtering import (
     compile_list_of_regexes,
-    filter_profiles
+    filter_profiles,
+    ProfileMatcher,
+    get_profile_matcher,
 )
 
 from .transcoding import (
+    MediaInfoCache,
+    get_media_info_cache,
     get_transcode_temp_directory,
     should_convert_for_ffmpeg,
     convert_for_ffmpeg,
@@ -167,6 +173,7 @@ from .plugin_tools import (
     get_subset_name_with_asset_doc,
     prepare_template_data,
     source_hash,
+    source_hash_from_stat,
 )
 
 from .path_tools import (
@@ -181,6 +188,11 @@ from .path_tools import (
     get_project_basic_paths,
 )
 
+from .sequence_tools import (
+    FrameSequence,
+    detect_sequences,
+)
+
 from .openpype_version import (
     op_version_control_available,
     get_openpype_version,
@@ -239,11 +251,15 @@ __all__ = [
     "FileDefItem",
 
     "import_filepath",
+    "import_filepath_cached",
+    "get_file_fingerprint",
     "modules_from_path",
     "recursive_bases_from_class",
     "classes_from_module",
     "import_module_from_dirpath",
 
+    "MediaInfoCache",
+    "get_media_info_cache",
     "get_transcode_temp_directory",
     "should_convert_for_ffmpeg",
     "convert_for_ffmpeg",
@@ -295,11 +311,14 @@ __all__ = [
     "compile_list_of_regexes",
 
     "filter_profiles",
+    "ProfileMatcher",
+    "get_profile_matcher",
 
     "TaskNotSetError",
     "get_subset_name",
     "get_subset_name_with_asset_doc",
     "source_hash",
+    "source_hash_from_stat",
 
     "format_file_size",
     "collect_frames",
@@ -308,6 +327,9 @@ __all__ = [
     "get_version_from_path",
     "get_last_version_from_path",
 
+    "FrameSequence",
+    "detect_sequences",
+
     "merge_dict",
     "TemplateMissingKey",
     "TemplateUnsolved",
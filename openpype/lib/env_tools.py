@@ -1,4 +1,8 @@
 import os
+import json
+import time
+import hashlib
+import tempfile
 
 
 def env_value_to_bool(env_key=None, value=None, default=False):
@@ -69,3 +73,105 @@ def get_paths_from_environ(env_key=None, env_value=None, return_first=False):
         return None
     # Return all existing paths from environment variable
     return existing_paths
+
+
+def get_settings_state_hash(project_name=None):
+    """Hash of last saved state of system and project settings.
+
+    Hash changes when settings are saved so it can be used to validate
+    cached values based on settings.
+
+    Args:
+        project_name (Optional[str]): Project name for which project
+            settings state is used.
+
+    Returns:
+        str: Hash of settings state.
+    """
+    from openpype.settings.lib import (
+        get_system_last_saved_info,
+        get_project_last_saved_info,
+    )
+
+    states = [get_system_last_saved_info().to_data()]
+    if project_name:
+        states.append(get_project_last_saved_info(project_name).to_data())
+
+    content = json.dumps(states, sort_keys=True, default=str)
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+def read_environment_cache(cache_path, ttl=None):
+    """Read environment stored by 'write_environment_cache'.
+
+    Cache files are replaced atomically so reading does not need any lock.
+
+    Args:
+        cache_path (str): Path to cache file.
+        ttl (Optional[float]): Max age of cache in seconds.
+
+    Returns:
+        Union[dict[str, Any], None]: Cache data with "env", "created" and
+            "settings_hash" keys or None if cache is not available.
+    """
+    try:
+        with open(cache_path, "r") as stream:
+            data = json.load(stream)
+    except (IOError, OSError, ValueError):
+        return None
+
+    if not isinstance(data, dict) or "env" not in data:
+        return None
+
+    if ttl is not None and (time.time() - data.get("created", 0)) > ttl:
+        return None
+    return data
+
+
+def write_environment_cache(cache_path, env, settings_hash=None):
+    """Store environment to a cache file.
+
+    Data are written to temporary file which then replaces the cache file
+    so concurrent readers never read partially written file.
+
+    Args:
+        cache_path (str): Path to cache file.
+        env (dict[str, str]): Environment to store.
+        settings_hash (Optional[str]): Hash of settings state used to
+            create the environment.
+
+    Returns:
+        bool: Cache was stored.
+    """
+    dirpath = os.path.dirname(cache_path)
+    data = {
+        "created": time.time(),
+        "settings_hash": settings_hash,
+        "env": env
+    }
+    tmp_path = None
+    try:
+        if not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=os.path.basename(cache_path), suffix=".tmp", dir=dirpath
+        )
+        with os.fdopen(fd, "w") as stream:
+            json.dump(data, stream)
+
+        if hasattr(os, "replace"):
+            os.replace(tmp_path, cache_path)
+        else:
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
+            os.rename(tmp_path, cache_path)
+        return True
+
+    except (IOError, OSError):
+        if tmp_path and os.path.exists(tmp_path):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    return False
@@ -2,6 +2,8 @@ import os
 import logging
 import sys
 import errno
+import hashlib
+import threading
 import six
 
 from openpype.lib import create_hard_link
@@ -12,6 +14,172 @@ if sys.platform == "win32":
 else:
     from shutil import copyfile
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    # Python 2 without 'futures' backport
+    ThreadPoolExecutor = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+if sys.platform.startswith("linux"):
+    import fcntl
+else:
+    fcntl = None
+
+# Linux ioctl request code to clone file content (copy-on-write)
+_FICLONE = 0x40049409
+
+DEFAULT_TRANSFER_WORKERS = 8
+DEFAULT_TRANSFER_CHUNK_SIZE = 16
+# Size of blocks used for hashing of file content
+HASH_BLOCK_SIZE = 4 * 1024 * 1024
+
+
+def _reflink_file(src, dst):
+    """Clone file content using copy-on-write (btrfs, xfs, ...)."""
+
+    if fcntl is None:
+        raise OSError(errno.ENOTSUP, "Reflink is not supported")
+
+    with open(src, "rb") as src_stream:
+        with open(dst, "wb") as dst_stream:
+            fcntl.ioctl(dst_stream.fileno(), _FICLONE, src_stream.fileno())
+
+
+def _copy_file_range(src, dst):
+    """Copy file content in kernel (server side copy on NFS 4.2)."""
+
+    if not hasattr(os, "copy_file_range"):
+        raise OSError(errno.ENOTSUP, "copy_file_range is not supported")
+
+    with open(src, "rb") as src_stream:
+        with open(dst, "wb") as dst_stream:
+            remaining = os.fstat(src_stream.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(
+                    src_stream.fileno(), dst_stream.fileno(), remaining
+                )
+                if copied == 0:
+                    break
+                remaining -= copied
+
+    if remaining > 0:
+        raise OSError(errno.EIO, "copy_file_range did not copy whole file")
+
+
+def create_content_hasher(algorithm):
+    """Create hash object for file content hashing.
+
+    Args:
+        algorithm (str): Name of hash algorithm. 'xxhash' (xxh64) if
+            'xxhash' module is available or any algorithm from 'hashlib'.
+
+    Returns:
+        Any: Object with 'update' and 'hexdigest' methods.
+    """
+
+    if algorithm == "xxhash":
+        if xxhash is None:
+            raise ValueError("Python module 'xxhash' is not available")
+        return xxhash.xxh64()
+    return hashlib.new(algorithm)
+
+
+def _copy_file_with_hash(src, dst, hasher):
+    """Copy file content in blocks and feed them to hasher."""
+
+    with open(src, "rb") as src_stream:
+        with open(dst, "wb") as dst_stream:
+            while True:
+                block = src_stream.read(HASH_BLOCK_SIZE)
+                if not block:
+                    break
+                hasher.update(block)
+                dst_stream.write(block)
+
+
+def _hash_file(path, hasher):
+    with open(path, "rb") as stream:
+        while True:
+            block = stream.read(HASH_BLOCK_SIZE)
+            if not block:
+                break
+            hasher.update(block)
+
+
+class DirectoryStatCache(object):
+    """Cache of file stats collected with one scan per directory.
+
+    Stats of all files in a directory are collected with 'os.scandir' on
+    first request of a file from the directory. Files missing in a scan are
+    stat separately.
+
+    Directory cache must be invalidated when its content changes.
+    """
+
+    def __init__(self):
+        self._stats_by_dirpath = {}
+        self._lock = threading.Lock()
+
+    def stat(self, path):
+        """Stat of a file.
+
+        Args:
+            path (str): Path to a file.
+
+        Returns:
+            os.stat_result: Stat of the file.
+        """
+
+        path = os.path.normpath(os.path.abspath(path))
+        dirpath, filename = os.path.split(path)
+        with self._lock:
+            stats = self._stats_by_dirpath.get(dirpath)
+            if stats is None:
+                stats = self._scan_dir(dirpath)
+                self._stats_by_dirpath[dirpath] = stats
+
+            stat_result = stats.get(filename)
+            if stat_result is None:
+                stat_result = os.stat(path)
+                stats[filename] = stat_result
+        return stat_result
+
+    def invalidate(self, paths=None):
+        """Invalidate directories of passed file paths.
+
+        Args:
+            paths (Optional[Iterable[str]]): Paths to changed files. All
+                cached directories are invalidated if 'None' is passed.
+        """
+
+        with self._lock:
+            if paths is None:
+                self._stats_by_dirpath.clear()
+                return
+
+            for path in paths:
+                dirpath = os.path.dirname(
+                    os.path.normpath(os.path.abspath(path))
+                )
+                self._stats_by_dirpath.pop(dirpath, None)
+
+    @staticmethod
+    def _scan_dir(dirpath):
+        output = {}
+        # Python 2 does not have 'scandir'
+        if not hasattr(os, "scandir") or not os.path.isdir(dirpath):
+            return output
+
+        for entry in os.scandir(dirpath):
+            if entry.is_file():
+                output[entry.name] = entry.stat()
+        return output
+
 
 class DuplicateDestinationError(ValueError):
     """Error raised when transfer destination already exists in queue.
@@ -49,17 +217,87 @@ class FileTransaction(object):
 
     Warning:
         Any folders created during the transfer will not be removed.
+
+    Files are transferred in parallel by a thread pool. Copied files which
+    are on the same filesystem as their destination are cloned using reflink
+    or 'copy_file_range' when available, and hardlinked if 'hardlink' is
+    in 'copy_strategies'. Otherwise regular copy is used.
+
+    Args:
+        log (Optional[logging.Logger]): Logger used for output.
+        allow_queue_replacements (Optional[bool]): Allow to replace
+            source of already queued destination.
+        workers (Optional[int]): Number of threads transferring files.
+            Value is taken from 'OPENPYPE_TRANSFER_WORKERS' environment
+            variable or 'DEFAULT_TRANSFER_WORKERS' is used if not passed.
+            Transfer is serial if is set to '1'.
+        progress_callback (Optional[Callable[[str, str, int, int], None]]):
+            Called after each transferred file with source path,
+            destination path, number of transferred files and total number
+            of files to transfer.
+        copy_strategies (Optional[Iterable[str]]): Strategies allowed for
+            copy of files on the same filesystem. Available are 'reflink',
+            'copy_file_range' and 'hardlink'. Hardlink is not used by
+            default as published file would share content with source.
+        content_hash_algorithm (Optional[str]): Compute hash of content of
+            each transferred file with the algorithm ('xxhash', 'sha256',
+            ...). Copied files are hashed while they're copied so the
+            content is read only once. Hashes are available in
+            'content_hashes' as '<algorithm>:<hexdigest>'.
     """
 
     MODE_COPY = 0
     MODE_HARDLINK = 1
 
-    def __init__(self, log=None, allow_queue_replacements=False):
+    STRATEGY_REFLINK = "reflink"
+    STRATEGY_COPY_FILE_RANGE = "copy_file_range"
+    STRATEGY_HARDLINK = "hardlink"
+    default_copy_strategies = (
+        STRATEGY_REFLINK,
+        STRATEGY_COPY_FILE_RANGE,
+    )
+
+    def __init__(
+        self,
+        log=None,
+        allow_queue_replacements=False,
+        workers=None,
+        progress_callback=None,
+        copy_strategies=None,
+        content_hash_algorithm=None
+    ):
         if log is None:
             log = logging.getLogger("FileTransaction")
 
         self.log = log
 
+        if workers is None:
+            workers = int(
+                os.environ.get("OPENPYPE_TRANSFER_WORKERS")
+                or DEFAULT_TRANSFER_WORKERS
+            )
+        self._workers = max(1, workers)
+        self._progress_callback = progress_callback
+
+        if copy_strategies is None:
+            copy_strategies = self.default_copy_strategies
+        self._copy_strategies = tuple(copy_strategies)
+        # Strategies that failed on this machine are not tried again
+        self._unsupported_strategies = set()
+
+        if content_hash_algorithm == "xxhash" and xxhash is None:
+            self.log.warning((
+                "Python module 'xxhash' is not available."
+                " Using 'sha256' for content hashes."
+            ))
+            content_hash_algorithm = "sha256"
+        self._content_hash_algorithm = content_hash_algorithm
+        # Content hashes by destination path
+        self._content_hashes = {}
+
+        self._lock = threading.Lock()
+        self._transferred_count = 0
+
         # The transfer queue
         # todo: make this an actual FIFO queue?
         self._transfers = {}
@@ -126,25 +364,139 @@ class FileTransaction(object):
             os.rename(dst, backup)
 
         # Copy the files to transfer
-        for dst, (src, opts) in self._transfers.items():
+        transfers = list(self._transfers.items())
+        self._transferred_count = 0
+        if self._workers == 1 or ThreadPoolExecutor is None:
+            self._process_chunk(transfers)
+            return
+
+        chunk_size = max(
+            1,
+            min(
+                DEFAULT_TRANSFER_CHUNK_SIZE,
+                len(transfers) // self._workers
+            )
+        )
+        chunks = [
+            transfers[idx:idx + chunk_size]
+            for idx in range(0, len(transfers), chunk_size)
+        ]
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            futures = [
+                executor.submit(self._process_chunk, chunk)
+                for chunk in chunks
+            ]
+            # Re-raise first error after all running chunks finished
+            #   so 'rollback' knows about all transferred files
+            error = None
+            for future in futures:
+                if error is not None:
+                    future.cancel()
+                    continue
+                try:
+                    future.result()
+                except Exception:
+                    error = sys.exc_info()
+
+        if error is not None:
+            six.reraise(*error)
+
+    def _process_chunk(self, transfers):
+        for dst, (src, opts) in transfers:
             path_same = self._same_paths(src, dst)
             if path_same:
                 self.log.debug(
                     "Source and destination are same files {} -> {}".format(
                         src, dst))
+                if self._content_hash_algorithm:
+                    self._hash_existing_file(dst)
+                self._file_processed(src, dst, False)
                 continue
 
             self._create_folder_for_file(dst)
 
             if opts["mode"] == self.MODE_COPY:
                 self.log.debug("Copying file ... {} -> {}".format(src, dst))
-                copyfile(src, dst)
+                if self._content_hash_algorithm:
+                    self._copy_file_with_hash(src, dst)
+                else:
+                    self._copy_file(src, dst)
+
             elif opts["mode"] == self.MODE_HARDLINK:
                 self.log.debug("Hardlinking file ... {} -> {}".format(
                     src, dst))
                 create_hard_link(src, dst)
-
-            self._transferred.append(dst)
+                if self._content_hash_algorithm:
+                    self._hash_existing_file(dst)
+
+            self._file_processed(src, dst, True)
+
+    def _file_processed(self, src, dst, transferred):
+        with self._lock:
+            if transferred:
+                self._transferred.append(dst)
+            self._transferred_count += 1
+            count = self._transferred_count
+
+        if self._progress_callback is not None:
+            self._progress_callback(src, dst, count, len(self._transfers))
+
+    def _copy_file(self, src, dst):
+        """Copy file using the fastest allowed strategy."""
+
+        strategies = [
+            strategy
+            for strategy in self._copy_strategies
+            if strategy not in self._unsupported_strategies
+        ]
+        if strategies and self._same_filesystem(src, dst):
+            for strategy in strategies:
+                try:
+                    if strategy == self.STRATEGY_REFLINK:
+                        _reflink_file(src, dst)
+                    elif strategy == self.STRATEGY_COPY_FILE_RANGE:
+                        _copy_file_range(src, dst)
+                    elif strategy == self.STRATEGY_HARDLINK:
+                        create_hard_link(src, dst)
+                    else:
+                        continue
+                    return
+
+                except (OSError, IOError, NotImplementedError):
+                    self.log.debug(
+                        "Copy strategy '{}' failed for {} -> {}".format(
+                            strategy, src, dst),
+                        exc_info=True)
+                    self._unsupported_strategies.add(strategy)
+                    if os.path.exists(dst):
+                        os.remove(dst)
+
+        copyfile(src, dst)
+
+    def _copy_file_with_hash(self, src, dst):
+        hasher = create_content_hasher(self._content_hash_algorithm)
+        _copy_file_with_hash(src, dst, hasher)
+        self._store_content_hash(dst, hasher)
+
+    def _hash_existing_file(self, path):
+        hasher = create_content_hasher(self._content_hash_algorithm)
+        _hash_file(path, hasher)
+        self._store_content_hash(path, hasher)
+
+    def _store_content_hash(self, dst, hasher):
+        content_hash = "{}:{}".format(
+            self._content_hash_algorithm, hasher.hexdigest()
+        )
+        with self._lock:
+            self._content_hashes[dst] = content_hash
+
+    @staticmethod
+    def _same_filesystem(src, dst):
+        try:
+            dst_device = os.stat(os.path.dirname(dst)).st_dev
+            return os.stat(src).st_dev == dst_device
+        except OSError:
+            return False
 
     def finalize(self):
         # Delete any backed up files
@@ -190,6 +542,17 @@ class FileTransaction(object):
         """Return the processed transfers destination paths"""
         return list(self._transferred)
 
+    @property
+    def content_hashes(self):
+        """Content hashes of processed files by destination path.
+
+        Filled only if 'content_hash_algorithm' was passed on initialization.
+
+        Returns:
+            dict[str, str]: Hashes as '<algorithm>:<hexdigest>'.
+        """
+        return dict(self._content_hashes)
+
     @property
     def backups(self):
         """Return the backup file paths"""
@@ -200,6 +563,7 @@ class FileTransaction(object):
         try:
             os.makedirs(dirname)
         except OSError as e:
+            # Folder may be created by other transfer thread
             if e.errno == errno.EEXIST:
                 pass
             else:
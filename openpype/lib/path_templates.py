@@ -1,6 +1,7 @@
 import os
 import re
 import copy
+import string
 import numbers
 import collections
 
@@ -11,6 +12,52 @@ KEY_PADDING_PATTERN = re.compile(r"([^:]+)\S+[><]\S+")
 SUB_DICT_PATTERN = re.compile(r"([^\[\]]+)")
 OPTIONAL_PATTERN = re.compile(r"(<.*?[^{0]*>)[^0-9]*?")
 
+# Parsed parts of template strings shared by all 'StringTemplate' objects
+#   - parts are not modified after parsing so they can be reused
+_TEMPLATE_PARTS_CACHE = {}
+# Keys to nested data of formatting keys
+#   - e.g. "project[name]" -> ("project", "name")
+_KEY_PATHS_CACHE = {}
+_CACHE_LIMIT = 4096
+_MISSING = object()
+
+
+def _intern(value):
+    try:
+        return six.moves.intern(value)
+    except TypeError:
+        # Python 2 can't intern unicode
+        return value
+
+
+def _get_key_path(key):
+    """Split formatting key to keys of nested data.
+
+    Padding of key is ignored. Result is cached so regexes are used only
+    once per key.
+
+    Args:
+        key (str): Formatting key e.g. "project[name]" or "frame:0>4".
+
+    Returns:
+        tuple[str]: Keys of nested data e.g. ("project", "name").
+    """
+
+    key_path = _KEY_PATHS_CACHE.get(key)
+    if key_path is None:
+        existence_check = key
+        key_padding = KEY_PADDING_PATTERN.findall(existence_check)
+        if key_padding:
+            existence_check = key_padding[0]
+        key_path = tuple(
+            _intern(sub_key)
+            for sub_key in SUB_DICT_PATTERN.findall(existence_check)
+        )
+        if len(_KEY_PATHS_CACHE) >= _CACHE_LIMIT:
+            _KEY_PATHS_CACHE.clear()
+        _KEY_PATHS_CACHE[key] = key_path
+    return key_path
+
 
 def merge_dict(main_dict, enhance_dict):
     """Merges dictionaries by keys.
@@ -89,6 +136,32 @@ class StringTemplate(object):
             ))
 
         self._template = template
+        parts = _TEMPLATE_PARTS_CACHE.get(template)
+        if parts is None:
+            parts = self._parse_template(template)
+            if len(_TEMPLATE_PARTS_CACHE) >= _CACHE_LIMIT:
+                _TEMPLATE_PARTS_CACHE.clear()
+            _TEMPLATE_PARTS_CACHE[template] = parts
+        self._parts = parts
+
+        root_keys = set()
+        for part in parts:
+            if not isinstance(part, six.string_types):
+                root_keys |= part.root_keys
+        self._root_keys = root_keys
+
+    @classmethod
+    def _parse_template(cls, template):
+        """Split template string to parts which are used for formatting.
+
+        Args:
+            template (str): Template string.
+
+        Returns:
+            list: Parts of template. Contains 'str', 'FormattingPart' and
+                'OptionalPart' objects.
+        """
+
         parts = []
         last_end_idx = 0
         for item in KEY_PATTERN.finditer(template):
@@ -119,7 +192,7 @@ class StringTemplate(object):
             if substr:
                 new_parts.append(substr)
 
-        self._parts = self.find_optional_parts(new_parts)
+        return cls.find_optional_parts(new_parts)
 
     def __str__(self):
         return self.template
@@ -157,7 +230,72 @@ class StringTemplate(object):
                 result.add_output(part)
             else:
                 part.format(data, result)
+        return self._create_result(result)
+
+    def format_many(self, data_list):
+        """Format template with multiple data at once.
+
+        Meant for data which differ only in few keys, e.g. frames of
+        sequence. Parts of template which use keys with same values in all
+        data are formatted only once.
+
+        Args:
+            data_list (Iterable[dict]): Data to be filled into template.
+
+        Returns:
+            list[TemplateResult]: Result for each item in data list.
+        """
+
+        data_list = list(data_list)
+        if not data_list:
+            return []
+
+        first_data = data_list[0]
+        changing_keys = set()
+        for key in self._root_keys:
+            first_value = first_data.get(key, _MISSING)
+            for data in data_list:
+                value = data.get(key, _MISSING)
+                if value is not first_value and value != first_value:
+                    changing_keys.add(key)
+                    break
+
+        # Format parts which are same for all data only once
+        #   - parts are replaced with their output in the list
+        static_result = TemplatePartResult()
+        parts = []
+        for part in self._parts:
+            if (
+                not isinstance(part, six.string_types)
+                and not part.root_keys & changing_keys
+            ):
+                part_result = TemplatePartResult()
+                part.format(first_data, part_result)
+                static_result.add_output(part_result)
+                part = part_result.output
+
+            if (
+                parts
+                and isinstance(part, six.string_types)
+                and isinstance(parts[-1], six.string_types)
+            ):
+                parts[-1] += part
+            else:
+                parts.append(part)
+
+        output = []
+        for data in data_list:
+            result = TemplatePartResult()
+            result.add_values(static_result)
+            for part in parts:
+                if isinstance(part, six.string_types):
+                    result.add_output(part)
+                else:
+                    part.format(data, result)
+            output.append(self._create_result(result))
+        return output
 
+    def _create_result(self, result):
         invalid_types = result.invalid_types
         invalid_types.update(result.invalid_optional_types)
         invalid_types = result.split_keys_to_subdicts(invalid_types)
@@ -182,6 +320,12 @@ class StringTemplate(object):
         result.validate()
         return result
 
+    def format_strict_many(self, *args, **kwargs):
+        results = self.format_many(*args, **kwargs)
+        for result in results:
+            result.validate()
+        return results
+
     @classmethod
     def format_template(cls, template, data):
         objected_template = cls(template)
@@ -568,23 +712,32 @@ class TemplatePartResult:
 
         elif isinstance(other, TemplatePartResult):
             self._output += other.output
-
-            self._missing_keys |= other.missing_keys
-            self._missing_optional_keys |= other.missing_optional_keys
-
-            self._invalid_types.update(other.invalid_types)
-            self._invalid_optional_types.update(other.invalid_optional_types)
-
-            if other.optional and not other.solved:
-                return
-            self._used_values.update(other.used_values)
-            self._realy_used_values.update(other.realy_used_values)
+            self.add_values(other, other.optional and not other.solved)
 
         else:
             raise TypeError("Cannot add data from \"{}\" to \"{}\"".format(
                 str(type(other)), self.__class__.__name__)
             )
 
+    def add_values(self, other, skip_used_values=False):
+        """Add keys and values from other result without output.
+
+        Args:
+            other (TemplatePartResult): Result to take values from.
+            skip_used_values (bool): Add only missing keys and invalid types.
+        """
+
+        self._missing_keys |= other.missing_keys
+        self._missing_optional_keys |= other.missing_optional_keys
+
+        self._invalid_types.update(other.invalid_types)
+        self._invalid_optional_types.update(other.invalid_optional_types)
+
+        if skip_used_values:
+            return
+        self._used_values.update(other.used_values)
+        self._realy_used_values.update(other.realy_used_values)
+
     @property
     def solved(self):
         if self.optional:
@@ -634,17 +787,13 @@ class TemplatePartResult:
     def split_keys_to_subdicts(values):
         output = {}
         for key, value in values.items():
-            key_padding = list(KEY_PADDING_PATTERN.findall(key))
-            if key_padding:
-                key = key_padding[0]
-            key_subdict = list(SUB_DICT_PATTERN.findall(key))
+            key_path = _get_key_path(key)
             data = output
-            last_key = key_subdict.pop(-1)
-            for subkey in key_subdict:
+            for subkey in key_path[:-1]:
                 if subkey not in data:
                     data[subkey] = {}
                 data = data[subkey]
-            data[last_key] = value
+            data[key_path[-1]] = value
         return output
 
     def get_clean_used_values(self):
@@ -698,11 +847,67 @@ class FormattingPart:
 
     Containt only single key to format e.g. "{project[name]}".
 
+    Key path to value in data and formatting of the value are prepared on
+    initialization so they're not resolved on each format.
+
     Args:
         template(str): String containing the formatting key.
     """
     def __init__(self, template):
         self._template = template
+        key = template[1:-1]
+        self._key = key
+        existence_check = key
+        key_padding = KEY_PADDING_PATTERN.findall(existence_check)
+        if key_padding:
+            existence_check = key_padding[0]
+        self._existence_check = existence_check
+        self._key_path = _get_key_path(key)
+        if self._key_path:
+            self._root_keys = frozenset(self._key_path[:1])
+        else:
+            self._root_keys = frozenset()
+        self._format_spec = self._get_format_spec(template, self._key_path)
+
+    @staticmethod
+    def _get_format_spec(template, key_path):
+        """Format spec of value if template can be filled with 'format'.
+
+        Returns:
+            Union[str, None]: Format spec for builtin 'format' or None if
+                template must be formatted with 'str.format'.
+        """
+
+        try:
+            parsed = list(string.Formatter().parse(template))
+        except ValueError:
+            return None
+
+        if len(parsed) != 1 or not key_path:
+            return None
+
+        literal_text, field_name, format_spec, conversion = parsed[0]
+        if (
+            literal_text
+            or conversion is not None
+            or format_spec is None
+            or "{" in format_spec
+            # 'str.format' would use digit keys as indexes
+            or any(sub_key.isdigit() for sub_key in key_path[1:])
+        ):
+            return None
+
+        expected_field_name = key_path[0] + "".join(
+            "[{}]".format(sub_key) for sub_key in key_path[1:]
+        )
+        if field_name != expected_field_name:
+            return None
+        return format_spec
+
+    @property
+    def root_keys(self):
+        """Keys of formatting data used by this part."""
+        return self._root_keys
 
     @property
     def template(self):
@@ -717,13 +922,9 @@ class FormattingPart:
     @staticmethod
     def validate_value_type(value):
         """Check if value can be used for formatting of single key."""
-        if isinstance(value, (numbers.Number, FormatObject)):
-            return True
-
-        for inh_class in type(value).mro():
-            if inh_class in six.string_types:
-                return True
-        return False
+        return isinstance(
+            value, (numbers.Number, FormatObject) + six.string_types
+        )
 
     def format(self, data, result):
         """Format the formattings string.
@@ -732,47 +933,40 @@ class FormattingPart:
             data(dict): Data that should be used for formatting.
             result(TemplatePartResult): Object where result is stored.
         """
-        key = self.template[1:-1]
+        key = self._key
         if key in result.realy_used_values:
             result.add_output(result.realy_used_values[key])
             return result
 
-        # check if key expects subdictionary keys (e.g. project[name])
-        existence_check = key
-        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
-        if key_padding:
-            existence_check = key_padding[0]
-        key_subdict = list(SUB_DICT_PATTERN.findall(existence_check))
-
+        key_path = self._key_path
         value = data
         missing_key = False
         invalid_type = False
-        used_keys = []
-        for sub_key in key_subdict:
+        used_count = 0
+        for sub_key in key_path:
             if (
                 value is None
                 or (hasattr(value, "items") and sub_key not in value)
             ):
                 missing_key = True
-                used_keys.append(sub_key)
+                used_count += 1
                 break
 
             if not hasattr(value, "items"):
                 invalid_type = True
                 break
 
-            used_keys.append(sub_key)
+            used_count += 1
             value = value.get(sub_key)
 
         if missing_key or invalid_type:
-            if len(used_keys) == 0:
-                invalid_key = key_subdict[0]
+            if used_count == 0:
+                invalid_key = key_path[0]
             else:
-                invalid_key = used_keys[0]
-                for idx, sub_key in enumerate(used_keys):
-                    if idx == 0:
-                        continue
-                    invalid_key += "[{0}]".format(sub_key)
+                invalid_key = key_path[0] + "".join(
+                    "[{0}]".format(sub_key)
+                    for sub_key in key_path[1:used_count]
+                )
 
             if missing_key:
                 result.add_missing_key(invalid_key)
@@ -784,19 +978,15 @@ class FormattingPart:
             return result
 
         if self.validate_value_type(value):
-            fill_data = {}
-            first_value = True
-            for used_key in reversed(used_keys):
-                if first_value:
-                    first_value = False
-                    fill_data[used_key] = value
-                else:
-                    _fill_data = {used_key: fill_data}
-                    fill_data = _fill_data
-
-            formatted_value = self.template.format(**fill_data)
+            if self._format_spec is not None:
+                formatted_value = format(value, self._format_spec)
+            else:
+                fill_data = value
+                for used_key in reversed(key_path):
+                    fill_data = {used_key: fill_data}
+                formatted_value = self.template.format(**fill_data)
             result.add_realy_used_value(key, formatted_value)
-            result.add_used_value(existence_check, formatted_value)
+            result.add_used_value(self._existence_check, formatted_value)
             result.add_output(formatted_value)
             return result
 
@@ -818,6 +1008,16 @@ class OptionalPart:
 
     def __init__(self, parts):
         self._parts = parts
+        root_keys = set()
+        for part in parts:
+            if not isinstance(part, six.string_types):
+                root_keys |= part.root_keys
+        self._root_keys = frozenset(root_keys)
+
+    @property
+    def root_keys(self):
+        """Keys of formatting data used by this part."""
+        return self._root_keys
 
     @property
     def parts(self):
@@ -7,6 +7,8 @@ import warnings
 
 import clique
 
+from .sequence_tools import assemble
+
 log = logging.getLogger(__name__)
 
 
@@ -129,7 +131,7 @@ def collect_frames(files):
     """
 
     patterns = [clique.PATTERNS["frames"]]
-    collections, remainder = clique.assemble(
+    collections, remainder = assemble(
         files, minimum_items=1, patterns=patterns)
 
     sources_and_frames = {}
@@ -1,8 +1,17 @@
 import re
 import logging
+import collections
+
+import six
 
 log = logging.getLogger(__name__)
 
+# Characters which make string a regex pattern instead of exact value
+_REGEX_SPECIAL_CHARS = frozenset("\\.^$*+?{}[]|()")
+# Matchers cached by id of profiles
+_PROFILE_MATCHERS_CACHE = collections.OrderedDict()
+_PROFILE_MATCHERS_CACHE_SIZE = 64
+
 
 def compile_list_of_regexes(in_list):
     """Convert strings in entered list to compiled regex objects."""
@@ -79,6 +88,12 @@ def fullmatch(regex, string, flags=0):
     return None
 
 
+def _regex_fullmatch(regex, value):
+    if hasattr(regex, "fullmatch"):
+        return regex.fullmatch(value)
+    return fullmatch(regex, value)
+
+
 def validate_value_by_regexes(value, in_list):
     """Validates in any regex from list match entered value.
 
@@ -116,6 +131,18 @@ def validate_value_by_regexes(value, in_list):
     return -1
 
 
+def _prepare_keys_order(key_values, keys_order):
+    if not keys_order:
+        return tuple(key_values.keys())
+
+    _keys_order = list(keys_order)
+    # Make all keys from `key_values` are passed
+    for key in key_values.keys():
+        if key not in _keys_order:
+            _keys_order.append(key)
+    return tuple(_keys_order)
+
+
 def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     """ Filter profiles by entered key -> values.
 
@@ -152,15 +179,7 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     if not logger:
         logger = log
 
-    if not keys_order:
-        keys_order = tuple(key_values.keys())
-    else:
-        _keys_order = list(keys_order)
-        # Make all keys from `key_values` are passed
-        for key in key_values.keys():
-            if key not in _keys_order:
-                _keys_order.append(key)
-        keys_order = tuple(_keys_order)
+    keys_order = _prepare_keys_order(key_values, keys_order)
 
     log_parts = " | ".join([
         "{}: \"{}\"".format(*item)
@@ -225,3 +244,240 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
             "Profile selected: {}".format(profile)
         )
     return profile
+
+
+class _ProfilesKeyFilter(object):
+    """Prepared values of one key of all profiles.
+
+    Values of profiles which are not regex patterns are indexed, so they're
+    matched with lookup. Regexes are compiled only once.
+
+    Args:
+        profiles_data (list[dict]): Profile definitions.
+        key (str): Key in profiles.
+    """
+
+    def __init__(self, profiles_data, key):
+        # Indexes of profiles which don't filter by the key
+        self._unfiltered = set()
+        # Profile indexes by exact values
+        self._indexes_by_value = collections.defaultdict(set)
+        # Regexes of profiles which are not exact values
+        self._regexes = {}
+        # All regexes of profiles used for non-string values
+        self._all_regexes = {}
+
+        for idx, profile in enumerate(profiles_data):
+            in_list = profile.get(key)
+            if in_list and not isinstance(in_list, (list, tuple, set)):
+                in_list = [in_list]
+
+            if not in_list or "*" in in_list:
+                self._unfiltered.add(idx)
+                continue
+
+            regexes = []
+            all_regexes = []
+            for item in in_list:
+                regex = compile_list_of_regexes([item])
+                if not regex:
+                    continue
+                all_regexes.extend(regex)
+                if (
+                    isinstance(item, six.string_types)
+                    and not _REGEX_SPECIAL_CHARS.intersection(item)
+                ):
+                    self._indexes_by_value[item].add(idx)
+                else:
+                    regexes.extend(regex)
+            self._regexes[idx] = regexes
+            self._all_regexes[idx] = all_regexes
+
+    def get_points(self, idx, value, exact_indexes):
+        """Points of profile for the value.
+
+        Same as result of 'validate_value_by_regexes'.
+
+        Args:
+            idx (int): Index of profile.
+            value (Any): Filtering value.
+            exact_indexes (set[int]): Indexes of profiles which contain
+                the value as exact value.
+
+        Returns:
+            int: '0' if profile does not filter by the key, '1' if value
+                matches and '-1' if does not match.
+        """
+
+        if idx in self._unfiltered:
+            return 0
+
+        if not value:
+            return -1
+
+        if isinstance(value, six.string_types):
+            if idx in exact_indexes:
+                return 1
+            regexes = self._regexes[idx]
+        else:
+            regexes = self._all_regexes[idx]
+
+        for regex in regexes:
+            if _regex_fullmatch(regex, value):
+                return 1
+        return -1
+
+    def get_exact_indexes(self, value):
+        """Indexes of profiles which contain the value as exact value."""
+        if isinstance(value, six.string_types):
+            indexes = self._indexes_by_value.get(value)
+            if indexes:
+                return indexes
+        return set()
+
+
+class ProfileMatcher(object):
+    """Profiles prepared for repeated filtering.
+
+    Result of 'match' is same as result of 'filter_profiles'. Regexes in
+    profiles are compiled only once, exact values are matched with lookup
+    and results are cached by filtering values.
+
+    Profiles must not be modified after matcher was created, create new
+    matcher for new settings instead.
+
+    Args:
+        profiles_data (list[dict]): Profile definitions as dictionaries.
+        cache_size (int): Maximum number of cached results.
+    """
+
+    def __init__(self, profiles_data, cache_size=128):
+        self._profiles = list(profiles_data or [])
+        self._cache_size = cache_size
+        self._cache = collections.OrderedDict()
+        self._filters_by_key = {}
+
+    @property
+    def profiles(self):
+        return self._profiles
+
+    def _get_key_filter(self, key):
+        key_filter = self._filters_by_key.get(key)
+        if key_filter is None:
+            key_filter = _ProfilesKeyFilter(self._profiles, key)
+            self._filters_by_key[key] = key_filter
+        return key_filter
+
+    def match(self, key_values, keys_order=None, logger=None):
+        """Find most matching profile for key values.
+
+        Args:
+            key_values (dict): Mapping of Key <-> Value. Key is checked if
+                is available in profile and if Value is matching it's values.
+            keys_order (list, tuple): Order of keys from `key_values` which
+                matters only when multiple profiles have same score.
+            logger (logging.Logger): Optionally can be passed different
+                logger.
+
+        Returns:
+            dict/None: Return most matching profile or None if none of
+                profiles match at least one criteria.
+        """
+
+        if not self._profiles:
+            return None
+
+        if not logger:
+            logger = log
+
+        keys_order = _prepare_keys_order(key_values, keys_order)
+        values = tuple(key_values[key] for key in keys_order)
+        cache_key = (keys_order, values)
+        try:
+            hash(cache_key)
+        except TypeError:
+            cache_key = None
+
+        if cache_key is not None and cache_key in self._cache:
+            # Move result to the end of the cache
+            profile = self._cache.pop(cache_key)
+            self._cache[cache_key] = profile
+            return profile
+
+        profile = self._match(keys_order, values)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Profile for {} selected: {}".format(
+                " | ".join(
+                    "{}: \"{}\"".format(key, value)
+                    for key, value in zip(keys_order, values)
+                ),
+                profile
+            ))
+
+        if cache_key is not None:
+            if len(self._cache) >= self._cache_size:
+                self._cache.popitem(last=False)
+            self._cache[cache_key] = profile
+        return profile
+
+    def _match(self, keys_order, values):
+        # Points and scores of profiles which did not fail any criteria
+        profile_points = [0] * len(self._profiles)
+        profile_scores = [[] for _ in self._profiles]
+        indexes = range(len(self._profiles))
+        for key, value in zip(keys_order, values):
+            key_filter = self._get_key_filter(key)
+            exact_indexes = key_filter.get_exact_indexes(value)
+            valid_indexes = []
+            for idx in indexes:
+                match = key_filter.get_points(idx, value, exact_indexes)
+                if match == -1:
+                    continue
+                profile_points[idx] += match
+                profile_scores[idx].append(bool(match))
+                valid_indexes.append(idx)
+            indexes = valid_indexes
+
+        matching_profiles = None
+        highest_profile_points = -1
+        for idx in indexes:
+            points = profile_points[idx]
+            if points < highest_profile_points:
+                continue
+
+            if points > highest_profile_points:
+                matching_profiles = []
+                highest_profile_points = points
+
+            matching_profiles.append(
+                (self._profiles[idx], profile_scores[idx])
+            )
+
+        return _profile_exclusion(matching_profiles, log)
+
+
+def get_profile_matcher(profiles_data):
+    """Matcher for profiles cached by identity of the profiles object.
+
+    Should be used only for profiles which are not modified, e.g. profiles
+    from settings applied on plugin or from read-only settings.
+
+    Args:
+        profiles_data (list[dict]): Profile definitions as dictionaries.
+
+    Returns:
+        ProfileMatcher: Matcher for profiles.
+    """
+
+    cache_key = id(profiles_data)
+    item = _PROFILE_MATCHERS_CACHE.get(cache_key)
+    # Stored profiles make sure that id was not reused by other object
+    if item is not None and item[0] is profiles_data:
+        return item[1]
+
+    matcher = ProfileMatcher(profiles_data)
+    _PROFILE_MATCHERS_CACHE.pop(cache_key, None)
+    if len(_PROFILE_MATCHERS_CACHE) >= _PROFILE_MATCHERS_CACHE_SIZE:
+        _PROFILE_MATCHERS_CACHE.popitem(last=False)
+    _PROFILE_MATCHERS_CACHE[cache_key] = (profiles_data, matcher)
+    return matcher
@@ -16,10 +16,15 @@ requirements. Possible requirement should be listed in 'pack_project' function.
 
 import os
 import json
+import uuid
+import hashlib
 import platform
 import tempfile
+import threading
 import shutil
 import datetime
+import collections
+from concurrent.futures import ThreadPoolExecutor
 
 import zipfile
 from openpype.client.mongo import (
@@ -31,8 +36,22 @@ from openpype.client.mongo import (
 
 DOCUMENTS_FILE_NAME = "database"
 METADATA_FILE_NAME = "metadata"
+MANIFEST_FILE_NAME = "manifest"
 PROJECT_FILES_DIR = "project_files"
 
+# Files with these extensions are already compressed and are stored
+#   to zip without compression
+STORED_EXTENSIONS = {
+    ".mov", ".mp4", ".m4v", ".mkv", ".avi", ".webm", ".mxf",
+    ".jpg", ".jpeg", ".png", ".gif", ".webp", ".exr",
+    ".zip", ".gz", ".bz2", ".xz", ".7z", ".rar",
+    ".mp3", ".aac", ".ogg", ".flac",
+}
+# Files smaller than this size are read by worker threads to memory,
+#   bigger files are streamed to zip
+READ_TO_MEMORY_SIZE = 16 * 1024 * 1024
+CHUNK_SIZE = 4 * 1024 * 1024
+
 
 def add_timestamp(filepath):
     """Add timestamp string to a file."""
@@ -61,32 +80,204 @@ def get_project_document(project_name, database_name=None):
     return col.find_one({"type": "project"})
 
 
-def _pack_files_to_zip(zip_stream, source_path, root_path):
+def _get_workers_count(workers):
+    if workers:
+        return workers
+    return min(32, (os.cpu_count() or 1) * 4)
+
+
+def _get_compress_type(filepath):
+    ext = os.path.splitext(filepath)[1].lower()
+    if ext in STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def _read_file(filepath, size):
+    """Read content of file and calculate its hash.
+
+    Content is returned only for small files, big files are streamed to zip
+    in the thread writing zip.
+
+    Returns:
+        tuple[Union[bytes, None], Union[str, None]]: Content and hash of file.
+    """
+
+    if size > READ_TO_MEMORY_SIZE:
+        return None, None
+
+    with open(filepath, "rb") as stream:
+        content = stream.read()
+    return content, "sha256:" + hashlib.sha256(content).hexdigest()
+
+
+def _write_file_to_zip(zip_stream, filepath, archive_name, content):
+    """Write file to zip stream.
+
+    Returns:
+        str: Hash of written content.
+    """
+
+    zinfo = zipfile.ZipInfo.from_file(filepath, archive_name)
+    zinfo.compress_type = _get_compress_type(filepath)
+    if content is not None:
+        zip_stream.writestr(zinfo, content)
+        return None
+
+    file_hash = hashlib.sha256()
+    with open(filepath, "rb") as src_stream:
+        with zip_stream.open(zinfo, "w") as dst_stream:
+            while True:
+                chunk = src_stream.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                file_hash.update(chunk)
+                dst_stream.write(chunk)
+    return "sha256:" + file_hash.hexdigest()
+
+
+def _collect_files(source_path, root_path):
+    """Collect files which should be packed.
+
+    Returns:
+        list[tuple[str, str, os.stat_result]]: Path to file, archive name
+            and stat of the file.
+    """
+
+    output = []
+    for root, _, filenames in os.walk(source_path):
+        for filename in filenames:
+            filepath = os.path.join(root, filename)
+            archive_name = "/".join([
+                PROJECT_FILES_DIR,
+                os.path.relpath(filepath, root_path).replace("\\", "/")
+            ])
+            output.append((filepath, archive_name, os.stat(filepath)))
+    return output
+
+
+def _pack_files_to_zip(
+    zip_stream,
+    source_path,
+    root_path,
+    previous_manifest=None,
+    package_id=None,
+    workers=None
+):
     """Pack files to a zip stream.
 
+    Files are read and hashed by a pool of threads and written to the zip
+    in the order they were found. Already compressed media are stored
+    without compression.
+
     Args:
         zip_stream (zipfile.ZipFile): Stream to a zipfile.
         source_path (str): Path to a directory where files are.
         root_path (str): Path to a directory which is used for calculation
             of relative path.
+        previous_manifest (Optional[dict[str, Any]]): Manifest of previous
+            package. Files which did not change since previous package are
+            not packed.
+        package_id (Optional[str]): Id of package stored to manifest items.
+        workers (Optional[int]): Number of threads reading files.
+
+    Returns:
+        dict[str, dict[str, Any]]: Manifest items by archive name.
     """
 
-    for root, _, filenames in os.walk(source_path):
-        for filename in filenames:
-            filepath = os.path.join(root, filename)
-            # TODO add one more folder
-            archive_name = os.path.join(
-                PROJECT_FILES_DIR,
-                os.path.relpath(filepath, root_path)
+    previous_files = {}
+    if previous_manifest:
+        previous_files = previous_manifest["files"]
+
+    manifest_files = {}
+    to_pack = []
+    for filepath, archive_name, stat in _collect_files(
+        source_path, root_path
+    ):
+        item = {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "hash": None,
+            "package": package_id
+        }
+        previous_item = previous_files.get(archive_name)
+        if (
+            previous_item is not None
+            and previous_item["size"] == item["size"]
+            and previous_item["mtime"] == item["mtime"]
+        ):
+            item = dict(previous_item)
+        else:
+            to_pack.append((filepath, archive_name))
+        manifest_files[archive_name] = item
+
+    print("Packing {} of {} files".format(len(to_pack), len(manifest_files)))
+
+    workers = _get_workers_count(workers)
+    # Limit number of files read to memory at the same time
+    max_pending = workers * 2
+    with ThreadPoolExecutor(workers) as executor:
+        pending = collections.deque()
+        queue_iter = iter(to_pack)
+        for idx in range(len(to_pack)):
+            while len(pending) < max_pending:
+                queue_item = next(queue_iter, None)
+                if queue_item is None:
+                    break
+                filepath, archive_name = queue_item
+                size = manifest_files[archive_name]["size"]
+                pending.append((
+                    filepath,
+                    archive_name,
+                    executor.submit(_read_file, filepath, size)
+                ))
+
+            filepath, archive_name, future = pending.popleft()
+            content, file_hash = future.result()
+            written_hash = _write_file_to_zip(
+                zip_stream, filepath, archive_name, content
             )
-            zip_stream.write(filepath, archive_name)
+            item = manifest_files[archive_name]
+            item["hash"] = file_hash or written_hash
+            if content is not None:
+                item["size"] = len(content)
+
+            if idx and idx % 1000 == 0:
+                print("Packed {}/{} files".format(idx, len(to_pack)))
+
+    return manifest_files
+
+
+def _load_manifest(path):
+    """Load manifest from zip package or json file.
+
+    Args:
+        path (str): Path to package zip or manifest json.
+
+    Returns:
+        Union[dict[str, Any], None]: Manifest data or None if package does
+            not contain manifest.
+    """
+
+    if not zipfile.is_zipfile(path):
+        with open(path, "r") as stream:
+            return json.load(stream)
+
+    with zipfile.ZipFile(path, "r") as zip_stream:
+        try:
+            content = zip_stream.read(MANIFEST_FILE_NAME + ".json")
+        except KeyError:
+            return None
+    return json.loads(content.decode("utf-8"))
 
 
 def pack_project(
     project_name,
     destination_dir=None,
     only_documents=False,
-    database_name=None
+    database_name=None,
+    previous_package=None,
+    workers=None
 ):
     """Make a package of a project with mongo documents and files.
 
@@ -95,6 +286,11 @@ def pack_project(
     - project must have all templates starting with
         "{root[...]}/{project[name]}"
 
+    Package contains manifest with size and hash of all project files. When
+    previous package is passed only files changed since the previous package
+    are packed (incremental package). Files are then restored by unpacking
+    of the previous package(s) and the incremental package.
+
     Args:
         project_name (str): Project that should be packaged.
         destination_dir (Optional[str]): Optional path where zip will be
@@ -103,6 +299,9 @@ def pack_project(
             files.
         database_name (Optional[str]): Custom database name from which is
             project queried.
+        previous_package (Optional[str]): Path to previous package zip or
+            its manifest json.
+        workers (Optional[int]): Number of threads reading files.
     """
 
     print("Creating package of project \"{}\"".format(project_name))
@@ -142,6 +341,17 @@ def pack_project(
     if not os.path.exists(destination_dir):
         os.makedirs(destination_dir)
 
+    previous_manifest = None
+    if previous_package:
+        # Manifest must be loaded before existing zip is renamed
+        previous_manifest = _load_manifest(previous_package)
+        if previous_manifest is None:
+            raise ValueError(
+                "Previous package \"{}\" does not contain manifest".format(
+                    previous_package
+                )
+            )
+
     zip_path = os.path.join(destination_dir, project_name + ".zip")
 
     print("Project will be packaged into \"{}\"".format(zip_path))
@@ -170,6 +380,16 @@ def pack_project(
     # Query all project documents and store them to temp json
     store_project_documents(project_name, temp_docs_json, database_name)
 
+    manifest = {
+        "id": str(uuid.uuid4()),
+        "project_name": project_name,
+        "created": datetime.datetime.now().isoformat(),
+        "base_id": None,
+        "files": {}
+    }
+    if previous_manifest:
+        manifest["base_id"] = previous_manifest["id"]
+
     print("Packing files into zip")
     # Write all to zip file
     with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zip_stream:
@@ -180,7 +400,17 @@ def pack_project(
 
         # Add project files to zip
         if not only_documents:
-            _pack_files_to_zip(zip_stream, project_source_path, root_path)
+            manifest["files"] = _pack_files_to_zip(
+                zip_stream,
+                project_source_path,
+                root_path,
+                previous_manifest,
+                manifest["id"],
+                workers
+            )
+        zip_stream.writestr(
+            MANIFEST_FILE_NAME + ".json", json.dumps(manifest, indent=4)
+        )
 
     print("Cleaning up")
     # Cleanup
@@ -190,26 +420,16 @@ def pack_project(
     print("*** Packing finished ***")
 
 
-def _unpack_project_files(unzip_dir, root_path, project_name):
-    """Move project files from unarchived temp folder to new root.
-
-    Unpack is skipped if source files are not available in the zip. That can
-    happen if nothing was published yet or only documents were stored to
-    package.
+def _prepare_project_files_dir(root_path, project_name, merge):
+    """Prepare directory where project files are unpacked.
 
     Args:
-        unzip_dir (str): Location where zip was unzipped.
         root_path (str): Path to new root.
         project_name (str): Name of project.
+        merge (bool): Unpack to existing project directory. Existing
+            directory is renamed otherwise.
     """
 
-    src_project_files_dir = os.path.join(
-        unzip_dir, PROJECT_FILES_DIR, project_name
-    )
-    # Skip if files are not in the zip
-    if not os.path.exists(src_project_files_dir):
-        return
-
     # Make sure root path exists
     if not os.path.exists(root_path):
         os.makedirs(root_path)
@@ -217,24 +437,179 @@ def _unpack_project_files(unzip_dir, root_path, project_name):
     dst_project_files_dir = os.path.normpath(
         os.path.join(root_path, project_name)
     )
-    if os.path.exists(dst_project_files_dir):
+    if os.path.exists(dst_project_files_dir) and not merge:
         new_path = add_timestamp(dst_project_files_dir)
         print("Project folder already exists. Renamed \"{}\" -> \"{}\"".format(
             dst_project_files_dir, new_path
         ))
         os.rename(dst_project_files_dir, new_path)
 
-    print("Moving project files from temp \"{}\" -> \"{}\"".format(
-        src_project_files_dir, dst_project_files_dir
-    ))
-    shutil.move(src_project_files_dir, dst_project_files_dir)
+
+def _extract_file(zip_getter, archive_name, dst_path, expected):
+    """Extract file from zip and validate it against manifest item.
+
+    Returns:
+        Union[str, None]: Error message if file does not match manifest.
+    """
+
+    dirpath = os.path.dirname(dst_path)
+    if not os.path.exists(dirpath):
+        try:
+            os.makedirs(dirpath)
+        except OSError:
+            # Created by other thread
+            if not os.path.isdir(dirpath):
+                raise
+
+    file_hash = hashlib.sha256()
+    size = 0
+    with zip_getter().open(archive_name, "r") as src_stream:
+        with open(dst_path, "wb") as dst_stream:
+            while True:
+                chunk = src_stream.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                file_hash.update(chunk)
+                size += len(chunk)
+                dst_stream.write(chunk)
+
+    if expected is None:
+        return None
+
+    if expected.get("mtime") is not None:
+        os.utime(dst_path, (expected["mtime"], expected["mtime"]))
+
+    if size != expected["size"]:
+        return "{}: size {} does not match expected {}".format(
+            archive_name, size, expected["size"]
+        )
+    expected_hash = expected.get("hash")
+    if expected_hash and expected_hash != "sha256:" + file_hash.hexdigest():
+        return "{}: hash does not match".format(archive_name)
+    return None
+
+
+def _unpack_project_files(
+    path_to_zip, manifest, root_path, project_name, workers=None
+):
+    """Extract project files from zip directly to new root.
+
+    Files are extracted by a pool of threads and validated against manifest
+    if the package has one. Unpack is skipped if project files are not in
+    the zip. That can happen if nothing was published yet or only documents
+    were stored to package.
+
+    Args:
+        path_to_zip (str): Path to package zip.
+        manifest (Union[dict[str, Any], None]): Manifest of the package.
+        root_path (str): Path to new root.
+        project_name (str): Name of project.
+        workers (Optional[int]): Number of threads extracting files.
+
+    Returns:
+        list[str]: Errors of files which don't match manifest.
+
+    Raises:
+        ValueError: Zip contains file which would be extracted outside of
+            project directory.
+    """
+
+    prefix = "/".join([PROJECT_FILES_DIR, project_name, ""])
+    with zipfile.ZipFile(path_to_zip, "r") as zip_stream:
+        archive_names = [
+            name
+            for name in zip_stream.namelist()
+            if name.startswith(prefix) and not name.endswith("/")
+        ]
+
+    manifest_files = {}
+    package_id = None
+    merge = False
+    if manifest:
+        manifest_files = manifest["files"]
+        package_id = manifest["id"]
+        merge = bool(manifest.get("base_id"))
+
+    errors = []
+    # Files which should be in this package but are missing
+    archive_names_set = set(archive_names)
+    for archive_name, item in manifest_files.items():
+        if (
+            item["package"] == package_id
+            and archive_name not in archive_names_set
+        ):
+            errors.append("{}: missing in package".format(archive_name))
+
+    if not archive_names:
+        print("Project doesn't have uploaded project files.")
+        return errors
+
+    # Don't allow to write outside of project directory (e.g. '../')
+    project_dir = os.path.join(
+        os.path.abspath(os.path.join(root_path, project_name)), ""
+    )
+    dst_paths = []
+    for archive_name in archive_names:
+        rel_path = archive_name[len(PROJECT_FILES_DIR) + 1:]
+        dst_path = os.path.normpath(
+            os.path.join(os.path.abspath(root_path), rel_path)
+        )
+        if not dst_path.startswith(project_dir):
+            raise ValueError(
+                "Invalid path of file in package \"{}\"".format(archive_name)
+            )
+        dst_paths.append(dst_path)
+
+    _prepare_project_files_dir(root_path, project_name, merge)
+
+    # Each thread uses own zip stream
+    thread_data = threading.local()
+    zip_streams = []
+
+    def zip_getter():
+        zip_stream = getattr(thread_data, "zip_stream", None)
+        if zip_stream is None:
+            zip_stream = zipfile.ZipFile(path_to_zip, "r")
+            thread_data.zip_stream = zip_stream
+            zip_streams.append(zip_stream)
+        return zip_stream
+
+    try:
+        with ThreadPoolExecutor(_get_workers_count(workers)) as executor:
+            futures = []
+            for archive_name, dst_path in zip(archive_names, dst_paths):
+                futures.append(executor.submit(
+                    _extract_file,
+                    zip_getter,
+                    archive_name,
+                    dst_path,
+                    manifest_files.get(archive_name)
+                ))
+
+            for future in futures:
+                error = future.result()
+                if error:
+                    errors.append(error)
+    finally:
+        for zip_stream in zip_streams:
+            zip_stream.close()
+
+    print("Extracted {} files".format(len(archive_names)))
+    return errors
 
 
 def unpack_project(
-    path_to_zip, new_root=None, database_only=None, database_name=None
+    path_to_zip,
+    new_root=None,
+    database_only=None,
+    database_name=None,
+    workers=None
 ):
     """Unpack project zip file to recreate project.
 
+    Incremental package is unpacked over existing project files, so
+    previous package(s) should be unpacked first.
+
     Args:
         path_to_zip (str): Path to zip which was created using 'pack_project'
             function.
@@ -242,6 +617,10 @@ def unpack_project(
             unpacked project.
         database_only (Optional[bool]): Unpack only database from zip.
         database_name (str): Name of database where project will be recreated.
+        workers (Optional[int]): Number of threads extracting files.
+
+    Raises:
+        ValueError: When unpacked files don't match manifest of package.
     """
 
     if database_only is None:
@@ -255,14 +634,12 @@ def unpack_project(
     tmp_dir = tempfile.mkdtemp(prefix="unpack_")
     print("Zip is extracted to temp: {}".format(tmp_dir))
     with zipfile.ZipFile(path_to_zip, "r") as zip_stream:
-        if database_only:
-            for filename in (
-                "{}.json".format(METADATA_FILE_NAME),
-                "{}.json".format(DOCUMENTS_FILE_NAME),
-            ):
-                zip_stream.extract(filename, tmp_dir)
-        else:
-            zip_stream.extractall(tmp_dir)
+        for filename in (
+            "{}.json".format(METADATA_FILE_NAME),
+            "{}.json".format(DOCUMENTS_FILE_NAME),
+        ):
+            zip_stream.extract(filename, tmp_dir)
+    manifest = _load_manifest(path_to_zip)
 
     metadata_json_path = os.path.join(tmp_dir, METADATA_FILE_NAME + ".json")
     with open(metadata_json_path, "r") as stream:
@@ -303,9 +680,18 @@ def unpack_project(
             }}
         )
 
-    _unpack_project_files(tmp_dir, root_path, project_name)
-
     # CLeanup
     print("Cleaning up")
     shutil.rmtree(tmp_dir)
+
+    if not database_only:
+        errors = _unpack_project_files(
+            path_to_zip, manifest, root_path, project_name, workers
+        )
+        if errors:
+            raise ValueError(
+                "Unpacked files don't match package manifest:\n{}".format(
+                    "\n".join(errors)
+                )
+            )
     print("*** Unpack finished ***")
@@ -9,6 +9,10 @@ import six
 
 log = logging.getLogger(__name__)
 
+# Modules imported with 'import_filepath_cached'
+# - {filepath: (fingerprint, module)}
+_IMPORTED_FILES_CACHE = {}
+
 
 def import_filepath(filepath, module_name=None):
     """Import python file as python module.
@@ -45,11 +49,65 @@ def import_filepath(filepath, module_name=None):
     return module
 
 
-def modules_from_path(folder_path):
+def get_file_fingerprint(filepath):
+    """Fingerprint of file used to detect changes of file.
+
+    Args:
+        filepath (str): Path to file.
+
+    Returns:
+        tuple[float, int]: Modification time and size of file.
+    """
+    stat = os.stat(filepath)
+    return (stat.st_mtime, stat.st_size)
+
+
+def get_imported_file_fingerprint(filepath):
+    """Fingerprint of file when was imported with 'import_filepath_cached'.
+
+    Returns:
+        Union[tuple[float, int], None]: Fingerprint or None if file was not
+            imported.
+    """
+    cached = _IMPORTED_FILES_CACHE.get(filepath)
+    if cached is None:
+        return None
+    return cached[0]
+
+
+def import_filepath_cached(filepath, module_name=None):
+    """Import python file as python module and reuse it until file changes.
+
+    Module is imported again only if modification time or size of the file
+    changed since last import. Module object and its content are the same
+    on unchanged file.
+
+    Args:
+        filepath(str): Path to python file.
+        module_name(str): Name of loaded module.
+
+    Returns:
+        types.ModuleType: Imported module.
+    """
+    fingerprint = get_file_fingerprint(filepath)
+    cached = _IMPORTED_FILES_CACHE.get(filepath)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    module = import_filepath(filepath, module_name)
+    _IMPORTED_FILES_CACHE[filepath] = (fingerprint, module)
+    return module
+
+
+def modules_from_path(folder_path, use_cache=False, filepath_filter=None):
     """Get python scripts as modules from a path.
 
     Arguments:
         path (str): Path to folder containing python scripts.
+        use_cache (bool): Reuse modules of files which did not change since
+            last import (see 'import_filepath_cached').
+        filepath_filter (Callable[[str], bool]): Files for which the filter
+            returns 'False' are not imported.
 
     Returns:
         tuple<list, list>: First list contains successfully imported modules
@@ -88,8 +146,14 @@ def modules_from_path(folder_path):
         if not os.path.isfile(full_path):
             continue
 
+        if filepath_filter is not None and not filepath_filter(full_path):
+            continue
+
         try:
-            module = import_filepath(full_path, mod_name)
+            if use_cache:
+                module = import_filepath_cached(full_path, mod_name)
+            else:
+                module = import_filepath(full_path, mod_name)
             modules.append((full_path, module))
 
         except Exception:
@@ -0,0 +1,444 @@
+"""Detection and representation of frame sequences.
+
+Replacement of 'clique.assemble' for big lists of files. Each filename is
+parsed only once and frames of found sequences are stored as ranges
+instead of sorted sets.
+
+Function 'assemble' returns the same output as 'clique.assemble' so it can
+be used where clique collections are expected.
+"""
+
+import re
+import bisect
+import collections
+
+import clique
+
+_DIGITS_REGEX = re.compile(r"\d+")
+_FRAMES_REGEX = re.compile(r"\.(\d+)\.\D+\d?$")
+
+
+def _frames_to_ranges(frames):
+    """Convert frames to sorted list of inclusive ranges.
+
+    Args:
+        frames (Iterable[int]): Frame numbers.
+
+    Returns:
+        list[tuple[int, int]]: Ranges of frames.
+    """
+
+    ranges = []
+    start = end = None
+    for frame in sorted(set(frames)):
+        if start is None:
+            start = end = frame
+        elif frame == end + 1:
+            end = frame
+        else:
+            ranges.append((start, end))
+            start = end = frame
+
+    if start is not None:
+        ranges.append((start, end))
+    return ranges
+
+
+def _format_ranges(ranges):
+    return ", ".join(
+        str(start) if start == end else "{}-{}".format(start, end)
+        for start, end in ranges
+    )
+
+
+class FrameSequence(object):
+    """Sequence of files differing only by frame number.
+
+    Frames are stored as sorted ranges so queries of holes, boundaries and
+    length don't have to go through all frames.
+
+    Args:
+        head (str): Part of filename before frame number.
+        tail (str): Part of filename after frame number.
+        padding (int): Width of frame number. Zero means no padding.
+        frames (Optional[Iterable[int]]): Frame numbers.
+    """
+
+    def __init__(self, head, tail, padding=0, frames=None):
+        self.head = head
+        self.tail = tail
+        self.padding = padding
+        self._set_ranges(_frames_to_ranges(frames or []))
+
+    def _set_ranges(self, ranges):
+        self._ranges = ranges
+        self._starts = [start for start, _ in ranges]
+        self._count = sum(end - start + 1 for start, end in ranges)
+
+    @classmethod
+    def from_ranges(cls, head, tail, padding, ranges):
+        """Create sequence from ranges of frames.
+
+        Args:
+            head (str): Part of filename before frame number.
+            tail (str): Part of filename after frame number.
+            padding (int): Width of frame number.
+            ranges (Iterable[tuple[int, int]]): Inclusive ranges of frames.
+
+        Returns:
+            FrameSequence: Sequence with frames from ranges.
+        """
+
+        sequence = cls(head, tail, padding)
+        merged = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1] + 1:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        sequence._set_ranges(merged)
+        return sequence
+
+    @classmethod
+    def from_collection(cls, collection):
+        """Create sequence from clique collection.
+
+        Args:
+            collection (clique.Collection): Collection to convert.
+
+        Returns:
+            FrameSequence: Sequence with same frames.
+        """
+
+        return cls(
+            collection.head,
+            collection.tail,
+            collection.padding,
+            collection.indexes
+        )
+
+    def to_collection(self):
+        """Convert sequence to clique collection.
+
+        Returns:
+            clique.Collection: Collection with same frames.
+        """
+
+        collection = clique.Collection(self.head, self.tail, self.padding)
+        indexes = collection.indexes
+        # Frames are already sorted and unique so they can be set directly
+        #   without bisecting of each frame in 'SortedSet.add'
+        if isinstance(getattr(indexes, "_members", None), list):
+            indexes._members = list(self)
+        else:
+            indexes.update(self)
+        return collection
+
+    @property
+    def ranges(self):
+        """Inclusive ranges of frames.
+
+        Returns:
+            list[tuple[int, int]]: Sorted ranges of frames.
+        """
+
+        return list(self._ranges)
+
+    @property
+    def start(self):
+        """First frame or None if sequence is empty."""
+        if self._ranges:
+            return self._ranges[0][0]
+        return None
+
+    @property
+    def end(self):
+        """Last frame or None if sequence is empty."""
+        if self._ranges:
+            return self._ranges[-1][1]
+        return None
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for start, end in self._ranges:
+            for frame in range(start, end + 1):
+                yield frame
+
+    def __contains__(self, frame):
+        idx = bisect.bisect_right(self._starts, frame) - 1
+        return idx >= 0 and frame <= self._ranges[idx][1]
+
+    def __eq__(self, other):
+        if not isinstance(other, FrameSequence):
+            return False
+        return (
+            self.head == other.head
+            and self.tail == other.tail
+            and self.padding == other.padding
+            and self._ranges == other._ranges
+        )
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return "<{} \"{}\">".format(self.__class__.__name__, self.format())
+
+    def is_contiguous(self):
+        """Sequence does not have any holes."""
+        return len(self._ranges) < 2
+
+    def holes(self):
+        """Ranges of missing frames between first and last frame.
+
+        Returns:
+            list[tuple[int, int]]: Inclusive ranges of missing frames.
+        """
+
+        return [
+            (self._ranges[idx][1] + 1, self._ranges[idx + 1][0] - 1)
+            for idx in range(len(self._ranges) - 1)
+        ]
+
+    def format_frame(self, frame):
+        """Filename of frame.
+
+        Args:
+            frame (int): Frame number.
+
+        Returns:
+            str: Filename with frame number.
+        """
+
+        if self.padding:
+            frame = str(frame).zfill(self.padding)
+        return "{}{}{}".format(self.head, frame, self.tail)
+
+    def filenames(self):
+        """Filenames of all frames in sequence.
+
+        Returns:
+            list[str]: Filenames in order of frames.
+        """
+
+        return [self.format_frame(frame) for frame in self]
+
+    def format(self, pattern="{head}{padding}{tail} [{ranges}]"):
+        """Format sequence the same way as clique collection.
+
+        Pattern can contain keys "head", "tail", "padding" (in '%04d'
+        format), "range", "ranges" and "holes".
+
+        Args:
+            pattern (str): Pattern to format.
+
+        Returns:
+            str: Formatted pattern.
+        """
+
+        data = {
+            "head": self.head,
+            "tail": self.tail,
+            "padding": "%0{}d".format(self.padding) if self.padding else "%d",
+            "range": "",
+            "ranges": _format_ranges(self._ranges),
+            "holes": _format_ranges(self.holes()),
+        }
+        if self._ranges:
+            data["range"] = _format_ranges([(self.start, self.end)])
+        return pattern.format(**data)
+
+
+def _get_padding(digits):
+    if len(digits) > 1 and digits[0] == "0":
+        return len(digits)
+    return 0
+
+
+def _parse_item(item, frames_pattern):
+    """Parse all numbers in item which can be frame numbers.
+
+    Returns:
+        list[tuple[str, str, int, str]]: Head, tail, padding and digits.
+    """
+
+    if frames_pattern:
+        # Frames pattern is anchored to the end so there is one match at most
+        match = _FRAMES_REGEX.search(item)
+        if match is None:
+            return []
+        start, end = match.span(1)
+        digits = match.group(1)
+        return [(item[:start], item[end:], _get_padding(digits), digits)]
+
+    output = []
+    for match in _DIGITS_REGEX.finditer(item):
+        start, end = match.span()
+        digits = match.group()
+        output.append((item[:start], item[end:], _get_padding(digits), digits))
+    return output
+
+
+def detect_sequences(
+    items,
+    minimum_items=2,
+    frames_pattern=False,
+    assume_padded_when_ambiguous=False
+):
+    """Find frame sequences in filenames.
+
+    Result matches result of 'clique.assemble' without patterns (or with
+    'clique.PATTERNS["frames"]' if 'frames_pattern' is set), but each
+    filename is parsed only once.
+
+    Args:
+        items (Iterable[str]): Filenames or filepaths.
+        minimum_items (int): Minimum number of frames of a sequence.
+        frames_pattern (bool): Only numbers between dots followed by
+            an extension are considered frames (e.g. 'name.0001.exr').
+        assume_padded_when_ambiguous (bool): Sequences where all frames have
+            the same width (e.g. 1000-1010) are considered padded.
+
+    Returns:
+        tuple[list[FrameSequence], list[str]]: Found sequences and items
+            which are not part of any sequence.
+    """
+
+    # Item of each frame per sequence key '(head, tail, padding)'
+    items_by_key = collections.OrderedDict()
+    # Sequence keys of each item with width of frame number
+    keys_by_item = {}
+    remainder = []
+    for item in items:
+        item_keys = []
+        for head, tail, padding, digits in _parse_item(item, frames_pattern):
+            key = (head, tail, padding)
+            frame_items = items_by_key.get(key)
+            if frame_items is None:
+                frame_items = items_by_key[key] = {}
+            frame_items.setdefault(int(digits), item)
+            item_keys.append((key, len(digits)))
+
+        if item_keys:
+            keys_by_item[item] = item_keys
+        else:
+            remainder.append(item)
+
+    # Merge frames without padding into padded sequences if they have the
+    #   same width (e.g. 0998-0999 and 1000-1001)
+    unpadded_keys_by_name = collections.defaultdict(list)
+    for key in items_by_key:
+        head, tail, padding = key
+        if padding == 0:
+            unpadded_keys_by_name[(head, tail)].append(key)
+
+    frames_by_key = {}
+    fully_merged = set()
+    for key, frame_items in items_by_key.items():
+        frames = set(frame_items)
+        frames_by_key[key] = frames
+        head, tail, padding = key
+        if padding == 0:
+            continue
+        for unpadded_key in unpadded_keys_by_name.get((head, tail), []):
+            unpadded_frames = items_by_key[unpadded_key]
+            merged = {
+                frame
+                for frame in unpadded_frames
+                if len(str(abs(frame))) == padding
+            }
+            frames |= merged
+            if len(merged) == len(unpadded_frames):
+                fully_merged.add(unpadded_key)
+
+    kept_keys = set()
+    removed_keys = []
+    for key, frames in frames_by_key.items():
+        if key in fully_merged:
+            continue
+        if len(frames) >= minimum_items:
+            kept_keys.add(key)
+        else:
+            removed_keys.append(key)
+
+    # Items of removed sequences are in remainder if they're not part of
+    #   any other sequence (e.g. based on other number in item)
+    remainder_set = set(remainder)
+    for key in removed_keys:
+        frame_items = items_by_key[key]
+        for frame in sorted(frame_items):
+            item = frame_items[frame]
+            if item in remainder_set:
+                continue
+
+            has_membership = False
+            for (head, tail, padding), width in keys_by_item[item]:
+                if (
+                    (head, tail, padding) in kept_keys
+                    or (padding == 0 and (head, tail, width) in kept_keys)
+                ):
+                    has_membership = True
+                    break
+
+            if not has_membership:
+                remainder_set.add(item)
+                remainder.append(item)
+
+    sequences = []
+    for key, frames in frames_by_key.items():
+        if key not in kept_keys:
+            continue
+        head, tail, padding = key
+        if assume_padded_when_ambiguous and padding == 0:
+            first_width = len(str(min(frames)))
+            if first_width == len(str(max(frames))):
+                padding = first_width
+        sequences.append(FrameSequence(head, tail, padding, frames))
+
+    return sequences, remainder
+
+
+def assemble(
+    iterable,
+    patterns=None,
+    minimum_items=2,
+    case_sensitive=True,
+    assume_padded_when_ambiguous=False
+):
+    """Drop-in replacement of 'clique.assemble'.
+
+    Sequences are detected using 'detect_sequences' and converted to clique
+    collections. Custom patterns, except 'clique.PATTERNS["frames"]', and
+    case insensitive search are passed to clique.
+
+    Returns:
+        tuple[list[clique.Collection], list[str]]: Collections and items
+            which are not part of any collection.
+    """
+
+    frames_pattern = False
+    if patterns is not None:
+        frames_pattern = (
+            len(patterns) == 1
+            and patterns[0] == clique.PATTERNS["frames"]
+        )
+
+    if not case_sensitive or (patterns is not None and not frames_pattern):
+        return clique.assemble(
+            iterable,
+            patterns=patterns,
+            minimum_items=minimum_items,
+            case_sensitive=case_sensitive,
+            assume_padded_when_ambiguous=assume_padded_when_ambiguous
+        )
+
+    sequences, remainder = detect_sequences(
+        iterable,
+        minimum_items,
+        frames_pattern,
+        assume_padded_when_ambiguous
+    )
+    return [sequence.to_collection() for sequence in sequences], remainder
@@ -1,7 +1,10 @@
 import os
 import re
+import copy
 import logging
 import json
+import hashlib
+import threading
 import collections
 import tempfile
 import subprocess
@@ -16,6 +19,17 @@ from .vendor_bin_utils import (
     is_oiio_supported,
 )
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    # Python 2 without 'futures' backport
+    ThreadPoolExecutor = None
+
+try:
+    import OpenImageIO
+except ImportError:
+    OpenImageIO = None
+
 # Max length of string that is supported by ffmpeg
 MAX_FFMPEG_STRING_LEN = 8196
 # Not allowed symbols in attributes for ffmpeg
@@ -78,10 +92,241 @@ def get_transcode_temp_directory():
     )
 
 
-def get_oiio_info_for_input(filepath, logger=None, subimages=False):
-    """Call oiiotool to get information about input and return stdout.
+class MediaInfoCache(object):
+    """Cache of metadata read from media files.
+
+    Metadata are stored in memory and on disk (in temp directory by default)
+    so they're shared across plugins of one publish process and across
+    processes running on the same machine. Keys are created from path,
+    modification time and size of the file, so changed file is never
+    resolved from cache.
+
+    Values must be json serializable. Least recently used items are removed
+    when limit of items is reached.
+
+    Args:
+        cache_dir (Optional[str]): Directory where cache files are stored.
+            Disk cache is disabled if is empty string.
+        max_memory_items (int): Maximum count of items in memory.
+        max_disk_items (int): Maximum count of files on disk.
+    """
+
+    # Check disk limit after each n writes
+    disk_check_frequency = 100
+
+    def __init__(
+        self, cache_dir=None, max_memory_items=512, max_disk_items=20000
+    ):
+        if cache_dir is None:
+            cache_dir = os.path.join(
+                tempfile.gettempdir(), "openpype_media_info"
+            )
+        self._cache_dir = cache_dir
+        self._max_memory_items = max_memory_items
+        self._max_disk_items = max_disk_items
+        self._memory_cache = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._writes_count = 0
+
+    def _get_key(self, kind, filepath, variant):
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return None
+        key = "|".join([
+            kind,
+            os.path.normcase(os.path.abspath(filepath)),
+            str(stat.st_mtime),
+            str(stat.st_size),
+            str(variant)
+        ])
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def _get_cache_filepath(self, key):
+        return os.path.join(self._cache_dir, key + ".json")
+
+    def get(self, kind, filepath, variant=""):
+        """Cached value for a file.
+
+        Args:
+            kind (str): Kind of metadata e.g. 'ffprobe'.
+            filepath (str): Path to file.
+            variant (Any): Additional key which affects stored value.
+
+        Returns:
+            Any: Cached value or None if is not cached.
+        """
+        key = self._get_key(kind, filepath, variant)
+        if key is None:
+            return None
+
+        with self._lock:
+            value = self._memory_cache.pop(key, None)
+            if value is not None:
+                self._memory_cache[key] = value
+                return copy.deepcopy(value)
+
+        if not self._cache_dir:
+            return None
+
+        cache_filepath = self._get_cache_filepath(key)
+        try:
+            with open(cache_filepath, "r") as stream:
+                value = json.load(stream)
+            # Mark file as recently used
+            os.utime(cache_filepath, None)
+        except (OSError, ValueError):
+            return None
+
+        self._set_memory(key, copy.deepcopy(value))
+        return value
+
+    def set(self, kind, filepath, value, variant=""):
+        """Store value for a file.
+
+        Args:
+            kind (str): Kind of metadata e.g. 'ffprobe'.
+            filepath (str): Path to file.
+            value (Any): Json serializable value.
+            variant (Any): Additional key which affects stored value.
+        """
+        key = self._get_key(kind, filepath, variant)
+        if key is None:
+            return
+
+        self._set_memory(key, copy.deepcopy(value))
+        if not self._cache_dir:
+            return
+
+        cache_filepath = self._get_cache_filepath(key)
+        # Write to temp file and rename so other processes can't read
+        #   partially written file
+        tmp_filepath = "{}.{}.{}.tmp".format(
+            cache_filepath, os.getpid(), threading.current_thread().ident
+        )
+        try:
+            if not os.path.exists(self._cache_dir):
+                os.makedirs(self._cache_dir)
+            with open(tmp_filepath, "w") as stream:
+                json.dump(value, stream)
+            os.replace(tmp_filepath, cache_filepath)
+        except (OSError, TypeError, ValueError):
+            if os.path.exists(tmp_filepath):
+                os.remove(tmp_filepath)
+            return
+
+        with self._lock:
+            self._writes_count += 1
+            check_disk = self._writes_count % self.disk_check_frequency == 0
+        if check_disk:
+            self._evict_disk_items()
+
+    def clear(self):
+        """Clear memory and disk cache."""
+        with self._lock:
+            self._memory_cache.clear()
+
+        if self._cache_dir and os.path.exists(self._cache_dir):
+            for filename in os.listdir(self._cache_dir):
+                try:
+                    os.remove(os.path.join(self._cache_dir, filename))
+                except OSError:
+                    pass
+
+    def _set_memory(self, key, value):
+        with self._lock:
+            self._memory_cache.pop(key, None)
+            self._memory_cache[key] = value
+            while len(self._memory_cache) > self._max_memory_items:
+                self._memory_cache.popitem(last=False)
+
+    def _evict_disk_items(self):
+        try:
+            filenames = os.listdir(self._cache_dir)
+        except OSError:
+            return
+
+        if len(filenames) <= self._max_disk_items:
+            return
+
+        items = []
+        for filename in filenames:
+            filepath = os.path.join(self._cache_dir, filename)
+            try:
+                items.append((os.path.getmtime(filepath), filepath))
+            except OSError:
+                pass
+        items.sort()
+        # Remove 10% more than is the limit so the cleanup is not done
+        #   after each write
+        remove_count = (
+            len(items) - self._max_disk_items
+            + int(self._max_disk_items * 0.1)
+        )
+        for _, filepath in items[:remove_count]:
+            try:
+                os.remove(filepath)
+            except OSError:
+                pass
+
+
+_media_info_cache = None
+
+
+def get_media_info_cache():
+    """Media info cache used by transcoding functions.
+
+    Cache can be disabled with 'OPENPYPE_MEDIA_INFO_CACHE' environment
+    variable set to '0'. Disk cache directory can be changed with
+    'OPENPYPE_MEDIA_INFO_CACHE_DIR'.
+
+    Returns:
+        Union[MediaInfoCache, None]: Cache object or None if is disabled.
+    """
+    global _media_info_cache
+
+    if os.environ.get("OPENPYPE_MEDIA_INFO_CACHE") == "0":
+        return None
+
+    if _media_info_cache is None:
+        _media_info_cache = MediaInfoCache(
+            os.environ.get("OPENPYPE_MEDIA_INFO_CACHE_DIR")
+        )
+    return _media_info_cache
+
 
-    Stdout should contain xml format string.
+def _get_oiio_info_xml_in_process(filepath, subimages):
+    """Read image specs with OpenImageIO python module.
+
+    Returns:
+        list[str]: Xml strings of image specs (same as oiiotool output).
+    """
+    image_input = OpenImageIO.ImageInput.open(filepath)
+    if not image_input:
+        raise ValueError("Failed to read input file \"{}\".\n{}".format(
+            filepath, OpenImageIO.geterror()
+        ))
+
+    output = []
+    try:
+        subimage = 0
+        while image_input.seek_subimage(subimage, 0):
+            output.append(
+                image_input.spec().serialize("xml", "detailed")
+            )
+            if not subimages:
+                break
+            subimage += 1
+    finally:
+        image_input.close()
+    return output
+
+
+def _get_oiio_info_xml_subprocess(filepath, subimages, logger):
+    """Read image specs with oiiotool.
+
+    Returns:
+        list[str]: Xml strings of image specs.
     """
     args = [
         get_oiio_tools_path(),
@@ -118,9 +363,37 @@ def get_oiio_info_for_input(filepath, logger=None, subimages=False):
             )
         )
 
+    return [
+        "\n".join(subimage_lines)
+        for subimage_lines in subimages_lines
+    ]
+
+
+def get_oiio_info_for_input(filepath, logger=None, subimages=False):
+    """Call oiiotool to get information about input and return stdout.
+
+    Stdout should contain xml format string. OpenImageIO python module is
+    used instead of oiiotool if is available. Result is cached using
+    'MediaInfoCache'.
+    """
+    cache = get_media_info_cache()
+    xml_texts = None
+    if cache is not None:
+        xml_texts = cache.get("oiio", filepath, subimages)
+
+    if xml_texts is None:
+        if OpenImageIO is not None:
+            xml_texts = _get_oiio_info_xml_in_process(filepath, subimages)
+        else:
+            xml_texts = _get_oiio_info_xml_subprocess(
+                filepath, subimages, logger
+            )
+
+        if cache is not None:
+            cache.set("oiio", filepath, xml_texts, subimages)
+
     output = []
-    for subimage_lines in subimages_lines:
-        xml_text = "\n".join(subimage_lines)
+    for xml_text in xml_texts:
         output.append(parse_oiio_xml_output(xml_text, logger=logger))
 
     if subimages:
@@ -392,7 +665,7 @@ def should_convert_for_ffmpeg(src_filepath):
         return False
 
     # Can't determine if should convert or not without oiio_tool
-    if not is_oiio_supported():
+    if OpenImageIO is None and not is_oiio_supported():
         return None
 
     # Load info about info from oiio tool
@@ -585,7 +858,8 @@ def convert_for_ffmpeg(
 def convert_input_paths_for_ffmpeg(
     input_paths,
     output_dir,
-    logger=None
+    logger=None,
+    workers=None
 ):
     """Convert source file to format supported in ffmpeg.
 
@@ -598,16 +872,25 @@ def convert_input_paths_for_ffmpeg(
     - This way it can handle gaps and can keep input filenames without handling
         frame template
 
+    Each file is converted by separate oiiotool process. Conversion of
+    sequences can run multiple processes at once based on 'workers'. All
+    files are processed even if some of them fail and error with all
+    failed files is raised at the end.
+
     Args:
         input_paths (str): Paths that should be converted. It is expected that
             contains single file or image sequence of samy type.
         output_dir (str): Path to directory where output will be rendered.
             Must not be same as input's directory.
         logger (logging.Logger): Logger used for logging.
+        workers (Optional[int]): Maximum count of conversion processes
+            running at once. Count of cpu cores is used when set to '0'.
+            Files are converted one by one if not set.
 
     Raises:
         ValueError: If input filepath has extension not supported by function.
             Currently is supported only ".exr" extension.
+        RuntimeError: If conversion of any file failed.
     """
     if logger is None:
         logger = logging.getLogger(__name__)
@@ -654,6 +937,39 @@ def convert_input_paths_for_ffmpeg(
         # - this option is crashing if used on multipart exrs
         input_arg += ":ch={}".format(input_channels_str)
 
+    # Attributes are taken from first file so are same for all files
+    erase_args = []
+    for attr_name, attr_value in input_info["attribs"].items():
+        if not isinstance(attr_value, str):
+            continue
+
+        # Remove attributes that have string value longer than allowed
+        #   length for ffmpeg or when containing unallowed symbols
+        erase_reason = "Missing reason"
+        erase_attribute = False
+        if len(attr_value) > MAX_FFMPEG_STRING_LEN:
+            erase_reason = "has too long value ({} chars).".format(
+                len(attr_value)
+            )
+            erase_attribute = True
+
+        if not erase_attribute:
+            for char in NOT_ALLOWED_FFMPEG_CHARS:
+                if char in attr_value:
+                    erase_attribute = True
+                    erase_reason = (
+                        "contains unsupported character \"{}\"."
+                    ).format(char)
+                    break
+
+        if erase_attribute:
+            # Set attribute to empty string
+            logger.info((
+                "Removed attribute \"{}\" from metadata because {}."
+            ).format(attr_name, erase_reason))
+            erase_args.extend(["--eraseattrib", attr_name])
+
+    oiio_cmds = []
     for input_path in input_paths:
         # Prepare subprocess arguments
         oiio_cmd = [
@@ -674,36 +990,7 @@ def convert_input_paths_for_ffmpeg(
             # Use first subimage
             "--subimage", "0"
         ])
-
-        for attr_name, attr_value in input_info["attribs"].items():
-            if not isinstance(attr_value, str):
-                continue
-
-            # Remove attributes that have string value longer than allowed
-            #   length for ffmpeg or when containing unallowed symbols
-            erase_reason = "Missing reason"
-            erase_attribute = False
-            if len(attr_value) > MAX_FFMPEG_STRING_LEN:
-                erase_reason = "has too long value ({} chars).".format(
-                    len(attr_value)
-                )
-                erase_attribute = True
-
-            if not erase_attribute:
-                for char in NOT_ALLOWED_FFMPEG_CHARS:
-                    if char in attr_value:
-                        erase_attribute = True
-                        erase_reason = (
-                            "contains unsupported character \"{}\"."
-                        ).format(char)
-                        break
-
-            if erase_attribute:
-                # Set attribute to empty string
-                logger.info((
-                    "Removed attribute \"{}\" from metadata because {}."
-                ).format(attr_name, erase_reason))
-                oiio_cmd.extend(["--eraseattrib", attr_name])
+        oiio_cmd.extend(erase_args)
 
         # Add last argument - path to output
         base_filename = os.path.basename(input_path)
@@ -711,15 +998,68 @@ def convert_input_paths_for_ffmpeg(
         oiio_cmd.extend([
             "-o", output_path
         ])
+        oiio_cmds.append(oiio_cmd)
+
+    _run_conversion_commands(oiio_cmds, input_paths, workers, logger)
+
+
+def _run_conversion_commands(cmds, input_paths, workers, logger):
+    """Run conversion commands and raise error with all failed inputs."""
+    if not cmds:
+        return
+
+    if ThreadPoolExecutor is None or workers is None:
+        workers = 1
+    elif workers == 0:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(cmds)))
 
-        logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
-        run_subprocess(oiio_cmd, logger=logger)
+    def convert(cmd):
+        logger.debug("Conversion command: {}".format(" ".join(cmd)))
+        try:
+            run_subprocess(cmd, logger=logger)
+        except Exception as exc:
+            return exc
+        return None
+
+    if workers == 1:
+        errors = [convert(cmd) for cmd in cmds]
+    else:
+        logger.debug("Converting {} files with {} workers".format(
+            len(cmds), workers
+        ))
+        # Each conversion runs in separate process, threads only wait
+        #   for them. 'map' keeps order of inputs.
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            errors = list(executor.map(convert, cmds))
+
+    failed = [
+        (input_path, error)
+        for input_path, error in zip(input_paths, errors)
+        if error is not None
+    ]
+    if not failed:
+        return
+
+    for input_path, error in failed:
+        logger.error("Conversion of \"{}\" failed: {}".format(
+            input_path, error
+        ))
+    raise RuntimeError(
+        "Conversion failed for {} of {} files:\n{}".format(
+            len(failed),
+            len(cmds),
+            "\n".join(input_path for input_path, _ in failed)
+        )
+    )
 
 
 # FFMPEG functions
 def get_ffprobe_data(path_to_file, logger=None):
     """Load data about entered filepath via ffprobe.
 
+    Result is cached using 'MediaInfoCache'.
+
     Args:
         path_to_file (str): absolute path
         logger (logging.Logger): injected logger, if empty new is created
@@ -729,6 +1069,21 @@ def get_ffprobe_data(path_to_file, logger=None):
     logger.info(
         "Getting information about input \"{}\".".format(path_to_file)
     )
+    cache = get_media_info_cache()
+    if cache is not None:
+        data = cache.get("ffprobe", path_to_file)
+        if data is not None:
+            logger.debug("Using cached FFprobe data")
+            return data
+
+    data = _get_ffprobe_data(path_to_file, logger)
+    # Don't cache failed probe
+    if cache is not None and "error" not in data:
+        cache.set("ffprobe", path_to_file, data)
+    return data
+
+
+def _get_ffprobe_data(path_to_file, logger):
     args = [
         get_ffmpeg_tool_path("ffprobe"),
         "-hide_banner",
@@ -4,6 +4,7 @@ import os
 import sys
 import json
 import time
+import types
 import inspect
 import logging
 import platform
@@ -23,6 +24,7 @@ from openpype.settings import (
 )
 
 from openpype.settings.lib import (
+    DEFAULTS_DIR,
     get_studio_system_settings_overrides,
     load_json_file
 )
@@ -53,6 +55,10 @@ IGNORED_DEFAULT_FILENAMES = (
     "example_addons",
     "default_modules",
 )
+# Manifest file describing module without import of it's code
+#   {"name": "ftrack", "settings_key": "ftrack"}
+# - module directory with manifest is not imported if is disabled in settings
+MODULE_MANIFEST_FILENAME = "manifest.json"
 
 
 # Inherit from `object` for Python 2 hosts
@@ -152,11 +158,123 @@ class _InterfacesClass(_ModuleClass):
         return self.__attributes__[attr_name]
 
 
+class _LazyModule(types.ModuleType):
+    """Placeholder of OpenPype module which was not imported.
+
+    Modules which have manifest and are disabled in settings are not imported
+    on modules load. Placeholder is stored instead of them and real module is
+    imported on first access to any attribute which is not available
+    without import.
+
+    Args:
+        name (str): Full name of module ('openpype_modules.<basename>').
+        basename (str): Name of module directory.
+        manifest (dict[str, str]): Data from module manifest.
+        import_func (Callable[[], ModuleType]): Import of the module.
+    """
+
+    def __init__(self, name, basename, manifest, filepath, import_func):
+        super(_LazyModule, self).__init__(name)
+        # Can be used without import of module (e.g. by 'inspect')
+        self.__file__ = filepath
+        self._basename = basename
+        self._manifest = manifest
+        self._import_func = import_func
+        self._module = None
+
+    def __getattr__(self, attr_name):
+        return getattr(self.load(), attr_name)
+
+    @property
+    def module_name(self):
+        return self._manifest.get("name") or self._basename
+
+    def is_enabled(self, modules_settings):
+        """Module is not disabled in passed modules settings."""
+        return _is_manifest_module_enabled(self._manifest, modules_settings)
+
+    def load(self):
+        """Import module and replace placeholder with it.
+
+        Returns:
+            ModuleType: Imported module.
+        """
+        if self._module is None:
+            start = time.time()
+            module = self._import_func()
+            _LoadCache.import_times[self._basename] = time.time() - start
+            if module is None:
+                raise ImportError(
+                    "Failed to import module '{}'".format(self._basename)
+                )
+            self._module = module
+        return self._module
+
+
 class _LoadCache:
     interfaces_lock = threading.Lock()
     modules_lock = threading.Lock()
     interfaces_loaded = False
     modules_loaded = False
+    # Import time of modules by module basename
+    import_times = {}
+
+
+def _get_module_manifest(dirpath):
+    """Load module manifest from module directory.
+
+    Returns:
+        Union[dict[str, str], None]: Manifest data or None if module does
+            not have manifest.
+    """
+    manifest_path = os.path.join(dirpath, MODULE_MANIFEST_FILENAME)
+    if not os.path.exists(manifest_path):
+        return None
+    return load_json_file(manifest_path) or None
+
+
+def _is_manifest_module_enabled(manifest, modules_settings):
+    settings_key = manifest.get("settings_key")
+    if not settings_key or modules_settings is None:
+        return True
+    module_settings = modules_settings.get(settings_key)
+    if not isinstance(module_settings, dict):
+        return True
+    return module_settings.get("enabled") is not False
+
+
+def _get_modules_settings_for_load(log):
+    """Modules settings used to decide which modules are imported.
+
+    Full system settings can't be used because default settings of modules
+    require imported modules. Only 'enabled' values are used so core
+    defaults with studio overrides are enough. Manager decides again with
+    full settings.
+
+    All modules are imported if settings are not available.
+
+    Returns:
+        Union[dict[str, Any], None]: Modules settings.
+    """
+    try:
+        modules_settings = load_json_file(os.path.join(
+            DEFAULTS_DIR, SYSTEM_SETTINGS_KEY, "modules.json"
+        ))
+        overrides = get_studio_system_settings_overrides().get("modules")
+    except Exception:
+        log.warning(
+            "Failed to receive system settings. Importing all modules.",
+            exc_info=True
+        )
+        return None
+
+    for key, value in (overrides or {}).items():
+        if isinstance(value, dict) and "enabled" in value:
+            module_settings = modules_settings.get(key)
+            if not isinstance(module_settings, dict):
+                module_settings = modules_settings[key] = {}
+            module_settings["enabled"] = value["enabled"]
+    return modules_settings
 
 
 def get_default_modules_dir():
@@ -318,6 +436,8 @@ def _load_modules():
     module_dirs.insert(0, hosts_dir)
     module_dirs.insert(0, current_dir)
 
+    modules_settings = _get_modules_settings_for_load(log)
+
     processed_paths = set()
     for dirpath in module_dirs:
         # Skip already processed paths
@@ -348,6 +468,7 @@ def _load_modules():
             basename, ext = os.path.splitext(filename)
 
             # Validations
+            manifest = None
             if os.path.isdir(fullpath):
                 # Check existence of init file
                 init_path = os.path.join(fullpath, "__init__.py")
@@ -357,45 +478,44 @@ def _load_modules():
                         " file {}"
                     ).format(fullpath))
                     continue
+                manifest = _get_module_manifest(fullpath)
 
             elif ext not in (".py", ):
                 continue
 
-            # TODO add more logic how to define if folder is module or not
-            # - check manifest and content of manifest
-            try:
-                # Don't import dynamically current directory modules
-                if is_in_current_dir:
-                    import_str = "openpype.modules.{}".format(basename)
-                    new_import_str = "{}.{}".format(modules_key, basename)
-                    default_module = __import__(import_str, fromlist=("", ))
-                    sys.modules[new_import_str] = default_module
-                    setattr(openpype_modules, basename, default_module)
-
-                elif is_in_host_dir:
-                    import_str = "openpype.hosts.{}".format(basename)
-                    new_import_str = "{}.{}".format(modules_key, basename)
-                    # Until all hosts are converted to be able use them as
-                    #   modules is this error check needed
-                    try:
-                        default_module = __import__(
-                            import_str, fromlist=("", )
-                        )
-                        sys.modules[new_import_str] = default_module
-                        setattr(openpype_modules, basename, default_module)
-
-                    except Exception:
-                        log.warning(
-                            "Failed to import host folder {}".format(basename),
-                            exc_info=True
-                        )
-
-                elif os.path.isdir(fullpath):
-                    import_module_from_dirpath(dirpath, filename, modules_key)
+            import_args = (
+                openpype_modules,
+                modules_key,
+                dirpath,
+                filename,
+                is_in_current_dir,
+                is_in_host_dir,
+                log
+            )
+            if (
+                manifest is not None
+                and not _is_manifest_module_enabled(
+                    manifest, modules_settings
+                )
+            ):
+                new_import_str = "{}.{}".format(modules_key, basename)
+                lazy_module = _LazyModule(
+                    new_import_str,
+                    basename,
+                    manifest,
+                    init_path,
+                    lambda args=import_args: _import_module(*args)
+                )
+                sys.modules[new_import_str] = lazy_module
+                setattr(openpype_modules, basename, lazy_module)
+                log.debug("Module '{}' is disabled. Skipping import.".format(
+                    basename
+                ))
+                continue
 
-                else:
-                    module = import_filepath(fullpath)
-                    setattr(openpype_modules, basename, module)
+            start = time.time()
+            try:
+                _import_module(*import_args)
 
             except Exception:
                 if is_in_current_dir:
@@ -406,6 +526,68 @@ def _load_modules():
                     msg = "Failed to import module '{}'.".format(fullpath)
                 log.error(msg, exc_info=True)
 
+            _LoadCache.import_times[basename] = time.time() - start
+
+
+def _import_module(
+    openpype_modules,
+    modules_key,
+    dirpath,
+    filename,
+    is_in_current_dir,
+    is_in_host_dir,
+    log
+):
+    """Import module and store it to 'openpype_modules'.
+
+    Returns:
+        Union[ModuleType, None]: Imported module.
+    """
+    fullpath = os.path.join(dirpath, filename)
+    basename, _ = os.path.splitext(filename)
+    new_import_str = "{}.{}".format(modules_key, basename)
+
+    # Remove placeholder of not imported module
+    if isinstance(openpype_modules.get(basename), _LazyModule):
+        openpype_modules.__attributes__.pop(basename)
+        sys.modules.pop(new_import_str, None)
+
+    # TODO add more logic how to define if folder is module or not
+    # - check manifest and content of manifest
+    # Don't import dynamically current directory modules
+    if is_in_current_dir:
+        import_str = "openpype.modules.{}".format(basename)
+        default_module = __import__(import_str, fromlist=("", ))
+        sys.modules[new_import_str] = default_module
+        setattr(openpype_modules, basename, default_module)
+        return default_module
+
+    if is_in_host_dir:
+        import_str = "openpype.hosts.{}".format(basename)
+        # Until all hosts are converted to be able use them as
+        #   modules is this error check needed
+        try:
+            default_module = __import__(
+                import_str, fromlist=("", )
+            )
+            sys.modules[new_import_str] = default_module
+            setattr(openpype_modules, basename, default_module)
+            return default_module
+
+        except Exception:
+            log.warning(
+                "Failed to import host folder {}".format(basename),
+                exc_info=True
+            )
+        return None
+
+    if os.path.isdir(fullpath):
+        return import_module_from_dirpath(dirpath, filename, modules_key)
+
+    module = import_filepath(fullpath)
+    setattr(openpype_modules, basename, module)
+    return module
+
 
 @six.add_metaclass(ABCMeta)
 class OpenPypeModule:
@@ -529,6 +711,60 @@ class OpenPypeAddOn(OpenPypeModule):
         pass
 
 
+class _NotImportedModule(object):
+    """Disabled module which code was not imported.
+
+    Manager stores this object under name of module so disabled module is
+    still available. Module is imported and initialized on first access to
+    attribute which is not available on this object.
+
+    Args:
+        manager (ModulesManager): Manager which created the object.
+        lazy_module (_LazyModule): Placeholder of python module.
+        modules_settings (dict[str, Any]): Settings passed to module.
+    """
+    enabled = False
+    _id = None
+
+    def __init__(self, manager, lazy_module, modules_settings):
+        self.manager = manager
+        self.name = lazy_module.module_name
+        self._lazy_module = lazy_module
+        self._modules_settings = modules_settings
+        self._module = None
+
+    @property
+    def id(self):
+        if self._id is None:
+            self._id = uuid4()
+        return self._id
+
+    def __getattr__(self, attr_name):
+        if attr_name.startswith("__"):
+            raise AttributeError(attr_name)
+        return getattr(self._get_module(), attr_name)
+
+    def _get_module(self):
+        if self._module is not None:
+            return self._module
+
+        python_module = self._lazy_module.load()
+        for attr_name in dir(python_module):
+            attr = getattr(python_module, attr_name, None)
+            if (
+                inspect.isclass(attr)
+                and issubclass(attr, OpenPypeModule)
+                and not inspect.isabstract(attr)
+                and attr.name == self.name
+            ):
+                self._module = attr(self.manager, self._modules_settings)
+                return self._module
+
+        raise AttributeError(
+            "Module '{}' was not found after import.".format(self.name)
+        )
+
+
 class ModulesManager:
     """Manager of Pype modules helps to load and prepare them to work.
 
@@ -553,6 +789,9 @@ class ModulesManager:
         self.initialize_modules()
         self.connect_modules()
 
+        if os.environ.get("OPENPYPE_PROFILE_STARTUP") == "1":
+            self.print_report()
+
     def __getitem__(self, module_name):
         return self.modules_by_name[module_name]
 
@@ -602,44 +841,36 @@ class ModulesManager:
         modules_settings = system_settings["modules"]
 
         report = {}
+        import_report = {}
         time_start = time.time()
         prev_start_time = time_start
 
         module_classes = []
-        for module in openpype_modules:
-            # Go through globals in `pype.modules`
-            for name in dir(module):
-                modules_item = getattr(module, name, None)
-                # Filter globals that are not classes which inherit from
-                #   OpenPypeModule
-                if (
-                    not inspect.isclass(modules_item)
-                    or modules_item is OpenPypeModule
-                    or modules_item is OpenPypeAddOn
-                    or not issubclass(modules_item, OpenPypeModule)
-                ):
+        lazy_modules = []
+        for basename, module in tuple(openpype_modules.items()):
+            if isinstance(module, _LazyModule):
+                if not module.is_enabled(modules_settings):
+                    lazy_modules.append(module)
                     continue
-
-                # Check if class is abstract (Developing purpose)
-                if inspect.isabstract(modules_item):
-                    # Find abstract attributes by convention on `abc` module
-                    not_implemented = []
-                    for attr_name in dir(modules_item):
-                        attr = getattr(modules_item, attr_name, None)
-                        abs_method = getattr(
-                            attr, "__isabstractmethod__", None
-                        )
-                        if attr and abs_method:
-                            not_implemented.append(attr_name)
-
-                    # Log missing implementations
-                    self.log.warning((
-                        "Skipping abstract Class: {}."
-                        " Missing implementations: {}"
-                    ).format(name, ", ".join(not_implemented)))
+                # Module is enabled in settings of this manager
+                try:
+                    module = module.load()
+                except Exception:
+                    self.log.warning(
+                        "Failed to import module {}.".format(basename),
+                        exc_info=True
+                    )
                     continue
+
+            import_time = _LoadCache.import_times.get(basename)
+            for modules_item in self._get_module_classes(module):
                 module_classes.append(modules_item)
+                # Import time is reported only on first class of module
+                if import_time is not None:
+                    import_report[modules_item.__name__] = import_time
+                    import_time = None
 
+        prev_start_time = time.time()
         for modules_item in module_classes:
             try:
                 name = modules_item.__name__
@@ -664,10 +895,59 @@ class ModulesManager:
                     exc_info=True
                 )
 
+        # Disabled modules which were not imported
+        for lazy_module in lazy_modules:
+            module = _NotImportedModule(self, lazy_module, modules_settings)
+            self.modules.append(module)
+            self.modules_by_id[module.id] = module
+            self.modules_by_name[module.name] = module
+            self.log.debug("[ ] {} (not imported)".format(module.name))
+
         if self._report is not None:
+            import_report[self._report_total_key] = sum(
+                import_report.values()
+            )
+            self._report["Import"] = import_report
             report[self._report_total_key] = time.time() - time_start
             self._report["Initialization"] = report
 
+    def _get_module_classes(self, module):
+        """Classes of OpenPype modules available in python module."""
+        module_classes = []
+        # Go through globals in `pype.modules`
+        for name in dir(module):
+            modules_item = getattr(module, name, None)
+            # Filter globals that are not classes which inherit from
+            #   OpenPypeModule
+            if (
+                not inspect.isclass(modules_item)
+                or modules_item is OpenPypeModule
+                or modules_item is OpenPypeAddOn
+                or not issubclass(modules_item, OpenPypeModule)
+            ):
+                continue
+
+            # Check if class is abstract (Developing purpose)
+            if inspect.isabstract(modules_item):
+                # Find abstract attributes by convention on `abc` module
+                not_implemented = []
+                for attr_name in dir(modules_item):
+                    attr = getattr(modules_item, attr_name, None)
+                    abs_method = getattr(
+                        attr, "__isabstractmethod__", None
+                    )
+                    if attr and abs_method:
+                        not_implemented.append(attr_name)
+
+                # Log missing implementations
+                self.log.warning((
+                    "Skipping abstract Class: {}."
+                    " Missing implementations: {}"
+                ).format(name, ", ".join(not_implemented)))
+                continue
+            module_classes.append(modules_item)
+        return module_classes
+
     def connect_modules(self):
         """Trigger connection with other enabled modules.
 
@@ -1194,6 +1474,10 @@ def get_module_settings_defs():
     log = Logger.get_logger("ModuleSettingsLoad")
 
     for raw_module in openpype_modules:
+        # Disabled modules which were not imported
+        if isinstance(raw_module, _LazyModule):
+            continue
+
         for attr_name in dir(raw_module):
             attr = getattr(raw_module, attr_name)
             if (
@@ -6,7 +6,6 @@ import json
 import re
 from copy import copy, deepcopy
 import requests
-import clique
 
 import pyblish.api
 
@@ -20,7 +19,7 @@ from openpype.pipeline import (
 )
 from openpype.tests.lib import is_in_tests
 from openpype.pipeline.farm.patterning import match_aov_pattern
-from openpype.lib import is_running_from_build
+from openpype.lib import is_running_from_build, sequence_tools
 
 
 def get_resources(project_name, version, extension=None):
@@ -65,7 +64,7 @@ def get_resource_files(resources, frame_range=None):
         list of str: list of collected resources
 
     """
-    res_collections, _ = clique.assemble(resources)
+    res_collections, _ = sequence_tools.assemble(resources)
     assert len(res_collections) == 1, "Multiple collections found"
     res_collection = res_collections[0]
 
@@ -388,7 +387,7 @@ class ProcessSubmittedJobOnFarm(pyblish.api.InstancePlugin):
         subset_resources = get_resources(
             project_name, version, representation.get("ext")
         )
-        r_col, _ = clique.assemble(subset_resources)
+        r_col, _ = sequence_tools.assemble(subset_resources)
 
         # if override remove all frames we are expecting to be rendered
         # so we'll copy only those missing from current render
@@ -462,7 +461,7 @@ class ProcessSubmittedJobOnFarm(pyblish.api.InstancePlugin):
         instances = []
         # go through aovs in expected files
         for aov, files in exp_files[0].items():
-            cols, rem = clique.assemble(files)
+            cols, rem = sequence_tools.assemble(files)
             # we shouldn't have any reminders. And if we do, it should
             # be just one item for single frame renders.
             if not cols and rem:
@@ -612,7 +611,7 @@ class ProcessSubmittedJobOnFarm(pyblish.api.InstancePlugin):
         """
         representations = []
         host_name = os.environ.get("AVALON_APP", "")
-        collections, remainders = clique.assemble(exp_files)
+        collections, remainders = sequence_tools.assemble(exp_files)
 
         # create representation for every collected sequence
         for collection in collections:
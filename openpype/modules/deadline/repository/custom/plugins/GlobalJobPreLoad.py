@@ -2,9 +2,11 @@
 # -*- coding: utf-8 -*-
 import os
 import tempfile
+import time
 from datetime import datetime
 import subprocess
 import json
+import hashlib
 import platform
 import uuid
 import re
@@ -15,6 +17,9 @@ from Deadline.Scripting import (
     ProcessUtils,
 )
 
+ENV_CACHE_DIRNAME = "openpype_env_cache"
+DEFAULT_ENV_CACHE_TTL = 3600
+
 VERSION_REGEX = re.compile(
     r"(?P<major>0|[1-9]\d*)"
     r"\.(?P<minor>0|[1-9]\d*)"
@@ -286,6 +291,98 @@ def get_requested_openpype_executable(
     return FileUtils.SearchFileList(";".join(exe_list))
 
 
+def get_environment_cache_ttl():
+    """Lifetime of cached environments from plugin configuration.
+
+    Returns:
+        int: Lifetime in seconds, cache is disabled when is 0.
+    """
+    config = RepositoryUtils.GetPluginConfig("OpenPype")
+    value = config.GetConfigEntryWithDefault(
+        "EnvironmentCacheTTL", str(DEFAULT_ENV_CACHE_TTL)
+    )
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        return DEFAULT_ENV_CACHE_TTL
+
+
+def get_environment_cache_path(job_id, exe, context):
+    """Path to environment cache file on this node.
+
+    Cache is used only by tasks of the same job using the same OpenPype
+    executable and context.
+    """
+    key = json.dumps([job_id, exe, context], sort_keys=True)
+    filename = "{}.json".format(
+        hashlib.sha1(key.encode("utf-8")).hexdigest()
+    )
+    return os.path.join(tempfile.gettempdir(), ENV_CACHE_DIRNAME, filename)
+
+
+def load_environment_cache(cache_path, ttl):
+    """Load cached environment if is not older than ttl.
+
+    Cache files are replaced atomically by OpenPype process so they can be
+    read without locking.
+
+    Returns:
+        Union[dict[str, str], None]: Environment or None if cache is not
+            available.
+    """
+    try:
+        with open(cache_path, "r") as stream:
+            data = json.load(stream)
+    except (IOError, OSError, ValueError):
+        return None
+
+    if not isinstance(data, dict) or "env" not in data:
+        return None
+
+    if (time.time() - data.get("created", 0)) > ttl:
+        return None
+    return data["env"]
+
+
+def store_environment_cache(cache_path, env):
+    """Store environment to cache file.
+
+    Used when OpenPype process did not store the cache (older versions).
+    """
+    dirpath = os.path.dirname(cache_path)
+    tmp_path = "{}.{}.tmp".format(cache_path, uuid.uuid4())
+    try:
+        if not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+        with open(tmp_path, "w") as stream:
+            json.dump({"created": time.time(), "env": env}, stream)
+        os.replace(tmp_path, cache_path)
+
+    except OSError:
+        if os.path.exists(tmp_path):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def cleanup_environment_cache(cache_dir, ttl):
+    """Remove cache files of old jobs."""
+    if not os.path.isdir(cache_dir):
+        return
+
+    # Keep files longer than ttl so they can be validated by settings
+    max_age = max(ttl * 24, 24 * 60 * 60)
+    now = time.time()
+    for filename in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, filename)
+        try:
+            if (now - os.path.getmtime(path)) > max_age:
+                os.remove(path)
+        except OSError:
+            pass
+
+
 def inject_openpype_environment(deadlinePlugin):
     """ Pull env vars from OpenPype and push them to rendering process.
 
@@ -321,20 +418,6 @@ def inject_openpype_environment(deadlinePlugin):
 
         print("--- OpenPype executable: {}".format(exe))
 
-        # tempfile.TemporaryFile cannot be used because of locking
-        temp_file_name = "{}_{}.json".format(
-            datetime.utcnow().strftime('%Y%m%d%H%M%S%f'),
-            str(uuid.uuid1())
-        )
-        export_url = os.path.join(tempfile.gettempdir(), temp_file_name)
-        print(">>> Temporary path: {}".format(export_url))
-
-        args = [
-            "--headless",
-            "extractenvironments",
-            export_url
-        ]
-
         add_kwargs = {
             "project": job.GetJobEnvironmentKeyValue("AVALON_PROJECT"),
             "asset": job.GetJobEnvironmentKeyValue("AVALON_ASSET"),
@@ -342,38 +425,34 @@ def inject_openpype_environment(deadlinePlugin):
             "app": job.GetJobEnvironmentKeyValue("AVALON_APP_NAME"),
             "envgroup": "farm"
         }
-
-        if job.GetJobEnvironmentKeyValue('IS_TEST'):
-            args.append("--automatic-tests")
-
-        if all(add_kwargs.values()):
-            for key, value in add_kwargs.items():
-                args.extend(["--{}".format(key), value])
-        else:
+        if not all(add_kwargs.values()):
             raise RuntimeError((
                 "Missing required env vars: AVALON_PROJECT, AVALON_ASSET,"
                 " AVALON_TASK, AVALON_APP_NAME"
             ))
 
-        if not os.environ.get("OPENPYPE_MONGO"):
-            print(">>> Missing OPENPYPE_MONGO env var, process won't work")
-
-        os.environ["AVALON_TIMEOUT"] = "5000"
-
-        args_str = subprocess.list2cmdline(args)
-        print(">>> Executing: {} {}".format(exe, args_str))
-        process_exitcode = deadlinePlugin.RunProcess(
-            exe, args_str, os.path.dirname(exe), -1
-        )
-
-        if process_exitcode != 0:
-            raise RuntimeError(
-                "Failed to run OpenPype process to extract environments."
+        # Tasks of the same job on this node reuse extracted environment
+        cache_path = None
+        contents = None
+        cache_ttl = get_environment_cache_ttl()
+        if cache_ttl:
+            cache_path = get_environment_cache_path(
+                job.JobId, exe, add_kwargs
             )
+            contents = load_environment_cache(cache_path, cache_ttl)
 
-        print(">>> Loading file ...")
-        with open(export_url) as fp:
-            contents = json.load(fp)
+        if contents is not None:
+            print(">>> Using cached environment {}".format(cache_path))
+        else:
+            contents = extract_environment(
+                deadlinePlugin, job, exe, add_kwargs, cache_path
+            )
+            if cache_path:
+                if load_environment_cache(cache_path, cache_ttl) is None:
+                    store_environment_cache(cache_path, contents)
+                cleanup_environment_cache(
+                    os.path.dirname(cache_path), cache_ttl
+                )
 
         for key, value in contents.items():
             deadlinePlugin.SetProcessEnvironmentVariable(key, value)
@@ -384,9 +463,6 @@ def inject_openpype_environment(deadlinePlugin):
             print(">>> Setting script path {}".format(script_url))
             job.SetJobPluginInfoKeyValue("ScriptFilename", script_url)
 
-        print(">>> Removing temporary file")
-        os.remove(export_url)
-
         print(">> Injection end.")
     except Exception as e:
         if hasattr(e, "output"):
@@ -398,6 +474,96 @@ def inject_openpype_environment(deadlinePlugin):
         raise
 
 
+def run_process_with_output(exe, args):
+    """Run process and print its output.
+
+    Output is returned to be able to check for errors of the process.
+
+    Returns:
+        tuple[int, str]: Exit code and output of the process.
+    """
+    proc = subprocess.Popen(
+        [exe] + args,
+        cwd=os.path.dirname(exe),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        universal_newlines=True
+    )
+    lines = []
+    for line in proc.stdout:
+        print(line.rstrip("\n"))
+        lines.append(line)
+    proc.stdout.close()
+    return proc.wait(), "".join(lines)
+
+
+def extract_environment(deadlinePlugin, job, exe, add_kwargs, cache_path):
+    """Run OpenPype process to extract environment for job context.
+
+    Returns:
+        dict[str, str]: Extracted environment.
+    """
+    # tempfile.TemporaryFile cannot be used because of locking
+    temp_file_name = "{}_{}.json".format(
+        datetime.utcnow().strftime('%Y%m%d%H%M%S%f'),
+        str(uuid.uuid1())
+    )
+    export_url = os.path.join(tempfile.gettempdir(), temp_file_name)
+    print(">>> Temporary path: {}".format(export_url))
+
+    args = [
+        "--headless",
+        "extractenvironments",
+        export_url
+    ]
+
+    if job.GetJobEnvironmentKeyValue('IS_TEST'):
+        args.append("--automatic-tests")
+
+    for key, value in add_kwargs.items():
+        args.extend(["--{}".format(key), value])
+
+    if not os.environ.get("OPENPYPE_MONGO"):
+        print(">>> Missing OPENPYPE_MONGO env var, process won't work")
+
+    os.environ["AVALON_TIMEOUT"] = "5000"
+
+    process_exitcode = None
+    if cache_path:
+        cache_args = args + ["--cache-path", cache_path]
+        print(">>> Executing: {} {}".format(
+            exe, subprocess.list2cmdline(cache_args)))
+        process_exitcode, output = run_process_with_output(exe, cache_args)
+        # Older OpenPype versions don't support cache, fail on other errors
+        if (
+            process_exitcode != 0
+            and "no such option: --cache-path" not in output.lower()
+        ):
+            raise RuntimeError(
+                "Failed to run OpenPype process to extract environments."
+            )
+
+    if process_exitcode != 0:
+        args_str = subprocess.list2cmdline(args)
+        print(">>> Executing: {} {}".format(exe, args_str))
+        process_exitcode = deadlinePlugin.RunProcess(
+            exe, args_str, os.path.dirname(exe), -1
+        )
+
+    if process_exitcode != 0:
+        raise RuntimeError(
+            "Failed to run OpenPype process to extract environments."
+        )
+
+    print(">>> Loading file ...")
+    with open(export_url) as fp:
+        contents = json.load(fp)
+
+    print(">>> Removing temporary file")
+    os.remove(export_url)
+    return contents
+
+
 def inject_render_job_id(deadlinePlugin):
     """Inject dependency ids to publish process as env var for validation."""
     print(">>> Injecting render job id ...")
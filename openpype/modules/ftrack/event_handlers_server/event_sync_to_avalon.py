@@ -4,6 +4,7 @@ import json
 import time
 import datetime
 import atexit
+import threading
 import traceback
 
 from bson.objectid import ObjectId
@@ -19,6 +20,7 @@ from openpype.client import (
     get_asset_ids_with_subsets
 )
 from openpype.client.operations import CURRENT_ASSET_DOC_SCHEMA
+from openpype.settings import get_system_settings
 from openpype.pipeline import AvalonMongoDB, schema
 
 from openpype_modules.ftrack.lib import (
@@ -92,6 +94,27 @@ class SyncToAvalonEvent(BaseEvent):
         self.dbcon = AvalonMongoDB()
         # Set processing session to not use global
         self.set_process_session(session)
+
+        # Batching of events
+        # - events received within 'batch_delay' are processed together
+        # - handler is shared by all projects so system settings are used
+        sync_settings = (
+            get_system_settings()["modules"]["ftrack"]
+            .get("sync_to_avalon") or {}
+        )
+        self.batch_delay = sync_settings.get("batch_delay") or 0
+        self.batch_max_events = sync_settings.get("batch_max_events") or 1
+        self._pending_events = []
+        self._pending_lock = threading.Lock()
+        self._process_lock = threading.Lock()
+        self._batch_timer = None
+        self._batch_metrics = {
+            "batches": 0,
+            "events": 0,
+            "max_batch_size": 0,
+            "latency": 0.0,
+            "max_latency": 0.0
+        }
         super().__init__(session)
 
     def debug_logs(self):
@@ -113,6 +136,19 @@ class SyncToAvalonEvent(BaseEvent):
         self.log.debug(
             "DEBUG MESSAGE: Known types {}".format(known_entityTypes)
         )
+        metrics = self._batch_metrics
+        if metrics["batches"]:
+            self.log.debug((
+                "DEBUG MESSAGE: Processed {} events in {} batches"
+                " (max batch size {}, avg latency {:.2f}s,"
+                " max latency {:.2f}s)"
+            ).format(
+                metrics["events"],
+                metrics["batches"],
+                metrics["max_batch_size"],
+                metrics["latency"] / metrics["batches"],
+                metrics["max_latency"]
+            ))
 
     @property
     def cur_project(self):
@@ -595,8 +631,234 @@ class SyncToAvalonEvent(BaseEvent):
         return "/".join([ent["name"] for ent in entity["link"]])
 
     def launch(self, session, event):
+        """Main entry point for synchronization.
+
+        Events are collected for 'batch_delay' seconds and changes of all
+        collected events are synchronized together. Events are processed
+        in separated thread when delay is used.
+
+        Args:
+            session (ftrack_api.Session): Session to ftrack.
+            event (ftrack_api.event.base.Event): Event content.
+
+        Returns:
+            bool: Event was accepted.
+        """
+        if self.batch_delay <= 0:
+            self.process_events([(time.time(), event)])
+            return True
+
+        with self._pending_lock:
+            self._pending_events.append((time.time(), event))
+            process_now = len(self._pending_events) >= self.batch_max_events
+            if not process_now and self._batch_timer is None:
+                self._batch_timer = threading.Timer(
+                    self.batch_delay, self._process_pending
+                )
+                self._batch_timer.daemon = True
+                self._batch_timer.start()
+
+        if process_now:
+            self._process_pending()
+        return True
+
+    def register(self):
+        super().register()
+        # Collected events are already marked as processed by event
+        #   processor so they must be processed before it stops
+        self.session.event_hub.subscribe(
+            "topic=ftrack.meta.disconnected", self._on_disconnect
+        )
+        atexit.register(self._process_pending)
+
+    def _on_disconnect(self, event):
+        self._process_pending()
+
+    def _process_pending(self):
+        """Process collected events right away."""
+        with self._pending_lock:
+            if self._batch_timer is not None:
+                self._batch_timer.cancel()
+                self._batch_timer = None
+            items, self._pending_events = self._pending_events, []
+
+        if items:
+            try:
+                self.process_events(items)
+            except Exception:
+                self.log.error(
+                    "Failed to process batch of events.", exc_info=True
+                )
+
+    def process_events(self, items):
+        """Process batch of events.
+
+        Events are grouped by project and changes of events in a group are
+        merged into one event. Event changing auto sync of project is
+        processed separately.
+
+        Args:
+            items (list[tuple[float, ftrack_api.event.base.Event]]): Received
+                time and event.
+        """
+        with self._process_lock:
+            started = time.time()
+            for events in self._split_events(items):
+                event = self.merge_events(events)
+                if event is not None:
+                    self.process_event(self.session, event)
+
+            ended = time.time()
+            latency = ended - items[0][0]
+            metrics = self._batch_metrics
+            metrics["batches"] += 1
+            metrics["events"] += len(items)
+            metrics["max_batch_size"] = max(
+                metrics["max_batch_size"], len(items)
+            )
+            metrics["latency"] += latency
+            metrics["max_latency"] = max(metrics["max_latency"], latency)
+            if len(items) > 1:
+                self.log.debug((
+                    "Batch of {} events processed in {:.2f}s"
+                    " (latency {:.2f}s)"
+                ).format(len(items), ended - started, latency))
+
+    def _get_event_project_id(self, event):
+        for ent_info in event["data"].get("entities") or []:
+            if ent_info.get("entityType") == "show":
+                return ent_info.get("entityId")
+            for parent in ent_info.get("parents") or []:
+                if parent.get("entityType") == "show":
+                    return parent.get("entityId")
+        return None
+
+    def _is_auto_sync_change(self, event):
+        for ent_info in event["data"].get("entities") or []:
+            if (
+                ent_info.get("entityType") == "show"
+                and CUST_ATTR_AUTO_SYNC in (ent_info.get("changes") or {})
+            ):
+                return True
+        return False
+
+    def _split_events(self, items):
+        """Split events into groups which can be merged.
+
+        Order of events of a project is kept. Change of auto sync stops
+        synchronization of the project so following events can't be merged
+        with previous events.
+
+        Returns:
+            list[list[ftrack_api.event.base.Event]]: Groups of events.
+        """
+        groups_by_project_id = collections.OrderedDict()
+        for _, event in items:
+            project_id = self._get_event_project_id(event)
+            groups = groups_by_project_id.setdefault(project_id, [[]])
+            if project_id is None or self._is_auto_sync_change(event):
+                if groups[-1]:
+                    groups.append([])
+                groups[-1].append(event)
+                groups.append([])
+            else:
+                groups[-1].append(event)
+
+        output = []
+        for groups in groups_by_project_id.values():
+            output.extend(group for group in groups if group)
+        return output
+
+    def merge_events(self, events):
+        """Merge changes of multiple events into one event.
+
+        Changes of the same entity are merged so each entity is processed
+        only once. Entities which were created and removed in the batch
+        are skipped. Task changes are kept as they are because they're only
+        collecting ids of parents.
+
+        Args:
+            events (list[ftrack_api.event.base.Event]): Events to merge.
+
+        Returns:
+            Union[ftrack_api.event.base.Event, None]: Merged event or None
+                when changes are cancelling each other.
+        """
+        if len(events) == 1:
+            return events[0]
+
+        merged_by_id = collections.OrderedDict()
+        other_infos = []
+        for event in events:
+            for ent_info in event["data"].get("entities") or []:
+                ftrack_id = ent_info.get("entityId")
+                entity_type = ent_info.get("entity_type") or ""
+                if (
+                    not isinstance(ftrack_id, str)
+                    or entity_type.lower() == "task"
+                ):
+                    other_infos.append(ent_info)
+                    continue
+
+                ent_info = copy.deepcopy(ent_info)
+                prev_info = merged_by_id.pop(ftrack_id, None)
+                if prev_info is not None:
+                    ent_info = self._merge_entity_info(prev_info, ent_info)
+                if ent_info is not None:
+                    merged_by_id[ftrack_id] = ent_info
+
+        entities_info = list(merged_by_id.values()) + other_infos
+        if not entities_info:
+            return None
+
+        last_event = events[-1]
+        data = dict(last_event["data"])
+        data["entities"] = entities_info
+        return ftrack_api.event.base.Event(
+            topic=last_event["topic"],
+            data=data,
+            source=last_event.get("source"),
+            target=last_event.get("target") or "",
+            in_reply_to_event=last_event.get("in_reply_to_event")
+        )
+
+    def _merge_entity_info(self, prev_info, ent_info):
+        prev_action = prev_info["action"]
+        action = ent_info["action"]
+        if prev_action == "add":
+            # Entity did not exist before batch
+            if action == "remove":
+                return None
+            # Added entity is queried from ftrack with current values
+            return prev_info
+
+        if action in ("add", "remove") or prev_action == "remove":
+            return ent_info
+
+        # Merge 'update' and 'move' changes
+        keys = list(prev_info.get("keys") or [])
+        for key in ent_info.get("keys") or []:
+            if key not in keys:
+                keys.append(key)
+
+        prev_changes = prev_info.get("changes") or {}
+        changes = dict(prev_changes)
+        for key, change in (ent_info.get("changes") or {}).items():
+            prev_change = prev_changes.get(key)
+            if prev_change is not None and change is not None:
+                change = dict(change)
+                change["old"] = prev_change.get("old")
+            changes[key] = change
+
+        if "move" in (prev_action, action):
+            ent_info["action"] = "move"
+        ent_info["keys"] = keys
+        ent_info["changes"] = changes
+        return ent_info
+
+    def process_event(self, session, event):
         """
-            Main entry port for synchronization.
+            Synchronization of changes in an event.
             Goes through event (can contain multiple changes) and decides if
             the event is interesting for us (interest_entTypes).
             It separates changes into add|remove|update.
@@ -699,7 +961,7 @@ class SyncToAvalonEvent(BaseEvent):
             auto_sync = changes[CUST_ATTR_AUTO_SYNC]["new"]
             turned_on = auto_sync == "1"
             ft_project = self.cur_project
-            username = self._get_username(session, event)
+            username = self._get_username(self.process_session, event)
             message = (
                 "Auto sync was turned {} for project \"{}\" by \"{}\"."
             ).format(
@@ -112,14 +112,45 @@ class StorerEventHub(SocketBaseEventHub):
 
 
 class ProcessEventHub(SocketBaseEventHub):
+    """Event hub processing events stored in Mongo DB by event storer.
+
+    New events are received using Mongo change streams. Polling of the
+    collection is used as fallback when change streams are not available
+    (e.g. Mongo server is not a replica set).
+
+    Processed events are marked in Mongo DB in batches and are removed by
+    TTL index after 'processed_lifetime'. If the index can't be created
+    are processed events removed periodically.
+    """
     hearbeat_msg = b"processor"
 
     is_collection_created = False
     pypelog = Logger.get_logger("Session Processor")
 
+    # Max. number of processed events before they're marked in database
+    ack_batch_size = 50
+    # Max. time in seconds before processed events are marked in database
+    ack_interval = 1.0
+    # Wait time for new events
+    poll_interval = 0.5
+    # Max. number of changes received from change stream at once
+    receive_batch_size = 100
+    # How long are processed events kept in database
+    processed_lifetime = datetime.timedelta(days=3)
+    # Interval of removement of processed events if TTL index is not used
+    cleanup_interval = 3600
+    ttl_index_name = "processed_events_ttl"
+
     def __init__(self, *args, **kwargs):
         self.mongo_url = None
         self.dbcon = None
+        self._change_stream = None
+        self._resume_token = None
+        self._loaded_ids = set()
+        self._processed_ids = []
+        self._last_ack_time = time.time()
+        self._use_ttl_index = False
+        self._last_cleanup = None
 
         super(ProcessEventHub, self).__init__(*args, **kwargs)
 
@@ -129,6 +160,7 @@ class ProcessEventHub(SocketBaseEventHub):
             mongo_client = OpenPypeMongoConnection.get_mongo_client()
             self.dbcon = mongo_client[database_name][collection_name]
             self.mongo_client = mongo_client
+            self._ensure_indexes()
 
         except pymongo.errors.AutoReconnect:
             self.pypelog.error((
@@ -145,31 +177,67 @@ class ProcessEventHub(SocketBaseEventHub):
             self.sock.sendall(b"MongoError")
             sys.exit(0)
 
+    def _ensure_indexes(self):
+        self.dbcon.create_index([
+            ("pype_data.is_processed", pymongo.ASCENDING),
+            ("pype_data.stored", pymongo.ASCENDING)
+        ])
+        try:
+            self.dbcon.create_index(
+                "pype_data.stored",
+                name=self.ttl_index_name,
+                expireAfterSeconds=int(
+                    self.processed_lifetime.total_seconds()
+                ),
+                partialFilterExpression={"pype_data.is_processed": True}
+            )
+            self._use_ttl_index = True
+
+        except pymongo.errors.PyMongoError:
+            self.pypelog.info((
+                "Failed to create TTL index. Processed events"
+                " will be removed periodically."
+            ), exc_info=True)
+            self._use_ttl_index = False
+
     def wait(self, duration=None):
         """Overridden wait
-        Event are loaded from Mongo DB when queue is empty. Handled event is
-        set as processed in Mongo DB.
+        Event are loaded from Mongo DB when queue is empty. Handled events
+        are set as processed in Mongo DB in batches.
         """
         started = time.time()
         self.prepare_dbcon()
+        # Start watching before loading of stored events so events stored
+        #   in the meantime are not missed
+        self._open_change_stream()
+        self.load_events()
+        try:
+            self._process_events(started, duration)
+        finally:
+            self._close_change_stream()
+            self._flush_processed()
+
+    def _process_events(self, started, duration):
         while True:
             try:
-                event = self._event_queue.get(timeout=0.1)
+                event = self._event_queue.get_nowait()
             except queue.Empty:
-                if not self.load_events():
-                    time.sleep(0.5)
+                # Receive new events before waiting, events are marked as
+                #   processed only when there is nothing to receive
+                if not self._receive_events():
+                    self._flush_processed()
+                    self._cleanup_processed()
+                    # Change stream waits for new events on its own
+                    if self._change_stream is None:
+                        time.sleep(self.poll_interval)
             else:
                 try:
                     self._handle(event)
 
                     mongo_id = event["data"].get("_event_mongo_id")
-                    if mongo_id is None:
-                        continue
-
-                    self.dbcon.update_one(
-                        {"_id": mongo_id},
-                        {"$set": {"pype_data.is_processed": True}}
-                    )
+                    if mongo_id is not None:
+                        self._processed_ids.append(mongo_id)
+                        self._flush_processed(force=False)
 
                 except pymongo.errors.AutoReconnect:
                     self.pypelog.error((
@@ -184,14 +252,124 @@ class ProcessEventHub(SocketBaseEventHub):
                 if (time.time() - started) > duration:
                     break
 
-    def load_events(self):
-        """Load not processed events sorted by stored date"""
-        ago_date = datetime.datetime.now() - datetime.timedelta(days=3)
+    def _flush_processed(self, force=True):
+        """Mark processed events in database.
+
+        Args:
+            force (bool): Mark events even if batch size or interval
+                was not reached.
+        """
+        if not self._processed_ids:
+            self._last_ack_time = time.time()
+            return
+
+        if (
+            not force
+            and len(self._processed_ids) < self.ack_batch_size
+            and (time.time() - self._last_ack_time) < self.ack_interval
+        ):
+            return
+
+        processed_ids, self._processed_ids = self._processed_ids, []
+        self._last_ack_time = time.time()
+        self.dbcon.update_many(
+            {"_id": {"$in": processed_ids}},
+            {"$set": {"pype_data.is_processed": True}}
+        )
+
+    def _cleanup_processed(self):
+        """Remove old processed events if TTL index is not available."""
+        if self._use_ttl_index:
+            return
+
+        now = time.time()
+        if (
+            self._last_cleanup is not None
+            and (now - self._last_cleanup) < self.cleanup_interval
+        ):
+            return
+        self._last_cleanup = now
+
+        ago_date = datetime.datetime.utcnow() - self.processed_lifetime
         self.dbcon.delete_many({
             "pype_data.stored": {"$lte": ago_date},
             "pype_data.is_processed": True
         })
 
+    def _open_change_stream(self):
+        pipeline = [{"$match": {
+            "operationType": {"$in": ["insert", "replace"]},
+            "fullDocument.pype_data.is_processed": False
+        }}]
+        try:
+            self._change_stream = self.dbcon.watch(
+                pipeline,
+                max_await_time_ms=int(self.poll_interval * 1000),
+                resume_after=self._resume_token
+            )
+            return True
+
+        except Exception:
+            self.pypelog.info((
+                "Mongo change streams are not available."
+                " Using polling of events."
+            ), exc_info=True)
+            self._change_stream = None
+        return False
+
+    def _close_change_stream(self):
+        if self._change_stream is not None:
+            try:
+                self._change_stream.close()
+            except Exception:
+                pass
+            self._change_stream = None
+
+    def _receive_events(self):
+        """Receive new events from change stream or database.
+
+        Change stream is read until there are no changes or until
+        'receive_batch_size' changes were received.
+
+        Returns:
+            bool: New events were received.
+        """
+        if self._change_stream is None:
+            # Mark processed events first so they're not loaded again
+            self._flush_processed()
+            return self.load_events()
+
+        received = False
+        for _ in range(self.receive_batch_size):
+            try:
+                change = self._change_stream.try_next()
+
+            except pymongo.errors.PyMongoError:
+                self.pypelog.warning(
+                    "Change stream failed. Trying to reopen.", exc_info=True
+                )
+                self._close_change_stream()
+                if not self._open_change_stream():
+                    # Load what could be missed, polling is used from now
+                    self._flush_processed()
+                    return self.load_events() or received
+                return received
+
+            if change is None:
+                break
+
+            received = True
+            self._resume_token = self._change_stream.resume_token
+            event_data = change["fullDocument"]
+            # Event stored during initial load of events was already queued
+            if event_data["_id"] in self._loaded_ids:
+                self._loaded_ids.discard(event_data["_id"])
+                continue
+            self._add_event(event_data)
+        return received
+
+    def load_events(self):
+        """Load not processed events sorted by stored date"""
         not_processed_events = self.dbcon.find(
             {"pype_data.is_processed": False}
         ).sort(
@@ -200,24 +378,30 @@ class ProcessEventHub(SocketBaseEventHub):
 
         found = False
         for event_data in not_processed_events:
-            new_event_data = {
-                k: v for k, v in event_data.items()
-                if k not in ["_id", "pype_data"]
-            }
-            try:
-                event = ftrack_api.event.base.Event(**new_event_data)
-                event["data"]["_event_mongo_id"] = event_data["_id"]
-            except Exception:
-                self.logger.exception(L(
-                    'Failed to convert payload into event: {0}',
-                    event_data
-                ))
-                continue
-            found = True
-            self._event_queue.put(event)
-
+            if self._change_stream is not None:
+                self._loaded_ids.add(event_data["_id"])
+            if self._add_event(event_data):
+                found = True
         return found
 
+    def _add_event(self, event_data):
+        new_event_data = {
+            k: v for k, v in event_data.items()
+            if k not in ["_id", "pype_data"]
+        }
+        try:
+            event = ftrack_api.event.base.Event(**new_event_data)
+            event["data"]["_event_mongo_id"] = event_data["_id"]
+        except Exception:
+            self.logger.exception(L(
+                'Failed to convert payload into event: {0}',
+                event_data
+            ))
+            return False
+
+        self._event_queue.put(event)
+        return True
+
     def _handle_packet(self, code, packet_identifier, path, data):
         """Override `_handle_packet` which skip events and extend heartbeat"""
         code_name = self._code_name_mapping[code]
@@ -1,15 +1,122 @@
+import os
 import abc
+import json
+import time
+import hashlib
+
 import six
+import appdirs
+
 from openpype.lib import Logger
+from openpype.lib.file_transaction import (
+    create_content_hasher,
+    HASH_BLOCK_SIZE,
+)
+from ..utils import ResumableError, ChunkChecksumError
 
 log = Logger.get_logger("SyncServer")
 
 
+class TransferJournal(object):
+    """Confirmed progress of chunked transfer of single file.
+
+    Journal is stored locally (even for uploads) so transfer interrupted by
+    lost connection or killed process can continue from the last confirmed
+    chunk. Journal is bound to published 'hash' and size of source file,
+    stored progress is ignored if source file was changed.
+
+    Args:
+        site_name (str): Site where file is transferred to.
+        target_path (str): Resolved path of transferred file on the site.
+        source_hash (str): Published 'hash' of file.
+        source_size (int): Size of source file.
+    """
+    dirpath = os.path.join(
+        appdirs.user_data_dir("openpype", "pypeclub"),
+        "sync_server",
+        "transfers"
+    )
+
+    def __init__(self, site_name, target_path, source_hash, source_size):
+        key = "{}|{}".format(site_name, target_path).encode("utf-8")
+        self.path = os.path.join(
+            self.dirpath, hashlib.sha1(key).hexdigest() + ".json"
+        )
+        self.source_hash = source_hash
+        self.source_size = source_size
+        self.offset = 0
+        self.last_chunk = None
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r") as stream:
+                data = json.load(stream)
+        except ValueError:
+            return
+
+        if (
+            data.get("source_hash") == self.source_hash
+            and data.get("source_size") == self.source_size
+        ):
+            self.offset = data["offset"]
+            self.last_chunk = data.get("last_chunk")
+
+    def confirm(self, offset, size, checksum):
+        """Store that chunk at 'offset' is written on target."""
+        self.offset = offset + size
+        self.last_chunk = {
+            "offset": offset,
+            "size": size,
+            "checksum": checksum
+        }
+        if not os.path.exists(self.dirpath):
+            os.makedirs(self.dirpath)
+        with open(self.path, "w") as stream:
+            json.dump({
+                "source_hash": self.source_hash,
+                "source_size": self.source_size,
+                "offset": self.offset,
+                "last_chunk": self.last_chunk
+            }, stream)
+
+    def rollback_last_chunk(self):
+        """Last confirmed chunk is not valid on target, transfer it again."""
+        if self.last_chunk:
+            self.offset = self.last_chunk["offset"]
+        else:
+            self.offset = 0
+        self.last_chunk = None
+
+    def reset(self):
+        self.offset = 0
+        self.last_chunk = None
+        self.remove()
+
+    def remove(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def chunk_checksum(data):
+    return hashlib.sha1(data).hexdigest()
+
+
 @six.add_metaclass(abc.ABCMeta)
 class AbstractProvider:
     CODE = ''
     LABEL = ''
 
+    # default size of chunk in bytes for chunked transfers, could be
+    #   overridden by 'chunk_size' (MB) in site presets
+    CHUNK_SIZE = 8 * 1024 * 1024
+    # how many times is interrupted chunked transfer resumed in one call
+    CHUNK_RETRIES = 3
+    # suffix of file on target during chunked transfer
+    PARTIAL_SUFFIX = ".oppart"
+
     _log = None
 
     def __init__(self, project_name, site_name, tree=None, presets=None):
@@ -215,3 +322,228 @@ class AbstractProvider:
             raise ValueError(msg)
 
         return path
+
+    def get_chunk_size(self):
+        """Size of chunk in bytes used for chunked transfers."""
+        chunk_size = (self.presets or {}).get("chunk_size")
+        if chunk_size:
+            return int(chunk_size * 1024 * 1024)
+        return self.CHUNK_SIZE
+
+    def get_resumable_errors(self):
+        """Exceptions after which chunked transfer may continue."""
+        return (OSError, EOFError, ResumableError)
+
+    def open_chunk_file(self, path, mode, remote, offset=0):
+        """Open file for chunked transfer.
+
+        Providers using chunked transfers must implement opening of files
+        on their side ('remote' is True).
+
+        Args:
+            path (str): Resolved path to file.
+            mode (str): 'rb' to read, 'r+b' to write into existing file or
+                'wb' to create new file.
+            remote (bool): Path is on provider side, not on local disk.
+            offset (int): Position where reading/writing starts.
+
+        Returns:
+            file-like object with 'read', 'write' and 'truncate'
+        """
+        if remote:
+            raise NotImplementedError(
+                "{} doesn't support chunked transfers".format(
+                    self.__class__.__name__
+                )
+            )
+        stream = open(path, mode)
+        stream.seek(offset)
+        return stream
+
+    def get_chunk_file_size(self, path, remote):
+        """Size of file or None if file does not exist."""
+        if remote:
+            raise NotImplementedError
+        if not os.path.exists(path):
+            return None
+        return os.path.getsize(path)
+
+    def finalize_chunk_file(self, partial_path, path, remote):
+        """Replace 'path' with completely transferred 'partial_path'."""
+        if remote:
+            raise NotImplementedError
+        os.replace(partial_path, path)
+
+    def reset_chunk_transfer(self):
+        """Called when chunked transfer was interrupted before resuming.
+
+        Providers may drop broken connections here.
+        """
+        pass
+
+    def transfer_file_chunked(self, source_path, target_path,
+                              server, project_name, file, representation,
+                              site, direction):
+        """
+            Transfer file in chunks which allows to continue from last
+            confirmed chunk after an error.
+
+            Data are written to temporary file next to 'target_path' which is
+            renamed when whole file is transferred. Confirmed progress is
+            stored in 'TransferJournal'. Checksum of last confirmed chunk is
+            validated on target before transfer is resumed and whole file is
+            validated against 'contentHash' of published file if available.
+
+        Args:
+            source_path (string): resolved source path
+            target_path (string): resolved target path
+            direction (string): 'upload' (target is on provider side) or
+                'download' (source is on provider side)
+
+            arguments for saving progress:
+            server (SyncServer): server instance to call update_db on
+            project_name (str):
+            file (dict): info about uploaded file (matches structure from db)
+            representation (dict): complete repre containing 'file'
+            site (str): site name
+
+        Raises:
+            ResumableError: transfer failed, may be resumed in next loop
+        """
+        upload = direction == "upload"
+        source_size = self.get_chunk_file_size(source_path, not upload)
+        if source_size is None:
+            raise FileNotFoundError(
+                "Source file {} doesn't exist.".format(source_path))
+
+        if upload:
+            # do not spread file which doesn't match published content
+            self._validate_content_hash(source_path, file)
+
+        journal = TransferJournal(
+            self.site_name, target_path, file.get("hash"), source_size
+        )
+        partial_path = target_path + self.PARTIAL_SUFFIX
+        resumable_errors = self.get_resumable_errors()
+        attempt = 0
+        while True:
+            try:
+                self._transfer_chunks(
+                    source_path, partial_path, source_size, journal,
+                    upload, server, project_name, file, representation, site
+                )
+                break
+
+            except resumable_errors as exc:
+                self.reset_chunk_transfer()
+                attempt += 1
+                if attempt > self.CHUNK_RETRIES:
+                    raise ResumableError(
+                        "Transfer of {} interrupted at {}/{} bytes: {}".format(
+                            source_path, journal.offset, source_size, exc
+                        )
+                    )
+                self.log.warning((
+                    "Transfer of {} interrupted at {}/{} bytes, resuming"
+                ).format(source_path, journal.offset, source_size),
+                    exc_info=True)
+
+        self.finalize_chunk_file(partial_path, target_path, upload)
+        journal.remove()
+
+        if not upload:
+            try:
+                self._validate_content_hash(target_path, file)
+            except ChunkChecksumError:
+                os.remove(target_path)
+                raise
+
+    def _transfer_chunks(self, source_path, partial_path, source_size,
+                         journal, upload, server, project_name, file,
+                         representation, site):
+        chunk_size = self.get_chunk_size()
+        partial_size = self.get_chunk_file_size(partial_path, upload)
+        if partial_size is None:
+            journal.reset()
+        elif partial_size < journal.offset:
+            # writes of last chunk might not be finished
+            journal.rollback_last_chunk()
+            if partial_size < journal.offset:
+                journal.reset()
+
+        if journal.offset and journal.last_chunk:
+            # last confirmed chunk might be damaged by interruption
+            last_chunk = journal.last_chunk
+            with self.open_chunk_file(
+                partial_path, "rb", upload, last_chunk["offset"]
+            ) as stream:
+                data = stream.read(last_chunk["size"])
+            if chunk_checksum(data) != last_chunk["checksum"]:
+                self.log.debug("Last chunk of {} is damaged".format(
+                    partial_path))
+                journal.rollback_last_chunk()
+
+        if journal.offset:
+            self.log.debug("Resuming {} from {} bytes".format(
+                source_path, journal.offset))
+            mode = "r+b"
+        else:
+            mode = "wb"
+
+        last_tick = None
+        offset = journal.offset
+        with self.open_chunk_file(
+            source_path, "rb", not upload, offset
+        ) as src:
+            with self.open_chunk_file(
+                partial_path, mode, upload, offset
+            ) as dst:
+                dst.truncate(offset)
+                while journal.offset < source_size:
+                    offset = journal.offset
+                    data = src.read(chunk_size)
+                    if not data:
+                        raise EOFError(
+                            "Unexpected end of {}".format(source_path))
+                    dst.write(data)
+                    dst.flush()
+                    journal.confirm(offset, len(data), chunk_checksum(data))
+
+                    if (
+                        last_tick is None
+                        or time.time() - last_tick >= server.LOG_PROGRESS_SEC
+                    ):
+                        last_tick = time.time()
+                        server.update_db(
+                            project_name=project_name,
+                            new_file_id=None,
+                            file=file,
+                            representation=representation,
+                            site=site,
+                            progress=float(journal.offset) / source_size
+                        )
+
+    def _validate_content_hash(self, path, file):
+        """Compare content of local file with published 'contentHash'."""
+        content_hash = file.get("contentHash")
+        if not content_hash:
+            return
+
+        algorithm, expected = content_hash.split(":", 1)
+        try:
+            hasher = create_content_hasher(algorithm)
+        except ValueError:
+            self.log.debug(
+                "Hash algorithm '{}' is not available".format(algorithm))
+            return
+
+        with open(path, "rb") as stream:
+            while True:
+                block = stream.read(HASH_BLOCK_SIZE)
+                if not block:
+                    break
+                hasher.update(block)
+
+        if hasher.hexdigest() != expected:
+            raise ChunkChecksumError(
+                "Content of {} doesn't match published hash".format(path))
@@ -1,8 +1,5 @@
 from __future__ import print_function
 import os.path
-import shutil
-import threading
-import time
 
 from openpype.lib import Logger
 from openpype.lib.local_settings import get_local_site_id
@@ -92,16 +89,17 @@ class LocalDriveHandler(AbstractProvider):
             raise FileNotFoundError("Source file {} doesn't exist."
                                     .format(source_path))
 
-        if overwrite:
-            thread = threading.Thread(target=self._copy,
-                                      args=(source_path, target_path))
-            thread.start()
-            self._mark_progress(project_name, file, representation, server,
-                                site, source_path, target_path, direction)
-        else:
-            if os.path.exists(target_path):
+        if os.path.exists(target_path):
+            if not overwrite:
                 raise ValueError("File {} exists, set overwrite".
                                  format(target_path))
+            if os.path.samefile(source_path, target_path):
+                log.debug("same files, skipping")
+                return os.path.basename(target_path)
+
+        self.transfer_file_chunked(source_path, target_path,
+                                   server, project_name, file,
+                                   representation, site, direction.lower())
 
         return os.path.basename(target_path)
 
@@ -183,41 +181,18 @@ class LocalDriveHandler(AbstractProvider):
         """
         pass
 
-    def _copy(self, source_path, target_path):
-        print("copying {}->{}".format(source_path, target_path))
-        try:
-            shutil.copy(source_path, target_path)
-        except shutil.SameFileError:
-            print("same files, skipping")
-
-    def _mark_progress(self, project_name, file, representation, server, site,
-                       source_path, target_path, direction):
-        """
-            Updates progress field in DB by values 0-1.
-
-            Compares file sizes of source and target.
-        """
-        source_file_size = os.path.getsize(source_path)
-        target_file_size = 0
-        last_tick = status_val = None
-        while source_file_size != target_file_size:
-            if not last_tick or \
-                    time.time() - last_tick >= server.LOG_PROGRESS_SEC:
-                status_val = target_file_size / source_file_size
-                last_tick = time.time()
-                log.debug(direction + "ed %d%%." % int(status_val * 100))
-                server.update_db(project_name=project_name,
-                                 new_file_id=None,
-                                 file=file,
-                                 representation=representation,
-                                 site=site,
-                                 progress=status_val
-                                 )
-            try:
-                target_file_size = os.path.getsize(target_path)
-            except FileNotFoundError:
-                pass
-            time.sleep(0.5)
+    def open_chunk_file(self, path, mode, remote, offset=0):
+        """Both sides of transfer are on (mounted) local disk."""
+        return super(LocalDriveHandler, self).open_chunk_file(
+            path, mode, False, offset)
+
+    def get_chunk_file_size(self, path, remote):
+        return super(LocalDriveHandler, self).get_chunk_file_size(
+            path, False)
+
+    def finalize_chunk_file(self, partial_path, path, remote):
+        super(LocalDriveHandler, self).finalize_chunk_file(
+            partial_path, path, False)
 
     def _normalize_site_name(self, site_name):
         """Transform user id to 'local' for Local settings"""
@@ -1,15 +1,15 @@
 import os
 import os.path
-import time
-import threading
 import platform
 
 from openpype.lib import Logger
 from openpype.settings import get_system_settings
 from .abstract_provider import AbstractProvider
+from ..utils import ResumableError
 log = Logger.get_logger("SyncServer-SFTPHandler")
 
 pysftp = None
+paramiko = None
 try:
     import pysftp
     import paramiko
@@ -40,6 +40,7 @@ class SFTPHandler(AbstractProvider):
         self.site_name = site_name
         self.root = None
         self._conn = None
+        self._transfer_conn = None
 
         self.presets = presets
         if not self.presets:
@@ -130,6 +131,13 @@ class SFTPHandler(AbstractProvider):
                 'label': "SFTP user ssh key password",
                 'type': 'text'
             },
+            {
+                "type": "number",
+                "key": "chunk_size",
+                "label": "Transfer chunk size (MB)",
+                "decimal": 1,
+                "minimum": 0
+            },
             # roots could be overridden only on Project level, User cannot
             {
                 "key": "root",
@@ -254,19 +262,11 @@ class SFTPHandler(AbstractProvider):
                 raise ValueError("File {} exists, set overwrite".
                                  format(target_path))
 
-        thread = threading.Thread(target=self._upload,
-                                  args=(source_path, target_path))
-        thread.start()
-        self._mark_progress(project_name, file, representation, server,
-                            site, source_path, target_path, "upload")
+        self._transfer(source_path, target_path, server, project_name,
+                       file, representation, site, "upload")
 
         return os.path.basename(target_path)
 
-    def _upload(self, source_path, target_path):
-        print("copying {}->{}".format(source_path, target_path))
-        conn = self._get_conn()
-        conn.put(source_path, target_path)
-
     def download_file(self, source_path, target_path,
                       server, project_name, file, representation, site,
                       overwrite=False):
@@ -300,18 +300,84 @@ class SFTPHandler(AbstractProvider):
                 raise ValueError("File {} exists, set overwrite".
                                  format(target_path))
 
-        thread = threading.Thread(target=self._download,
-                                  args=(source_path, target_path))
-        thread.start()
-        self._mark_progress(project_name, file, representation, server,
-                            site, source_path, target_path, "download")
+        self._transfer(source_path, target_path, server, project_name,
+                       file, representation, site, "download")
 
         return os.path.basename(target_path)
 
-    def _download(self, source_path, target_path):
-        print("downloading {}->{}".format(source_path, target_path))
-        conn = self._get_conn()
-        conn.get(source_path, target_path)
+    def _transfer(self, source_path, target_path, server, project_name,
+                  file, representation, site, direction):
+        """Chunked transfer with own connection, closed at the end."""
+        self._transfer_conn = None
+        try:
+            self.transfer_file_chunked(source_path, target_path, server,
+                                       project_name, file, representation,
+                                       site, direction)
+        finally:
+            self._close_transfer_conn()
+
+    def _get_transfer_conn(self):
+        """
+            Connection used for chunked transfer, recreated after error.
+        """
+        if self._transfer_conn is None:
+            self._transfer_conn = self._get_conn()
+            if self._transfer_conn is None:
+                raise ResumableError("Couldn't connect to {}".format(
+                    self.sftp_host))
+        return self._transfer_conn
+
+    def get_resumable_errors(self):
+        errors = super(SFTPHandler, self).get_resumable_errors()
+        if paramiko is not None:
+            errors += (paramiko.ssh_exception.SSHException, )
+        return errors
+
+    def open_chunk_file(self, path, mode, remote, offset=0):
+        if not remote:
+            return super(SFTPHandler, self).open_chunk_file(
+                path, mode, remote, offset)
+
+        stream = self._get_transfer_conn().open(path, mode)
+        stream.seek(offset)
+        if mode == "rb":
+            # read rest of the file with parallel requests
+            stream.prefetch()
+        else:
+            # do not wait for acknowledgement of each write request,
+            #   unfinished writes are detected when transfer is resumed
+            stream.set_pipelined(True)
+        return stream
+
+    def get_chunk_file_size(self, path, remote):
+        if not remote:
+            return super(SFTPHandler, self).get_chunk_file_size(
+                path, remote)
+
+        conn = self._get_transfer_conn()
+        if not conn.isfile(path):
+            return None
+        return conn.stat(path).st_size
+
+    def finalize_chunk_file(self, partial_path, path, remote):
+        if not remote:
+            return super(SFTPHandler, self).finalize_chunk_file(
+                partial_path, path, remote)
+
+        conn = self._get_transfer_conn()
+        conn.sftp_client.posix_rename(partial_path, path)
+
+    def reset_chunk_transfer(self):
+        # connection might be broken
+        self._close_transfer_conn()
+
+    def _close_transfer_conn(self):
+        if self._transfer_conn is not None:
+            try:
+                self._transfer_conn.close()
+            except Exception:
+                pass
+            self._transfer_conn = None
 
     def delete_file(self, path):
         """
@@ -425,40 +491,3 @@ class SFTPHandler(AbstractProvider):
         except (paramiko.ssh_exception.SSHException,
                 pysftp.exceptions.ConnectionException):
             self.log.warning("Couldn't connect", exc_info=True)
-
-    def _mark_progress(self, project_name, file, representation, server, site,
-                       source_path, target_path, direction):
-        """
-            Updates progress field in DB by values 0-1.
-
-            Compares file sizes of source and target.
-        """
-        pass
-        if direction == "upload":
-            source_file_size = os.path.getsize(source_path)
-        else:
-            source_file_size = self.conn.stat(source_path).st_size
-
-        target_file_size = 0
-        last_tick = status_val = None
-        while source_file_size != target_file_size:
-            if not last_tick or \
-                    time.time() - last_tick >= server.LOG_PROGRESS_SEC:
-                status_val = target_file_size / source_file_size
-                last_tick = time.time()
-                self.log.debug(direction + "ed %d%%." % int(status_val * 100))
-                server.update_db(project_name=project_name,
-                                 new_file_id=None,
-                                 file=file,
-                                 representation=representation,
-                                 site=site,
-                                 progress=status_val
-                                 )
-            try:
-                if direction == "upload":
-                    target_file_size = self.conn.stat(target_path).st_size
-                else:
-                    target_file_size = os.path.getsize(target_path)
-            except FileNotFoundError:
-                pass
-            time.sleep(0.5)
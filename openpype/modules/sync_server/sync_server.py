@@ -1,11 +1,15 @@
 """Python 3 only implementation."""
 import os
+import heapq
 import asyncio
+import itertools
 import threading
+import collections
 import concurrent.futures
 from time import sleep
 
 from .providers import lib
+from openpype.client import get_file_info_path, iter_representation_files
 from openpype.client.entity_links import get_linked_representation_id
 from openpype.lib import Logger
 from openpype.lib.local_settings import get_local_site_id
@@ -43,43 +47,44 @@ async def upload(module, project_name, file, representation, provider_name,
         preset (dictionary): site config ('credentials_url', 'root'...)
 
     """
-    # create ids sequentially, upload file in parallel later
-    with module.lock:
-        # this part modifies structure on 'remote_site', only single
-        # thread can do that at a time, upload/download to prepared
-        # structure should be run in parallel
-        remote_handler = lib.factory.get_provider(provider_name,
-                                                  project_name,
-                                                  remote_site_name,
-                                                  tree=tree,
-                                                  presets=preset)
-
-        file_path = file.get("path", "")
-        local_file_path, remote_file_path = resolve_paths(
-            module, file_path, project_name,
-            remote_site_name, remote_handler
-        )
-
-        target_folder = os.path.dirname(remote_file_path)
-        folder_id = remote_handler.create_folder(target_folder)
-
-        if not folder_id:
-            err = "Folder {} wasn't created. Check permissions.". \
-                format(target_folder)
-            raise NotADirectoryError(err)
-
     loop = asyncio.get_running_loop()
-    file_id = await loop.run_in_executor(None,
-                                         remote_handler.upload_file,
-                                         local_file_path,
-                                         remote_file_path,
-                                         module,
-                                         project_name,
-                                         file,
-                                         representation,
-                                         remote_site_name,
-                                         True
-                                         )
+    semaphore = _get_frames_semaphore(module)
+
+    async def _upload_file(frame_file):
+        async with semaphore:
+            remote_handler, local_file_path, remote_file_path = (
+                await loop.run_in_executor(
+                    None,
+                    _prepare_upload,
+                    module,
+                    project_name,
+                    frame_file,
+                    provider_name,
+                    remote_site_name,
+                    tree,
+                    preset
+                )
+            )
+
+            return await loop.run_in_executor(None,
+                                              remote_handler.upload_file,
+                                              local_file_path,
+                                              remote_file_path,
+                                              module,
+                                              project_name,
+                                              frame_file,
+                                              representation,
+                                              remote_site_name,
+                                              True
+                                              )
+
+    # compact sequence is transferred by frames concurrently and tracked
+    #   as one file
+    file_ids = await asyncio.gather(*[
+        _upload_file(frame_file)
+        for frame_file in iter_representation_files([file])
+    ])
+    file_id = file_ids[-1] if file_ids else None
 
     module.handle_alternate_site(project_name, representation,
                                  remote_site_name,
@@ -107,14 +112,17 @@ async def download(module, project_name, file, representation, provider_name,
         Returns:
         (string) - 'name' of local file
     """
-    with module.lock:
-        remote_handler = lib.factory.get_provider(provider_name,
-                                                  project_name,
-                                                  remote_site_name,
-                                                  tree=tree,
-                                                  presets=preset)
-
-        file_path = file.get("path", "")
+    remote_handler = _get_site_provider(
+        project_name, provider_name, remote_site_name, tree, preset
+    )
+
+    local_site = module.get_active_site(project_name)
+
+    loop = asyncio.get_running_loop()
+    semaphore = _get_frames_semaphore(module)
+
+    async def _download_file(frame_file):
+        file_path = frame_file.get("path", "")
         local_file_path, remote_file_path = resolve_paths(
             module, file_path, project_name, remote_site_name, remote_handler
         )
@@ -122,20 +130,26 @@ async def download(module, project_name, file, representation, provider_name,
         local_folder = os.path.dirname(local_file_path)
         os.makedirs(local_folder, exist_ok=True)
 
-    local_site = module.get_active_site(project_name)
-
-    loop = asyncio.get_running_loop()
-    file_id = await loop.run_in_executor(None,
-                                         remote_handler.download_file,
-                                         remote_file_path,
-                                         local_file_path,
-                                         module,
-                                         project_name,
-                                         file,
-                                         representation,
-                                         local_site,
-                                         True
-                                         )
+        async with semaphore:
+            return await loop.run_in_executor(None,
+                                              remote_handler.download_file,
+                                              remote_file_path,
+                                              local_file_path,
+                                              module,
+                                              project_name,
+                                              frame_file,
+                                              representation,
+                                              local_site,
+                                              True
+                                              )
+
+    # compact sequence is transferred by frames concurrently and tracked
+    #   as one file
+    file_ids = await asyncio.gather(*[
+        _download_file(frame_file)
+        for frame_file in iter_representation_files([file])
+    ])
+    file_id = file_ids[-1] if file_ids else None
 
     module.handle_alternate_site(project_name, representation, local_site,
                                  file["_id"], file_id)
@@ -143,6 +157,63 @@ async def download(module, project_name, file, representation, provider_name,
     return file_id
 
 
+_site_locks_guard = threading.Lock()
+_site_locks = collections.defaultdict(threading.Lock)
+
+
+def _get_site_lock(project_name, site_name):
+    """Lock for changes of folder structure on a site of a project."""
+    with _site_locks_guard:
+        return _site_locks[(project_name, site_name)]
+
+
+def _get_site_provider(project_name, provider_name, site_name, tree, preset):
+    # tree is shared by all files of the site, it's modified by provider
+    with _get_site_lock(project_name, site_name):
+        return lib.factory.get_provider(provider_name,
+                                        project_name,
+                                        site_name,
+                                        tree=tree,
+                                        presets=preset)
+
+
+def _prepare_upload(module, project_name, file, provider_name,
+                    remote_site_name, tree, preset):
+    """Create provider and remote folder for uploaded file.
+
+    Returns:
+        (AbstractProvider, string, string): handler, local and remote path
+    """
+    remote_handler = _get_site_provider(
+        project_name, provider_name, remote_site_name, tree, preset
+    )
+
+    file_path = file.get("path", "")
+    local_file_path, remote_file_path = resolve_paths(
+        module, file_path, project_name,
+        remote_site_name, remote_handler
+    )
+
+    target_folder = os.path.dirname(remote_file_path)
+    # this part modifies structure on 'remote_site', only single
+    # thread can do that at a time, upload/download to prepared
+    # structure should be run in parallel
+    with _get_site_lock(project_name, remote_site_name):
+        folder_id = remote_handler.create_folder(target_folder)
+
+    if not folder_id:
+        err = "Folder {} wasn't created. Check permissions.". \
+            format(target_folder)
+        raise NotADirectoryError(err)
+
+    return remote_handler, local_file_path, remote_file_path
+
+
+def _get_frames_semaphore(module):
+    """Limit of concurrently transferred frames of one compact sequence."""
+    return asyncio.Semaphore(max(1, module.SITE_CONCURRENCY_LIMIT))
+
+
 def resolve_paths(module, file_path, project_name,
                   remote_site_name=None, remote_handler=None):
     """
@@ -286,11 +357,159 @@ def download_last_published_workfile(
     return last_published_workfile_path
 
 
+class SyncTransferJob(object):
+    """Single file transfer scheduled by 'SyncTransferScheduler'.
+
+    Args:
+        direction (str): SyncStatus.DO_UPLOAD or SyncStatus.DO_DOWNLOAD
+        project_name (str): project of representation
+        file (dict): file info from representation
+        representation (dict): representation from 'get_sync_representations'
+        provider_name (str): provider of remote site
+        remote_site (str): name of remote site
+        site (str): site which record is updated in DB after transfer
+        tree (dict): folder structure of remote site
+        preset (dict): remote site config
+    """
+    def __init__(self, direction, project_name, file, representation,
+                 provider_name, remote_site, site, tree, preset):
+        self.direction = direction
+        self.project_name = project_name
+        self.file = file
+        self.representation = representation
+        self.provider_name = provider_name
+        self.remote_site = remote_site
+        self.site = site
+        self.tree = tree
+        self.preset = preset
+
+    @property
+    def priority(self):
+        return self.representation.get("priority") or 0
+
+
+class SyncTransferScheduler(object):
+    """Bounded priority queue of file transfers of all projects.
+
+    Queue keeps transfers with highest priority of all added transfers,
+    transfer with lowest priority is dropped when queue is over limit.
+    Transfers are started by priority (higher first) and run concurrently,
+    limited per provider (by provider batch limit) and per remote site.
+
+    Args:
+        module (SyncServerModule): object to run SyncServerModule API
+        queue_limit (int): maximum number of queued transfers
+        site_limit (int): maximum concurrent transfers per remote site
+    """
+    def __init__(self, module, queue_limit, site_limit):
+        self._module = module
+        self._queue_limit = queue_limit
+        self._site_limit = site_limit
+        # heap with job of lowest priority on top (dropped first)
+        self._jobs = []
+        # keeps order of jobs with same priority
+        self._counter = itertools.count()
+        self._provider_semaphores = {}
+        self._site_semaphores = {}
+
+    def __len__(self):
+        return len(self._jobs)
+
+    def is_full(self):
+        return self._queue_limit and len(self._jobs) >= self._queue_limit
+
+    def add_job(self, job):
+        """Add transfer to queue.
+
+        Transfer with lowest priority is dropped if queue is full, jobs
+        added later are dropped first from jobs with same priority.
+
+        Returns:
+            (bool): False if queue is full and job has lower priority than
+                all queued jobs so it was not added
+        """
+        item = (job.priority, -next(self._counter), job)
+        if not self.is_full():
+            heapq.heappush(self._jobs, item)
+            return True
+
+        if item[:2] < self._jobs[0][:2]:
+            return False
+        heapq.heapreplace(self._jobs, item)
+        return True
+
+    async def run(self):
+        """Process all queued transfers.
+
+        Returns:
+            (dict): {project_name: [(new_file_id, file, representation,
+                site, error)]} - arguments for 'update_db_bulk'
+        """
+        jobs = [
+            item[2]
+            for item in sorted(
+                self._jobs, key=lambda item: (-item[0], -item[1])
+            )
+        ]
+        self._jobs = []
+
+        # tasks are created in priority order, semaphores are fair
+        tasks = [
+            asyncio.create_task(self._run_job(job))
+            for job in jobs
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        output = collections.defaultdict(list)
+        for job, file_id in zip(jobs, results):
+            error = None
+            if isinstance(file_id, BaseException):
+                error = str(file_id)
+                file_id = None
+            output[job.project_name].append(
+                (file_id, job.file, job.representation, job.site, error)
+            )
+        return output
+
+    async def _run_job(self, job):
+        provider_semaphore = self._get_semaphore(
+            self._provider_semaphores,
+            job.provider_name,
+            lib.factory.get_provider_batch_limit(job.provider_name)
+        )
+        site_semaphore = self._get_semaphore(
+            self._site_semaphores, job.remote_site, self._site_limit
+        )
+        async with provider_semaphore, site_semaphore:
+            func = upload
+            if job.direction == SyncStatus.DO_DOWNLOAD:
+                func = download
+            return await func(self._module,
+                              job.project_name,
+                              job.file,
+                              job.representation,
+                              job.provider_name,
+                              job.remote_site,
+                              job.tree,
+                              job.preset)
+
+    @staticmethod
+    def _get_semaphore(semaphores, key, limit):
+        semaphore = semaphores.get(key)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max(1, limit))
+            semaphores[key] = semaphore
+        return semaphore
+
+
 class SyncServerThread(threading.Thread):
     """
         Separate thread running synchronization server with asyncio loop.
         Stopped when tray is closed.
     """
+    # threads used for file transfers of all sites
+    MAX_WORKERS = 8
+
     def __init__(self, module):
         self.log = Logger.get_logger(self.__class__.__name__)
 
@@ -298,7 +517,9 @@ class SyncServerThread(threading.Thread):
         self.module = module
         self.loop = None
         self.is_running = False
-        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=3)
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.MAX_WORKERS
+        )
         self.timer = None
 
     def run(self):
@@ -328,8 +549,8 @@ class SyncServerThread(threading.Thread):
                 - gets list of active remote providers (has configuration,
                     credentials)
                 - for each project_name it looks for representations that
-                  should be synced
-                - synchronize found collections
+                  should be synced and queues their files to scheduler
+                - synchronize queued files of all projects concurrently
                 - update representations - fills error messages for exceptions
                 - waits X seconds and repeat
         Returns:
@@ -341,117 +562,21 @@ class SyncServerThread(threading.Thread):
                 start_time = time.time()
                 self.module.set_sync_project_settings()  # clean cache
                 project_name = None
+                scheduler = SyncTransferScheduler(
+                    self.module,
+                    self.module.TRANSFER_QUEUE_LIMIT,
+                    self.module.SITE_CONCURRENCY_LIMIT
+                )
+                # files of all projects are queued, scheduler keeps files
+                #   with highest priority
                 enabled_projects = self.module.get_enabled_projects()
                 for project_name in enabled_projects:
-                    preset = self.module.sync_project_settings[project_name]
-
-                    local_site, remote_site = self._working_sites(project_name,
-                                                                  preset)
-                    if not all([local_site, remote_site]):
-                        continue
-
-                    sync_repres = self.module.get_sync_representations(
-                        project_name,
-                        local_site,
-                        remote_site
-                    )
-
-                    task_files_to_process = []
-                    files_processed_info = []
-                    # process only unique file paths in one batch
-                    # multiple representation could have same file path
-                    # (textures),
-                    # upload process can find already uploaded file and
-                    # reuse same id
-                    processed_file_path = set()
-
-                    site_preset = preset.get('sites')[remote_site]
-                    remote_provider = \
-                        self.module.get_provider_for_site(site=remote_site)
-                    handler = lib.factory.get_provider(remote_provider,
-                                                       project_name,
-                                                       remote_site,
-                                                       presets=site_preset)
-                    limit = lib.factory.get_provider_batch_limit(
-                        remote_provider)
-                    # first call to get_provider could be expensive, its
-                    # building folder tree structure in memory
-                    # call only if needed, eg. DO_UPLOAD or DO_DOWNLOAD
-                    for sync in sync_repres:
-                        if limit <= 0:
-                            continue
-                        files = sync.get("files") or []
-                        if files:
-                            for file in files:
-                                # skip already processed files
-                                file_path = file.get('path', '')
-                                if file_path in processed_file_path:
-                                    continue
-                                status = self.module.check_status(
-                                    file,
-                                    local_site,
-                                    remote_site,
-                                    preset.get('config'))
-                                if status == SyncStatus.DO_UPLOAD:
-                                    tree = handler.get_tree()
-                                    limit -= 1
-                                    task = asyncio.create_task(
-                                        upload(self.module,
-                                               project_name,
-                                               file,
-                                               sync,
-                                               remote_provider,
-                                               remote_site,
-                                               tree,
-                                               site_preset))
-                                    task_files_to_process.append(task)
-                                    # store info for exception handlingy
-                                    files_processed_info.append((file,
-                                                                 sync,
-                                                                 remote_site,
-                                                                 project_name
-                                                                 ))
-                                    processed_file_path.add(file_path)
-                                if status == SyncStatus.DO_DOWNLOAD:
-                                    tree = handler.get_tree()
-                                    limit -= 1
-                                    task = asyncio.create_task(
-                                        download(self.module,
-                                                 project_name,
-                                                 file,
-                                                 sync,
-                                                 remote_provider,
-                                                 remote_site,
-                                                 tree,
-                                                 site_preset))
-                                    task_files_to_process.append(task)
-
-                                    files_processed_info.append((file,
-                                                                 sync,
-                                                                 local_site,
-                                                                 project_name
-                                                                 ))
-                                    processed_file_path.add(file_path)
-
-                    self.log.debug("Sync tasks count {}".format(
-                        len(task_files_to_process)
-                    ))
-                    files_created = await asyncio.gather(
-                        *task_files_to_process,
-                        return_exceptions=True)
-                    for file_id, info in zip(files_created,
-                                             files_processed_info):
-                        file, representation, site, project_name = info
-                        error = None
-                        if isinstance(file_id, BaseException):
-                            error = str(file_id)
-                            file_id = None
-                        self.module.update_db(project_name,
-                                              file_id,
-                                              file,
-                                              representation,
-                                              site,
-                                              error)
+                    self._queue_project_files(scheduler, project_name)
+
+                self.log.debug("Sync tasks count {}".format(len(scheduler)))
+                results_by_project = await scheduler.run()
+                for project_name, results in results_by_project.items():
+                    self.module.update_db_bulk(project_name, results)
 
                 duration = time.time() - start_time
                 self.log.debug("One loop took {:.2f}s".format(duration))
@@ -479,6 +604,78 @@ class SyncServerThread(threading.Thread):
                     "Unhandled except. in sync loop, stopping server",
                     exc_info=True)
 
+    def _queue_project_files(self, scheduler, project_name):
+        """Queue files of project which should be synchronized."""
+        preset = self.module.sync_project_settings[project_name]
+
+        local_site, remote_site = self._working_sites(project_name, preset)
+        if not all([local_site, remote_site]):
+            return
+
+        sync_repres = self.module.get_sync_representations(
+            project_name,
+            local_site,
+            remote_site
+        )
+
+        # process only unique file paths in one batch
+        # multiple representation could have same file path
+        # (textures),
+        # upload process can find already uploaded file and
+        # reuse same id
+        processed_file_path = set()
+
+        site_preset = preset.get('sites')[remote_site]
+        remote_provider = \
+            self.module.get_provider_for_site(site=remote_site)
+        handler = lib.factory.get_provider(remote_provider,
+                                           project_name,
+                                           remote_site,
+                                           presets=site_preset)
+        limit = lib.factory.get_provider_batch_limit(remote_provider)
+        # first call to get_provider could be expensive, its
+        # building folder tree structure in memory
+        # call only if needed, eg. DO_UPLOAD or DO_DOWNLOAD
+        for sync in sync_repres:
+            if limit <= 0:
+                break
+            files = sync.get("files") or []
+            for file in files:
+                # skip already processed files
+                file_path = get_file_info_path(file) or ''
+                if file_path in processed_file_path:
+                    continue
+                status = self.module.check_status(
+                    file,
+                    local_site,
+                    remote_site,
+                    preset.get('config'))
+                if status == SyncStatus.DO_UPLOAD:
+                    # store site for exception handling
+                    site = remote_site
+                elif status == SyncStatus.DO_DOWNLOAD:
+                    site = local_site
+                else:
+                    continue
+
+                job = SyncTransferJob(
+                    status,
+                    project_name,
+                    file,
+                    sync,
+                    remote_provider,
+                    remote_site,
+                    site,
+                    handler.get_tree(),
+                    site_preset
+                )
+                # representations are sorted by priority, following files
+                #   would be dropped too
+                if not scheduler.add_job(job):
+                    return
+                limit -= 1
+                processed_file_path.add(file_path)
+
     def stop(self):
         """Sets is_running flag to false, 'check_shutdown' shuts server down"""
         self.is_running = False
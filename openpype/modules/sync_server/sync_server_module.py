@@ -9,11 +9,13 @@ from collections import deque, defaultdict
 
 import click
 from bson.objectid import ObjectId
+from pymongo import UpdateOne
 
 from openpype.client import (
     get_projects,
     get_representations,
     get_representation_by_id,
+    invalidate_entity_cache,
 )
 from openpype.modules import OpenPypeModule, ITrayModule
 from openpype.settings import (
@@ -35,6 +37,7 @@ from .providers.local_drive import LocalDriveHandler
 from .providers import lib
 
 from .utils import time_function, SyncStatus, SiteAlreadyPresentError
+from .sync_state import SyncStateIndex
 
 log = Logger.get_logger("SyncServer")
 
@@ -103,6 +106,13 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
     LOCAL_SITE = 'local'
     LOG_PROGRESS_SEC = 5  # how often log progress to DB
     DEFAULT_PRIORITY = 50  # higher is better, allowed range 1 - 1000
+    # maximum number of files queued for synchronization in one loop
+    #   (across all projects)
+    TRANSFER_QUEUE_LIMIT = 500
+    # maximum number of files transferred concurrently to/from single site
+    SITE_CONCURRENCY_LIMIT = 4
+    # how often is whole project rescanned into sync state index (seconds)
+    SYNC_STATE_FULL_SCAN_INTERVAL = 3600
 
     name = "sync_server"
     label = "Sync Queue"
@@ -130,6 +140,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         self._anatomies = {}
 
         self._connection = None
+        self._sync_state = None
 
         # list of long blocking tasks
         self.long_running_tasks = deque()
@@ -1633,6 +1644,9 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         retries_arr = self._get_retries_arr(project_name)
         match = {
             "type": "representation",
+            "_id": {"$in": self._get_pending_representation_ids(
+                project_name, [active_site, remote_site]
+            )},
             "$or": [
                 {"$and": [
                     {
@@ -1792,6 +1806,74 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         Returns:
             None
         """
+        query, update, arr_filter = self._prepare_update_db_args(
+            new_file_id, file, representation, site,
+            error, progress, priority
+        )
+
+        self.connection.database[project_name].update_one(
+            query,
+            update,
+            upsert=True,
+            array_filters=arr_filter
+        )
+
+        if progress is not None or priority is not None:
+            return
+
+        self._representations_changed(project_name, [representation["_id"]])
+        self._log_file_processed(new_file_id, file, representation, error)
+
+    def update_db_bulk(self, project_name, results):
+        """
+            Update results of multiple synchronized files with single
+            'bulk_write'.
+
+        Args:
+            project_name (string): name of project
+            results (list): of tuples (new_file_id, file, representation,
+                site, error) where 'new_file_id' is None if file failed
+                and 'error' contains exception message
+
+        Returns:
+            None
+        """
+        if not results:
+            return
+
+        operations = []
+        for new_file_id, file, representation, site, error in results:
+            query, update, arr_filter = self._prepare_update_db_args(
+                new_file_id, file, representation, site, error
+            )
+            operations.append(UpdateOne(
+                query,
+                update,
+                upsert=True,
+                array_filters=arr_filter
+            ))
+
+        self.connection.database[project_name].bulk_write(
+            operations, ordered=False
+        )
+        self._representations_changed(
+            project_name,
+            [representation["_id"] for _, _, representation, _, _ in results]
+        )
+
+        for new_file_id, file, representation, _, error in results:
+            self._log_file_processed(new_file_id, file, representation, error)
+
+    def _prepare_update_db_args(self, new_file_id, file, representation,
+                                site, error=None, progress=None,
+                                priority=None):
+        """
+            Prepare query, update and array filters for update of single
+            file site record.
+
+        Returns:
+            (dict, dict, list)
+        """
         representation_id = representation.get("_id")
         file_id = None
         if file:
@@ -1822,16 +1904,9 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         if file_id:
             arr_filter.append({'f._id': ObjectId(file_id)})
 
-        self.connection.database[project_name].update_one(
-            query,
-            update,
-            upsert=True,
-            array_filters=arr_filter
-        )
-
-        if progress is not None or priority is not None:
-            return
+        return query, update, arr_filter
 
+    def _log_file_processed(self, new_file_id, file, representation, error):
         status = 'failed'
         error_str = 'with error {}'.format(error)
         if new_file_id:
@@ -1843,7 +1918,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
             (
                 "File for {} - {source_file} process {status} {error_str}"
             ).format(
-                representation_id,
+                representation.get("_id"),
                 status=status,
                 source_file=source_file,
                 error_str=error_str
@@ -1980,6 +2055,44 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
             upsert=True,
             array_filters=arr_filter
         )
+        self._representations_changed(project_name, [query["_id"]])
+
+    @property
+    def sync_state(self):
+        """Index of synchronization state of representations."""
+        if self._sync_state is None:
+            self._sync_state = SyncStateIndex(
+                self.SYNC_STATE_FULL_SCAN_INTERVAL
+            )
+        return self._sync_state
+
+    def _get_pending_representation_ids(self, project_name, site_names):
+        """
+            Ids of representations not synchronized on any of 'site_names'.
+
+            Index is updated with representations changed since last call
+            before querying.
+        """
+        self.sync_state.update_project(project_name)
+        return self.sync_state.get_pending_representation_ids(
+            project_name, site_names
+        )
+
+    def _representations_changed(self, project_name, representation_ids):
+        """
+            Propagate change of sites on representations to caches.
+        """
+        invalidate_entity_cache(project_name)
+        try:
+            self.sync_state.refresh_representations(
+                project_name, representation_ids
+            )
+        except Exception:
+            # index will be fixed by next full scan
+            self.log.warning(
+                "Failed to refresh sync state of representations",
+                exc_info=True
+            )
 
     def _reset_site_for_file(self, project_name, representation_id,
                              elem, file_id, site_name):
@@ -2347,6 +2460,33 @@ def cli_main():
     pass
 
 
+@cli_main.command()
+@click.option(
+    "-p",
+    "--project",
+    multiple=True,
+    help="Name of project to index, all projects if not entered")
+def backfill_sync_state(project):
+    """Index synchronization state of representations.
+
+    Should be run once after update, when sync state index is empty, to
+    avoid long first loop of sync server.
+    """
+    project_names = list(project)
+    if not project_names:
+        project_names = [
+            project_doc["name"]
+            for project_doc in get_projects(fields=["name"])
+        ]
+
+    sync_state = SyncStateIndex()
+    for project_name in project_names:
+        count = sync_state.backfill(project_name)
+        print("Indexed {} representations of '{}'".format(
+            count, project_name
+        ))
+
+
 @cli_main.command()
 @click.option(
     "-a",
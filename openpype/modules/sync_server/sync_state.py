@@ -0,0 +1,365 @@
+"""Compact index of synchronization state of representations.
+
+Each document describes state of one site of one representation:
+    {
+        "type": "representation",
+        "project_name": "MyProject",
+        "representation_id": ObjectId("..."),
+        "site": "gdrive",
+        "status": "pending",
+        "updated_dt": datetime
+    }
+
+Status is 'pending' when any file of representation is not yet present on
+the site (and site is not paused), 'paused' when all missing files are paused
+and 'synced' otherwise.
+
+Index is maintained incrementally when SyncServerModule changes sites of
+representations. Changes made outside of the module (publishing, editing of
+sites in DB) are picked up from change stream of project collection, resume
+token of the stream is stored in 'project' document. Whole project is
+rescanned periodically, that is the only way to catch the changes when change
+streams are not available (server is not a replica set).
+"""
+import os
+import time
+from datetime import datetime
+
+import pymongo
+from pymongo import UpdateOne, DeleteMany, ASCENDING
+
+from openpype.client.mongo import (
+    OpenPypeMongoConnection,
+    get_project_connection,
+)
+from openpype.lib import Logger
+
+log = Logger.get_logger("SyncState")
+
+
+class SyncStateStatus:
+    PENDING = "pending"
+    PAUSED = "paused"
+    SYNCED = "synced"
+
+
+def get_sites_status(files):
+    """Compute synchronization status of each site from files of repre.
+
+    Args:
+        files (list): 'files' of representation document
+
+    Returns:
+        (dict): {site_name: SyncStateStatus}
+    """
+    statuses = {}
+    for repre_file in files or []:
+        for site in repre_file.get("sites") or []:
+            site_name = site.get("name")
+            if not site_name:
+                continue
+            status = statuses.get(site_name, SyncStateStatus.SYNCED)
+            if status == SyncStateStatus.PENDING:
+                continue
+
+            if not site.get("created_dt"):
+                if site.get("paused"):
+                    status = SyncStateStatus.PAUSED
+                else:
+                    status = SyncStateStatus.PENDING
+            statuses[site_name] = status
+    return statuses
+
+
+class SyncStateIndex:
+    """Access to sync state collection.
+
+    Args:
+        full_scan_interval (int): seconds after which is project rescanned
+    """
+    collection_name = "sync_state"
+    # size of batches of representations processed during backfill
+    batch_size = 1000
+    # max. number of changes of project processed in one update
+    max_changes = 10000
+    # how long waits change stream for changes (milliseconds)
+    change_stream_wait_ms = 10
+
+    def __init__(self, full_scan_interval=3600):
+        self.full_scan_interval = full_scan_interval
+        self._collection = None
+        self._indexes_checked = False
+
+    @property
+    def collection(self):
+        if self._collection is None:
+            client = OpenPypeMongoConnection.get_mongo_client()
+            database = client[os.environ["OPENPYPE_DATABASE_NAME"]]
+            self._collection = database[self.collection_name]
+            self._ensure_indexes()
+        return self._collection
+
+    def _ensure_indexes(self):
+        if self._indexes_checked:
+            return
+        self._indexes_checked = True
+        self._collection.create_index([
+            ("project_name", ASCENDING),
+            ("site", ASCENDING),
+            ("status", ASCENDING)
+        ])
+        self._collection.create_index(
+            [
+                ("project_name", ASCENDING),
+                ("representation_id", ASCENDING),
+                ("site", ASCENDING)
+            ],
+            unique=True,
+            partialFilterExpression={"type": "representation"}
+        )
+
+    def get_pending_representation_ids(self, project_name, site_names):
+        """Ids of representations which are not synced on any of sites.
+
+        Args:
+            project_name (string)
+            site_names (list): of site names
+
+        Returns:
+            (list): of ObjectId
+        """
+        return self.collection.distinct("representation_id", {
+            "type": "representation",
+            "project_name": project_name,
+            "site": {"$in": list(site_names)},
+            "status": SyncStateStatus.PENDING
+        })
+
+    def refresh_representations(self, project_name, representation_ids):
+        """Recompute state of representations from project collection.
+
+        Args:
+            project_name (string)
+            representation_ids (iterable): of ObjectId
+        """
+        representation_ids = list(set(representation_ids))
+        if not representation_ids:
+            return
+
+        repre_docs = get_project_connection(project_name).find(
+            {
+                "type": "representation",
+                "_id": {"$in": representation_ids}
+            },
+            {"files.sites": True}
+        )
+        found_ids = set()
+        operations = []
+        for repre_doc in repre_docs:
+            found_ids.add(repre_doc["_id"])
+            operations.extend(
+                self._prepare_operations(project_name, repre_doc)
+            )
+
+        # removed or archived representations
+        missing_ids = set(representation_ids) - found_ids
+        if missing_ids:
+            operations.append(DeleteMany({
+                "type": "representation",
+                "project_name": project_name,
+                "representation_id": {"$in": list(missing_ids)}
+            }))
+
+        if operations:
+            self.collection.bulk_write(operations, ordered=False)
+
+    def update_project(self, project_name):
+        """Make sure index of project is up to date.
+
+        Rescans whole project if was not scanned for 'full_scan_interval',
+        otherwise only representations changed since last update are
+        reindexed using change stream of project collection.
+        """
+        project_doc = self.collection.find_one({
+            "type": "project",
+            "project_name": project_name
+        })
+        last_full_scan = None
+        resume_token = None
+        if project_doc:
+            last_full_scan = project_doc.get("last_full_scan")
+            resume_token = project_doc.get("resume_token")
+
+        if (
+            last_full_scan is None
+            or time.time() - last_full_scan > self.full_scan_interval
+        ):
+            self.backfill(project_name)
+            return
+
+        # Change streams are not available (e.g. standalone server), index
+        #   is updated by module and by full scans
+        if resume_token is None:
+            return
+
+        try:
+            with self._watch(project_name, resume_token) as change_stream:
+                if self._index_changes(
+                    project_name, change_stream, self.max_changes
+                ):
+                    self._set_resume_token(
+                        project_name, change_stream.resume_token
+                    )
+                    return
+
+        except pymongo.errors.PyMongoError:
+            # e.g. resume token is not in oplog anymore
+            log.info(
+                "Failed to resume change stream of {}".format(project_name),
+                exc_info=True
+            )
+        self.backfill(project_name)
+
+    def backfill(self, project_name):
+        """Index all representations of project.
+
+        Returns:
+            (int): count of indexed representations
+        """
+        start = time.time()
+        change_stream = None
+        try:
+            # Start watching before scan so changes made during scan are
+            #   not missed
+            change_stream = self._watch(project_name)
+        except pymongo.errors.PyMongoError:
+            log.info((
+                "Change streams are not available. Changes made outside"
+                " of sync server will be indexed by periodic full scans."
+            ), exc_info=True)
+
+        try:
+            count = self._index_representations(project_name)
+            resume_token = None
+            if (
+                change_stream is not None
+                and self._index_changes(project_name, change_stream)
+            ):
+                resume_token = change_stream.resume_token
+        finally:
+            if change_stream is not None:
+                change_stream.close()
+
+        # states of representations which were removed
+        self.collection.delete_many({
+            "type": "representation",
+            "project_name": project_name,
+            "updated_dt": {"$lt": datetime.fromtimestamp(start)}
+        })
+        self.collection.update_one(
+            {"type": "project", "project_name": project_name},
+            {"$set": {
+                "last_full_scan": start,
+                "resume_token": resume_token
+            }},
+            upsert=True
+        )
+        log.debug("Indexed {} representations of {} in {:.2f}s".format(
+            count, project_name, time.time() - start
+        ))
+        return count
+
+    def remove_project(self, project_name):
+        self.collection.delete_many({"project_name": project_name})
+
+    def _watch(self, project_name, resume_token=None):
+        return get_project_connection(project_name).watch(
+            [{"$project": {"operationType": True, "documentKey": True}}],
+            max_await_time_ms=self.change_stream_wait_ms,
+            resume_after=resume_token
+        )
+
+    def _index_changes(self, project_name, change_stream, max_changes=None):
+        """Reindex representations changed since start of change stream.
+
+        Args:
+            project_name (string)
+            change_stream (ChangeStream): of project collection
+            max_changes (int): maximum of processed changes, remaining
+                changes are processed on next update
+
+        Returns:
+            (bool): False if changes can't be tracked anymore (collection
+                was dropped or renamed) and project must be rescanned
+        """
+        count = 0
+        changed_ids = set()
+        while max_changes is None or count < max_changes:
+            change = change_stream.try_next()
+            if change is None:
+                break
+            count += 1
+            if change["operationType"] not in (
+                "insert", "update", "replace", "delete"
+            ):
+                return False
+
+            changed_ids.add(change["documentKey"]["_id"])
+            if len(changed_ids) >= self.batch_size:
+                self.refresh_representations(project_name, changed_ids)
+                changed_ids = set()
+
+        self.refresh_representations(project_name, changed_ids)
+        return True
+
+    def _set_resume_token(self, project_name, resume_token):
+        self.collection.update_one(
+            {"type": "project", "project_name": project_name},
+            {"$set": {"resume_token": resume_token}}
+        )
+
+    def _index_representations(self, project_name):
+        cursor = get_project_connection(project_name).find(
+            {"type": "representation"}, {"files.sites": True}
+        )
+
+        count = 0
+        operations = []
+        for repre_doc in cursor:
+            count += 1
+            operations.extend(
+                self._prepare_operations(project_name, repre_doc)
+            )
+            if len(operations) >= self.batch_size:
+                self.collection.bulk_write(operations, ordered=False)
+                operations = []
+
+        if operations:
+            self.collection.bulk_write(operations, ordered=False)
+        return count
+
+    def _prepare_operations(self, project_name, repre_doc):
+        repre_id = repre_doc["_id"]
+        now = datetime.now()
+        statuses = get_sites_status(repre_doc.get("files"))
+        operations = [
+            UpdateOne(
+                {
+                    "type": "representation",
+                    "project_name": project_name,
+                    "representation_id": repre_id,
+                    "site": site_name
+                },
+                {"$set": {"status": status, "updated_dt": now}},
+                upsert=True
+            )
+            for site_name, status in statuses.items()
+        ]
+        # sites removed from representation
+        operations.append(DeleteMany({
+            "type": "representation",
+            "project_name": project_name,
+            "representation_id": repre_id,
+            "site": {"$nin": list(statuses.keys())}
+        }))
+        return operations
@@ -9,7 +9,7 @@ import qtawesome
 from openpype.tools.utils.delegates import pretty_timestamp
 
 from openpype.lib import Logger, get_local_site_id
-from openpype.client import get_representation_by_id
+from openpype.client import get_representation_by_id, get_file_info_path
 
 from . import lib
 
@@ -620,7 +620,7 @@ class SyncRepresentationSummaryModel(_SyncRepresentationModel):
                 lib.pretty_size(repre.get("files_size", 0)),
                 repre.get("priority"),
                 lib.STATUS[repre.get("status", -1)],
-                files[0].get('path')
+                get_file_info_path(files[0])
             )
 
             self._data.append(item)
@@ -1061,6 +1061,8 @@ class SyncRepresentationDetailModel(_SyncRepresentationModel):
                 files = [files]
 
             for file in files:
+                # compact sequence is shown as one file
+                file_path = get_file_info_path(file)
                 local_updated = self._convert_date(
                     repre.get('updated_dt_local'),
                     current_date)
@@ -1081,7 +1083,7 @@ class SyncRepresentationDetailModel(_SyncRepresentationModel):
 
                 item = self.SyncRepresentationDetail(
                     file.get("_id"),
-                    os.path.basename(file["path"]),
+                    os.path.basename(file_path),
                     local_updated,
                     remote_updated,
                     local_site,
@@ -1095,7 +1097,7 @@ class SyncRepresentationDetailModel(_SyncRepresentationModel):
                     lib.STATUS[repre.get("status", -1)],
                     repre.get("tries"),
                     '\n'.join(errors),
-                    file.get('path')
+                    file_path
 
                 )
                 self._data.append(item)
@@ -1259,10 +1261,16 @@ class SyncRepresentationDetailModel(_SyncRepresentationModel):
             }
         else:
             regex_str = '.*{}.*'.format(self._word_filter)
+            regex = {'$regex': regex_str, '$options': 'i'}
             return {
                 "type": "representation",
                 "_id": self._id,
-                '$or': [{'files.path': {'$regex': regex_str, '$options': 'i'}}]
+                # compact sequence items don't have 'path'
+                '$or': [
+                    {'files.path': regex},
+                    {'files.sequence.head': regex},
+                    {'files.sequence.tail': regex}
+                ]
             }
 
     @property
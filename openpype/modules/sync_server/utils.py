@@ -10,6 +10,11 @@ class ResumableError(Exception):
     pass
 
 
+class ChunkChecksumError(ResumableError):
+    """Transferred data doesn't match source, transfer should be repeated."""
+    pass
+
+
 class SiteAlreadyPresentError(Exception):
     """Representation has already site skeleton present."""
     pass
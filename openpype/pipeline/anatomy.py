@@ -626,12 +626,43 @@ class AnatomyStringTemplate(StringTemplate):
 
         anatomy_templates = self.anatomy_templates
         if not data.get("root"):
-            data = copy.deepcopy(data)
+            # Formatting does not change data so shallow copy is enough
+            data = dict(data)
             data["root"] = anatomy_templates.anatomy.roots
         result = StringTemplate.format(self, data)
         rootless_path = anatomy_templates.rootless_path_from_result(result)
         return AnatomyTemplateResult(result, rootless_path)
 
+    def format_many(self, data_list):
+        """Format template with multiple data and add 'root' key to data.
+
+        Args:
+            data_list (Iterable[dict[str, Any]]): Formatting data for
+                template.
+
+        Returns:
+            list[AnatomyTemplateResult]: Formatting results.
+        """
+
+        anatomy_templates = self.anatomy_templates
+        roots = None
+        filled_data_list = []
+        for data in data_list:
+            if not data.get("root"):
+                if roots is None:
+                    roots = anatomy_templates.anatomy.roots
+                data = dict(data)
+                data["root"] = roots
+            filled_data_list.append(data)
+
+        return [
+            AnatomyTemplateResult(
+                result,
+                anatomy_templates.rootless_path_from_result(result)
+            )
+            for result in StringTemplate.format_many(self, filled_data_list)
+        ]
+
 
 class AnatomyTemplates(TemplatesDict):
     inner_key_pattern = re.compile(r"(\{@.*?[^{}0]*\})")
@@ -978,7 +1009,8 @@ class AnatomyTemplates(TemplatesDict):
         return output
 
     def format(self, data, strict=True):
-        copy_data = copy.deepcopy(data)
+        # Data are deep copied in 'TemplatesDict.format'
+        copy_data = dict(data)
         roots = self.roots
         if roots:
             copy_data["root"] = roots
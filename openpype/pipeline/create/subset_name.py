@@ -40,7 +40,9 @@ def get_subset_name_template(
     """
 
     if project_settings is None:
-        project_settings = get_project_settings(project_name)
+        project_settings = get_project_settings(
+            project_name, read_only=True
+        )
     tools_settings = project_settings["global"]["tools"]
     profiles = tools_settings["creator"]["subset_name_profiles"]
     filtering_criteria = {
@@ -6,7 +6,7 @@ import glob
 import clique
 import collections
 
-from openpype.lib import create_hard_link
+from openpype.lib import create_hard_link, sequence_tools
 
 
 def _copy_file(src_path, dst_path):
@@ -252,7 +252,7 @@ def deliver_sequence(
     # context.representation could be .psd
     ext = ext.replace("..", ".")
 
-    src_collections, remainder = clique.assemble(os.listdir(dir_path))
+    src_collections, remainder = sequence_tools.assemble(os.listdir(dir_path))
     src_collection = None
     for col in src_collections:
         if col.tail != ext:
@@ -1,16 +1,182 @@
 import os
+import sys
+import json
 import inspect
+import weakref
+import functools
+import tempfile
 import traceback
 
+import appdirs
+
 from openpype.lib import Logger
 from openpype.lib.python_module_tools import (
     modules_from_path,
     classes_from_module,
+    get_file_fingerprint,
+    get_imported_file_fingerprint,
 )
 
 log = Logger.get_logger(__name__)
 
 
+def _get_class_key(cls):
+    return "{}.{}".format(cls.__module__, cls.__name__)
+
+
+class PluginFilesIndex(object):
+    """Persistent index of classes available in plugin files.
+
+    Index stores for each imported plugin file its fingerprint and keys of
+    all classes (and their bases) available in the file. Files which did not
+    change and don't contain subclass of discovered superclass don't have to
+    be imported at all.
+
+    File is skipped only if superclass is known to the index (some indexed
+    file contains it) so changes of superclass location don't cause that
+    all files are skipped.
+
+    Args:
+        filepath (str): Path to json file where index is stored.
+    """
+    filename = "plugins_index.json"
+
+    def __init__(self, filepath=None):
+        if filepath is None:
+            filepath = os.path.join(
+                appdirs.user_data_dir("openpype", "pypeclub"),
+                self.filename
+            )
+        self._filepath = filepath
+        self._files = None
+        self._known_keys = set()
+        self._changed = False
+
+    @staticmethod
+    def _get_version():
+        from openpype.version import __version__
+
+        return "{}-py{}.{}".format(
+            __version__, sys.version_info[0], sys.version_info[1]
+        )
+
+    def _get_files(self):
+        if self._files is not None:
+            return self._files
+
+        self._files = {}
+        if not os.path.exists(self._filepath):
+            return self._files
+
+        try:
+            with open(self._filepath, "r") as stream:
+                data = json.load(stream)
+        except Exception:
+            log.debug("Failed to read plugins index.", exc_info=True)
+            return self._files
+
+        if data.get("version") == self._get_version():
+            self._files = data.get("files") or {}
+            for item in self._files.values():
+                self._known_keys |= set(item["classes"])
+        return self._files
+
+    def may_contain(self, filepath, superclass):
+        """File may contain subclasses of superclass and must be imported.
+
+        Args:
+            filepath (str): Path to python file.
+            superclass (type): Discovered superclass.
+
+        Returns:
+            bool: File must be imported.
+        """
+        files = self._get_files()
+        item = files.get(filepath)
+        if item is None:
+            return True
+
+        superclass_key = _get_class_key(superclass)
+        if superclass_key not in self._known_keys:
+            return True
+
+        try:
+            fingerprint = list(get_file_fingerprint(filepath))
+        except OSError:
+            return True
+
+        if item["fingerprint"] != fingerprint:
+            return True
+        return superclass_key in item["classes"]
+
+    def update(self, filepath, module):
+        """Store classes available in imported module.
+
+        Args:
+            filepath (str): Path to imported python file.
+            module (types.ModuleType): Module imported from the file.
+        """
+        fingerprint = get_imported_file_fingerprint(filepath)
+        if fingerprint is None:
+            return
+
+        fingerprint = list(fingerprint)
+        files = self._get_files()
+        item = files.get(filepath)
+        if item is not None and item["fingerprint"] == fingerprint:
+            return
+
+        class_keys = set()
+        for name in dir(module):
+            obj = getattr(module, name)
+            if inspect.isclass(obj):
+                class_keys |= {
+                    _get_class_key(cls)
+                    for cls in inspect.getmro(obj)
+                }
+
+        class_keys = list(sorted(class_keys))
+        files[filepath] = {
+            "fingerprint": fingerprint,
+            "classes": class_keys
+        }
+        self._known_keys |= set(class_keys)
+        self._changed = True
+
+    def save(self):
+        """Store index to file if was changed."""
+        if not self._changed:
+            return
+        self._changed = False
+
+        data = {
+            "version": self._get_version(),
+            "files": self._files
+        }
+        dirpath = os.path.dirname(self._filepath)
+        try:
+            if not os.path.exists(dirpath):
+                os.makedirs(dirpath)
+
+            # Write to temp file first so other processes don't read
+            #   partially written file
+            fd, tmp_path = tempfile.mkstemp(
+                prefix="plugins_index", suffix=".json", dir=dirpath
+            )
+            with os.fdopen(fd, "w") as stream:
+                json.dump(data, stream)
+
+            if hasattr(os, "replace"):
+                os.replace(tmp_path, self._filepath)
+            else:
+                if os.path.exists(self._filepath):
+                    os.remove(self._filepath)
+                os.rename(tmp_path, self._filepath)
+
+        except Exception:
+            log.debug("Failed to store plugins index.", exc_info=True)
+
+
 class DiscoverResult:
     """Result of Plug-ins discovery of a single superclass type.
 
@@ -99,17 +265,48 @@ class DiscoverResult:
 class PluginDiscoverContext(object):
     """Store and discover registered types nad registered paths to types.
 
-    Keeps in memory all registered types and their paths. Paths are dynamically
-    loaded on discover so different discover calls won't return the same
-    class objects even if were loaded from same file.
+    Keeps in memory all registered types and their paths. Files in paths are
+    imported again only when they changed, otherwise already imported
+    modules are used. Attributes of classes from reused modules are reset
+    to state after import, so changes made on classes after discovery
+    (e.g. applied settings) don't leak to next discovery.
+
+    Args:
+        files_index (PluginFilesIndex): Index of classes in plugin files
+            used to skip import of files without discovered plugins.
     """
 
-    def __init__(self):
+    def __init__(self, files_index=None):
         self._registered_plugins = {}
         self._registered_plugin_paths = {}
         self._last_discovered_plugins = {}
         # Store the last result to memory
         self._last_discovered_results = {}
+        self._files_index = files_index
+        # Attributes of classes after import
+        self._classes_state = weakref.WeakKeyDictionary()
+
+    def _reset_class_state(self, cls):
+        """Reset attributes of class to state when was discovered first."""
+        state = self._classes_state.get(cls)
+        if state is None:
+            self._classes_state[cls] = dict(cls.__dict__)
+            return
+
+        current = cls.__dict__
+        for key in tuple(current.keys()):
+            if key not in state:
+                try:
+                    delattr(cls, key)
+                except (AttributeError, TypeError):
+                    pass
+
+        for key, value in state.items():
+            if current.get(key, state) is not value:
+                try:
+                    setattr(cls, key, value)
+                except (AttributeError, TypeError):
+                    pass
 
     def get_last_discovered_plugins(self, superclass):
         """Access last discovered plugin by a subperclass.
@@ -166,9 +363,17 @@ class PluginDiscoverContext(object):
             plugin_names.add(class_name)
             result.plugins.append(cls)
 
+        filepath_filter = None
+        if self._files_index is not None:
+            filepath_filter = functools.partial(
+                self._files_index.may_contain, superclass=superclass
+            )
+
         # Include plug-ins from registered paths
         for path in registered_paths:
-            modules, crashed = modules_from_path(path)
+            modules, crashed = modules_from_path(
+                path, use_cache=True, filepath_filter=filepath_filter
+            )
             for item in crashed:
                 filepath, exc_info = item
                 result.crashed_file_paths[filepath] = exc_info
@@ -176,7 +381,11 @@ class PluginDiscoverContext(object):
             for item in modules:
                 filepath, module = item
                 result.add_module(module)
+                if self._files_index is not None:
+                    self._files_index.update(filepath, module)
+
                 for cls in classes_from_module(superclass, module):
+                    self._reset_class_state(cls)
                     if cls is superclass or cls in ignore_classes:
                         result.ignored_plugins.add(cls)
                         continue
@@ -194,6 +403,9 @@ class PluginDiscoverContext(object):
 
                     result.plugins.append(cls)
 
+        if self._files_index is not None:
+            self._files_index.save()
+
         # Store in memory last result to keep in memory loaded modules
         self._last_discovered_results[superclass] = result
         self._last_discovered_plugins[superclass] = list(
@@ -265,7 +477,7 @@ class _GlobalDiscover:
     @classmethod
     def get_context(cls):
         if cls._context is None:
-            cls._context = PluginDiscoverContext()
+            cls._context = PluginDiscoverContext(PluginFilesIndex())
         return cls._context
 
 
@@ -14,7 +14,8 @@ import pyblish.api
 from openpype.lib import (
     Logger,
     import_filepath,
-    filter_profiles
+    filter_profiles,
+    get_profile_matcher,
 )
 from openpype.settings import (
     get_project_settings,
@@ -48,6 +49,14 @@ def get_template_name_profiles(
         List[Dict[str, Any]]: Publish template profiles.
     """
 
+    return copy.deepcopy(_get_template_name_profiles(
+        project_name, project_settings, logger
+    ))
+
+
+def _get_template_name_profiles(project_name, project_settings, logger):
+    """Profiles for publish template keys which must not be modified."""
+
     if not project_name and not project_settings:
         raise ValueError((
             "Both project name and project settings are missing."
@@ -55,7 +64,9 @@ def get_template_name_profiles(
         ))
 
     if not project_settings:
-        project_settings = get_project_settings(project_name)
+        project_settings = get_project_settings(
+            project_name, read_only=True
+        )
 
     profiles = (
         project_settings
@@ -65,7 +76,7 @@ def get_template_name_profiles(
         ["template_name_profiles"]
     )
     if profiles:
-        return copy.deepcopy(profiles)
+        return profiles
 
     # Use legacy approach for cases new settings are not filled yet for the
     #   project
@@ -109,6 +120,14 @@ def get_hero_template_name_profiles(
         List[Dict[str, Any]]: Publish template profiles.
     """
 
+    return copy.deepcopy(_get_hero_template_name_profiles(
+        project_name, project_settings, logger
+    ))
+
+
+def _get_hero_template_name_profiles(project_name, project_settings, logger):
+    """Profiles for hero publish template keys which must not be modified."""
+
     if not project_name and not project_settings:
         raise ValueError((
             "Both project name and project settings are missing."
@@ -116,7 +135,9 @@ def get_hero_template_name_profiles(
         ))
 
     if not project_settings:
-        project_settings = get_project_settings(project_name)
+        project_settings = get_project_settings(
+            project_name, read_only=True
+        )
 
     profiles = (
         project_settings
@@ -126,7 +147,7 @@ def get_hero_template_name_profiles(
         ["hero_template_name_profiles"]
     )
     if profiles:
-        return copy.deepcopy(profiles)
+        return profiles
 
     # Use legacy approach for cases new settings are not filled yet for the
     #   project
@@ -175,8 +196,8 @@ def get_publish_template_name(
         task_name (str): Task name on which is intance working.
         task_type (str): Task type on which is intance working.
         project_setting (Dict[str, Any]): Prepared project settings.
-        logger (logging.Logger): Custom logger used for 'filter_profiles'
-            function.
+        logger (logging.Logger): Custom logger used for profiles
+            filtering.
 
     Returns:
         str: Template name which should be used for integration.
@@ -191,17 +212,19 @@ def get_publish_template_name(
     }
     if hero:
         default_template = DEFAULT_HERO_PUBLISH_TEMPLATE
-        profiles = get_hero_template_name_profiles(
+        profiles = _get_hero_template_name_profiles(
             project_name, project_settings, logger
         )
 
     else:
-        profiles = get_template_name_profiles(
+        profiles = _get_template_name_profiles(
             project_name, project_settings, logger
         )
         default_template = DEFAULT_PUBLISH_TEMPLATE
 
-    profile = filter_profiles(profiles, filter_criteria, logger=logger)
+    profile = get_profile_matcher(profiles).match(
+        filter_criteria, logger=logger
+    )
     if profile:
         template = profile["template_name"]
     return template or default_template
@@ -0,0 +1,810 @@
+# -*- coding: utf-8 -*-
+"""Long-lived publish worker for headless (farm) publishing.
+
+Each 'openpype publish <metadata.json>' job started on farm boots fresh
+interpreter which has to initialize modules, fetch settings and discover
+pyblish plugins before any work is done. Publish worker does that once and
+then processes publish jobs sent over local socket.
+
+Protocol is line based json over TCP socket bound to localhost. Client sends
+one request line:
+    {"token": "...", "paths": [...], "targets": [...], "env": {...}}
+
+Worker creates random token each time it starts and writes it to file in
+home directory of user which only the user can read. Requests without the
+token are rejected, so only processes of the same user can send jobs. Only
+job context keys of client environment ('JOB_ENV_KEYS') are used, other
+environment of the job is inherited from the worker.
+
+Worker responds with stream of messages, each on own line:
+    {"type": "output", "data": "..."}
+    {"type": "result", "success": true, "message": "..."}
+or with '{"type": "recycle"}' when worker is not able to process the job
+(e.g. settings changed since it was started) and client should publish on
+it's own. Requests with invalid token get '{"type": "rejected"}'.
+
+Each job runs with environment of worker updated by job context from
+client, with clean pyblish context and registrations are reset after the
+job. Worker exits after 'max_jobs' jobs or when settings were changed and
+supervisor ('run_publish_worker') starts new one.
+
+Module imports only standard library on import so it can be used as script
+to send a job without booting OpenPype:
+    python worker.py --targets farm path/to/metadata.json
+
+Note:
+    Worker should run under same user as farm jobs, clients which can't
+    read token of worker publish in their own process.
+"""
+import os
+import sys
+import hmac
+import json
+import time
+import socket
+import logging
+import argparse
+import binascii
+import contextlib
+import traceback
+import subprocess
+
+PUBLISH_WORKER_PORT_ENV = "OPENPYPE_PUBLISH_WORKER_PORT"
+# Additional environment keys which jobs can set (separated by 'os.pathsep')
+PUBLISH_WORKER_ENV_KEYS_ENV = "OPENPYPE_PUBLISH_WORKER_ENV_KEYS"
+DEFAULT_PUBLISH_WORKER_PORT = 48771
+DEFAULT_MAX_JOBS = 50
+
+# Environment keys of publish job context which are used from client
+#   environment (set by publish job submission)
+JOB_ENV_KEYS = (
+    "AVALON_PROJECT",
+    "AVALON_ASSET",
+    "AVALON_TASK",
+    "AVALON_APP_NAME",
+    "OPENPYPE_USERNAME",
+    "OPENPYPE_SG_USER",
+    "OPENPYPE_PUBLISH_JOB",
+    "OPENPYPE_RENDER_JOB",
+    "OPENPYPE_REMOTE_JOB",
+    "OPENPYPE_LOG_NO_COLORS",
+    "OPENPYPE_METADATA_FILE",
+    "FTRACK_API_USER",
+    "FTRACK_API_KEY",
+    "FTRACK_SERVER",
+    "IS_TEST",
+)
+
+_HOST = "127.0.0.1"
+
+
+class PublishWorkerNotAvailable(Exception):
+    """Worker is not running or refused to process the job."""
+    pass
+
+
+def get_publish_worker_port():
+    """Port of publish worker.
+
+    Returns:
+        int: Port from 'OPENPYPE_PUBLISH_WORKER_PORT' environment or default.
+    """
+    port = os.environ.get(PUBLISH_WORKER_PORT_ENV)
+    if port:
+        return int(port)
+    return DEFAULT_PUBLISH_WORKER_PORT
+
+
+def get_publish_worker_token_path(port):
+    """Path to file with token of publish worker running on port.
+
+    Args:
+        port (int): Port of publish worker.
+
+    Returns:
+        str: Path to token file in home directory of current user.
+    """
+    return os.path.join(
+        os.path.expanduser("~"),
+        ".openpype",
+        "publish_worker",
+        "{}.token".format(port)
+    )
+
+
+def get_job_env_keys():
+    """Environment keys which publish job can set.
+
+    Returns:
+        set[str]: 'JOB_ENV_KEYS' and keys from
+            'OPENPYPE_PUBLISH_WORKER_ENV_KEYS' environment.
+    """
+    output = set(JOB_ENV_KEYS)
+    for key in os.environ.get(PUBLISH_WORKER_ENV_KEYS_ENV, "").split(
+        os.pathsep
+    ):
+        if key:
+            output.add(key)
+    return output
+
+
+def _read_token(port):
+    try:
+        with open(get_publish_worker_token_path(port), "r") as stream:
+            return stream.read().strip()
+    except (IOError, OSError):
+        return None
+
+
+def _write_token(port, token):
+    """Write token to file which only current user can read."""
+    path = get_publish_worker_token_path(port)
+    dirpath = os.path.dirname(path)
+    if not os.path.exists(dirpath):
+        os.makedirs(dirpath, 0o700)
+
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as stream:
+        stream.write(token)
+    os.replace(tmp_path, path)
+
+
+def _remove_token(port, token):
+    # Don't remove token of other worker process
+    if _read_token(port) == token:
+        try:
+            os.remove(get_publish_worker_token_path(port))
+        except OSError:
+            pass
+
+
+def _send_message(connection, message):
+    data = json.dumps(message) + "\n"
+    connection.sendall(data.encode("utf-8"))
+
+
+def _iter_messages(connection):
+    buffer = b""
+    while True:
+        chunk = connection.recv(65536)
+        if not chunk:
+            break
+        buffer += chunk
+        while b"\n" in buffer:
+            line, buffer = buffer.split(b"\n", 1)
+            if line:
+                yield json.loads(line.decode("utf-8"))
+
+
+def send_publish_job(
+    paths, targets=None, env=None, port=None, stream=None, timeout=5
+):
+    """Send publish job to running publish worker and wait for result.
+
+    Output of the job is written to stream as it comes.
+
+    Args:
+        paths (list[str]): Paths to publish jsons.
+        targets (list[str]): Pyblish targets. Worker uses 'farm' if not
+            passed, same as 'openpype publish'.
+        env (dict[str, str]): Environment of the job. Current environment
+            is used if not passed.
+        port (int): Port of worker. Value from environment or default is
+            used if not passed.
+        stream (file): Where output of job is written. 'sys.stdout' is used
+            if not passed.
+        timeout (float): Timeout of connection to worker in seconds.
+
+    Returns:
+        bool: Job was successfully published.
+
+    Raises:
+        PublishWorkerNotAvailable: Worker is not running, its token is not
+            available or it did not accept the job. Nothing was published in
+            that case.
+    """
+    if port is None:
+        port = get_publish_worker_port()
+    if env is None:
+        env = dict(os.environ)
+    if stream is None:
+        stream = sys.stdout
+
+    token = _read_token(port)
+    if not token:
+        raise PublishWorkerNotAvailable(
+            "Token of publish worker on port {} is not available.".format(
+                port
+            )
+        )
+
+    try:
+        connection = socket.create_connection((_HOST, port), timeout)
+    except (socket.error, socket.timeout) as exc:
+        raise PublishWorkerNotAvailable(
+            "Publish worker on port {} is not available. {}".format(
+                port, str(exc)
+            )
+        )
+
+    # Publishing can take any time
+    connection.settimeout(None)
+    try:
+        _send_message(connection, {
+            "token": token,
+            "paths": list(paths),
+            "targets": list(targets or []),
+            "env": env
+        })
+        for message in _iter_messages(connection):
+            msg_type = message.get("type")
+            if msg_type == "output":
+                stream.write(message["data"])
+                stream.flush()
+
+            elif msg_type == "recycle":
+                raise PublishWorkerNotAvailable(
+                    "Publish worker is restarting."
+                )
+
+            elif msg_type == "rejected":
+                raise PublishWorkerNotAvailable(
+                    "Publish worker rejected the job."
+                )
+
+            elif msg_type == "result":
+                if message.get("message"):
+                    stream.write(message["message"] + "\n")
+                    stream.flush()
+                return bool(message.get("success"))
+
+    except socket.error as exc:
+        raise RuntimeError(
+            "Connection to publish worker was lost. {}".format(str(exc))
+        )
+
+    finally:
+        connection.close()
+
+    raise RuntimeError("Publish worker did not return result of the job.")
+
+
+class _SocketOutput(object):
+    """File-like object sending written text to client.
+
+    Output is also written to original stream so it is visible in output of
+    worker process.
+    """
+
+    def __init__(self, connection, stream):
+        self._connection = connection
+        self._stream = stream
+        self.connected = True
+
+    @property
+    def encoding(self):
+        return getattr(self._stream, "encoding", None) or "utf-8"
+
+    def write(self, data):
+        if not data:
+            return
+        if isinstance(data, bytes):
+            data = data.decode("utf-8", "replace")
+        try:
+            self._stream.write(data)
+        except Exception:
+            pass
+
+        if not self.connected:
+            return
+        try:
+            _send_message(self._connection, {"type": "output", "data": data})
+        except socket.error:
+            # Client disconnected, keep publishing
+            self.connected = False
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def flush(self):
+        try:
+            self._stream.flush()
+        except Exception:
+            pass
+
+    def isatty(self):
+        return False
+
+
+class PublishWorker(object):
+    """Publish worker processing publish jobs one by one.
+
+    Modules, settings and plugin paths are prepared in 'warm_up'. Discovered
+    plugins are cached per project (settings are applied on discovery) so
+    only first job of each project is discovering plugins.
+
+    Args:
+        port (int): Port on which worker listens.
+        max_jobs (int): Worker stops after this amount of processed jobs.
+        settings_check_interval (float): How often are settings checked for
+            changes when worker is idle (in seconds).
+    """
+    def __init__(
+        self, port=None, max_jobs=None, settings_check_interval=60
+    ):
+        from openpype.lib import Logger
+
+        if port is None:
+            port = get_publish_worker_port()
+        if max_jobs is None:
+            max_jobs = DEFAULT_MAX_JOBS
+
+        self.port = port
+        self.max_jobs = max_jobs
+        self.settings_check_interval = settings_check_interval
+        self.log = Logger.get_logger(self.__class__.__name__)
+
+        self._jobs_count = 0
+        self._token = None
+        self._stopped = False
+        self._warmed_up = False
+        self._module_publish_paths = []
+        self._plugins_cache = {}
+        self._settings_state = {}
+
+    @property
+    def jobs_count(self):
+        return self._jobs_count
+
+    def stop(self):
+        self._stopped = True
+
+    def warm_up(self):
+        """Load modules, settings and import plugins before first job."""
+        if self._warmed_up:
+            return
+
+        import pyblish.api
+        from openpype.modules import ModulesManager
+        from openpype.pipeline import install_openpype_plugins
+
+        start = time.time()
+        manager = ModulesManager()
+        self._module_publish_paths = list(
+            manager.collect_plugin_paths()["publish"]
+        )
+        # Import plugins and their dependencies
+        with self._job_registrations():
+            install_openpype_plugins()
+            for path in self._module_publish_paths:
+                pyblish.api.register_plugin_path(path)
+            pyblish.api.register_host("shell")
+            if os.environ.get("AVALON_PROJECT"):
+                self._get_plugins()
+            else:
+                # Settings can't be applied without project
+                pyblish.api.deregister_all_discovery_filters()
+                pyblish.api.discover()
+
+        self._settings_state[None] = self._get_settings_state(None)
+        self._warmed_up = True
+        self.log.info("Publish worker warmed up in {:.2f}s".format(
+            time.time() - start
+        ))
+
+    def serve(self):
+        """Listen for jobs until worker is stopped or should be recycled."""
+        self.warm_up()
+
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        if sys.platform != "win32":
+            server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind((_HOST, self.port))
+        server.listen(5)
+        server.settimeout(self.settings_check_interval)
+
+        # Token is written after port is bound by this process
+        self._token = binascii.hexlify(os.urandom(32)).decode("ascii")
+        _write_token(self.port, self._token)
+        self.log.info("Publish worker listening on {}:{}".format(
+            _HOST, self.port
+        ))
+        try:
+            while not self._stopped:
+                try:
+                    connection, _ = server.accept()
+                except socket.timeout:
+                    if self._settings_changed():
+                        self.log.info("Settings changed. Recycling worker.")
+                        break
+                    continue
+
+                try:
+                    self._handle_connection(connection)
+                finally:
+                    connection.close()
+
+                if self._jobs_count >= self.max_jobs:
+                    self.log.info((
+                        "Worker processed {} jobs. Recycling worker."
+                    ).format(self._jobs_count))
+                    break
+        finally:
+            server.close()
+            _remove_token(self.port, self._token)
+
+    def _handle_connection(self, connection):
+        connection.settimeout(None)
+        request = None
+        for message in _iter_messages(connection):
+            request = message
+            break
+
+        if not request:
+            return
+
+        token = request.get("token")
+        if not isinstance(token, str) or not hmac.compare_digest(
+            token, self._token
+        ):
+            self.log.warning("Rejected job with invalid token.")
+            _send_message(connection, {"type": "rejected"})
+            return
+
+        env = self._get_job_env(request.get("env") or {})
+        project_name = env.get("AVALON_PROJECT")
+        if self._settings_changed(project_name):
+            self.log.info("Settings changed. Recycling worker.")
+            self._stopped = True
+            _send_message(connection, {"type": "recycle"})
+            return
+
+        self._jobs_count += 1
+        output = _SocketOutput(connection, sys.__stdout__)
+        try:
+            with self._redirect_output(output):
+                success, message = self._run_job(
+                    request["paths"],
+                    request.get("targets"),
+                    env
+                )
+        except (Exception, SystemExit):
+            success = False
+            message = traceback.format_exc()
+
+        if not output.connected:
+            return
+
+        try:
+            _send_message(connection, {
+                "type": "result",
+                "success": success,
+                "message": message
+            })
+        except socket.error:
+            pass
+
+    @staticmethod
+    def _get_job_env(client_env):
+        """Environment of job from worker environment and job context.
+
+        Only job context keys are used from client environment, so client
+        can't change e.g. plugin paths or python paths of worker.
+
+        Args:
+            client_env (dict[str, str]): Environment sent by client.
+
+        Returns:
+            dict[str, str]: Environment for job.
+        """
+        job_env_keys = get_job_env_keys()
+        env = {
+            key: value
+            for key, value in os.environ.items()
+            if key not in job_env_keys
+        }
+        for key, value in client_env.items():
+            if key in job_env_keys and isinstance(value, str):
+                env[key] = value
+        return env
+
+    def _run_job(self, paths, targets, env):
+        """Publish job in isolated environment and pyblish registrations.
+
+        Mirrors 'PypeCommands.publish'.
+
+        Returns:
+            tuple[bool, str]: Success and message for client.
+        """
+        import pyblish.api
+        import pyblish.util
+        from openpype.lib.applications import get_app_environments_for_context
+        from openpype.pipeline import install_openpype_plugins
+
+        if not any(paths):
+            return False, "No publish paths specified"
+
+        with self._job_environment(env), self._job_registrations():
+            install_openpype_plugins()
+            for path in self._module_publish_paths:
+                pyblish.api.register_plugin_path(path)
+
+            if os.getenv("AVALON_APP_NAME"):
+                app_env = get_app_environments_for_context(
+                    os.environ["AVALON_PROJECT"],
+                    os.environ["AVALON_ASSET"],
+                    os.environ["AVALON_TASK"],
+                    os.environ["AVALON_APP_NAME"]
+                )
+                os.environ.update(app_env)
+
+            pyblish.api.register_host("shell")
+
+            if targets:
+                for target in targets:
+                    print("setting target: {}".format(target))
+                    pyblish.api.register_target(target)
+            else:
+                pyblish.api.register_target("farm")
+
+            os.environ["OPENPYPE_PUBLISH_DATA"] = os.pathsep.join(paths)
+            os.environ["HEADLESS_PUBLISH"] = "true"
+
+            self.log.info("Running publish ...")
+
+            plugins = self._get_plugins()
+            print("Using plugins:")
+            for plugin in plugins:
+                print(plugin)
+
+            error_format = (
+                "Failed {plugin.__name__}: {error} -- {error.traceback}"
+            )
+            context = pyblish.api.Context()
+            for result in pyblish.util.publish_iter(context, plugins):
+                if result["error"]:
+                    self.log.error(error_format.format(**result))
+                    return False, "Publish failed."
+
+        self.log.info("Publish finished.")
+        return True, None
+
+    def _get_plugins(self):
+        """Discovered plugins for current project and plugin paths.
+
+        Discovery filter applies project settings on plugin classes, so
+        plugins are cached per project. Settings changes lead to recycling
+        of worker, so cache does not need to be invalidated.
+        """
+        import pyblish.api
+        import pyblish.plugin
+
+        # Plugin paths contain registered paths and paths from
+        #   'PYBLISHPLUGINPATH' environment variable
+        key = (
+            os.environ.get("AVALON_PROJECT"),
+            tuple(pyblish.plugin.plugin_paths()),
+        )
+        plugins = self._plugins_cache.get(key)
+        if plugins is None:
+            plugins = pyblish.api.discover()
+            self._plugins_cache[key] = plugins
+        # Discovery filters may change the list in-place
+        return list(plugins)
+
+    def _get_settings_state(self, project_name):
+        from openpype.settings.lib import (
+            get_system_last_saved_info,
+            get_project_last_saved_info,
+        )
+
+        if project_name is None:
+            return (
+                get_system_last_saved_info(),
+                get_project_last_saved_info(None)
+            )
+        return get_project_last_saved_info(project_name)
+
+    def _settings_changed(self, project_name=None):
+        """Settings were saved since worker started or project was used."""
+        project_names = [None]
+        if project_name:
+            project_names.append(project_name)
+
+        for name in project_names:
+            state = self._get_settings_state(name)
+            if name not in self._settings_state:
+                self._settings_state[name] = state
+
+            elif self._settings_state[name] != state:
+                return True
+        return False
+
+    @contextlib.contextmanager
+    def _job_environment(self, env):
+        """Replace process environment and session for job duration."""
+        from openpype.pipeline import legacy_io
+
+        orig_env = dict(os.environ)
+        orig_session = dict(legacy_io.Session)
+        session_installed = legacy_io.is_installed()
+        orig_cwd = os.getcwd()
+
+        os.environ.clear()
+        os.environ.update(env)
+        try:
+            yield
+
+        finally:
+            if not session_installed and legacy_io.is_installed():
+                legacy_io.uninstall()
+            legacy_io.Session.clear()
+            legacy_io.Session.update(orig_session)
+
+            os.environ.clear()
+            os.environ.update(orig_env)
+            os.chdir(orig_cwd)
+
+    @contextlib.contextmanager
+    def _job_registrations(self):
+        """Reset pyblish registrations made during job.
+
+        Plugin paths from 'PYBLISHPLUGINPATH' are restored too, so plugin
+        paths used for discovery are same as before the job.
+        """
+        import pyblish.api
+        import pyblish.plugin
+
+        paths = pyblish.api.registered_paths()
+        env_paths = os.environ.get("PYBLISHPLUGINPATH")
+        targets = pyblish.api.registered_targets()
+        hosts = pyblish.api.registered_hosts()
+        plugins = pyblish.api.registered_plugins()
+        filters = list(pyblish.plugin._registered_plugin_filters)
+        callbacks = {
+            signal: list(signal_callbacks)
+            for signal, signal_callbacks in (
+                pyblish.api.registered_callbacks().items()
+            )
+        }
+        try:
+            yield
+
+        finally:
+            pyblish.api.deregister_all_paths()
+            for path in paths:
+                pyblish.api.register_plugin_path(path)
+
+            if env_paths is None:
+                os.environ.pop("PYBLISHPLUGINPATH", None)
+            else:
+                os.environ["PYBLISHPLUGINPATH"] = env_paths
+
+            pyblish.api.deregister_all_targets()
+            for target in targets:
+                pyblish.api.register_target(target)
+
+            pyblish.api.deregister_all_hosts()
+            for host in hosts:
+                pyblish.api.register_host(host)
+
+            pyblish.api.deregister_all_plugins()
+            for plugin in plugins:
+                pyblish.api.register_plugin(plugin)
+
+            pyblish.plugin._registered_plugin_filters[:] = filters
+
+            pyblish.api.deregister_all_callbacks()
+            for signal, signal_callbacks in callbacks.items():
+                for callback in signal_callbacks:
+                    pyblish.api.register_callback(signal, callback)
+
+    @contextlib.contextmanager
+    def _redirect_output(self, output):
+        """Send output of job to client.
+
+        Log handlers keep reference to stream from their creation so
+        streams of handlers are replaced too.
+        """
+        orig_stdout = sys.stdout
+        orig_stderr = sys.stderr
+        orig_streams = (
+            orig_stdout, orig_stderr, sys.__stdout__, sys.__stderr__
+        )
+        orig_handler_streams = {}
+        for handler in self._iter_stream_handlers():
+            if handler.stream in orig_streams:
+                orig_handler_streams[handler] = handler.stream
+                handler.stream = output
+
+        sys.stdout = output
+        sys.stderr = output
+        try:
+            yield
+
+        finally:
+            sys.stdout = orig_stdout
+            sys.stderr = orig_stderr
+            # Handlers created during job have output stream too
+            for handler in self._iter_stream_handlers():
+                if handler.stream is output:
+                    handler.stream = orig_handler_streams.get(
+                        handler, orig_stderr
+                    )
+
+    @staticmethod
+    def _iter_stream_handlers():
+        loggers = [logging.getLogger()] + [
+            logger
+            for logger in logging.Logger.manager.loggerDict.values()
+            if isinstance(logger, logging.Logger)
+        ]
+        for logger in loggers:
+            for handler in logger.handlers:
+                if isinstance(handler, logging.StreamHandler):
+                    yield handler
+
+
+def run_publish_worker(port=None, max_jobs=None):
+    """Keep publish worker process running.
+
+    Worker process is started again each time it exits, e.g. after it
+    processed 'max_jobs' jobs or settings changed.
+
+    Args:
+        port (int): Port on which worker listens.
+        max_jobs (int): Jobs processed by one worker process.
+    """
+    from openpype.lib import Logger, get_openpype_execute_args
+
+    log = Logger.get_logger("PublishWorkerSupervisor")
+    if port is None:
+        port = get_publish_worker_port()
+
+    args = get_openpype_execute_args(
+        "publishworker", "--port", str(port), "--once"
+    )
+    if max_jobs is not None:
+        args.extend(["--max-jobs", str(max_jobs)])
+
+    while True:
+        log.info("Starting publish worker process")
+        start = time.time()
+        try:
+            returncode = subprocess.call(args)
+        except KeyboardInterrupt:
+            break
+
+        if returncode != 0:
+            log.warning(
+                "Publish worker exited with code {}".format(returncode)
+            )
+        # Do not restart crashing worker in loop
+        if time.time() - start < 10:
+            time.sleep(10)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Send publish job to running publish worker."
+    )
+    parser.add_argument("paths", nargs="+", help="Paths to publish jsons.")
+    parser.add_argument(
+        "-t", "--targets", action="append", default=None, help="Targets."
+    )
+    parser.add_argument(
+        "-p", "--port", type=int, default=None, help="Port of worker."
+    )
+    args = parser.parse_args()
+    try:
+        success = send_publish_job(args.paths, args.targets, port=args.port)
+    except PublishWorkerNotAvailable as exc:
+        print(str(exc))
+        return 2
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
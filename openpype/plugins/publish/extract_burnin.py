@@ -18,7 +18,7 @@ from openpype.lib import (
     convert_input_paths_for_ffmpeg,
     should_convert_for_ffmpeg
 )
-from openpype.lib.profiles_filtering import filter_profiles
+from openpype.lib.profiles_filtering import get_profile_matcher
 
 
 class ExtractBurnin(publish.Extractor):
@@ -73,6 +73,8 @@ class ExtractBurnin(publish.Extractor):
     # Configurable by Settings
     profiles = None
     options = None
+    # Count of processes converting input files at once (0 - cpu count)
+    conversion_workers = 0
 
     def process(self, instance):
         if not self.profiles:
@@ -157,8 +159,9 @@ class ExtractBurnin(publish.Extractor):
             "task_types": task_type,
             "subset": subset
         }
-        profile = filter_profiles(self.profiles, filtering_criteria,
-                                  logger=self.log)
+        profile = get_profile_matcher(self.profiles).match(
+            filtering_criteria, logger=self.log
+        )
 
         if not profile:
             self.log.info((
@@ -236,7 +239,8 @@ class ExtractBurnin(publish.Extractor):
                 convert_input_paths_for_ffmpeg(
                     src_filepaths,
                     new_staging_dir,
-                    self.log
+                    self.log,
+                    self.conversion_workers
                 )
 
             # Add anatomy keys to burnin_data.
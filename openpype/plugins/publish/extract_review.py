@@ -2,20 +2,22 @@ import os
 import re
 import copy
 import json
+import time
 import shutil
+import collections
 from abc import ABCMeta, abstractmethod
 
 import six
-import clique
 import speedcopy
 import pyblish.api
 
 from openpype.lib import (
     get_ffmpeg_tool_path,
-    filter_profiles,
+    get_profile_matcher,
     path_to_subprocess_arg,
     run_subprocess,
 )
+from openpype.lib import sequence_tools
 from openpype.lib.transcoding import (
     IMAGE_EXTENSIONS,
     get_ffprobe_streams,
@@ -72,6 +74,10 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     # Preset attributes
     profiles = None
+    # Count of processes converting input files at once (0 - cpu count)
+    conversion_workers = 0
+    # Render output definitions with same input in one ffmpeg process
+    single_pass_outputs = False
 
     def process(self, instance):
         self.log.debug(str(instance.data["representations"]))
@@ -95,13 +101,13 @@ class ExtractReview(pyblish.api.InstancePlugin):
         self.log.info("Host: \"{}\"".format(host_name))
         self.log.info("Family: \"{}\"".format(family))
 
-        profile = filter_profiles(
-            self.profiles,
+        profile = get_profile_matcher(self.profiles).match(
             {
                 "hosts": host_name,
                 "families": family,
             },
-            logger=self.log)
+            logger=self.log
+        )
         if not profile:
             self.log.info((
                 "Skipped instance. None of profiles in presets are for"
@@ -282,7 +288,8 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 convert_input_paths_for_ffmpeg(
                     input_filepaths,
                     new_staging_dir,
-                    self.log
+                    self.log,
+                    self.conversion_workers
                 )
 
             try:
@@ -307,6 +314,8 @@ class ExtractReview(pyblish.api.InstancePlugin):
         self, instance, repre, src_repre_staging_dir, output_definitions
     ):
         fill_data = copy.deepcopy(instance.data["anatomyData"])
+        outputs = []
+        files_to_clean = []
         for _output_def in output_definitions:
             output_def = copy.deepcopy(_output_def)
             # Make sure output definition has "tags" key
@@ -349,15 +358,14 @@ class ExtractReview(pyblish.api.InstancePlugin):
             )
 
             temp_data = self.prepare_temp_data(instance, repre, output_def)
-            files_to_clean = []
             if temp_data["input_is_sequence"]:
                 self.log.info("Filling gaps in sequence.")
-                files_to_clean = self.fill_sequence_gaps(
+                files_to_clean.extend(self.fill_sequence_gaps(
                     files=temp_data["origin_repre"]["files"],
                     staging_dir=new_repre["stagingDir"],
                     start_frame=temp_data["frame_start"],
                     end_frame=temp_data["frame_end"]
-                )
+                ))
 
             # create or update outputName
             output_name = new_repre.get("outputName", "")
@@ -375,7 +383,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
             })
 
             try:  # temporary until oiiotool is supported cross platform
-                ffmpeg_args = self._ffmpeg_arguments(
+                ffmpeg_args_parts = self._ffmpeg_arguments_parts(
                     output_def, instance, new_repre, temp_data, fill_data
                 )
             except ZeroDivisionError:
@@ -389,29 +397,44 @@ class ExtractReview(pyblish.api.InstancePlugin):
                         ),
                         exc_info=True
                     )
-                    return
+                    break
                 raise NotImplementedError
 
-            subprcs_cmd = " ".join(ffmpeg_args)
-
-            # run subprocess
-            self.log.debug("Executing: {}".format(subprcs_cmd))
+            outputs.append({
+                "output_def": output_def,
+                "new_repre": new_repre,
+                "temp_data": temp_data,
+                "output_name": output_name,
+                "output_ext": output_ext,
+                "ffmpeg_args_parts": ffmpeg_args_parts,
+            })
 
-            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+        try:
+            for outputs_group in self._group_outputs_by_input(outputs):
+                if len(outputs_group) > 1:
+                    self._render_single_pass(outputs_group)
+                else:
+                    self._render_output(outputs_group[0])
 
+        finally:
             # delete files added to fill gaps
-            if files_to_clean:
-                for f in files_to_clean:
-                    os.unlink(f)
-
+            for filepath in set(files_to_clean):
+                if os.path.exists(filepath):
+                    os.unlink(filepath)
+
+        for output in outputs:
+            new_repre = output["new_repre"]
+            temp_data = output["temp_data"]
+            output_name = output["output_name"]
             new_repre.update({
                 "fps": temp_data["fps"],
-                "name": "{}_{}".format(output_name, output_ext),
+                "name": "{}_{}".format(output_name, output["output_ext"]),
                 "outputName": output_name,
-                "outputDef": output_def,
+                "outputDef": output["output_def"],
                 "frameStartFtrack": temp_data["output_frame_start"],
                 "frameEndFtrack": temp_data["output_frame_end"],
-                "ffmpeg_cmd": subprcs_cmd
+                "ffmpeg_cmd": output["ffmpeg_cmd"],
+                "ffmpeg_duration": output["ffmpeg_duration"]
             })
 
             # Force to pop these key if are in new repre
@@ -425,6 +448,139 @@ class ExtractReview(pyblish.api.InstancePlugin):
             )
             instance.data["representations"].append(new_repre)
 
+    def _render_output(self, output):
+        """Render single output definition with own ffmpeg process."""
+        ffmpeg_args = self.ffmpeg_full_args(
+            *output["ffmpeg_args_parts"]
+        )
+        subprcs_cmd = " ".join(ffmpeg_args)
+
+        # run subprocess
+        self.log.debug("Executing: {}".format(subprcs_cmd))
+
+        start = time.time()
+        run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+        duration = time.time() - start
+        self.log.debug("Output \"{}\" rendered in {:.2f}s".format(
+            output["output_name"], duration
+        ))
+
+        output["ffmpeg_cmd"] = subprcs_cmd
+        output["ffmpeg_duration"] = duration
+
+    def _group_outputs_by_input(self, outputs):
+        """Group outputs which can be rendered with single ffmpeg process.
+
+        Outputs can be merged only if 'single_pass_outputs' is enabled and
+        they have same input arguments, don't have audio and their video
+        filters are simple filter chains.
+
+        Returns:
+            list[list[dict]]: Groups of outputs in order of outputs.
+        """
+        if not self.single_pass_outputs:
+            return [[output] for output in outputs]
+
+        groups = collections.OrderedDict()
+        for idx, output in enumerate(outputs):
+            input_args, video_filters, audio_filters, output_args = (
+                self._normalized_ffmpeg_args(output["ffmpeg_args_parts"])
+            )
+            key = idx
+            if self._can_share_ffmpeg_pass(
+                input_args, video_filters, audio_filters, output_args
+            ):
+                key = tuple(input_args)
+            groups.setdefault(key, []).append(output)
+        return list(groups.values())
+
+    def _can_share_ffmpeg_pass(
+        self, input_args, video_filters, audio_filters, output_args
+    ):
+        inputs_count = 0
+        for arg in input_args:
+            if arg == "-i" or arg.startswith("-i "):
+                inputs_count += 1
+
+        # Audio would require mapping of audio streams
+        if inputs_count != 1 or audio_filters:
+            return False
+
+        # Filters with labeled pads can't be chained into filter graph
+        for video_filter in video_filters:
+            if "[" in video_filter or ";" in video_filter:
+                return False
+
+        for arg in output_args:
+            for identifier in ("-map", "-filter_complex", "-lavfi"):
+                if arg == identifier or arg.startswith(identifier + " "):
+                    return False
+        return True
+
+    def _render_single_pass(self, outputs):
+        """Render multiple outputs using one ffmpeg process.
+
+        Decoded input is split using 'split' filter to filter chain of each
+        output. Outputs are rendered separately if the process fails.
+        """
+        args_parts = [
+            self._normalized_ffmpeg_args(output["ffmpeg_args_parts"])
+            for output in outputs
+        ]
+        input_args = args_parts[0][0]
+        filter_graph = ["[0:v]split={}{}".format(
+            len(outputs),
+            "".join("[s{}]".format(idx) for idx in range(len(outputs)))
+        )]
+        mapped_output_args = []
+        for idx, (output, parts) in enumerate(zip(outputs, args_parts)):
+            _, video_filters, _, output_args = parts
+            filter_graph.append("[s{0}]{1}[v{0}]".format(
+                idx, ",".join(video_filters) or "null"
+            ))
+            mapped_output_args.extend(["-map", "\"[v{}]\"".format(idx)])
+            # Explicit mapping disables default stream selection, keep
+            #   audio stream of input (if there is any) as separate render
+            #   would
+            if not output["temp_data"]["output_ext_is_image"]:
+                mapped_output_args.extend(["-map", "0:a:0?"])
+            mapped_output_args.extend(output_args)
+
+        all_args = [path_to_subprocess_arg(self.ffmpeg_path)]
+        all_args.extend(input_args)
+        all_args.append("-filter_complex")
+        all_args.append("\"{}\"".format(";".join(filter_graph)))
+        all_args.extend(mapped_output_args)
+        subprcs_cmd = " ".join(all_args)
+
+        self.log.debug("Executing single pass: {}".format(subprcs_cmd))
+        start = time.time()
+        try:
+            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+        except RuntimeError:
+            self.log.warning(
+                "Single pass render failed. Rendering outputs separately.",
+                exc_info=True
+            )
+            for output in outputs:
+                self._render_output(output)
+            return
+
+        duration = time.time() - start
+        self.log.debug("Outputs {} rendered in {:.2f}s".format(
+            ", ".join(
+                "\"{}\"".format(output["output_name"]) for output in outputs
+            ),
+            duration
+        ))
+        for output in outputs:
+            # Keep command of the output as if it would be rendered
+            #   separately, it's used to copy codec arguments
+            output["ffmpeg_cmd"] = " ".join(self.ffmpeg_full_args(
+                *output["ffmpeg_args_parts"]
+            ))
+            output["ffmpeg_duration"] = duration
+
     def input_is_sequence(self, repre):
         """Deduce from representation data if input is sequence."""
         # TODO GLOBAL ISSUE - Find better way how to find out if input
@@ -495,7 +651,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
         first_sequence_frame = None
         if input_is_sequence and repre["files"]:
             # Calculate first frame that should be used
-            cols, _ = clique.assemble(repre["files"])
+            cols, _ = sequence_tools.assemble(repre["files"])
             input_frames = list(sorted(cols[0].indexes))
             first_sequence_frame = input_frames[0]
             # WARNING: This is an issue as we don't know if first frame
@@ -549,6 +705,21 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 process.
             temp_data (dict): Base data for successful process.
         """
+        return self.ffmpeg_full_args(*self._ffmpeg_arguments_parts(
+            output_def, instance, new_repre, temp_data, fill_data
+        ))
+
+    def _ffmpeg_arguments_parts(
+        self, output_def, instance, new_repre, temp_data, fill_data
+    ):
+        """Prepares ffmpeg arguments for expected extraction.
+
+        Same as '_ffmpeg_arguments' but arguments are not merged.
+
+        Returns:
+            tuple[list, list, list, list]: Input arguments, video filters,
+                audio filters and output arguments.
+        """
 
         # Get FFmpeg arguments from profile presets
         out_def_ffmpeg_args = output_def.get("ffmpeg_args") or {}
@@ -724,7 +895,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
             path_to_subprocess_arg(temp_data["full_output_path"])
         )
 
-        return self.ffmpeg_full_args(
+        return (
             ffmpeg_input_args,
             ffmpeg_video_filters,
             ffmpeg_audio_filters,
@@ -772,6 +943,41 @@ class ExtractReview(pyblish.api.InstancePlugin):
         Returns:
             list: Containing all arguments ready to run in subprocess.
         """
+        input_args, video_filters, audio_filters, output_args = (
+            self._normalized_ffmpeg_args(
+                (input_args, video_filters, audio_filters, output_args)
+            )
+        )
+
+        all_args = []
+        all_args.append(path_to_subprocess_arg(self.ffmpeg_path))
+        all_args.extend(input_args)
+        if video_filters:
+            all_args.append("-filter:v")
+            all_args.append("\"{}\"".format(",".join(video_filters)))
+
+        if audio_filters:
+            all_args.append("-filter:a")
+            all_args.append("\"{}\"".format(",".join(audio_filters)))
+
+        all_args.extend(output_args)
+
+        return all_args
+
+    def _normalized_ffmpeg_args(self, args_parts):
+        """Move filters found in output arguments to filters.
+
+        Args:
+            args_parts (tuple[list, list, list, list]): Input arguments,
+                video filters, audio filters and output arguments.
+
+        Returns:
+            tuple[list, list, list, list]: Copy of arguments with filters
+                moved out of output arguments.
+        """
+        input_args, video_filters, audio_filters, output_args = (
+            copy.deepcopy(args_parts)
+        )
         output_args = self.split_ffmpeg_args(output_args)
 
         video_args_dentifiers = ["-vf", "-filter:v"]
@@ -789,20 +995,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     arg = arg.replace(identifier, "").strip()
                     audio_filters.append(arg)
 
-        all_args = []
-        all_args.append(path_to_subprocess_arg(self.ffmpeg_path))
-        all_args.extend(input_args)
-        if video_filters:
-            all_args.append("-filter:v")
-            all_args.append("\"{}\"".format(",".join(video_filters)))
-
-        if audio_filters:
-            all_args.append("-filter:a")
-            all_args.append("\"{}\"".format(",".join(audio_filters)))
-
-        all_args.extend(output_args)
-
-        return all_args
+        return input_args, video_filters, audio_filters, output_args
 
     def fill_sequence_gaps(self, files, staging_dir, start_frame, end_frame):
         # type: (list, str, int, int) -> list
@@ -826,7 +1019,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
             KnownPublishError: if more than one collection is obtained.
         """
 
-        collections = clique.assemble(files)[0]
+        collections = sequence_tools.assemble(files)[0]
         if len(collections) != 1:
             raise KnownPublishError(
                 "Multiple collections {} found.".format(collections))
@@ -877,7 +1070,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
         dst_staging_dir = new_repre["stagingDir"]
 
         if temp_data["input_is_sequence"]:
-            collections = clique.assemble(repre["files"])[0]
+            collections = sequence_tools.assemble(repre["files"])[0]
             full_input_path = os.path.join(
                 src_staging_dir,
                 collections[0].format("{head}{padding}{tail}")
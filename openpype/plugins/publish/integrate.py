@@ -22,10 +22,12 @@ from openpype.client import (
     get_representations,
     get_subset_by_name,
     get_version_by_name,
+    compact_representation_files,
 )
-from openpype.lib import source_hash
+from openpype.lib import source_hash_from_stat
 from openpype.lib.file_transaction import (
     FileTransaction,
+    DirectoryStatCache,
     DuplicateDestinationError
 )
 from openpype.pipeline.publish import (
@@ -149,6 +151,11 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         "family", "hierarchy", "username", "user", "output"
     ]
     skip_host_families = []
+    # Algorithm of content hash of published files computed during transfer
+    #   - 'none' to disable, 'xxhash' or 'sha256'
+    content_hash = "none"
+    # Store files of sequences as single compact item in representation
+    compact_sequence_files = False
 
     def process(self, instance):
         if self._temp_skip_instance_by_settings(instance):
@@ -178,9 +185,15 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(instance.data["family"]))
             return
 
-        file_transactions = FileTransaction(log=self.log,
-                                            # Enforce unique transfers
-                                            allow_queue_replacements=False)
+        content_hash_algorithm = None
+        if self.content_hash and self.content_hash != "none":
+            content_hash_algorithm = self.content_hash
+        file_transactions = FileTransaction(
+            log=self.log,
+            # Enforce unique transfers
+            allow_queue_replacements=False,
+            content_hash_algorithm=content_hash_algorithm
+        )
         try:
             self.register(instance, file_transactions, filtered_repres)
         except DuplicateDestinationError as exc:
@@ -356,6 +369,12 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             "Transferred files: {}".format(file_transactions.transferred))
         self.log.debug("Retrieving Representation Site Sync information ...")
 
+        # File stats are shared in whole publish context, directories with
+        #   just transferred files must be scanned again
+        stat_cache = self._get_file_stat_cache(instance.context)
+        stat_cache.invalidate(file_transactions.transferred)
+        content_hashes = file_transactions.content_hashes
+
         # Get the accessible sites for Site Sync
         modules_by_name = instance.context.data["openPypeModules"]
         sync_server_module = modules_by_name["sync_server"]
@@ -367,9 +386,13 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         # Compute the resource file infos once (files belonging to the
         # version instance instead of an individual representation) so
         # we can re-use those file infos per representation
-        resource_file_infos = self.get_files_info(resource_destinations,
-                                                  sites=sites,
-                                                  anatomy=anatomy)
+        resource_file_infos = self.get_files_info(
+            resource_destinations,
+            sites=sites,
+            anatomy=anatomy,
+            stat_cache=stat_cache,
+            content_hashes=content_hashes
+        )
 
         # Finalize the representations now the published files are integrated
         # Get 'files' info for representations and its attached resources
@@ -380,18 +403,23 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             transfers = prepared["transfers"]
             destinations = [dst for src, dst in transfers]
             repre_doc["files"] = self.get_files_info(
-                destinations, sites=sites, anatomy=anatomy
+                destinations,
+                sites=sites,
+                anatomy=anatomy,
+                stat_cache=stat_cache,
+                content_hashes=content_hashes
             )
 
             # Add the version resource file infos to each representation
             repre_doc["files"] += resource_file_infos
+            db_repre_doc = self.get_db_representation_doc(repre_doc)
 
             # Set up representation for writing to the database. Since
             # we *might* be overwriting an existing entry if the version
             # already existed we'll use ReplaceOnce with `upsert=True`
             if repre_update_data is None:
                 op_session.create_entity(
-                    project_name, repre_doc["type"], repre_doc
+                    project_name, repre_doc["type"], db_repre_doc
                 )
             else:
                 op_session.update_entity(
@@ -698,13 +726,19 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             if not is_sequence_representation:
                 files = [files]
 
-            repre_context = None
-            transfers = []
+            data_list = []
             for src_file_name in files:
-                template_data["originalBasename"], _ = os.path.splitext(
+                file_template_data = dict(template_data)
+                file_template_data["originalBasename"], _ = os.path.splitext(
                     src_file_name)
+                data_list.append(file_template_data)
+            # Keep last value in template data as it was before
+            template_data.update(data_list[-1])
 
-                dst = path_template_obj.format_strict(template_data)
+            repre_context = None
+            transfers = []
+            dst_filepaths = path_template_obj.format_strict_many(data_list)
+            for src_file_name, dst in zip(files, dst_filepaths):
                 src = os.path.join(stagingdir, src_file_name)
                 transfers.append((src, dst))
                 if repre_context is None:
@@ -757,22 +791,21 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             )
 
             # Construct destination collection from template
-            repre_context = None
-            dst_filepaths = []
+            #   - all frames are formatted at once as only frame key changes
+            index_key = "udim" if is_udim else "frame"
+            data_list = []
             for index in destination_indexes:
-                if is_udim:
-                    template_data["udim"] = index
-                else:
-                    template_data["frame"] = index
-                template_filled = path_template_obj.format_strict(
-                    template_data
-                )
-                dst_filepaths.append(template_filled)
-                if repre_context is None:
-                    self.log.debug(
-                        "Template filled: {}".format(str(template_filled))
-                    )
-                    repre_context = template_filled.used_values
+                index_template_data = dict(template_data)
+                index_template_data[index_key] = index
+                data_list.append(index_template_data)
+            # Keep last value in template data as it was before
+            template_data[index_key] = destination_indexes[-1]
+
+            dst_filepaths = path_template_obj.format_strict_many(data_list)
+            self.log.debug(
+                "Template filled: {}".format(str(dst_filepaths[0]))
+            )
+            repre_context = dst_filepaths[0].used_values
 
             # Make sure context contains frame
             # NOTE: Frame would not be available only if template does not
@@ -950,6 +983,29 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             logger=self.log
         )
 
+    def get_db_representation_doc(self, repre_doc):
+        """Representation document as it is stored to database.
+
+        Files of sequences are stored as compact items when
+        'compact_sequence_files' is enabled. Passed document is not changed
+        so published representations keep item of each file (hero version
+        integration replaces paths per file).
+
+        Args:
+            repre_doc (dict[str, Any]): Representation document.
+
+        Returns:
+            dict[str, Any]: Representation document for database.
+        """
+
+        if not self.compact_sequence_files:
+            return repre_doc
+        db_repre_doc = dict(repre_doc)
+        db_repre_doc["files"] = compact_representation_files(
+            repre_doc["files"]
+        )
+        return db_repre_doc
+
     def get_rootless_path(self, anatomy, path):
         """Returns, if possible, path without absolute portion from root
             (eg. 'c:\' or '/opt/..')
@@ -977,25 +1033,50 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(path))
         return path
 
-    def get_files_info(self, destinations, sites, anatomy):
+    def get_files_info(
+        self,
+        destinations,
+        sites,
+        anatomy,
+        stat_cache=None,
+        content_hashes=None
+    ):
         """Prepare 'files' info portion for representations.
 
         Arguments:
             destinations (list): List of transferred file destinations
             sites (list): array of published locations
             anatomy: anatomy part from instance
+            stat_cache (DirectoryStatCache): cache of file stats
+            content_hashes (dict): content hashes by destination path
         Returns:
             output_resources: array of dictionaries to be added to 'files' key
             in representation
         """
 
+        if stat_cache is None:
+            stat_cache = DirectoryStatCache()
+
+        if content_hashes is None:
+            content_hashes = {}
+
         file_infos = []
         for file_path in destinations:
-            file_info = self.prepare_file_info(file_path, anatomy, sites=sites)
+            file_info = self.prepare_file_info(
+                file_path,
+                anatomy,
+                sites=sites,
+                file_stat=stat_cache.stat(file_path),
+                content_hash=content_hashes.get(
+                    os.path.normpath(os.path.abspath(file_path))
+                )
+            )
             file_infos.append(file_info)
         return file_infos
 
-    def prepare_file_info(self, path, anatomy, sites):
+    def prepare_file_info(
+        self, path, anatomy, sites, file_stat=None, content_hash=None
+    ):
         """ Prepare information for one file (asset or resource)
 
         Arguments:
@@ -1004,18 +1085,34 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             sites: array of published locations,
                 [ {'name':'studio', 'created_dt':date} by default
                 keys expected ['studio', 'site1', 'gdrive1']
+            file_stat: stat of the file, stat is called if not passed
+            content_hash: hash of file content as '<algorithm>:<hexdigest>'
 
         Returns:
             dict: file info dictionary
         """
 
-        return {
+        if file_stat is None:
+            file_stat = os.stat(path)
+
+        file_info = {
             "_id": ObjectId(),
             "path": self.get_rootless_path(anatomy, path),
-            "size": os.path.getsize(path),
-            "hash": source_hash(path),
+            "size": file_stat.st_size,
+            "hash": source_hash_from_stat(path, file_stat),
             "sites": sites
         }
+        if content_hash:
+            file_info["contentHash"] = content_hash
+        return file_info
+
+    @staticmethod
+    def _get_file_stat_cache(context):
+        stat_cache = context.data.get("fileStatCache")
+        if stat_cache is None:
+            stat_cache = DirectoryStatCache()
+            context.data["fileStatCache"] = stat_cache
+        return stat_cache
 
     def _validate_path_in_project_roots(self, anatomy, file_path):
         """Checks if 'file_path' starts with any of the roots.
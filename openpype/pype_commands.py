@@ -88,6 +88,25 @@ class PypeCommands:
         """
 
         from openpype.lib import Logger
+        from openpype.pipeline.publish.worker import (
+            PUBLISH_WORKER_PORT_ENV,
+            PublishWorkerNotAvailable,
+            send_publish_job,
+        )
+
+        log = Logger.get_logger("CLI-publish")
+
+        # Use running publish worker if is available on the machine
+        if not gui and os.getenv(PUBLISH_WORKER_PORT_ENV):
+            try:
+                success = send_publish_job(paths, targets)
+            except PublishWorkerNotAvailable as exc:
+                log.info("{} Publishing in this process.".format(str(exc)))
+            else:
+                if not success:
+                    sys.exit(1)
+                return
+
         from openpype.lib.applications import get_app_environments_for_context
         from openpype.modules import ModulesManager
         from openpype.pipeline import install_openpype_plugins
@@ -98,8 +117,6 @@ class PypeCommands:
         import pyblish.api
         import pyblish.util
 
-        log = Logger.get_logger("CLI-publish")
-
         install_openpype_plugins()
 
         manager = ModulesManager()
@@ -156,6 +173,30 @@ class PypeCommands:
 
         log.info("Publish finished.")
 
+    @staticmethod
+    def launch_publish_worker(port=None, max_jobs=None, once=False):
+        """Start long-lived worker processing publish jobs.
+
+        Args:
+            port (int): Port on which worker listens.
+            max_jobs (int): Jobs processed before worker process is recycled.
+            once (bool): Run only one worker process without restarting it.
+        """
+        from openpype.lib import Logger
+        from openpype.pipeline.publish.worker import (
+            PublishWorker,
+            run_publish_worker,
+        )
+
+        Logger.set_process_name("PublishWorker")
+
+        if not once:
+            run_publish_worker(port, max_jobs)
+            return
+
+        worker = PublishWorker(port, max_jobs)
+        worker.serve()
+
     @staticmethod
     def remotepublishfromapp(project_name, batch_path, host_name,
                              user_email, targets=None):
@@ -226,20 +267,44 @@ class PypeCommands:
 
     @staticmethod
     def extractenvironments(output_json_path, project, asset, task, app,
-                            env_group):
+                            env_group, cache_path=None):
         """Produces json file with environment based on project and app.
 
         Called by Deadline plugin to propagate environment into render jobs.
+
+        Environment stored in cache file is reused if settings were not
+        saved since it was created. Cache is refreshed otherwise.
         """
 
         from openpype.lib.applications import get_app_environments_for_context
+        from openpype.lib.env_tools import (
+            get_settings_state_hash,
+            read_environment_cache,
+            write_environment_cache,
+        )
 
-        if all((project, asset, task, app)):
-            env = get_app_environments_for_context(
-                project, asset, task, app, env_group
-            )
-        else:
-            env = os.environ.copy()
+        env = None
+        settings_hash = None
+        if cache_path:
+            settings_hash = get_settings_state_hash(project)
+            cache_data = read_environment_cache(cache_path)
+            if (
+                cache_data is not None
+                and cache_data.get("settings_hash") == settings_hash
+            ):
+                print("Using cached environment \"{}\"".format(cache_path))
+                env = cache_data["env"]
+
+        if env is None:
+            if all((project, asset, task, app)):
+                env = get_app_environments_for_context(
+                    project, asset, task, app, env_group
+                )
+            else:
+                env = os.environ.copy()
+
+        if cache_path:
+            write_environment_cache(cache_path, env, settings_hash)
 
         output_dir = os.path.dirname(output_json_path)
         if not os.path.exists(output_dir):
@@ -353,12 +418,44 @@ class PypeCommands:
         version_packer = VersionRepacker(directory)
         version_packer.process()
 
-    def pack_project(self, project_name, dirpath, database_only):
+    def pack_project(
+        self,
+        project_name,
+        dirpath,
+        database_only,
+        previous_package=None,
+        workers=None
+    ):
         from openpype.lib.project_backpack import pack_project
 
-        pack_project(project_name, dirpath, database_only)
+        pack_project(
+            project_name,
+            dirpath,
+            database_only,
+            previous_package=previous_package,
+            workers=workers
+        )
 
-    def unpack_project(self, zip_filepath, new_root, database_only):
+    def unpack_project(
+        self, zip_filepath, new_root, database_only, workers=None
+    ):
         from openpype.lib.project_backpack import unpack_project
 
-        unpack_project(zip_filepath, new_root, database_only)
+        unpack_project(
+            zip_filepath, new_root, database_only, workers=workers
+        )
+
+    def migrate_repre_files(self, project_name, expand=False, dry_run=False):
+        from openpype.lib import Logger
+        from openpype.client.representation_files import (
+            migrate_representation_files
+        )
+
+        log = Logger.get_logger("CLI-migrate_repre_files")
+        report = migrate_representation_files(
+            project_name, compact=not expand, dry_run=dry_run
+        )
+        log.info((
+            "Changed {changed} of {representations} representations"
+            " ({files_before} -> {files_after} file items)."
+        ).format(**report))
@@ -583,6 +583,7 @@ class CacheValues:
                     data = json.loads(value)
 
         self.data = data
+        self.creation_time = datetime.datetime.now()
         self.version = version
 
     def to_json_string(self):
@@ -596,7 +597,7 @@ class CacheValues:
         return delta > self.cache_lifetime
 
     def set_outdated(self):
-        self.create_time = None
+        self.creation_time = None
 
 
 class MongoSettingsHandler(SettingsHandler):
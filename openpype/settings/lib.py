@@ -4,6 +4,7 @@ import functools
 import logging
 import platform
 import copy
+import collections
 from .exceptions import (
     SaveWarningExc
 )
@@ -40,6 +41,187 @@ _SETTINGS_HANDLER = None
 _LOCAL_SETTINGS_HANDLER = None
 
 
+class _ReadOnlyDict(dict):
+    """Dictionary of settings values which can't be modified.
+
+    Deep copy of the object is mutable 'dict'.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(
+            "Settings values are read-only. Use 'copy.deepcopy' to get"
+            " mutable copy."
+        )
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return _copy_settings(self)
+
+    def __reduce__(self):
+        return (dict, (_copy_settings(self), ))
+
+
+class _ReadOnlyList(list):
+    """List of settings values which can't be modified.
+
+    Deep copy of the object is mutable 'list'.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(
+            "Settings values are read-only. Use 'copy.deepcopy' to get"
+            " mutable copy."
+        )
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    __setslice__ = __delslice__ = _read_only
+    append = extend = insert = remove = pop = _read_only
+    clear = sort = reverse = _read_only
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return _copy_settings(self)
+
+    def __reduce__(self):
+        return (list, (_copy_settings(self), ))
+
+
+def _copy_settings(value):
+    """Deep copy of settings values.
+
+    Settings contain only json serializable values so copy can be much
+    faster than 'copy.deepcopy'.
+    """
+
+    if isinstance(value, dict):
+        return {
+            key: _copy_settings(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_copy_settings(item) for item in value]
+    return value
+
+
+def _freeze_settings(value):
+    """Convert settings values to read-only variants."""
+    if isinstance(value, dict):
+        return _ReadOnlyDict(
+            (key, _freeze_settings(item))
+            for key, item in value.items()
+        )
+    if isinstance(value, list):
+        return _ReadOnlyList(_freeze_settings(item) for item in value)
+    return value
+
+
+class _SettingsLayer(object):
+    """Settings values merged from parent layer and overrides.
+
+    Merged values are cached until key of the layer changes. Key contains
+    version and content of overrides and revision of parent layer, so layer
+    is merged again only if overrides changed after handler refreshed them.
+    Values of layer are never modified, only copied.
+    """
+
+    def __init__(self):
+        self.revision = 0
+        self._key = None
+        self._value = None
+        self._clean_value = None
+        self._views = {}
+
+    def update(self, key, create_func):
+        """Make sure layer values are merged for passed key.
+
+        Args:
+            key (tuple): Values used to create merged values.
+            create_func (Callable[[], dict]): Function which merges values.
+
+        Returns:
+            _SettingsLayer: Self.
+        """
+
+        if self._value is None or self._key != key:
+            self._value = create_func()
+            self._key = key
+            self._clean_value = None
+            self._views = {}
+            self.revision += 1
+        return self
+
+    def get_value(self, clear_metadata=False):
+        """Merged values, must not be modified."""
+        if not clear_metadata:
+            return self._value
+
+        if self._clean_value is None:
+            clean_value = _copy_settings(self._value)
+            clear_metadata_from_settings(clean_value)
+            self._clean_value = clean_value
+        return self._clean_value
+
+    def get_settings(
+        self,
+        clear_metadata,
+        exclude_locals,
+        apply_locals_func,
+        read_only,
+        view_id=None
+    ):
+        """Settings values with optionally applied local settings.
+
+        Args:
+            clear_metadata (bool): Remove metadata keys.
+            exclude_locals (Union[bool, None]): Do not apply local settings.
+                Default value is based on 'clear_metadata'.
+            apply_locals_func (Callable[[dict, dict], None]): Function which
+                applies local settings on settings values.
+            read_only (bool): Return read-only values cached in the layer
+                instead of mutable copy.
+            view_id (Any): Additional identifier of read-only values, if
+                'apply_locals_func' depends on more than local settings.
+
+        Returns:
+            dict: Settings values.
+        """
+
+        if exclude_locals is None:
+            exclude_locals = not clear_metadata
+
+        local_settings = None
+        if not exclude_locals:
+            local_settings = get_local_settings()
+
+        view_key = (clear_metadata, exclude_locals, view_id)
+        if read_only:
+            view = self._views.get(view_key)
+            if view is not None and view[0] == local_settings:
+                return view[1]
+
+        result = _copy_settings(self.get_value(clear_metadata))
+        if not exclude_locals:
+            apply_locals_func(result, local_settings)
+
+        if read_only:
+            result = _freeze_settings(result)
+            self._views[view_key] = (local_settings, result)
+        return result
+
+
+# Cached layers of settings by settings key and project name
+_SETTINGS_LAYERS = collections.defaultdict(
+    lambda: collections.defaultdict(_SettingsLayer)
+)
+
+
 def require_handler(func):
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
@@ -507,6 +689,7 @@ def reset_default_settings():
     """Reset cache of default settings. Can't be used now."""
     global _DEFAULT_SETTINGS
     _DEFAULT_SETTINGS = None
+    _SETTINGS_LAYERS.clear()
 
 
 def _get_default_settings():
@@ -557,10 +740,15 @@ def get_default_settings():
     Returns:
         dict: Loaded default settings.
     """
+    return copy.deepcopy(_get_cached_default_settings())
+
+
+def _get_cached_default_settings():
+    """Cached default settings which must not be modified."""
     global _DEFAULT_SETTINGS
     if _DEFAULT_SETTINGS is None:
         _DEFAULT_SETTINGS = _get_default_settings()
-    return copy.deepcopy(_DEFAULT_SETTINGS)
+    return _DEFAULT_SETTINGS
 
 
 def load_json_file(fpath):
@@ -890,74 +1078,135 @@ def apply_local_settings_on_project_settings(
         sync_server_config["remote_site"] = remote_site
 
 
-def get_system_settings(clear_metadata=True, exclude_locals=None):
-    """System settings with applied studio overrides."""
-    default_values = get_default_settings()[SYSTEM_SETTINGS_KEY]
-    studio_values = get_studio_system_settings_overrides()
-    result = apply_overrides(default_values, studio_values)
+def _get_studio_settings_layer(settings_key, studio_overrides_func):
+    studio_overrides, version = studio_overrides_func(True)
 
-    # Clear overrides metadata from settings
-    if clear_metadata:
-        clear_metadata_from_settings(result)
+    def create_func():
+        default_values = _get_cached_default_settings()[settings_key]
+        return apply_overrides(
+            default_values, copy.deepcopy(studio_overrides)
+        )
 
-    # Apply local settings
-    # Default behavior is based on `clear_metadata` value
-    if exclude_locals is None:
-        exclude_locals = not clear_metadata
+    return _SETTINGS_LAYERS[settings_key][None].update(
+        (version, studio_overrides), create_func
+    )
 
-    if not exclude_locals:
-        # TODO local settings may be required to apply for environments
-        local_settings = get_local_settings()
-        apply_local_settings_on_system_settings(result, local_settings)
 
-    return result
+def _get_system_settings_layer():
+    return _get_studio_settings_layer(
+        SYSTEM_SETTINGS_KEY, get_studio_system_settings_overrides
+    )
 
 
-def get_default_project_settings(clear_metadata=True, exclude_locals=None):
-    """Project settings with applied studio's default project overrides."""
-    default_values = get_default_settings()[PROJECT_SETTINGS_KEY]
-    studio_values = get_studio_project_settings_overrides()
-    result = apply_overrides(default_values, studio_values)
-    # Clear overrides metadata from settings
-    if clear_metadata:
-        clear_metadata_from_settings(result)
+def _get_default_project_settings_layer():
+    return _get_studio_settings_layer(
+        PROJECT_SETTINGS_KEY, get_studio_project_settings_overrides
+    )
 
-    # Apply local settings
-    if exclude_locals is None:
-        exclude_locals = not clear_metadata
 
-    if not exclude_locals:
-        local_settings = get_local_settings()
-        apply_local_settings_on_project_settings(
-            result, local_settings, None
+def _get_default_anatomy_settings_layer():
+    return _get_studio_settings_layer(
+        PROJECT_ANATOMY_KEY, get_studio_project_anatomy_overrides
+    )
+
+
+def _get_project_settings_layer(project_name):
+    studio_layer = _get_default_project_settings_layer()
+    project_overrides, version = get_project_settings_overrides(
+        project_name, True
+    )
+
+    def create_func():
+        return apply_overrides(
+            studio_layer.get_value(), copy.deepcopy(project_overrides)
         )
-    return result
 
+    return _SETTINGS_LAYERS[PROJECT_SETTINGS_KEY][project_name].update(
+        (studio_layer.revision, version, project_overrides), create_func
+    )
 
-def get_default_anatomy_settings(clear_metadata=True, exclude_locals=None):
-    """Project anatomy data with applied studio's default project overrides."""
-    default_values = get_default_settings()[PROJECT_ANATOMY_KEY]
-    studio_values = get_studio_project_anatomy_overrides()
 
-    result = apply_overrides(default_values, studio_values)
-    # Clear overrides metadata from settings
-    if clear_metadata:
-        clear_metadata_from_settings(result)
+def _get_anatomy_settings_layer(project_name):
+    studio_layer = _get_default_anatomy_settings_layer()
+    project_overrides = get_project_anatomy_overrides(project_name)
 
-    # Apply local settings
-    if exclude_locals is None:
-        exclude_locals = not clear_metadata
+    def create_func():
+        result = dict(studio_layer.get_value())
+        if project_overrides:
+            for key, value in copy.deepcopy(project_overrides).items():
+                result[key] = value
+        return result
 
-    if not exclude_locals:
-        local_settings = get_local_settings()
-        apply_local_settings_on_anatomy_settings(
-            result, local_settings, None
-        )
-    return result
+    return _SETTINGS_LAYERS[PROJECT_ANATOMY_KEY][project_name].update(
+        (studio_layer.revision, project_overrides), create_func
+    )
+
+
+def get_system_settings(
+    clear_metadata=True, exclude_locals=None, read_only=False
+):
+    """System settings with applied studio overrides.
+
+    Merged settings are cached until studio overrides change.
+
+    Args:
+        clear_metadata (bool): Remove metadata keys from settings.
+        exclude_locals (Union[bool, None]): Do not apply local settings.
+            Default value is based on 'clear_metadata'.
+        read_only (bool): Return cached read-only settings instead of
+            a mutable copy.
+
+    Returns:
+        dict[str, Any]: System settings.
+    """
+
+    # TODO local settings may be required to apply for environments
+    return _get_system_settings_layer().get_settings(
+        clear_metadata,
+        exclude_locals,
+        apply_local_settings_on_system_settings,
+        read_only
+    )
+
+
+def get_default_project_settings(
+    clear_metadata=True, exclude_locals=None, read_only=False
+):
+    """Project settings with applied studio's default project overrides."""
+    return _get_default_project_settings_layer().get_settings(
+        clear_metadata,
+        exclude_locals,
+        lambda result, local_settings: (
+            apply_local_settings_on_project_settings(
+                result, local_settings, None
+            )
+        ),
+        read_only
+    )
+
+
+def get_default_anatomy_settings(
+    clear_metadata=True, exclude_locals=None, read_only=False
+):
+    """Project anatomy data with applied studio's default project overrides."""
+    return _get_default_anatomy_settings_layer().get_settings(
+        clear_metadata,
+        exclude_locals,
+        lambda result, local_settings: (
+            apply_local_settings_on_anatomy_settings(
+                result, local_settings, None
+            )
+        ),
+        read_only
+    )
 
 
 def get_anatomy_settings(
-    project_name, site_name=None, clear_metadata=True, exclude_locals=None
+    project_name,
+    site_name=None,
+    clear_metadata=True,
+    exclude_locals=None,
+    read_only=False
 ):
     """Project anatomy data with applied studio and project overrides."""
     if not project_name:
@@ -966,65 +1215,57 @@ def get_anatomy_settings(
             "`get_default_anatomy_settings` to get project defaults."
         )
 
-    studio_overrides = get_default_anatomy_settings(False)
-    project_overrides = get_project_anatomy_overrides(
-        project_name
+    return _get_anatomy_settings_layer(project_name).get_settings(
+        clear_metadata,
+        exclude_locals,
+        lambda result, local_settings: (
+            apply_local_settings_on_anatomy_settings(
+                result, local_settings, project_name, site_name
+            )
+        ),
+        read_only,
+        site_name
     )
-    result = copy.deepcopy(studio_overrides)
-    if project_overrides:
-        for key, value in project_overrides.items():
-            result[key] = value
 
-    # Clear overrides metadata from settings
-    if clear_metadata:
-        clear_metadata_from_settings(result)
 
-    # Apply local settings
-    if exclude_locals is None:
-        exclude_locals = not clear_metadata
+def get_project_settings(
+    project_name, clear_metadata=True, exclude_locals=None, read_only=False
+):
+    """Project settings with applied studio and project overrides.
 
-    if not exclude_locals:
-        local_settings = get_local_settings()
-        apply_local_settings_on_anatomy_settings(
-            result, local_settings, project_name, site_name
-        )
+    Merged settings of studio and project are cached until their overrides
+    change. Read-only settings can be used by code which does not modify
+    them to skip copying.
 
-    return result
+    Args:
+        project_name (str): Name of project.
+        clear_metadata (bool): Remove metadata keys from settings.
+        exclude_locals (Union[bool, None]): Do not apply local settings.
+            Default value is based on 'clear_metadata'.
+        read_only (bool): Return cached read-only settings instead of
+            a mutable copy.
 
+    Returns:
+        dict[str, Any]: Project settings.
+    """
 
-def get_project_settings(
-    project_name, clear_metadata=True, exclude_locals=None
-):
-    """Project settings with applied studio and project overrides."""
     if not project_name:
         raise ValueError(
             "Must enter project name."
             " Call `get_default_project_settings` to get project defaults."
         )
 
-    studio_overrides = get_default_project_settings(False)
-    project_overrides = get_project_settings_overrides(
-        project_name
+    return _get_project_settings_layer(project_name).get_settings(
+        clear_metadata,
+        exclude_locals,
+        lambda result, local_settings: (
+            apply_local_settings_on_project_settings(
+                result, local_settings, project_name
+            )
+        ),
+        read_only
     )
 
-    result = apply_overrides(studio_overrides, project_overrides)
-
-    # Clear overrides metadata from settings
-    if clear_metadata:
-        clear_metadata_from_settings(result)
-
-    # Apply local settings
-    if exclude_locals is None:
-        exclude_locals = not clear_metadata
-
-    if not exclude_locals:
-        local_settings = get_local_settings()
-        apply_local_settings_on_project_settings(
-            result, local_settings, project_name
-        )
-
-    return result
-
 
 def get_current_project_settings():
     """Project settings for current context project.
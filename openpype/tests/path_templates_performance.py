@@ -0,0 +1,73 @@
+"""Compare formatting of frame sequence path frame by frame and at once.
+
+Formats publish path template of 5000 frames sequence with
+'StringTemplate.format_strict' for each frame and with
+'StringTemplate.format_strict_many' and prints used CPU time.
+
+Usage:
+    python path_templates_performance.py
+"""
+import time
+
+from openpype.lib.path_templates import StringTemplate
+
+
+class TestPathTemplatesPerformance():
+    TEMPLATE = (
+        "{root[work]}/{project[name]}/{hierarchy}/{asset}/publish/{family}"
+        "/{subset}/v{version:0>3}/{project[code]}_{asset}_{subset}"
+        "_v{version:0>3}<_{output}><.{frame:0>4}><_{udim}>.{ext}"
+    )
+
+    def get_template_data(self):
+        return {
+            "root": {"work": "/mnt/projects"},
+            "project": {"name": "PerformanceTest", "code": "perf"},
+            "hierarchy": "shots/sq01",
+            "asset": "sh010",
+            "family": "render",
+            "subset": "renderMain",
+            "version": 12,
+            "output": "beauty",
+            "ext": "exr",
+            "task": {"name": "lighting", "type": "Lighting"},
+            "username": "artist",
+            "app": "maya"
+        }
+
+    def run(self, frames_count=5000, repeats=3):
+        template_data = self.get_template_data()
+        data_list = []
+        for frame in range(1001, 1001 + frames_count):
+            frame_data = dict(template_data)
+            frame_data["frame"] = frame
+            data_list.append(frame_data)
+
+        def per_frame():
+            template = StringTemplate(self.TEMPLATE)
+            return [template.format_strict(data) for data in data_list]
+
+        def at_once():
+            template = StringTemplate(self.TEMPLATE)
+            return template.format_strict_many(data_list)
+
+        results = {}
+        for label, func in (("per frame", per_frame), ("at once", at_once)):
+            durations = []
+            for _ in range(repeats):
+                start = time.process_time()
+                results[label] = func()
+                durations.append(time.process_time() - start)
+            print("{}: {} frames, avg {:.4f}s, min {:.4f}s".format(
+                label,
+                frames_count,
+                sum(durations) / len(durations),
+                min(durations)
+            ))
+
+        assert results["per frame"] == results["at once"]
+
+
+if __name__ == "__main__":
+    tp = TestPathTemplatesPerformance()
+    tp.run()
@@ -0,0 +1,143 @@
+"""Compare standard and compact 'files' of representation documents.
+
+Creates representation with 5000 frames EXR sequence and measures size of
+BSON document, encoding and decoding of document and expanding of compact
+sequence to file items. With '--mongo' argument are measured also writes
+and reads of 100 such representations from database.
+
+Usage:
+    python representation_files_performance.py [--mongo]
+
+Mongo url is taken from 'OPENPYPE_MONGO' environment variable
+(defaults to 'mongodb://localhost:27017').
+"""
+import os
+import sys
+import time
+import hashlib
+import datetime
+
+import bson
+from bson.objectid import ObjectId
+
+from openpype.client.representation_files import (
+    compact_representation_files,
+    expand_representation_files,
+)
+
+
+def measure(label, func, repeats=5):
+    durations = []
+    for _ in range(repeats):
+        start = time.time()
+        func()
+        durations.append(time.time() - start)
+    print("{}: avg {:.4f}s, min {:.4f}s".format(
+        label, sum(durations) / len(durations), min(durations)
+    ))
+
+
+class TestRepresentationFilesPerformance():
+    MONGO_DB = "performance_test"
+    PROJECT_NAME = "representation_files_test"
+
+    FRAMES_COUNT = 5000
+    REPRESENTATIONS_COUNT = 100
+
+    def __init__(self):
+        created_dt = datetime.datetime.now()
+        sites = [
+            {"name": "studio", "created_dt": created_dt},
+            {"name": "gdrive"}
+        ]
+        files = []
+        for frame in range(1001, 1001 + self.FRAMES_COUNT):
+            filename = "sh010_renderMain_v001.{:04d}.exr".format(frame)
+            files.append({
+                "_id": ObjectId(),
+                "path": "{root[work]}/test/sh010/publish/" + filename,
+                "size": 20000000 + frame,
+                "hash": "|".join([
+                    filename,
+                    str(1697040000.0 + frame * 0.25),
+                    str(20000000 + frame)
+                ]).replace(".", ","),
+                "sites": sites,
+                "contentHash": "sha256:{}".format(
+                    hashlib.sha256(filename.encode("utf-8")).hexdigest()
+                )
+            })
+        self.files = files
+        self.compact_files = compact_representation_files(files)
+
+    def _create_doc(self, files):
+        return {
+            "_id": ObjectId(),
+            "type": "representation",
+            "name": "exr",
+            "parent": ObjectId(),
+            "context": {"representation": "exr"},
+            "data": {},
+            "files": files
+        }
+
+    def run_bson(self):
+        for label, files in (
+            ("standard", self.files),
+            ("compact", self.compact_files),
+        ):
+            doc = self._create_doc(files)
+            data = bson.BSON.encode(doc)
+            print("{}: {} file items, {:.1f} KB".format(
+                label, len(files), len(data) / 1024.0
+            ))
+            measure(
+                "{} encode".format(label), lambda: bson.BSON.encode(doc)
+            )
+            measure(
+                "{} decode".format(label), lambda: bson.BSON(data).decode()
+            )
+
+        measure(
+            "compact files",
+            lambda: compact_representation_files(self.files)
+        )
+        measure(
+            "expand files",
+            lambda: expand_representation_files(self.compact_files)
+        )
+
+    def run_mongo(self):
+        os.environ.setdefault("OPENPYPE_MONGO", "mongodb://localhost:27017")
+        os.environ["AVALON_DB"] = self.MONGO_DB
+        os.environ["OPENPYPE_DATABASE_NAME"] = self.MONGO_DB
+
+        from openpype.client.mongo import get_project_connection
+
+        collection = get_project_connection(self.PROJECT_NAME)
+        for label, files in (
+            ("standard", self.files),
+            ("compact", self.compact_files),
+        ):
+            collection.delete_many({})
+
+            def write():
+                collection.insert_many([
+                    self._create_doc(files)
+                    for _ in range(self.REPRESENTATIONS_COUNT)
+                ])
+
+            def read():
+                for doc in collection.find({"type": "representation"}):
+                    expand_representation_files(doc["files"])
+
+            measure("{} mongo write".format(label), write, repeats=1)
+            measure("{} mongo read".format(label), read)
+        collection.drop()
+
+
+if __name__ == "__main__":
+    tp = TestRepresentationFilesPerformance()
+    tp.run_bson()
+    if "--mongo" in sys.argv:
+        tp.run_mongo()
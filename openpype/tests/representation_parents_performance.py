@@ -0,0 +1,114 @@
+"""Compare query and aggregation variants of 'get_representations_parents'.
+
+Creates synthetic project with 50k versions in a test database and measures
+how long it takes to receive parents of representations with both variants.
+
+Usage:
+    python representation_parents_performance.py
+
+Mongo url is taken from 'OPENPYPE_MONGO' environment variable
+(defaults to 'mongodb://localhost:27017').
+"""
+import os
+import time
+import random
+
+from bson.objectid import ObjectId
+
+
+class TestRepresentationParentsPerformance():
+    MONGO_DB = "performance_test"
+    PROJECT_NAME = "representation_parents_test"
+
+    ASSETS_COUNT = 1000
+    SUBSETS_PER_ASSET = 10
+    VERSIONS_PER_SUBSET = 5
+
+    def __init__(self):
+        os.environ.setdefault("OPENPYPE_MONGO", "mongodb://localhost:27017")
+        os.environ["AVALON_DB"] = self.MONGO_DB
+
+        from openpype.client.mongo import get_project_connection
+
+        self.collection = get_project_connection(self.PROJECT_NAME)
+        self.version_ids = []
+
+    def prepare(self):
+        print("Purging {} collection".format(self.PROJECT_NAME))
+        self.collection.delete_many({})
+
+        project_id = ObjectId()
+        docs = [{
+            "_id": project_id,
+            "type": "project",
+            "name": self.PROJECT_NAME,
+            "data": {}
+        }]
+        for asset_idx in range(self.ASSETS_COUNT):
+            asset_id = ObjectId()
+            docs.append({
+                "_id": asset_id,
+                "type": "asset",
+                "name": "asset_{}".format(asset_idx),
+                "parent": project_id,
+                "data": {"visualParent": None, "tasks": {}}
+            })
+            for subset_idx in range(self.SUBSETS_PER_ASSET):
+                subset_id = ObjectId()
+                docs.append({
+                    "_id": subset_id,
+                    "type": "subset",
+                    "name": "subset_{}".format(subset_idx),
+                    "parent": asset_id,
+                    "data": {"families": ["render"]}
+                })
+                for version in range(1, self.VERSIONS_PER_SUBSET + 1):
+                    version_id = ObjectId()
+                    self.version_ids.append(version_id)
+                    docs.append({
+                        "_id": version_id,
+                        "type": "version",
+                        "name": version,
+                        "parent": subset_id,
+                        "data": {"families": ["render"], "comment": ""}
+                    })
+
+        self.collection.insert_many(docs)
+        print("Created {} versions".format(len(self.version_ids)))
+
+    def run(self, containers_count=500, repeats=5):
+        from openpype.client import entities
+
+        repre_docs = [
+            {"_id": ObjectId(), "parent": version_id}
+            for version_id in random.sample(
+                self.version_ids, containers_count
+            )
+        ]
+        version_ids = list({doc["parent"] for doc in repre_docs})
+        for label, func in (
+            ("queries", entities._get_parents_by_version_id_queries),
+            ("aggregation", entities._get_parents_by_version_id_aggregation),
+        ):
+            durations = []
+            for _ in range(repeats):
+                start = time.time()
+                func(self.PROJECT_NAME, version_ids, None, None, None)
+                durations.append(time.time() - start)
+            print("{}: {} representations, avg {:.4f}s, min {:.4f}s".format(
+                label,
+                containers_count,
+                sum(durations) / len(durations),
+                min(durations)
+            ))
+
+    def cleanup(self):
+        self.collection.drop()
+
+
+if __name__ == "__main__":
+    tp = TestRepresentationParentsPerformance()
+    tp.prepare()
+    tp.run(500)
+    tp.run(5000)
+    tp.cleanup()
@@ -0,0 +1,180 @@
+"""Measure how long it takes to resolve containers in scene inventory.
+
+Creates synthetic project in a test database and list of loaded containers
+(1500 containers by default) and compares resolving of their context with
+queries per representation group against bulk queries used by
+'InventoryModel'.
+
+Usage:
+    python scene_inventory_performance.py
+
+Mongo url is taken from 'OPENPYPE_MONGO' environment variable
+(defaults to 'mongodb://localhost:27017').
+"""
+import os
+import time
+import random
+
+from bson.objectid import ObjectId
+
+
+class FamilyConfigCacheStub:
+    def family_config(self, family_name):
+        return {}
+
+
+class TestSceneInventoryPerformance():
+    MONGO_DB = "performance_test"
+    PROJECT_NAME = "scene_inventory_test"
+
+    ASSETS_COUNT = 300
+    SUBSETS_PER_ASSET = 5
+    VERSIONS_PER_SUBSET = 3
+
+    def __init__(self):
+        os.environ.setdefault("OPENPYPE_MONGO", "mongodb://localhost:27017")
+        os.environ["AVALON_DB"] = self.MONGO_DB
+        os.environ["AVALON_PROJECT"] = self.PROJECT_NAME
+
+        from openpype.client.mongo import get_project_connection
+
+        self.collection = get_project_connection(self.PROJECT_NAME)
+        self.repre_ids = []
+
+    def prepare(self):
+        print("Purging {} collection".format(self.PROJECT_NAME))
+        self.collection.delete_many({})
+
+        project_id = ObjectId()
+        docs = [{
+            "_id": project_id,
+            "type": "project",
+            "name": self.PROJECT_NAME,
+            "data": {}
+        }]
+        for asset_idx in range(self.ASSETS_COUNT):
+            asset_id = ObjectId()
+            docs.append({
+                "_id": asset_id,
+                "type": "asset",
+                "schema": "openpype:asset-3.0",
+                "name": "asset_{}".format(asset_idx),
+                "parent": project_id,
+                "data": {"visualParent": None, "tasks": {}}
+            })
+            for subset_idx in range(self.SUBSETS_PER_ASSET):
+                subset_id = ObjectId()
+                docs.append({
+                    "_id": subset_id,
+                    "type": "subset",
+                    "schema": "openpype:subset-3.0",
+                    "name": "modelMain{}".format(subset_idx),
+                    "parent": asset_id,
+                    "data": {"families": ["model"]}
+                })
+                for version in range(1, self.VERSIONS_PER_SUBSET + 1):
+                    version_id = ObjectId()
+                    docs.append({
+                        "_id": version_id,
+                        "type": "version",
+                        "schema": "openpype:version-3.0",
+                        "name": version,
+                        "parent": subset_id,
+                        "data": {"families": ["model"]}
+                    })
+                    repre_id = ObjectId()
+                    self.repre_ids.append(str(repre_id))
+                    docs.append({
+                        "_id": repre_id,
+                        "type": "representation",
+                        "schema": "openpype:representation-2.0",
+                        "name": "abc",
+                        "parent": version_id,
+                        "context": {},
+                        "data": {},
+                        "files": []
+                    })
+
+        self.collection.insert_many(docs)
+        print("Created {} representations".format(len(self.repre_ids)))
+
+    def get_containers(self, count):
+        """Synthetic containers, some representations are loaded twice."""
+        return [
+            {
+                "objectName": "container_{}".format(idx),
+                "namespace": "namespace_{}".format(idx),
+                "name": "name_{}".format(idx),
+                "loader": "ReferenceLoader",
+                "representation": random.choice(self.repre_ids)
+            }
+            for idx in range(count)
+        ]
+
+    def run(self, containers_count=1500, repeats=3):
+        from openpype.client import (
+            get_asset_by_id,
+            get_subset_by_id,
+            get_version_by_id,
+            get_last_version_by_subset_id,
+            get_representation_by_id,
+        )
+        from openpype.modules import load_modules
+        from openpype.pipeline import legacy_io
+
+        # Model imports 'openpype_modules'
+        load_modules()
+        from openpype.tools.sceneinventory.model import InventoryModel
+
+        legacy_io.install()
+        containers = self.get_containers(containers_count)
+        repre_ids = list({item["representation"] for item in containers})
+
+        def queries_per_group():
+            for repre_id in repre_ids:
+                repre_doc = get_representation_by_id(
+                    self.PROJECT_NAME, repre_id)
+                version_doc = get_version_by_id(
+                    self.PROJECT_NAME, repre_doc["parent"])
+                subset_doc = get_subset_by_id(
+                    self.PROJECT_NAME, version_doc["parent"])
+                get_asset_by_id(self.PROJECT_NAME, subset_doc["parent"])
+                get_last_version_by_subset_id(
+                    self.PROJECT_NAME, subset_doc["_id"])
+
+        model = InventoryModel(FamilyConfigCacheStub())
+
+        def first_refresh():
+            model._subsets_by_id = {}
+            model._assets_by_id = {}
+            model.update_items(containers)
+
+        def next_refresh():
+            model.update_items(containers)
+
+        for label, func in (
+            ("queries per group", queries_per_group),
+            ("model first refresh", first_refresh),
+            ("model next refresh", next_refresh),
+        ):
+            durations = []
+            for _ in range(repeats):
+                start = time.time()
+                func()
+                durations.append(time.time() - start)
+            print("{}: {} containers, avg {:.4f}s, min {:.4f}s".format(
+                label,
+                containers_count,
+                sum(durations) / len(durations),
+                min(durations)
+            ))
+
+    def cleanup(self):
+        self.collection.drop()
+
+
+if __name__ == "__main__":
+    tp = TestSceneInventoryPerformance()
+    tp.prepare()
+    tp.run(1500)
+    tp.cleanup()
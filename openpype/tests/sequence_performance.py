@@ -0,0 +1,85 @@
+"""Compare detection of frame sequences by clique and 'sequence_tools'.
+
+Creates synthetic directory listing (10 000 files by default) with few
+sequences, sequences with holes and single files, and measures
+'clique.assemble', 'sequence_tools.assemble' (clique compatible output)
+and 'sequence_tools.detect_sequences'.
+
+Usage:
+    python sequence_performance.py [directory]
+
+If directory is passed its content is used instead of synthetic listing.
+"""
+import os
+import sys
+import time
+import random
+
+import clique
+
+from openpype.lib.sequence_tools import assemble, detect_sequences
+
+
+def get_filenames(files_count):
+    filenames = []
+    sequence_idx = 0
+    while len(filenames) < files_count:
+        sequence_idx += 1
+        head = "sh{:03d}_comp_v{:03d}.".format(sequence_idx, sequence_idx)
+        for frame in range(1001, 1001 + 1000):
+            # Make some holes
+            if frame % 97 == 0:
+                continue
+            filenames.append("{}{:04d}.exr".format(head, frame))
+        filenames.append("sh{:03d}_comp_v{:03d}.mov".format(
+            sequence_idx, sequence_idx
+        ))
+    filenames = filenames[:files_count]
+    random.shuffle(filenames)
+    return filenames
+
+
+def measure(label, func, repeats=3):
+    durations = []
+    for _ in range(repeats):
+        start = time.time()
+        func()
+        durations.append(time.time() - start)
+    print("{}: avg {:.4f}s, min {:.4f}s".format(
+        label, sum(durations) / len(durations), min(durations)
+    ))
+
+
+def main(files_count=10000):
+    if len(sys.argv) > 1:
+        filenames = os.listdir(sys.argv[1])
+    else:
+        filenames = get_filenames(files_count)
+    print("Detecting sequences in {} files".format(len(filenames)))
+
+    clique_collections, clique_remainder = clique.assemble(filenames)
+    collections, remainder = assemble(filenames)
+    assert sorted(str(col) for col in clique_collections) == sorted(
+        str(col) for col in collections
+    )
+    assert sorted(clique_remainder) == sorted(remainder)
+
+    frames_pattern = [clique.PATTERNS["frames"]]
+    measure("clique.assemble", lambda: clique.assemble(filenames))
+    measure(
+        "clique.assemble (frames pattern)",
+        lambda: clique.assemble(filenames, patterns=frames_pattern)
+    )
+    measure("sequence_tools.assemble", lambda: assemble(filenames))
+    measure(
+        "sequence_tools.assemble (frames pattern)",
+        lambda: assemble(filenames, patterns=frames_pattern)
+    )
+    measure(
+        "sequence_tools.detect_sequences",
+        lambda: detect_sequences(filenames)
+    )
+
+
+if __name__ == "__main__":
+    main()
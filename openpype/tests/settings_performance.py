@@ -0,0 +1,78 @@
+"""Measure repeated calls of 'get_project_settings'.
+
+Compares resolving of project settings as it was done before layers of
+merged settings were cached (deep copy of defaults and overrides applied on
+each call) with cached layers returning mutable copy and read-only settings.
+
+Usage:
+    python settings_performance.py [project_name]
+
+Mongo url is taken from 'OPENPYPE_MONGO' environment variable
+(defaults to 'mongodb://localhost:27017').
+"""
+import os
+import sys
+import time
+
+
+class TestSettingsPerformance():
+    def __init__(self, project_name):
+        os.environ.setdefault("OPENPYPE_MONGO", "mongodb://localhost:27017")
+        os.environ.setdefault("OPENPYPE_DATABASE_NAME", "openpype")
+        self.project_name = project_name
+
+    def get_project_settings_without_cache(self):
+        from openpype.settings import lib
+
+        default_values = lib.get_default_settings()["project_settings"]
+        studio_values = lib.apply_overrides(
+            default_values, lib.get_studio_project_settings_overrides()
+        )
+        result = lib.apply_overrides(
+            studio_values,
+            lib.get_project_settings_overrides(self.project_name)
+        )
+        lib.clear_metadata_from_settings(result)
+        lib.apply_local_settings_on_project_settings(
+            result, lib.get_local_settings(), self.project_name
+        )
+        return result
+
+    def run(self, calls=100, repeats=3):
+        from openpype.settings import get_project_settings
+
+        def without_cache():
+            for _ in range(calls):
+                self.get_project_settings_without_cache()
+
+        def layers_copy():
+            for _ in range(calls):
+                get_project_settings(self.project_name)
+
+        def layers_read_only():
+            for _ in range(calls):
+                get_project_settings(self.project_name, read_only=True)
+
+        for label, func in (
+            ("without cache", without_cache),
+            ("cached layers", layers_copy),
+            ("read only", layers_read_only),
+        ):
+            durations = []
+            for _ in range(repeats):
+                start = time.process_time()
+                func()
+                durations.append(time.process_time() - start)
+            print("{}: {} calls, avg {:.4f}s, min {:.4f}s".format(
+                label,
+                calls,
+                sum(durations) / len(durations),
+                min(durations)
+            ))
+
+
+if __name__ == "__main__":
+    project_name = "demo_Big_Episodic"
+    if len(sys.argv) > 1:
+        project_name = sys.argv[1]
+    TestSettingsPerformance(project_name).run()
@@ -0,0 +1,150 @@
+"""Compare full scan and sync state index variants of sync query.
+
+Creates synthetic project with 1M file records (100k representations with
+10 files each) where only small portion of representations is waiting for
+synchronization, then measures how long it takes to find them with original
+'$elemMatch' scan over whole collection and with ids from sync state index.
+
+Usage:
+    python sync_state_performance.py
+
+Mongo url is taken from 'OPENPYPE_MONGO' environment variable
+(defaults to 'mongodb://localhost:27017').
+"""
+import os
+import time
+import random
+import datetime
+
+from bson.objectid import ObjectId
+
+
+class TestSyncStatePerformance():
+    MONGO_DB = "performance_test"
+    PROJECT_NAME = "sync_state_test"
+
+    REPRESENTATIONS_COUNT = 100000
+    FILES_PER_REPRESENTATION = 10
+    PENDING_RATIO = 0.01
+
+    ACTIVE_SITE = "studio"
+    REMOTE_SITE = "gdrive"
+
+    def __init__(self):
+        os.environ.setdefault("OPENPYPE_MONGO", "mongodb://localhost:27017")
+        os.environ["AVALON_DB"] = self.MONGO_DB
+        os.environ["OPENPYPE_DATABASE_NAME"] = self.MONGO_DB
+
+        from openpype.client.mongo import get_project_connection
+        from openpype.modules.sync_server.sync_state import SyncStateIndex
+
+        self.collection = get_project_connection(self.PROJECT_NAME)
+        self.sync_state = SyncStateIndex()
+
+    def prepare(self):
+        print("Purging {} collection".format(self.PROJECT_NAME))
+        self.collection.delete_many({})
+        self.sync_state.remove_project(self.PROJECT_NAME)
+
+        created_dt = datetime.datetime.now()
+        pending_count = 0
+        docs = []
+        for repre_idx in range(self.REPRESENTATIONS_COUNT):
+            remote_site = {"name": self.REMOTE_SITE}
+            if random.random() > self.PENDING_RATIO:
+                remote_site["created_dt"] = created_dt
+            else:
+                pending_count += 1
+
+            files = []
+            for file_idx in range(self.FILES_PER_REPRESENTATION):
+                files.append({
+                    "_id": ObjectId(),
+                    "path": "{{root[work]}}/test/file_{}.{}.exr".format(
+                        repre_idx, file_idx
+                    ),
+                    "size": 1000,
+                    "hash": "file_{}.{}.exr".format(repre_idx, file_idx),
+                    "sites": [
+                        {"name": self.ACTIVE_SITE, "created_dt": created_dt},
+                        dict(remote_site)
+                    ]
+                })
+            docs.append({
+                "_id": ObjectId(),
+                "type": "representation",
+                "name": "exr",
+                "parent": ObjectId(),
+                "context": {"representation": "exr"},
+                "data": {},
+                "files": files
+            })
+            if len(docs) >= 1000:
+                self.collection.insert_many(docs)
+                docs = []
+
+        if docs:
+            self.collection.insert_many(docs)
+        print("Created {} file records, {} representations pending".format(
+            self.REPRESENTATIONS_COUNT * self.FILES_PER_REPRESENTATION,
+            pending_count
+        ))
+
+    def backfill(self):
+        start = time.time()
+        self.sync_state.backfill(self.PROJECT_NAME)
+        print("backfill: {:.4f}s".format(time.time() - start))
+
+    def run(self, repeats=5):
+        upload_match = {
+            "type": "representation",
+            "$and": [
+                {"files.sites": {"$elemMatch": {
+                    "name": self.ACTIVE_SITE,
+                    "created_dt": {"$exists": True}
+                }}},
+                {"files.sites": {"$elemMatch": {
+                    "name": self.REMOTE_SITE,
+                    "created_dt": {"$exists": False}
+                }}}
+            ]
+        }
+
+        def full_scan():
+            return list(self.collection.find(upload_match, {"_id": True}))
+
+        def indexed():
+            self.sync_state.update_project(self.PROJECT_NAME)
+            match = dict(upload_match)
+            match["_id"] = {
+                "$in": self.sync_state.get_pending_representation_ids(
+                    self.PROJECT_NAME, [self.ACTIVE_SITE, self.REMOTE_SITE]
+                )
+            }
+            return list(self.collection.find(match, {"_id": True}))
+
+        for label, func in (("full scan", full_scan), ("indexed", indexed)):
+            durations = []
+            count = 0
+            for _ in range(repeats):
+                start = time.time()
+                count = len(func())
+                durations.append(time.time() - start)
+            print("{}: {} representations, avg {:.4f}s, min {:.4f}s".format(
+                label,
+                count,
+                sum(durations) / len(durations),
+                min(durations)
+            ))
+
+    def cleanup(self):
+        self.collection.drop()
+        self.sync_state.remove_project(self.PROJECT_NAME)
+
+
+if __name__ == "__main__":
+    tp = TestSyncStatePerformance()
+    tp.prepare()
+    tp.backfill()
+    tp.run()
+    tp.cleanup()
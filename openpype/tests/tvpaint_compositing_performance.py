@@ -0,0 +1,118 @@
+"""Compare compositing of TVPaint layers by PIL and 'LayersCompositor'.
+
+Creates rendered layers (5 layers, 48 frames, 1920x1080 by default) with
+static opaque background on the bottom and layers with drawings held for
+1 to 4 frames above it. Measures compositing of all frames by PIL
+'alpha_composite' (previous implementation) and by 'composite_frames' in
+single process and with process pool.
+
+Usage:
+    python tvpaint_compositing_performance.py [frames] [layers]
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+import numpy
+from PIL import Image
+
+from openpype.hosts.tvpaint.lib import composite_frames
+
+
+def create_layers(dirpath, frames_count, layers_count, size=(1920, 1080)):
+    random_state = numpy.random.RandomState(0)
+    src_filepaths_by_frame = {frame: [] for frame in range(frames_count)}
+    for layer_idx in range(layers_count):
+        # Background is held for all frames
+        hold = layer_idx % 4 + 1 if layer_idx else frames_count
+        src_filepath = None
+        for frame in range(frames_count):
+            filepath = os.path.join(
+                dirpath, "layer{}.{:04d}.png".format(layer_idx, frame)
+            )
+            if frame % hold:
+                # Held drawings are copies of rendered frame
+                shutil.copy(src_filepath, filepath)
+                src_filepaths_by_frame[frame].append(filepath)
+                continue
+
+            array = numpy.zeros((size[1], size[0], 4), dtype=numpy.uint8)
+            if not layer_idx:
+                # Opaque gradient
+                array[..., 0] = numpy.linspace(0, 255, size[0])
+                array[..., 1] = numpy.linspace(0, 255, size[1])[:, None]
+                array[..., 3] = 255
+            else:
+                # Drawing covering part of frame
+                x = random_state.randint(0, size[0] // 2)
+                y = random_state.randint(0, size[1] // 2)
+                array[y:y + size[1] // 2, x:x + size[0] // 2] = (
+                    random_state.randint(0, 256, 4)
+                )
+            Image.fromarray(array, "RGBA").save(filepath)
+            src_filepath = filepath
+            src_filepaths_by_frame[frame].append(filepath)
+    return src_filepaths_by_frame
+
+
+def pil_composite(jobs):
+    for src_filepaths, dst_filepath in jobs:
+        img_obj = None
+        for filepath in src_filepaths:
+            layer_img = Image.open(filepath)
+            if img_obj is None:
+                img_obj = layer_img
+            else:
+                img_obj.alpha_composite(layer_img)
+        img_obj.save(dst_filepath)
+
+
+def measure(label, func, output_dir):
+    os.makedirs(output_dir)
+    start = time.time()
+    func()
+    print("{}: {:.2f}s".format(label, time.time() - start))
+    shutil.rmtree(output_dir)
+
+
+def main(frames_count=48, layers_count=5):
+    if len(sys.argv) > 1:
+        frames_count = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        layers_count = int(sys.argv[2])
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        src_filepaths_by_frame = create_layers(
+            tmpdir, frames_count, layers_count
+        )
+        output_dir = os.path.join(tmpdir, "output")
+        jobs = [
+            (
+                src_filepaths,
+                os.path.join(output_dir, "{:04d}.png".format(frame))
+            )
+            for frame, src_filepaths in src_filepaths_by_frame.items()
+        ]
+        print("Compositing {} frames of {} layers".format(
+            frames_count, layers_count
+        ))
+        measure("PIL alpha_composite", lambda: pil_composite(jobs), output_dir)
+        measure(
+            "composite_frames (1 process)",
+            lambda: composite_frames(jobs, workers=1),
+            output_dir
+        )
+        measure(
+            "composite_frames (process pool)",
+            lambda: composite_frames(jobs),
+            output_dir
+        )
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,374 @@
+"""Base of stubs calling functions on client side of Adobe extensions.
+
+Each stub call is a separate round trip over websocket which is slow when
+called in loops (e.g. changing visibility of hundreds of layers). Stubs
+can queue calls in batch which is sent at once. Extensions with 'batch'
+route run the calls in one request, older extensions get the calls
+pipelined (all requests sent before waiting for responses).
+
+Stub also caches metadata of active document. The cache is used only when
+extension notifies about changes of active document which invalidates it.
+Extension also notifies when metadata might have changed outside of stub
+(save, revert, history steps). Metadata modified by stub are always read
+from client because not all changes are reported by hosts (e.g. undo).
+"""
+import copy
+import json
+import asyncio
+import weakref
+import logging
+import threading
+import contextlib
+from abc import ABCMeta, abstractmethod
+
+import six
+from wsrpc_aiohttp import WebSocketAsync
+
+from .app import WebServerTool
+
+
+class BatchCallError(Exception):
+    """Call in batch failed on client side."""
+    pass
+
+
+def _is_route_not_found(exc):
+    """Client failed the call because called route does not exist."""
+    message = str(exc).lower()
+    return "not found" in message and (
+        "route" in message or "method" in message
+    )
+
+
+class DocumentMetadataCache(object):
+    """Metadata of active document shared by all stubs of one host.
+
+    Cache is disabled until client notifies which document is active. Each
+    change of document increments token so values read before the change
+    are not stored.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._document = None
+        self._metadata = None
+        self._token = 0
+
+    @property
+    def token(self):
+        return self._token
+
+    @property
+    def enabled(self):
+        return self._document is not None
+
+    def set_document(self, document):
+        """Change active document, cached metadata are dropped.
+
+        Args:
+            document (Union[str, None]): Identifier of active document or
+                None if there is no active document.
+        """
+        with self._lock:
+            self._document = document or None
+            self._metadata = None
+            self._token += 1
+
+    def invalidate(self):
+        with self._lock:
+            self._metadata = None
+            self._token += 1
+
+    def get(self):
+        """Copy of cached metadata.
+
+        Returns:
+            Union[list[dict[str, Any]], None]: Metadata or None if are not
+                cached.
+        """
+        with self._lock:
+            if self._metadata is None:
+                return None
+            return copy.deepcopy(self._metadata)
+
+    def set(self, metadata, token=None):
+        """Store metadata of active document.
+
+        Args:
+            metadata (list[dict[str, Any]]): Metadata of active document.
+            token (Optional[int]): Token from before metadata were read,
+                metadata are not stored if document changed meanwhile.
+        """
+        with self._lock:
+            if self._document is None:
+                return
+            if token is not None and token != self._token:
+                return
+            self._metadata = copy.deepcopy(metadata)
+
+
+class StubBatch(object):
+    """Calls of stub queued to be sent at once.
+
+    Calls which return value are sent immediately together with already
+    queued calls. Final calls are callbacks called after all queued calls
+    were sent, they're used to write accumulated metadata only once.
+    """
+
+    def __init__(self, stub):
+        self._stub = stub
+        self._calls = []
+        self._final_calls = {}
+        self.metadata = None
+
+    def add(self, method, kwargs):
+        self._calls.append((method, kwargs))
+
+    def set_final_call(self, key, callback):
+        self._final_calls[key] = callback
+
+    def pop_calls(self):
+        calls = self._calls
+        self._calls = []
+        return calls
+
+    def send(self):
+        calls = self.pop_calls()
+        if calls:
+            for result in self._stub.send_calls(calls):
+                self._stub._handle_return(result)
+
+        final_calls = self._final_calls
+        self._final_calls = {}
+        for callback in final_calls.values():
+            callback()
+
+
+@six.add_metaclass(ABCMeta)
+class BaseServerStub(object):
+    """Base of stubs calling functions on client (Adobe js) side.
+
+    Expects that client is already connected (started when avalon menu
+    is opened). 'self.websocketserver.call' is used as async wrapper.
+
+    Stubs are created on each usage so state of batches and metadata
+    cache is stored on class.
+    """
+
+    # Prefix of client routes, e.g. 'Photoshop'
+    route_name = None
+
+    _batches = threading.local()
+    _metadata_caches = {}
+    # Clients without 'batch' route (older extensions)
+    _batch_unsupported_clients = weakref.WeakSet()
+
+    def __init__(self):
+        self.websocketserver = WebServerTool.get_instance()
+        self.client = self.get_client()
+        self.log = logging.getLogger(self.__class__.__name__)
+
+    @staticmethod
+    def get_client():
+        """
+            Return first connected client to WebSocket
+            TODO implement selection by Route
+        :return: <WebSocketAsync> client
+        """
+        clients = WebSocketAsync.get_clients()
+        client = None
+        if len(clients) > 0:
+            key = list(clients.keys())[0]
+            client = clients.get(key)
+
+        return client
+
+    @classmethod
+    def get_metadata_cache(cls):
+        cache = cls._metadata_caches.get(cls.route_name)
+        if cache is None:
+            cache = cls._metadata_caches.setdefault(
+                cls.route_name, DocumentMetadataCache()
+            )
+        return cache
+
+    @classmethod
+    def invalidate_metadata(cls):
+        """Drop cached metadata of active document.
+
+        Client notifies about changes which were not done by stub, e.g.
+        document was saved, reverted or its history state was changed.
+        """
+        cls.get_metadata_cache().invalidate()
+
+    @classmethod
+    def set_active_document(cls, document):
+        """Client notified about change of active document.
+
+        Args:
+            document (Union[str, None]): Identifier of active document.
+        """
+        cls.get_metadata_cache().set_document(document)
+
+    @property
+    def _batch(self):
+        return getattr(self._batches, self.route_name, None)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Queue calls without return value and send them at once on exit.
+
+        Batch is shared by all stubs of host in current thread. Nested
+        batches are merged to the outer one. Calls are not sent if an
+        exception is raised in the block.
+
+        Example:
+            with stub.batch():
+                for layer in layers:
+                    stub.set_visible(layer.id, False)
+        """
+        batch = self._batch
+        if batch is not None:
+            yield batch
+            return
+
+        batch = StubBatch(self)
+        setattr(self._batches, self.route_name, batch)
+        try:
+            yield batch
+        finally:
+            setattr(self._batches, self.route_name, None)
+        batch.send()
+
+    def send_calls(self, calls):
+        """Send multiple calls to client at once.
+
+        Args:
+            calls (list[tuple[str, dict[str, Any]]]): Method names (without
+                route prefix) and their arguments.
+
+        Returns:
+            list[Any]: Raw results of the calls.
+
+        Raises:
+            BatchCallError: Any of the calls failed. Calls are processed in
+                order but all of them are sent.
+        """
+        results = self.websocketserver.call(self._send_calls(calls))
+        for (method, _), result in zip(calls, results):
+            if isinstance(result, Exception):
+                raise BatchCallError(
+                    "Call '{}' failed: {}".format(method, result)
+                )
+        return results
+
+    async def _send_calls(self, calls):
+        client = self.client
+        if client not in self._batch_unsupported_clients:
+            payload = json.dumps([
+                {"method": self._get_route(method), "params": kwargs}
+                for method, kwargs in calls
+            ])
+            try:
+                response = await client.call(
+                    self._get_route("batch"), calls=payload
+                )
+            except Exception as exc:
+                # Route is missing in older extensions
+                if not _is_route_not_found(exc):
+                    raise
+                self.log.debug(
+                    "Client does not support batch calls", exc_info=True
+                )
+                self._batch_unsupported_clients.add(client)
+            else:
+                return [
+                    Exception(item["error"]) if "error" in item
+                    else item.get("result")
+                    for item in json.loads(response)
+                ]
+
+        return await asyncio.gather(
+            *[
+                client.call(self._get_route(method), **kwargs)
+                for method, kwargs in calls
+            ],
+            return_exceptions=True
+        )
+
+    def _get_route(self, method):
+        return "{}.{}".format(self.route_name, method)
+
+    def _handle_return(self, res):
+        """Process raw result of call, raise error if call failed."""
+        return res
+
+    def _call(self, method, **kwargs):
+        """Call client method and return its result.
+
+        Inside batch are queued calls sent together with this call.
+        """
+        batch = self._batch
+        if batch is None:
+            return self.websocketserver.call(
+                self.client.call(self._get_route(method), **kwargs)
+            )
+
+        calls = batch.pop_calls()
+        calls.append((method, kwargs))
+        return self.send_calls(calls)[-1]
+
+    def _queue_call(self, method, **kwargs):
+        """Call client method which result is not used.
+
+        Call is queued if batch is active.
+        """
+        batch = self._batch
+        if batch is None:
+            return self.websocketserver.call(
+                self.client.call(self._get_route(method), **kwargs)
+            )
+        batch.add(method, kwargs)
+
+    def _get_cached_metadata(self, use_cache=True):
+        """Metadata of active document from active batch or cache.
+
+        Args:
+            use_cache (bool): Use metadata cached from previous calls, only
+                metadata of active batch are used if disabled.
+
+        Returns:
+            Union[list[dict[str, Any]], None]: Copy of metadata or None if
+                metadata have to be read from client.
+        """
+        batch = self._batch
+        if batch is not None and batch.metadata is not None:
+            return copy.deepcopy(batch.metadata)
+        if not use_cache:
+            return None
+        return self.get_metadata_cache().get()
+
+    def _set_batch_metadata(self, metadata):
+        """Store metadata to active batch, written once when is sent."""
+        batch = self._batch
+        batch.metadata = metadata
+
+        def _write():
+            self._write_metadata(self._clean_metadata(batch.metadata))
+
+        batch.set_final_call("metadata", _write)
+
+    @abstractmethod
+    def _clean_metadata(self, metadata, all_items=None):
+        """Remove metadata of items which are not in active document."""
+        pass
+
+    def _write_metadata(self, metadata):
+        """Write metadata to active document and cache them."""
+        cache = self.get_metadata_cache()
+        token = cache.token
+        res = self._handle_return(
+            self._call("imprint", payload=json.dumps(metadata, indent=4))
+        )
+        cache.set(metadata, token)
+        return res
@@ -1,5 +1,6 @@
 import re
 import logging
+import collections
 
 from collections import defaultdict
 
@@ -8,11 +9,11 @@ import qtawesome
 
 from openpype.host import ILoadHost
 from openpype.client import (
-    get_asset_by_id,
-    get_subset_by_id,
-    get_version_by_id,
-    get_last_version_by_subset_id,
-    get_representation_by_id,
+    get_assets,
+    get_subsets,
+    get_versions,
+    get_last_versions,
+    get_representations,
 )
 from openpype.pipeline import (
     legacy_io,
@@ -208,11 +209,12 @@ class InventoryModel(TreeModel):
             else:
                 items = []
 
-        self.clear()
         if not selected or not self._hierarchy_view:
-            self.add_items(items)
+            self.update_items(items)
             return
 
+        self.clear()
+
         if (
             not hasattr(host, "pipeline")
             or not hasattr(host.pipeline, "update_hierarchy")
@@ -320,67 +322,221 @@ class InventoryModel(TreeModel):
             node.Item: root node which has children added based on the data
         """
 
-        # NOTE: @iLLiCiTiT this need refactor
-        project_name = legacy_io.active_project()
-
         self.beginResetModel()
 
-        # Group by representation
-        grouped = defaultdict(lambda: {"items": list()})
-        for item in items:
-            grouped[item["representation"]]["items"].append(item)
+        for group_node, item_nodes in self._create_group_nodes(items):
+            self.add_child(group_node, parent=parent)
+            for item_node in item_nodes:
+                self.add_child(item_node, parent=group_node)
 
-        # Add to model
-        not_found = defaultdict(list)
-        not_found_ids = []
-        for repre_id, group_dict in sorted(grouped.items()):
-            group_items = group_dict["items"]
-            # Get parenthood per group
-            representation = get_representation_by_id(
-                project_name, repre_id
+        self.endResetModel()
+
+        return self._root_item
+
+    def update_items(self, items):
+        """Update top level items of the model to match passed items.
+
+        Unlike 'add_items' the model is not reset. Groups which are not
+        available anymore are removed, existing groups are updated in place
+        and new groups are appended, so selection and expanded state of
+        unchanged groups is kept.
+
+        Args:
+            items (Iterable[dict]): Containers as returned by `ls()`.
+        """
+
+        root_item = self._root_item
+        new_nodes = collections.OrderedDict()
+        for group_node, item_nodes in self._create_group_nodes(items):
+            new_nodes[group_node["representation"]] = (group_node, item_nodes)
+
+        # Remove groups which are not available anymore
+        for row in reversed(range(root_item.childCount())):
+            group_node = root_item.child(row)
+            if group_node["representation"] not in new_nodes:
+                self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+                root_item.children().pop(row)
+                self.endRemoveRows()
+
+        # Update existing groups
+        for row, group_node in enumerate(root_item.children()):
+            new_group_node, item_nodes = new_nodes.pop(
+                group_node["representation"]
+            )
+            group_node.clear()
+            group_node.update(new_group_node)
+            group_index = self.createIndex(row, 0, group_node)
+            self.dataChanged.emit(
+                group_index,
+                self.createIndex(row, len(self.Columns) - 1, group_node)
             )
+
+            children_count = group_node.childCount()
+            if children_count:
+                self.beginRemoveRows(group_index, 0, children_count - 1)
+                del group_node.children()[:]
+                self.endRemoveRows()
+
+            if item_nodes:
+                self.beginInsertRows(group_index, 0, len(item_nodes) - 1)
+                for item_node in item_nodes:
+                    group_node.add_child(item_node)
+                self.endInsertRows()
+
+        # Add new groups
+        if new_nodes:
+            start_row = root_item.childCount()
+            self.beginInsertRows(
+                QtCore.QModelIndex(),
+                start_row,
+                start_row + len(new_nodes) - 1
+            )
+            for group_node, item_nodes in new_nodes.values():
+                root_item.add_child(group_node)
+                for item_node in item_nodes:
+                    group_node.add_child(item_node)
+            self.endInsertRows()
+
+    def _get_representations_context(self, project_name, repre_ids):
+        """Query documents of representations and their parents.
+
+        All documents are queried in bulk.
+
+        Args:
+            project_name (str): Name of project.
+            repre_ids (Iterable[str]): Representation ids.
+
+        Returns:
+            tuple[dict, dict]: Context documents by representation id and
+                name of entity type which was not found by representation
+                id.
+        """
+
+        repre_docs_by_id = {
+            str(repre_doc["_id"]): repre_doc
+            for repre_doc in get_representations(
+                project_name, representation_ids=repre_ids
+            )
+        }
+        version_ids = {
+            repre_doc["parent"] for repre_doc in repre_docs_by_id.values()
+        }
+        versions_by_id = {
+            version_doc["_id"]: version_doc
+            for version_doc in get_versions(
+                project_name, version_ids=version_ids, hero=True
+            )
+        }
+
+        # Hero versions use name and data of version they're linked to
+        hero_version_docs = [
+            version_doc
+            for version_doc in versions_by_id.values()
+            if version_doc["type"] == "hero_version"
+        ]
+        if hero_version_docs:
+            source_ids = {
+                version_doc["version_id"]
+                for version_doc in hero_version_docs
+            }
+            source_versions_by_id = {
+                version_doc["_id"]: version_doc
+                for version_doc in get_versions(
+                    project_name,
+                    version_ids=source_ids,
+                    fields=["name", "data"]
+                )
+            }
+            for version_doc in hero_version_docs:
+                _version = source_versions_by_id[version_doc["version_id"]]
+                version_doc["name"] = HeroVersionType(_version["name"])
+                version_doc["data"] = _version["data"]
+
+        subset_ids = {
+            version_doc["parent"] for version_doc in versions_by_id.values()
+        }
+        subsets_by_id = {
+            subset_doc["_id"]: subset_doc
+            for subset_doc in get_subsets(project_name, subset_ids=subset_ids)
+        }
+
+        asset_ids = {
+            subset_doc["parent"] for subset_doc in subsets_by_id.values()
+        }
+        assets_by_id = {
+            asset_doc["_id"]: asset_doc
+            for asset_doc in get_assets(project_name, asset_ids=asset_ids)
+        }
+
+        # Store the highest available version so the model can know
+        # whether current version is currently up-to-date.
+        last_versions_by_subset_id = get_last_versions(
+            project_name, subset_ids, fields=["name"]
+        )
+
+        contexts_by_repre_id = {}
+        not_found_by_repre_id = {}
+        for repre_id in repre_ids:
+            representation = repre_docs_by_id.get(repre_id)
             if not representation:
-                not_found["representation"].extend(group_items)
-                not_found_ids.append(repre_id)
+                not_found_by_repre_id[repre_id] = "representation"
                 continue
 
-            version = get_version_by_id(
-                project_name, representation["parent"]
-            )
+            version = versions_by_id.get(representation["parent"])
             if not version:
-                not_found["version"].extend(group_items)
-                not_found_ids.append(repre_id)
+                not_found_by_repre_id[repre_id] = "version"
                 continue
 
-            elif version["type"] == "hero_version":
-                _version = get_version_by_id(
-                    project_name, version["version_id"]
-                )
-                version["name"] = HeroVersionType(_version["name"])
-                version["data"] = _version["data"]
-
-            subset = get_subset_by_id(project_name, version["parent"])
+            subset = subsets_by_id.get(version["parent"])
             if not subset:
-                not_found["subset"].extend(group_items)
-                not_found_ids.append(repre_id)
+                not_found_by_repre_id[repre_id] = "subset"
                 continue
 
-            asset = get_asset_by_id(project_name, subset["parent"])
+            asset = assets_by_id.get(subset["parent"])
             if not asset:
-                not_found["asset"].extend(group_items)
-                not_found_ids.append(repre_id)
+                not_found_by_repre_id[repre_id] = "asset"
                 continue
 
-            grouped[repre_id].update({
+            contexts_by_repre_id[repre_id] = {
                 "representation": representation,
                 "version": version,
                 "subset": subset,
-                "asset": asset
-            })
+                "asset": asset,
+                "highest_version": last_versions_by_subset_id.get(
+                    subset["_id"]
+                )
+            }
+        return contexts_by_repre_id, not_found_by_repre_id
+
+    def _create_group_nodes(self, items):
+        """Create group nodes with item nodes for passed items.
 
-        for id in not_found_ids:
-            grouped.pop(id)
+        Args:
+            items (Iterable[dict]): Containers as returned by `ls()`.
+
+        Returns:
+            list[tuple[Item, list[Item]]]: Group nodes with their item nodes.
+        """
+
+        # NOTE: @iLLiCiTiT this need refactor
+        project_name = legacy_io.active_project()
 
+        # Group by representation
+        grouped = defaultdict(list)
+        for item in items:
+            grouped[item["representation"]].append(item)
+
+        contexts_by_repre_id, not_found_by_repre_id = (
+            self._get_representations_context(project_name, list(grouped))
+        )
+
+        not_found = defaultdict(list)
+        for repre_id in sorted(grouped.keys()):
+            where = not_found_by_repre_id.get(repre_id)
+            if where:
+                not_found[where].extend(grouped[repre_id])
+
+        output = []
         for where, group_items in not_found.items():
             # create the group header
             group_node = Item()
@@ -391,21 +547,23 @@ class InventoryModel(TreeModel):
             group_node["isGroupNode"] = False
             group_node["isNotSet"] = True
 
-            self.add_child(group_node, parent=parent)
-
+            item_nodes = []
             for item in group_items:
                 item_node = Item()
                 item_node.update(item)
                 item_node["Name"] = item.get("objectName", "NO NAME")
                 item_node["isNotFound"] = True
-                self.add_child(item_node, parent=group_node)
-
-        for repre_id, group_dict in sorted(grouped.items()):
-            group_items = group_dict["items"]
-            representation = grouped[repre_id]["representation"]
-            version = grouped[repre_id]["version"]
-            subset = grouped[repre_id]["subset"]
-            asset = grouped[repre_id]["asset"]
+                item_nodes.append(item_node)
+            output.append((group_node, item_nodes))
+
+        for repre_id in sorted(contexts_by_repre_id.keys()):
+            group_items = grouped[repre_id]
+            context = contexts_by_repre_id[repre_id]
+            representation = context["representation"]
+            version = context["version"]
+            subset = context["subset"]
+            asset = context["asset"]
+            highest_version = context["highest_version"]
 
             # Get the primary family
             no_family = ""
@@ -424,12 +582,6 @@ class InventoryModel(TreeModel):
             family = family_config.get("label", prim_family)
             family_icon = family_config.get("icon", None)
 
-            # Store the highest available version so the model can know
-            # whether current version is currently up-to-date.
-            highest_version = get_last_version_by_subset_id(
-                project_name, version["parent"]
-            )
-
             # create the group header
             group_node = Item()
             group_node["Name"] = "%s_%s: (%s)" % (asset["name"],
@@ -455,8 +607,7 @@ class InventoryModel(TreeModel):
                 group_node["active_site_progress"] = progress[self.active_site]
                 group_node["remote_site_progress"] = progress[self.remote_site]
 
-            self.add_child(group_node, parent=parent)
-
+            item_nodes = []
             for item in group_items:
                 item_node = Item()
                 item_node.update(item)
@@ -469,11 +620,10 @@ class InventoryModel(TreeModel):
                 # can view namespace in GUI without changing container data.
                 item_node["Name"] = item["namespace"]
 
-                self.add_child(item_node, parent=group_node)
-
-        self.endResetModel()
+                item_nodes.append(item_node)
+            output.append((group_node, item_nodes))
 
-        return self._root_item
+        return output
 
 
 class FilterProxyModel(QtCore.QSortFilterProxyModel):
@@ -250,6 +250,11 @@ if "--use-staging" in sys.argv:
     sys.argv.remove("--use-staging")
     os.environ["OPENPYPE_USE_STAGING"] = "1"
 
+# Print report of modules import and initialization times
+if "--profile-startup" in sys.argv:
+    sys.argv.remove("--profile-startup")
+    os.environ["OPENPYPE_PROFILE_STARTUP"] = "1"
+
 import igniter  # noqa: E402
 from igniter import BootstrapRepos  # noqa: E402
 from igniter.tools import (
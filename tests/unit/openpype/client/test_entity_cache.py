@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""Test suite for read-through cache of entity queries.
+
+Database is replaced by query function filtering documents in memory.
+"""
+import pytest
+
+from openpype.client.entity_cache import (
+    EntityCache,
+    cached_entity_query,
+    enable_entity_cache,
+    disable_entity_cache,
+    invalidate_entity_cache,
+    project_document,
+    _MISSING,
+)
+
+
+ASSET_DOCS = [
+    {
+        "_id": "asset{}".format(idx),
+        "name": "sh{:03d}".format(idx),
+        "data": {"frameStart": 1001, "frameEnd": 1000 + idx}
+    }
+    for idx in range(5)
+]
+
+queries = []
+
+
+@cached_entity_query("asset")
+def get_assets(project_name, asset_ids=None, fields=None):
+    asset_ids = list(asset_ids) if asset_ids is not None else None
+    queries.append((project_name, asset_ids, fields))
+    output = []
+    for doc in ASSET_DOCS:
+        if asset_ids is None or doc["_id"] in asset_ids:
+            output.append(project_document(
+                doc, set(fields) | {"_id"} if fields else None
+            ))
+    return iter(output)
+
+
+@pytest.fixture
+def entity_cache():
+    queries[:] = []
+    cache = enable_entity_cache(max_size=2, watch=False)
+    yield cache
+    disable_entity_cache()
+
+
+def test_generator_arguments(entity_cache):
+    docs = list(get_assets(
+        "test", asset_ids=(doc["_id"] for doc in ASSET_DOCS[:2])
+    ))
+    assert [doc["_id"] for doc in docs] == ["asset0", "asset1"]
+    # Query received all ids
+    assert queries == [("test", ["asset0", "asset1"], None)]
+
+    # Same query with list is served from cache
+    docs = get_assets("test", asset_ids=["asset1", "asset0"])
+    assert [doc["_id"] for doc in docs] == ["asset0", "asset1"]
+    assert len(queries) == 1
+
+
+def test_fields_subset(entity_cache):
+    get_assets("test", ["asset1"], fields=["name", "data"])
+    docs = get_assets("test", ["asset1"], fields=["data.frameEnd"])
+    assert docs == [{"_id": "asset1", "data": {"frameEnd": 1001}}]
+    assert len(queries) == 1
+
+    # Fields which are not cached are queried
+    get_assets("test", ["asset1"], fields=["parent"])
+    assert len(queries) == 2
+
+    # Returned documents are copies
+    docs[0]["data"]["frameEnd"] = 0
+    docs = get_assets("test", ["asset1"], fields=["data.frameEnd"])
+    assert docs[0]["data"]["frameEnd"] == 1001
+
+
+def test_lru_eviction():
+    cache = EntityCache(max_size=2)
+    for idx in range(3):
+        cache.set("test", "asset", idx, None, [idx])
+        # First query is used and should not be evicted
+        assert cache.get("test", "asset", 0, None) == [0]
+
+    assert cache.get("test", "asset", 0, None) == [0]
+    assert cache.get("test", "asset", 2, None) == [2]
+    assert cache.get("test", "asset", 1, None) is _MISSING
+    assert cache.stats.to_data()["entity_types"]["asset"]["misses"] == 1
+
+
+def test_invalidation(entity_cache):
+    get_assets("test", ["asset0"])
+    get_assets("other", ["asset0"])
+    assert len(queries) == 2
+
+    invalidate_entity_cache("test")
+    get_assets("test", ["asset0"])
+    get_assets("other", ["asset0"])
+    assert len(queries) == 3
+
+    invalidate_entity_cache()
+    get_assets("other", ["asset0"])
+    assert len(queries) == 4
+    assert entity_cache.stats.to_data()["invalidations"] == {"test": 1}
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""Test suite for compact sequences in representation files."""
+import hashlib
+
+from bson.objectid import ObjectId
+
+from openpype.client.representation_files import (
+    compact_representation_files,
+    expand_representation_files,
+    expand_representation_doc,
+    get_file_info_path,
+    is_compact_file_info,
+)
+
+
+SITES = [{"name": "studio", "created_dt": None}]
+
+
+def _file_info(filename, mtime=1697040000.25, size=100, content_hash=True):
+    file_info = {
+        "_id": ObjectId(),
+        "path": "{root[work]}/test/publish/" + filename,
+        "size": size,
+        "hash": "|".join(
+            [filename, str(mtime), str(size)]
+        ).replace(".", ","),
+        "sites": SITES
+    }
+    if content_hash:
+        file_info["contentHash"] = "sha256:{}".format(
+            hashlib.sha256(filename.encode("utf-8")).hexdigest()
+        )
+    return file_info
+
+
+def test_compact_and_expand():
+    files = [
+        _file_info("render.{:04d}.exr".format(frame), size=frame)
+        for frame in (998, 999, 1000, 1001, 1003)
+    ]
+    review = _file_info("review.mov", content_hash=False)
+    files.append(review)
+
+    compact_files = compact_representation_files(files)
+    assert len(compact_files) == 2
+    compact_info = compact_files[0]
+    assert is_compact_file_info(compact_info)
+    assert compact_info["_id"] == files[0]["_id"]
+    assert compact_info["size"] == sum((998, 999, 1000, 1001, 1003))
+    assert compact_info["sequence"]["ranges"] == [[998, 1001], [1003, 1003]]
+    assert get_file_info_path(compact_info) == (
+        "{root[work]}/test/publish/render.%04d.exr"
+    )
+    assert compact_files[1] is review
+
+    expanded = expand_representation_files(compact_files)
+    for file_info in files:
+        file_info["_id"] = compact_info["_id"]
+    review["_id"] = expanded[-1]["_id"]
+    assert expanded == files
+
+    repre_doc = {"files": compact_files}
+    assert expand_representation_doc(repre_doc)["files"] == files
+
+
+def test_not_compactable_files():
+    # Mixed content hash and different sites
+    files = [
+        _file_info("render.1001.exr"),
+        _file_info("render.1002.exr", content_hash=False),
+        _file_info("plate.1001.exr"),
+        dict(_file_info("plate.1002.exr"), sites=[{"name": "gdrive"}]),
+        # Modification time is not reproducible from hash
+        dict(_file_info("other.1001.exr"), hash="other,1001,exr|1,10|100"),
+        _file_info("other.1002.exr"),
+    ]
+    assert compact_representation_files(files) == files
+    assert compact_representation_files(files[:1], min_frames=1) != files[:1]
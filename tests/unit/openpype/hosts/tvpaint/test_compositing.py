@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""Test suite for compositing of TVPaint layers."""
+import os
+
+import pytest
+from PIL import Image
+
+numpy = pytest.importorskip("numpy")
+
+from openpype.hosts.tvpaint.lib import (  # noqa
+    LayersCompositor,
+    composite_rendered_layers,
+)
+
+
+def _create_layer(seed, size=(32, 16)):
+    random_state = numpy.random.RandomState(seed)
+    array = random_state.randint(
+        0, 256, (size[1], size[0], 4)
+    ).astype(numpy.uint8)
+    # Make some pixels fully transparent and opaque
+    array[:4, :, 3] = 0
+    array[4:8, :, 3] = 255
+    return array
+
+
+def _pil_composite(layers):
+    img_obj = None
+    for layer in layers:
+        layer_img = Image.fromarray(layer, "RGBA")
+        if img_obj is None:
+            img_obj = layer_img
+        else:
+            img_obj.alpha_composite(layer_img)
+    return numpy.asarray(img_obj).astype(numpy.int16)
+
+
+def test_composite_arrays_matches_pil():
+    layers = [_create_layer(seed) for seed in range(3)]
+    result = LayersCompositor().composite_arrays(layers)
+
+    expected = _pil_composite(layers)
+    diff = numpy.abs(result.astype(numpy.int16) - expected)
+    # Color of transparent pixels is not defined
+    diff[expected[..., 3] == 0] = 0
+    assert diff.max() <= 2
+
+    transparent = numpy.zeros_like(layers[0])
+    assert numpy.array_equal(
+        LayersCompositor().composite_arrays([transparent, layers[1]]),
+        layers[1]
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_composite_rendered_layers(tmpdir, workers):
+    tmpdir = str(tmpdir)
+    bottom = _create_layer(0)
+    top_layers = [_create_layer(1), _create_layer(2)]
+    layers_data = [
+        {"layer_id": 1, "position": 1},
+        {"layer_id": 2, "position": 0},
+    ]
+    filepaths_by_layer_id = {1: {}, 2: {}}
+    dst_filepaths_by_frame = {}
+    for frame in range(1, 41):
+        for layer_id, array in (
+            # Held drawing on bottom layer
+            (1, bottom),
+            (2, top_layers[(frame // 10) % 2]),
+        ):
+            filepath = os.path.join(
+                tmpdir, "layer{}.{:04d}.png".format(layer_id, frame)
+            )
+            Image.fromarray(array, "RGBA").save(filepath)
+            filepaths_by_layer_id[layer_id][frame] = filepath
+        dst_filepaths_by_frame[frame] = os.path.join(
+            tmpdir, "output.{:04d}.png".format(frame)
+        )
+
+    composite_rendered_layers(
+        layers_data, filepaths_by_layer_id, 1, 40,
+        dst_filepaths_by_frame, workers=workers
+    )
+
+    for frame, filepath in dst_filepaths_by_frame.items():
+        result = numpy.asarray(Image.open(filepath))
+        expected = LayersCompositor().composite_arrays(
+            [bottom, top_layers[(frame // 10) % 2]]
+        )
+        assert numpy.array_equal(result, expected)
+
+    assert sorted(os.listdir(tmpdir)) == sorted(
+        os.path.basename(filepath)
+        for filepath in dst_filepaths_by_frame.values()
+    )
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""Test suite for environment cache files."""
+import os
+import time
+
+from openpype.lib.env_tools import (
+    read_environment_cache,
+    write_environment_cache,
+)
+
+
+def test_environment_cache(tmp_path):
+    cache_path = str(tmp_path / "cache" / "env.json")
+    assert read_environment_cache(cache_path) is None
+
+    env = {"AVALON_PROJECT": "test"}
+    assert write_environment_cache(cache_path, env, "hash")
+    data = read_environment_cache(cache_path, ttl=60)
+    assert data["env"] == env
+    assert data["settings_hash"] == "hash"
+    # Temporary files are not left in cache directory
+    assert os.listdir(os.path.dirname(cache_path)) == ["env.json"]
+
+    # Expired cache
+    time.sleep(0.01)
+    assert read_environment_cache(cache_path, ttl=0) is None
+
+    # Corrupted file
+    with open(cache_path, "w") as stream:
+        stream.write("{")
+    assert read_environment_cache(cache_path) is None
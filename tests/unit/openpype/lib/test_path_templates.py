@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""Test suite for path templates formatting."""
+import pytest
+
+from openpype.lib.path_templates import (
+    StringTemplate,
+    TemplatesDict,
+    TemplateUnsolved,
+)
+
+TEMPLATE = (
+    "{root[work]}/{project[name]}/{asset}/v{version:0>3}"
+    "/{asset}_v{version:0>3}<_{output}><.{frame:0>4}>.{ext}"
+)
+
+
+def get_template_data():
+    return {
+        "root": {"work": "/mnt/work"},
+        "project": {"name": "Project"},
+        "asset": "sh010",
+        "version": 3,
+        "ext": "exr"
+    }
+
+
+def test_format_many_matches_format():
+    data_list = []
+    for frame in range(1001, 1011):
+        data = get_template_data()
+        data["frame"] = frame
+        # Optional key available only for some frames
+        if frame % 2:
+            data["output"] = "beauty"
+        data_list.append(data)
+    # Missing required key
+    data_list.append({"frame": 1})
+
+    template = StringTemplate(TEMPLATE)
+    results = template.format_many(data_list)
+
+    assert len(results) == len(data_list)
+    for data, result in zip(data_list, results):
+        expected = template.format(data)
+        assert result == expected
+        assert result.solved == expected.solved
+        assert result.used_values == expected.used_values
+        assert sorted(result.missing_keys) == sorted(expected.missing_keys)
+
+    assert results[0] == (
+        "/mnt/work/Project/sh010/v003/sh010_v003_beauty.1001.exr"
+    )
+    assert results[1] == "/mnt/work/Project/sh010/v003/sh010_v003.1002.exr"
+    with pytest.raises(TemplateUnsolved):
+        template.format_strict_many(data_list)
+
+
+def test_templates_dict_format():
+    templates = TemplatesDict({
+        "publish": {"path": TEMPLATE, "folder": "{root[work]}/{asset}"},
+        "broken": "{missing}"
+    })
+    data = get_template_data()
+    data["frame"] = 1
+    result = templates.format(data)
+
+    assert result["publish"]["folder"] == "/mnt/work/sh010"
+    assert result.get("broken") == "{missing}"
+    with pytest.raises(TemplateUnsolved):
+        result["broken"]
+    # Copies of strict result don't validate values
+    copied = dict(result)
+    copied.update(result)
+    copied = dict(**result)
+    assert copied["broken"] == "{missing}"
+    assert dict(result["publish"]) == {
+        "path": "/mnt/work/Project/sh010/v003/sh010_v003.0001.exr",
+        "folder": "/mnt/work/sh010"
+    }
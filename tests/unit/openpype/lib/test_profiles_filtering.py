@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""Test suite for profiles filtering.
+
+'ProfileMatcher' is compared with 'filter_profiles' on randomly generated
+profiles and filtering values.
+"""
+import random
+
+import pytest
+
+from openpype.lib.profiles_filtering import (
+    filter_profiles,
+    ProfileMatcher,
+    get_profile_matcher,
+)
+
+KEYS = ("hosts", "families", "task_names", "task_types", "subset")
+VALUES = (
+    "maya", "nuke", "render", "review", "model", "compositing",
+    "renderMain", "Main", "NUKE"
+)
+PATTERNS = VALUES + (
+    "", "*", "ren.*", "ma[y]a", "(?i)nuke", ".*Main", "review|model",
+    "comp", "rend"
+)
+
+
+def _random_filter(rand):
+    choice = rand.random()
+    if choice < 0.2:
+        return None
+    if choice < 0.3:
+        return []
+    if choice < 0.4:
+        return rand.choice(PATTERNS)
+    items = rand.sample(PATTERNS, rand.randint(1, 4))
+    if choice < 0.5:
+        return tuple(items)
+    return items
+
+
+def _random_profiles(rand):
+    profiles = []
+    for idx in range(rand.randint(0, 12)):
+        profile = {"id": idx}
+        for key in KEYS:
+            if rand.random() < 0.8:
+                profile[key] = _random_filter(rand)
+        profiles.append(profile)
+    return profiles
+
+
+def _random_key_values(rand):
+    keys = rand.sample(KEYS, rand.randint(1, len(KEYS)))
+    key_values = {}
+    for key in keys:
+        key_values[key] = rand.choice(VALUES + ("", None, "render.main"))
+    keys_order = None
+    if rand.random() < 0.5:
+        keys_order = rand.sample(keys, rand.randint(1, len(keys)))
+    return key_values, keys_order
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matcher_matches_filter_profiles(seed):
+    rand = random.Random(seed)
+    for _ in range(50):
+        profiles = _random_profiles(rand)
+        matcher = ProfileMatcher(profiles, cache_size=8)
+        for _ in range(20):
+            key_values, keys_order = _random_key_values(rand)
+            expected = filter_profiles(profiles, key_values, keys_order)
+            # Second call uses cached result
+            for _ in range(2):
+                result = matcher.match(key_values, keys_order)
+                assert result is expected, (
+                    "Profiles: {}\nValues: {}\nOrder: {}".format(
+                        profiles, key_values, keys_order
+                    )
+                )
+
+
+def test_get_profile_matcher_cache():
+    profiles = [{"hosts": ["maya"], "families": ["render"]}]
+    matcher = get_profile_matcher(profiles)
+    assert get_profile_matcher(profiles) is matcher
+    assert get_profile_matcher(list(profiles)) is not matcher
+    assert matcher.match({"hosts": "maya"}) is profiles[0]
+    assert matcher.match({"hosts": "nuke"}) is None
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""Test suite for packing of project files with manifest."""
+import os
+import zipfile
+
+import pytest
+
+from openpype.lib import project_backpack
+
+
+def _write(path, content):
+    dirpath = os.path.dirname(path)
+    if not os.path.exists(dirpath):
+        os.makedirs(dirpath)
+    with open(path, "wb") as stream:
+        stream.write(content)
+
+
+def _pack(zip_path, root_path, previous_manifest=None):
+    source_path = os.path.join(root_path, "project")
+    manifest = {"id": os.path.basename(zip_path), "files": {}}
+    with zipfile.ZipFile(zip_path, "w") as zip_stream:
+        manifest["files"] = project_backpack._pack_files_to_zip(
+            zip_stream,
+            source_path,
+            root_path,
+            previous_manifest,
+            manifest["id"],
+            workers=2
+        )
+    return manifest
+
+
+def test_pack_and_unpack(tmp_path, monkeypatch):
+    # Stream bigger files to zip
+    monkeypatch.setattr(project_backpack, "READ_TO_MEMORY_SIZE", 10)
+    root_path = str(tmp_path / "root")
+    _write(os.path.join(root_path, "project", "work", "scene.ma"), b"a" * 5)
+    _write(os.path.join(root_path, "project", "plate.exr"), b"b" * 100)
+
+    zip_path = str(tmp_path / "full.zip")
+    manifest = _pack(zip_path, root_path)
+    assert set(manifest["files"]) == {
+        "project_files/project/work/scene.ma",
+        "project_files/project/plate.exr",
+    }
+    with zipfile.ZipFile(zip_path) as zip_stream:
+        compress_types = {
+            info.filename: info.compress_type
+            for info in zip_stream.infolist()
+        }
+    assert compress_types["project_files/project/plate.exr"] == (
+        zipfile.ZIP_STORED
+    )
+    assert compress_types["project_files/project/work/scene.ma"] == (
+        zipfile.ZIP_DEFLATED
+    )
+
+    new_root = str(tmp_path / "new_root")
+    errors = project_backpack._unpack_project_files(
+        zip_path, manifest, new_root, "project", workers=2
+    )
+    assert not errors
+    with open(os.path.join(new_root, "project", "plate.exr"), "rb") as s:
+        assert s.read() == b"b" * 100
+
+    # Corrupted manifest is reported
+    manifest["files"]["project_files/project/plate.exr"]["hash"] = "sha256:0"
+    errors = project_backpack._unpack_project_files(
+        zip_path, manifest, new_root, "project", workers=2
+    )
+    assert len(errors) == 1
+
+
+def test_incremental_pack(tmp_path):
+    root_path = str(tmp_path / "root")
+    scene_path = os.path.join(root_path, "project", "scene.ma")
+    _write(scene_path, b"a")
+    _write(os.path.join(root_path, "project", "plate.exr"), b"b")
+    manifest = _pack(str(tmp_path / "full.zip"), root_path)
+
+    _write(scene_path, b"changed")
+    zip_path = str(tmp_path / "incremental.zip")
+    incremental = _pack(zip_path, root_path, manifest)
+    with zipfile.ZipFile(zip_path) as zip_stream:
+        assert zip_stream.namelist() == ["project_files/project/scene.ma"]
+
+    files = incremental["files"]
+    assert files["project_files/project/plate.exr"]["package"] == "full.zip"
+    assert files["project_files/project/scene.ma"]["package"] == (
+        "incremental.zip"
+    )
+
+    new_root = str(tmp_path / "new_root")
+    assert not project_backpack._unpack_project_files(
+        zip_path, incremental, new_root, "project"
+    )
+
+
+def test_unpack_validation(tmp_path):
+    new_root = str(tmp_path / "new_root")
+    # Package without project files does not touch root
+    zip_path = str(tmp_path / "documents.zip")
+    with zipfile.ZipFile(zip_path, "w") as zip_stream:
+        zip_stream.writestr("database/project.json", b"[]")
+    assert not project_backpack._unpack_project_files(
+        zip_path, None, new_root, "project"
+    )
+    assert not os.path.exists(new_root)
+
+    for archive_name in (
+        "project_files/project/../other/file.txt",
+        "project_files/project/../../file.txt",
+    ):
+        zip_path = str(tmp_path / "invalid.zip")
+        with zipfile.ZipFile(zip_path, "w") as zip_stream:
+            zip_stream.writestr("project_files/project/valid.txt", b"a")
+            zip_stream.writestr(archive_name, b"a")
+        with pytest.raises(ValueError):
+            project_backpack._unpack_project_files(
+                zip_path, None, new_root, "project"
+            )
+    assert not os.path.exists(new_root)
+    assert not os.path.exists(str(tmp_path / "file.txt"))
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Test suite for detection of frame sequences."""
+import clique
+
+from openpype.lib.sequence_tools import (
+    FrameSequence,
+    assemble,
+    detect_sequences,
+)
+
+
+FILENAMES = [
+    "sh010_v001.1001.exr",
+    "sh010_v001.1002.exr",
+    "sh010_v001.1003.exr",
+    "sh010_v001.1005.exr",
+    "plate.0998.exr",
+    "plate.0999.exr",
+    "plate.1000.exr",
+    "review.mov",
+    "single.0001.png",
+    "v001_a.1.jpg",
+    "v002_a.1.jpg",
+]
+
+
+def _to_data(result):
+    collections, remainder = result
+    return (
+        sorted(
+            (col.head, col.tail, col.padding, tuple(col.indexes))
+            for col in collections
+        ),
+        sorted(remainder)
+    )
+
+
+def test_assemble_matches_clique():
+    frames_pattern = [clique.PATTERNS["frames"]]
+    for kwargs in (
+        {},
+        {"minimum_items": 1},
+        {"patterns": frames_pattern, "minimum_items": 1},
+        {"assume_padded_when_ambiguous": True},
+    ):
+        assert _to_data(assemble(FILENAMES, **kwargs)) == _to_data(
+            clique.assemble(FILENAMES, **kwargs)
+        )
+
+
+def test_frame_sequence():
+    sequences, remainder = detect_sequences(FILENAMES, frames_pattern=True)
+    assert sorted(remainder) == [
+        "review.mov", "single.0001.png", "v001_a.1.jpg", "v002_a.1.jpg"
+    ]
+
+    sequences_by_head = {sequence.head: sequence for sequence in sequences}
+    sequence = sequences_by_head["sh010_v001."]
+    assert sequence.ranges == [(1001, 1003), (1005, 1005)]
+    assert sequence.holes() == [(1004, 1004)]
+    assert not sequence.is_contiguous()
+    assert len(sequence) == 4
+    assert 1004 not in sequence
+    assert 1005 in sequence
+    assert sequence.format_frame(1001) == "sh010_v001.1001.exr"
+
+    plate = sequences_by_head["plate."]
+    assert plate.padding == 4
+    assert (plate.start, plate.end) == (998, 1000)
+    assert plate.filenames() == [
+        "plate.0998.exr", "plate.0999.exr", "plate.1000.exr"
+    ]
+
+    collection = plate.to_collection()
+    assert plate.format() == collection.format()
+    assert FrameSequence.from_collection(collection) == plate
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""Test suite for batching of events in SyncToAvalonEvent.
+
+Synchronization itself is replaced, tests cover collecting, merging and
+flushing of events.
+"""
+import time
+import logging
+import threading
+
+import pytest
+
+ftrack_api = pytest.importorskip("ftrack_api")
+
+from openpype.modules import load_modules  # noqa
+
+load_modules()
+
+from openpype_modules.ftrack.event_handlers_server import (  # noqa
+    event_sync_to_avalon
+)
+
+SyncToAvalonEvent = event_sync_to_avalon.SyncToAvalonEvent
+
+
+class FakeEventHub(object):
+    def __init__(self):
+        self.callbacks = {}
+
+    def subscribe(self, subscription, callback, priority=None):
+        self.callbacks[subscription] = callback
+
+
+class FakeSession(object):
+    def __init__(self):
+        self.event_hub = FakeEventHub()
+
+
+def _create_handler(batch_delay, batch_max_events):
+    handler = SyncToAvalonEvent.__new__(SyncToAvalonEvent)
+    handler.log = logging.getLogger("test")
+    handler._session = FakeSession()
+    handler.batch_delay = batch_delay
+    handler.batch_max_events = batch_max_events
+    handler._pending_events = []
+    handler._pending_lock = threading.Lock()
+    handler._process_lock = threading.Lock()
+    handler._batch_timer = None
+    handler._batch_metrics = {
+        "batches": 0,
+        "events": 0,
+        "max_batch_size": 0,
+        "latency": 0.0,
+        "max_latency": 0.0
+    }
+    handler.processed = []
+    handler.process_event = (
+        lambda session, event: handler.processed.append(event)
+    )
+    return handler
+
+
+def _create_event(*entities_info):
+    entities = []
+    for ftrack_id, action, changes in entities_info:
+        entities.append({
+            "entityId": ftrack_id,
+            "entityType": "task",
+            "entity_type": "Shot",
+            "action": action,
+            "keys": list(changes),
+            "changes": changes,
+            "parents": [{"entityType": "show", "entityId": "project"}]
+        })
+    return ftrack_api.event.base.Event(
+        topic="ftrack.update", data={"entities": entities}
+    )
+
+
+def test_merge_events():
+    handler = _create_handler(0, 1)
+    event = handler.merge_events([
+        _create_event(
+            ("shot1", "update", {"name": {"old": "a", "new": "b"}}),
+            ("shot2", "add", {}),
+        ),
+        _create_event(
+            ("shot1", "update", {"name": {"old": "b", "new": "c"}}),
+            ("shot1", "update", {"fps": {"old": 24, "new": 25}}),
+            ("shot2", "remove", {}),
+        ),
+    ])
+    entities = event["data"]["entities"]
+    assert len(entities) == 1
+    assert entities[0]["entityId"] == "shot1"
+    assert entities[0]["keys"] == ["name", "fps"]
+    assert entities[0]["changes"] == {
+        "name": {"old": "a", "new": "c"},
+        "fps": {"old": 24, "new": 25}
+    }
+
+    assert handler.merge_events([
+        _create_event(("shot2", "add", {})),
+        _create_event(("shot2", "remove", {})),
+    ]) is None
+
+
+def test_batch_max_events():
+    handler = _create_handler(60, 3)
+    for idx in range(2):
+        handler.launch(None, _create_event(
+            ("shot{}".format(idx), "update", {"name": {"old": 1, "new": 2}})
+        ))
+    assert not handler.processed
+    assert handler._batch_timer is not None
+
+    handler.launch(None, _create_event(("shot2", "add", {})))
+    assert handler._batch_timer is None
+    assert len(handler.processed) == 1
+    assert len(handler.processed[0]["data"]["entities"]) == 3
+
+
+def test_batch_delay():
+    handler = _create_handler(0.05, 100)
+    handler.launch(None, _create_event(("shot1", "add", {})))
+    handler.launch(None, _create_event(("shot2", "add", {})))
+    timer = handler._batch_timer
+    timer.join(5)
+    # Wait until timer callback released the processing lock
+    for _ in range(100):
+        if handler.processed:
+            break
+        time.sleep(0.01)
+    assert len(handler.processed) == 1
+    assert len(handler.processed[0]["data"]["entities"]) == 2
+
+
+def test_process_pending_on_disconnect():
+    handler = _create_handler(60, 100)
+    handler.register()
+    handler.launch(None, _create_event(("shot1", "add", {})))
+    assert not handler.processed
+
+    callback = handler.session.event_hub.callbacks[
+        "topic=ftrack.meta.disconnected"
+    ]
+    callback(ftrack_api.event.base.Event(topic="ftrack.meta.disconnected"))
+    assert len(handler.processed) == 1
+    assert handler._batch_timer is None
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""Test suite for receiving of stored events by ftrack event processor.
+
+Mongo collection and its change stream are replaced, event hub is created
+without connection to ftrack server.
+"""
+import time
+import queue
+import logging
+
+import pytest
+
+pytest.importorskip("ftrack_api")
+
+import pymongo  # noqa
+from openpype.modules import load_modules  # noqa
+
+load_modules()
+
+from openpype_modules.ftrack.ftrack_server.lib import ProcessEventHub  # noqa
+
+
+class FakeChangeStream(object):
+    def __init__(self, changes, resume_after=None, fail_at=None):
+        self._changes = list(changes)
+        self._position = 0
+        if resume_after is not None:
+            self._position = resume_after["position"]
+        self._fail_at = fail_at
+        self.resume_token = resume_after
+
+    def try_next(self):
+        if self._position == self._fail_at:
+            self._fail_at = None
+            raise pymongo.errors.AutoReconnect("connection lost")
+
+        if self._position >= len(self._changes):
+            return None
+        change = self._changes[self._position]
+        self._position += 1
+        self.resume_token = {"position": self._position}
+        return change
+
+    def close(self):
+        pass
+
+
+class FakeCollection(object):
+    def __init__(self, docs=None, changes=None, fail_at=None):
+        self.docs = list(docs or [])
+        self.changes = list(changes or [])
+        self.fail_at = fail_at
+        self.streams = []
+        self.watch_kwargs = []
+        self.processed_batches = []
+
+    def watch(self, pipeline, **kwargs):
+        self.watch_kwargs.append(kwargs)
+        stream = FakeChangeStream(
+            self.changes, kwargs.get("resume_after"), self.fail_at
+        )
+        self.fail_at = None
+        self.streams.append(stream)
+        return stream
+
+    def find(self, query):
+        return FakeCursor([
+            doc
+            for doc in self.docs
+            if not doc["pype_data"]["is_processed"]
+        ])
+
+    def update_many(self, query, update):
+        ids = query["_id"]["$in"]
+        self.processed_batches.append(ids)
+        for doc in self.docs:
+            if doc["_id"] in ids:
+                doc["pype_data"]["is_processed"] = True
+
+
+class FakeCursor(list):
+    def sort(self, *args, **kwargs):
+        return self
+
+
+def _create_event(idx):
+    return {
+        "_id": idx,
+        "topic": "ftrack.update",
+        "data": {"idx": idx},
+        "source": {},
+        "pype_data": {"is_processed": False}
+    }
+
+
+def _create_hub(dbcon, handled, stop_after):
+    hub = ProcessEventHub.__new__(ProcessEventHub)
+    hub.logger = logging.getLogger("test")
+    hub.dbcon = dbcon
+    hub._event_queue = queue.Queue()
+    hub._change_stream = None
+    hub._resume_token = None
+    hub._loaded_ids = set()
+    hub._processed_ids = []
+    hub._last_ack_time = time.time()
+    hub._use_ttl_index = True
+    hub._last_cleanup = None
+
+    def _handle(event):
+        if event["topic"] == "ftrack.update":
+            handled.append(event["data"]["idx"])
+        if len(handled) == stop_after:
+            hub._event_queue.put({
+                "topic": "ftrack.meta.disconnected", "data": {}
+            })
+
+    hub._handle = _handle
+    return hub
+
+
+def _run(hub):
+    hub._open_change_stream()
+    hub.load_events()
+    hub._process_events(0, None)
+    hub._close_change_stream()
+    hub._flush_processed()
+
+
+def test_change_stream_draining():
+    events = [_create_event(idx) for idx in range(250)]
+    # First events were stored before processor started and some of them
+    #   are also received from change stream
+    dbcon = FakeCollection(
+        events[:5],
+        [
+            {"operationType": "insert", "fullDocument": event}
+            for event in events[3:]
+        ]
+    )
+    handled = []
+    hub = _create_hub(dbcon, handled, 250)
+    hub.ack_interval = 3600
+    _run(hub)
+
+    assert handled == list(range(250))
+    # Processed events are marked in batches, not when queue is empty
+    assert len(dbcon.processed_batches) <= 250 // hub.ack_batch_size + 2
+    assert sorted(
+        mongo_id
+        for batch in dbcon.processed_batches
+        for mongo_id in batch
+    ) == list(range(250))
+
+
+def test_change_stream_resume():
+    events = [_create_event(idx) for idx in range(10)]
+    dbcon = FakeCollection(
+        events,
+        [
+            {"operationType": "insert", "fullDocument": event}
+            for event in events
+        ],
+        fail_at=4
+    )
+    handled = []
+    hub = _create_hub(dbcon, handled, 10)
+    hub._open_change_stream()
+    hub._process_events(0, None)
+
+    assert handled == list(range(10))
+    # Stream was reopened after last received change
+    assert len(dbcon.streams) == 2
+    assert dbcon.watch_kwargs[0]["resume_after"] is None
+    assert dbcon.watch_kwargs[1]["resume_after"] == {"position": 4}
+    assert hub._resume_token == {"position": 10}
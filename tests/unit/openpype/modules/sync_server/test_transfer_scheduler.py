@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""Test suite for priority queue of sync server transfers.
+
+Transfers are replaced, only order and selection of queued files is tested.
+"""
+import asyncio
+
+from openpype.modules.sync_server import sync_server
+from openpype.modules.sync_server.utils import SyncStatus
+
+
+def _create_job(project_name, name, priority):
+    return sync_server.SyncTransferJob(
+        SyncStatus.DO_UPLOAD,
+        project_name,
+        {"_id": name},
+        {"priority": priority},
+        "local_drive",
+        "remote",
+        "remote",
+        None,
+        None
+    )
+
+
+def test_queue_keeps_highest_priorities(monkeypatch):
+    async def _upload(module, project_name, file, *args):
+        return file["_id"]
+
+    monkeypatch.setattr(sync_server, "upload", _upload)
+
+    scheduler = sync_server.SyncTransferScheduler(None, 3, 2)
+    # First project fills the queue with low priority files
+    for name in ("a1", "a2", "a3"):
+        assert scheduler.add_job(_create_job("projectA", name, 10))
+
+    # Higher priority files of another project replace them
+    assert scheduler.add_job(_create_job("projectB", "b1", 50))
+    assert scheduler.add_job(_create_job("projectB", "b2", 90))
+    assert not scheduler.add_job(_create_job("projectB", "b3", 5))
+    assert len(scheduler) == 3
+
+    results = asyncio.run(scheduler.run())
+    assert len(scheduler) == 0
+    assert [item[0] for item in results["projectA"]] == ["a1"]
+    assert [item[0] for item in results["projectB"]] == ["b2", "b1"]
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""Test suite for lazy import of modules disabled in settings."""
+import os
+import types
+
+from openpype.modules import base
+
+
+def test_manifest_module_enabled():
+    manifest = {"name": "ftrack", "settings_key": "ftrack"}
+    assert not base._is_manifest_module_enabled(
+        manifest, {"ftrack": {"enabled": False}}
+    )
+    assert base._is_manifest_module_enabled(
+        manifest, {"ftrack": {"enabled": True}}
+    )
+    # Import module if it's not possible to decide
+    assert base._is_manifest_module_enabled(manifest, {})
+    assert base._is_manifest_module_enabled(manifest, None)
+    assert base._is_manifest_module_enabled({"name": "ftrack"}, {})
+
+
+def test_default_modules_manifests():
+    modules_dir = os.path.dirname(os.path.abspath(base.__file__))
+    for filename in os.listdir(modules_dir):
+        dirpath = os.path.join(modules_dir, filename)
+        if not os.path.isdir(dirpath):
+            continue
+        manifest = base._get_module_manifest(dirpath)
+        if manifest is None:
+            continue
+        assert manifest["name"]
+        assert manifest["settings_key"]
+
+
+def test_lazy_module_import():
+    imported = []
+
+    def import_func():
+        module = types.ModuleType("openpype_modules.lazy_test")
+        module.VALUE = 1
+        imported.append(module)
+        return module
+
+    lazy_module = base._LazyModule(
+        "openpype_modules.lazy_test",
+        "lazy_test",
+        {"name": "lazy", "settings_key": "lazy"},
+        "/lazy_test/__init__.py",
+        import_func
+    )
+    assert lazy_module.module_name == "lazy"
+    assert not lazy_module.is_enabled({"lazy": {"enabled": False}})
+    # Known attributes don't trigger import
+    assert lazy_module.__file__ == "/lazy_test/__init__.py"
+    assert not imported
+
+    assert lazy_module.VALUE == 1
+    assert lazy_module.VALUE == 1
+    assert len(imported) == 1
+    assert lazy_module.load() is imported[0]
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""Test suite for communication with publish worker.
+
+Publishing itself is replaced, tests cover sending of jobs, output
+forwarding and recycling of worker.
+"""
+import io
+import json
+import socket
+import threading
+
+import pytest
+
+from openpype.pipeline.publish import worker as worker_module
+from openpype.pipeline.publish.worker import (
+    PublishWorker,
+    PublishWorkerNotAvailable,
+    send_publish_job,
+)
+
+
+@pytest.fixture(autouse=True)
+def token_dir(tmpdir, monkeypatch):
+    monkeypatch.setattr(
+        worker_module,
+        "get_publish_worker_token_path",
+        lambda port: str(tmpdir.join("{}.token".format(port)))
+    )
+    return tmpdir
+
+
+def _get_free_port():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+class FakePublishWorker(PublishWorker):
+    settings_changed = False
+
+    def __init__(self, *args, **kwargs):
+        super(FakePublishWorker, self).__init__(*args, **kwargs)
+        self.jobs = []
+
+    def warm_up(self):
+        self._warmed_up = True
+
+    def _settings_changed(self, project_name=None):
+        return self.settings_changed
+
+    def _run_job(self, paths, targets, env):
+        self.jobs.append((paths, targets, env))
+        print("publishing {}".format(paths[0]))
+        if env.get("FAIL"):
+            return False, "Publish failed."
+        return True, None
+
+
+def _start_worker(worker):
+    thread = threading.Thread(target=worker.serve)
+    thread.daemon = True
+    thread.start()
+    # Wait until worker listens
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", worker.port), 1).close()
+            break
+        except socket.error:
+            thread.join(0.05)
+    return thread
+
+
+def test_publish_jobs(monkeypatch):
+    monkeypatch.setenv("WORKER_ENV", "1")
+    monkeypatch.delenv("AVALON_PROJECT", raising=False)
+    worker = FakePublishWorker(_get_free_port(), max_jobs=2)
+    thread = _start_worker(worker)
+
+    stream = io.StringIO()
+    assert send_publish_job(
+        ["/a.json"],
+        ["farm"],
+        env={"AVALON_PROJECT": "test", "PYBLISHPLUGINPATH": "/plugins"},
+        port=worker.port,
+        stream=stream
+    )
+    assert "publishing /a.json" in stream.getvalue()
+
+    stream = io.StringIO()
+    monkeypatch.setenv(worker_module.PUBLISH_WORKER_ENV_KEYS_ENV, "FAIL")
+    assert not send_publish_job(
+        ["/b.json"], env={"FAIL": "1"}, port=worker.port, stream=stream
+    )
+    assert "Publish failed." in stream.getvalue()
+
+    thread.join(5)
+    # Worker stops after 'max_jobs'
+    assert not thread.is_alive()
+    assert [job[:2] for job in worker.jobs] == [
+        (["/a.json"], ["farm"]),
+        (["/b.json"], []),
+    ]
+    # Only job context is used from client environment
+    first_env, second_env = [job[2] for job in worker.jobs]
+    assert first_env["AVALON_PROJECT"] == "test"
+    assert first_env["WORKER_ENV"] == "1"
+    assert "PYBLISHPLUGINPATH" not in first_env
+    assert "AVALON_PROJECT" not in second_env
+    assert second_env["FAIL"] == "1"
+
+
+def test_token(token_dir):
+    worker = FakePublishWorker(_get_free_port(), max_jobs=1)
+    thread = _start_worker(worker)
+
+    token_path = token_dir.join("{}.token".format(worker.port))
+    assert oct(token_path.stat().mode & 0o777) == oct(0o600)
+
+    # Job without valid token is rejected
+    connection = socket.create_connection(("127.0.0.1", worker.port), 5)
+    try:
+        connection.sendall(json.dumps({
+            "token": "invalid", "paths": ["/a.json"], "env": {}
+        }).encode("utf-8") + b"\n")
+        messages = list(worker_module._iter_messages(connection))
+    finally:
+        connection.close()
+    assert messages == [{"type": "rejected"}]
+    assert worker.jobs == []
+
+    token = token_path.read()
+    token_path.write("invalid")
+    with pytest.raises(PublishWorkerNotAvailable):
+        send_publish_job(["/a.json"], env={}, port=worker.port)
+
+    token_path.remove()
+    with pytest.raises(PublishWorkerNotAvailable):
+        send_publish_job(["/a.json"], env={}, port=worker.port)
+
+    token_path.write(token)
+    assert send_publish_job(
+        ["/a.json"], env={}, port=worker.port, stream=io.StringIO()
+    )
+    thread.join(5)
+    assert not thread.is_alive()
+    # Token is removed when worker stops
+    assert not token_path.exists()
+
+
+def test_recycle_on_settings_change():
+    worker = FakePublishWorker(_get_free_port())
+    thread = _start_worker(worker)
+    worker.settings_changed = True
+
+    with pytest.raises(PublishWorkerNotAvailable):
+        send_publish_job(["/a.json"], env={}, port=worker.port)
+
+    thread.join(5)
+    assert not thread.is_alive()
+    assert worker.jobs == []
+
+
+def test_worker_not_running():
+    with pytest.raises(PublishWorkerNotAvailable):
+        send_publish_job(["/a.json"], env={}, port=_get_free_port())
+
+
+def test_plugins_cache_uses_env_paths(tmpdir, monkeypatch):
+    import pyblish.api
+
+    plugin_dirs = []
+    for name in ("first", "second"):
+        plugin_dir = tmpdir.mkdir(name)
+        plugin_dir.join("collect_{}.py".format(name)).write(
+            "import pyblish.api\n"
+            "class Collect{}(pyblish.api.ContextPlugin):\n"
+            "    pass\n".format(name.capitalize())
+        )
+        plugin_dirs.append(str(plugin_dir))
+
+    worker = FakePublishWorker(_get_free_port())
+    monkeypatch.setenv("AVALON_PROJECT", "test")
+    with worker._job_registrations():
+        pyblish.api.deregister_all_paths()
+        monkeypatch.setenv("PYBLISHPLUGINPATH", plugin_dirs[0])
+        first = {plugin.__name__ for plugin in worker._get_plugins()}
+        monkeypatch.setenv("PYBLISHPLUGINPATH", plugin_dirs[1])
+        second = {plugin.__name__ for plugin in worker._get_plugins()}
+
+    assert first == {"CollectFirst"}
+    assert second == {"CollectSecond"}
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Test suite for cached discovery of plugins from registered paths."""
+import os
+
+from openpype.pipeline.plugin_discover import (
+    PluginDiscoverContext,
+    PluginFilesIndex,
+)
+
+
+class DiscoverTestPlugin(object):
+    label = None
+
+
+PLUGIN_CONTENT = """
+from {module} import DiscoverTestPlugin
+
+
+class {name}(DiscoverTestPlugin):
+    pass
+"""
+
+
+def _write_plugin(dirpath, name, content=None):
+    if content is None:
+        content = PLUGIN_CONTENT.format(module=__name__, name=name)
+    filepath = os.path.join(dirpath, "{}.py".format(name.lower()))
+    with open(filepath, "w") as stream:
+        stream.write(content)
+    return filepath
+
+
+def test_discover_reuses_unchanged_files(tmp_path):
+    dirpath = str(tmp_path)
+    filepath = _write_plugin(dirpath, "PluginA")
+    context = PluginDiscoverContext()
+    context.register_plugin_path(DiscoverTestPlugin, dirpath)
+
+    plugin = context.discover(DiscoverTestPlugin)[0]
+    # Changes made on discovered class are reset on next discovery
+    plugin.label = "Changed"
+    plugin.new_attr = True
+
+    plugins = context.discover(DiscoverTestPlugin)
+    assert plugins == [plugin]
+    assert plugin.label is None
+    assert not hasattr(plugin, "new_attr")
+
+    # Changed file is imported again
+    _write_plugin(dirpath, "PluginA", PLUGIN_CONTENT.format(
+        module=__name__, name="PluginA"
+    ) + "\n# Changed\n")
+    plugins = context.discover(DiscoverTestPlugin)
+    assert len(plugins) == 1
+    assert plugins[0] is not plugin
+    assert os.path.exists(filepath)
+
+
+def test_files_index_skips_files_without_plugins(tmp_path):
+    plugins_dir = tmp_path / "plugins"
+    plugins_dir.mkdir()
+    dirpath = str(plugins_dir)
+    index_path = str(tmp_path / "index.json")
+
+    _write_plugin(dirpath, "PluginA")
+    other_path = _write_plugin(dirpath, "Other", "VALUE = 1\n")
+
+    context = PluginDiscoverContext(PluginFilesIndex(index_path))
+    context.register_plugin_path(DiscoverTestPlugin, dirpath)
+    result = context.discover(DiscoverTestPlugin, return_report=True)
+    assert len(result.plugins) == 1
+    assert os.path.exists(index_path)
+
+    # New process reads stored index
+    index = PluginFilesIndex(index_path)
+    assert not index.may_contain(other_path, DiscoverTestPlugin)
+    context = PluginDiscoverContext(index)
+    context.register_plugin_path(DiscoverTestPlugin, dirpath)
+    result = context.discover(DiscoverTestPlugin, return_report=True)
+    assert len(result.plugins) == 1
+    assert other_path not in {
+        module.__file__ for module in result._modules
+    }
+
+    # Unknown superclass does not skip anything
+    assert index.may_contain(other_path, PluginFilesIndex)
+
+    # Changed file must be imported
+    os.utime(other_path, (0, 0))
+    assert index.may_contain(other_path, DiscoverTestPlugin)
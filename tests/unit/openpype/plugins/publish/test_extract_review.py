@@ -27,3 +27,40 @@ def test_fix_ffmpeg_full_args_filters():
     assert ret[-1] == output_arg
     assert ret[-2] == '"adeclick,adeclick"'  # TODO fix this duplication
     assert ret[-3] == "-filter:a"
+
+
+def test_single_pass_keeps_audio(monkeypatch):
+    """Merged outputs map audio of input as separate renders would."""
+    from openpype.plugins.publish import extract_review
+
+    commands = []
+    monkeypatch.setattr(
+        extract_review,
+        "run_subprocess",
+        lambda cmd, **kwargs: commands.append(cmd)
+    )
+    plugin = ExtractReview()
+    plugin.ffmpeg_path = "ffmpeg"
+    outputs = []
+    for name, ext, is_image in (
+        ("h264", "mp4", False),
+        ("thumb", "jpg", True),
+    ):
+        outputs.append({
+            "output_name": name,
+            "temp_data": {"output_ext_is_image": is_image},
+            "ffmpeg_args_parts": (
+                ["-i \"input.mov\""],
+                ["scale=960:540"],
+                [],
+                ["\"{}.{}\"".format(name, ext)]
+            )
+        })
+    plugin._render_single_pass(outputs)
+
+    assert len(commands) == 1
+    args = commands[0].split(" ")
+    mp4_idx = args.index("\"h264.mp4\"")
+    jpg_idx = args.index("\"thumb.jpg\"")
+    assert args[mp4_idx - 2:mp4_idx] == ["-map", "0:a:0?"]
+    assert "0:a:0?" not in args[mp4_idx:jpg_idx]
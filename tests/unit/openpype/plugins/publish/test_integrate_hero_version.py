@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""Test suite for hero version integration of published sequences.
+
+Database is replaced, files are published to temporary directory.
+"""
+import os
+
+import pyblish.api
+from bson.objectid import ObjectId
+
+import openpype
+from openpype.client.operations import OperationsSession
+from openpype.lib import StringTemplate
+from openpype.plugins.publish import integrate_hero_version
+from openpype.plugins.publish.integrate import IntegrateAsset
+from openpype.plugins.publish.integrate_hero_version import (
+    IntegrateHeroVersion
+)
+
+
+SITES = [{"name": "studio", "created_dt": None}]
+
+
+class FakeAnatomy(object):
+    project_name = "test_project"
+
+    def __init__(self, root):
+        self.root = root
+        self.templates = {
+            "hero": {
+                "folder": "{root[work]}/{asset}/hero",
+                "path": (
+                    "{root[work]}/{asset}/hero/{subset}<.{frame}>.{ext}"
+                ),
+                "frame_padding": 4
+            }
+        }
+        self.templates_obj = {
+            "hero": {
+                key: StringTemplate(value)
+                for key, value in self.templates["hero"].items()
+                if key != "frame_padding"
+            }
+        }
+
+    def find_root_template_from_path(self, path):
+        if not path.startswith(self.root):
+            return False, path
+        return True, "{root[work]}" + path[len(self.root):]
+
+
+def _publish_sequence(tmpdir, anatomy, compact):
+    publish_dir = os.path.join(tmpdir, "shot010", "v001")
+    os.makedirs(publish_dir)
+    published_files = []
+    for frame in range(1001, 1011):
+        filepath = os.path.join(
+            publish_dir, "renderMain.{}.exr".format(frame)
+        )
+        with open(filepath, "w") as stream:
+            stream.write(str(frame))
+        published_files.append(filepath)
+
+    plugin = IntegrateAsset()
+    plugin.compact_sequence_files = compact
+    repre_doc = {
+        "_id": ObjectId(),
+        "schema": "openpype:representation-2.0",
+        "type": "representation",
+        "parent": ObjectId(),
+        "name": "exr",
+        "data": {},
+        "context": {},
+        "files": plugin.get_files_info(published_files, SITES, anatomy)
+    }
+    db_repre_doc = plugin.get_db_representation_doc(repre_doc)
+    return publish_dir, published_files, repre_doc, db_repre_doc
+
+
+def test_hero_version_of_compacted_sequence(tmpdir, monkeypatch):
+    tmpdir = str(tmpdir)
+    anatomy = FakeAnatomy(tmpdir)
+    publish_dir, published_files, repre_doc, db_repre_doc = (
+        _publish_sequence(tmpdir, anatomy, True)
+    )
+    # Database document is compacted, published representation is not
+    assert len(db_repre_doc["files"]) == 1
+    assert len(repre_doc["files"]) == len(published_files)
+
+    # Representation schema is validated
+    monkeypatch.setenv(
+        "OPENPYPE_REPOS_ROOT",
+        os.path.dirname(os.path.dirname(os.path.abspath(openpype.__file__)))
+    )
+    committed = []
+    monkeypatch.setattr(
+        integrate_hero_version,
+        "get_hero_version_by_subset_id",
+        lambda *args, **kwargs: None
+    )
+    monkeypatch.setattr(
+        integrate_hero_version,
+        "get_archived_representations",
+        lambda *args, **kwargs: []
+    )
+    monkeypatch.setattr(
+        OperationsSession,
+        "commit",
+        lambda session: committed.extend(session.to_data())
+    )
+
+    context = pyblish.api.Context()
+    context.data["anatomy"] = anatomy
+    instance = context.create_instance("renderMain")
+    instance.data.update({
+        "subset": "renderMain",
+        "anatomyData": {
+            "root": {"work": tmpdir},
+            "asset": "shot010",
+            "subset": "renderMain"
+        },
+        "publishDir": publish_dir,
+        "versionEntity": {"_id": repre_doc["parent"], "parent": ObjectId()},
+        "published_representations": {
+            repre_doc["_id"]: {
+                "representation": repre_doc,
+                "anatomy_data": {
+                    "root": {"work": tmpdir},
+                    "asset": "shot010",
+                    "subset": "renderMain",
+                    "ext": "exr",
+                    "version": 1
+                },
+                "published_files": published_files
+            }
+        }
+    })
+
+    plugin = IntegrateHeroVersion()
+    plugin.integrate_instance(
+        instance,
+        anatomy.project_name,
+        "hero",
+        anatomy.templates["hero"]["path"]
+    )
+
+    hero_dir = os.path.join(tmpdir, "shot010", "hero")
+    assert sorted(os.listdir(hero_dir)) == [
+        "renderMain.{}.exr".format(frame) for frame in range(1001, 1011)
+    ]
+    hero_repres = [
+        operation["data"]
+        for operation in committed
+        if operation["entity_type"] == "representation"
+    ]
+    assert len(hero_repres) == 1
+    assert [file_info["path"] for file_info in hero_repres[0]["files"]] == [
+        "{{root[work]}}/shot010/hero/renderMain.{}.exr".format(frame)
+        for frame in range(1001, 1011)
+    ]
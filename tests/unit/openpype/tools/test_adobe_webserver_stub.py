@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""Test suite for batched calls and metadata cache of Adobe stubs."""
+import json
+import asyncio
+import logging
+
+import pytest
+
+pytest.importorskip("wsrpc_aiohttp")
+
+from openpype.hosts.photoshop.api.ws_stub import PhotoshopServerStub  # noqa
+
+
+class FakeWebServer(object):
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+
+    def call(self, func):
+        return self.loop.run_until_complete(func)
+
+
+class FakeClient(object):
+    """Mimics Photoshop extension with two layers."""
+
+    def __init__(self, batch_route=True, batch_error=None):
+        self.batch_route = batch_route
+        self.batch_error = batch_error
+        self.requests = []
+        self.headline = "[]"
+        self.visible = {}
+
+    def _process(self, route, params):
+        method = route.split(".", 1)[-1]
+        if method == "get_layers":
+            return json.dumps([{"id": 1, "name": "a"}, {"id": 2, "name": "b"}])
+        if method == "read":
+            return self.headline
+        if method == "imprint":
+            self.headline = params["payload"]
+        elif method == "set_visible":
+            self.visible[params["layer_id"]] = params["visibility"]
+        return None
+
+    async def call(self, route, **kwargs):
+        self.requests.append(route)
+        if route != "Photoshop.batch":
+            return self._process(route, kwargs)
+        if not self.batch_route:
+            raise Exception("Route not found")
+        if self.batch_error is not None:
+            raise self.batch_error
+        return json.dumps([
+            {"result": self._process(call["method"], call["params"])}
+            for call in json.loads(kwargs["calls"])
+        ])
+
+
+def _create_stub(client):
+    stub = PhotoshopServerStub.__new__(PhotoshopServerStub)
+    stub.websocketserver = FakeWebServer()
+    stub.client = client
+    stub.log = logging.getLogger("test")
+    return stub
+
+
+@pytest.mark.parametrize("batch_route", [True, False])
+def test_batch(batch_route):
+    client = FakeClient(batch_route)
+    stub = _create_stub(client)
+    with stub.batch():
+        for layer_id in (1, 2):
+            stub.set_visible(layer_id, False)
+            stub.imprint(layer_id, {"members": [str(layer_id)]})
+        assert len(stub.get_layers_metadata()) == 2
+
+    assert client.visible == {1: False, 2: False}
+    assert [item["members"] for item in json.loads(client.headline)] == [
+        ["1"], ["2"]
+    ]
+    # Metadata are read with first queued call and written once
+    if batch_route:
+        expected = ["Photoshop.batch", "Photoshop.batch"]
+    else:
+        expected = [
+            "Photoshop.batch",
+            "Photoshop.set_visible",
+            "Photoshop.read",
+            "Photoshop.set_visible",
+        ]
+    expected.extend(["Photoshop.get_layers", "Photoshop.imprint"])
+    assert client.requests == expected
+
+
+def test_batch_error():
+    client = FakeClient(batch_error=Exception("Connection lost"))
+    stub = _create_stub(client)
+    with pytest.raises(Exception, match="Connection lost"):
+        with stub.batch():
+            stub.set_visible(1, False)
+
+    # Calls are not sent one by one for other errors than missing route
+    assert client.requests == ["Photoshop.batch"]
+    assert client not in PhotoshopServerStub._batch_unsupported_clients
+
+
+def test_metadata_cache():
+    client = FakeClient()
+    stub = _create_stub(client)
+    PhotoshopServerStub.set_active_document("first.psd")
+    try:
+        stub.imprint(1, {"members": ["1"]})
+        stub.get_layers_metadata()
+        metadata = stub.get_layers_metadata()
+        assert client.requests.count("Photoshop.read") == 1
+        assert metadata == [{"members": ["1"]}]
+
+        # Returned metadata are copies
+        metadata[0]["members"] = ["2"]
+        assert stub.get_layers_metadata() == [{"members": ["1"]}]
+
+        PhotoshopServerStub.set_active_document("second.psd")
+        stub.get_layers_metadata()
+        assert client.requests.count("Photoshop.read") == 2
+    finally:
+        PhotoshopServerStub.set_active_document(None)
+
+
+def test_metadata_invalidation():
+    client = FakeClient()
+    stub = _create_stub(client)
+    PhotoshopServerStub.set_active_document("first.psd")
+    try:
+        stub.get_layers_metadata()
+        stub.get_layers_metadata()
+        assert client.requests.count("Photoshop.read") == 1
+
+        # Document was e.g. reverted
+        client.headline = json.dumps([{"members": ["2"]}])
+        PhotoshopServerStub.invalidate_metadata()
+        assert stub.get_layers_metadata() == [{"members": ["2"]}]
+        assert client.requests.count("Photoshop.read") == 2
+
+        # Metadata are read from client before they're modified
+        client.headline = "[]"
+        stub.imprint(1, {"members": ["1"]})
+        assert client.requests.count("Photoshop.read") == 3
+        assert json.loads(client.headline) == [{"members": ["1"]}]
+    finally:
+        PhotoshopServerStub.set_active_document(None)